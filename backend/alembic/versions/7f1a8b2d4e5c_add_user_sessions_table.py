@@ -0,0 +1,39 @@
+"""Add user_sessions table
+
+Revision ID: 7f1a8b2d4e5c
+Revises: 1ea47a54e630
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7f1a8b2d4e5c'
+down_revision: Union[str, Sequence[str], None] = '1ea47a54e630'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create user_sessions table for the database session backend."""
+    op.create_table(
+        'user_sessions',
+        sa.Column('token', sa.String(), nullable=False),
+        sa.Column('user_id', sa.String(), nullable=False),
+        sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('token')
+    )
+    op.create_index('ix_user_sessions_user_id', 'user_sessions', ['user_id'])
+    op.create_index('ix_user_sessions_expires_at', 'user_sessions', ['expires_at'])
+
+
+def downgrade() -> None:
+    """Drop user_sessions table."""
+    op.drop_index('ix_user_sessions_expires_at', table_name='user_sessions')
+    op.drop_index('ix_user_sessions_user_id', table_name='user_sessions')
+    op.drop_table('user_sessions')
@@ -0,0 +1,31 @@
+"""Add keyset pagination indexes for admin lists
+
+Revision ID: 8a2b9c3d5e6f
+Revises: 7f1a8b2d4e5c
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8a2b9c3d5e6f'
+down_revision: Union[str, Sequence[str], None] = '7f1a8b2d4e5c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ('users', 'groups', 'stores', 'products')
+
+
+def upgrade() -> None:
+    """Index (created_at, id) on the tables listed newest first in the admin panel."""
+    for table in TABLES:
+        op.create_index(f'ix_{table}_created_id', table, ['created_at', 'id'])
+
+
+def downgrade() -> None:
+    """Drop the admin list keyset indexes."""
+    for table in TABLES:
+        op.drop_index(f'ix_{table}_created_id', table_name=table)
@@ -0,0 +1,42 @@
+"""Add trigram indexes for product and store name search
+
+Revision ID: 9b3c0d4e6f7a
+Revises: 8a2b9c3d5e6f
+Create Date: 2026-10-16 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b3c0d4e6f7a'
+down_revision: Union[str, Sequence[str], None] = '8a2b9c3d5e6f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Enable pg_trgm and index product and store names with GIN trigram indexes."""
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.create_index(
+        'ix_products_name_trgm',
+        'products',
+        ['name'],
+        postgresql_using='gin',
+        postgresql_ops={'name': 'gin_trgm_ops'},
+    )
+    op.create_index(
+        'ix_stores_name_trgm',
+        'stores',
+        ['name'],
+        postgresql_using='gin',
+        postgresql_ops={'name': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    """Drop the trigram name indexes (the pg_trgm extension is left installed)."""
+    op.drop_index('ix_stores_name_trgm', table_name='stores')
+    op.drop_index('ix_products_name_trgm', table_name='products')
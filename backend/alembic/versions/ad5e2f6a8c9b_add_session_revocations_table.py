@@ -0,0 +1,36 @@
+"""Add session_revocations table
+
+Revision ID: ad5e2f6a8c9b
+Revises: 9b3c0d4e6f7a
+Create Date: 2026-10-16 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'ad5e2f6a8c9b'
+down_revision: Union[str, Sequence[str], None] = '9b3c0d4e6f7a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create session_revocations table for signed-token revocations."""
+    op.create_table(
+        'session_revocations',
+        sa.Column('key', sa.String(), nullable=False),
+        sa.Column('cutoff', sa.BigInteger(), nullable=False),
+        sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('key')
+    )
+    op.create_index('ix_session_revocations_expires_at', 'session_revocations', ['expires_at'])
+
+
+def downgrade() -> None:
+    """Drop session_revocations table."""
+    op.drop_index('ix_session_revocations_expires_at', table_name='session_revocations')
+    op.drop_table('session_revocations')
@@ -0,0 +1,35 @@
+"""Add revoked_at to session_revocations
+
+Revision ID: c3d7e9f1a2b4
+Revises: ad5e2f6a8c9b
+Create Date: 2026-10-16 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3d7e9f1a2b4'
+down_revision: Union[str, Sequence[str], None] = 'ad5e2f6a8c9b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add revoked_at, so workers can sync revocations made since their last sync."""
+    op.add_column(
+        'session_revocations',
+        sa.Column(
+            'revoked_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False
+        ),
+    )
+    op.create_index('ix_session_revocations_revoked_at', 'session_revocations', ['revoked_at'])
+
+
+def downgrade() -> None:
+    """Drop revoked_at from session_revocations."""
+    op.drop_index('ix_session_revocations_revoked_at', table_name='session_revocations')
+    op.drop_column('session_revocations', 'revoked_at')
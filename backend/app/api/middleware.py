@@ -7,11 +7,41 @@ from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.types import ASGIApp
 
-from app.infrastructure.request_context import generate_request_id, set_request_id
+from app.infrastructure.query_counter import QueryStats, start_query_stats
+from app.infrastructure.request_context import (
+    generate_request_id,
+    set_request_id,
+    start_request_stats,
+)
 
 logger = logging.getLogger(__name__)
 
 
+def _format_request_stats(request_stats: dict, query_stats: QueryStats) -> dict:
+    """Round per-request statistics for logging."""
+    return {
+        **{key: round(value, 2) for key, value in request_stats.items()},
+        'db_queries': query_stats.count,
+        'db_time_ms': round(query_stats.total_ms, 2),
+    }
+
+
+def _log_repeated_queries(request: Request, request_id: str, query_stats: QueryStats) -> None:
+    """Warn about statement shapes repeated often enough to suggest an N+1 query."""
+    for statement, count in query_stats.repeated_shapes():
+        logger.warning(
+            f'Probable N+1 query in {request.method} {request.url.path}',
+            extra={
+                'request_id': request_id,
+                'method': request.method,
+                'path': request.url.path,
+                'statement': statement[:500],
+                'executions': count,
+                'db_queries': query_stats.count,
+            },
+        )
+
+
 class RequestLoggingMiddleware(BaseHTTPMiddleware):
     """Middleware to log all HTTP requests and responses."""
 
@@ -29,6 +59,8 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         # Generate and set request ID in context
         request_id = generate_request_id()
         set_request_id(request_id)
+        request_stats = start_request_stats()
+        query_stats = start_query_stats()
 
         # Also store in request.state for easy access in route handlers
         request.state.request_id = request_id
@@ -55,11 +87,18 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
                         'path': request.url.path,
                         'status_code': response.status_code,
                         'duration_ms': duration_ms,
+                        **_format_request_stats(request_stats, query_stats),
                     },
                 )
 
+            _log_repeated_queries(request, request_id, query_stats)
+
             # Add request ID to response headers for tracing
             response.headers['X-Request-ID'] = request_id
+            response.headers['X-DB-Queries'] = str(query_stats.count)
+            response.headers['X-DB-Time'] = f'{query_stats.total_ms:.1f}'
+            if 'queue_wait_ms' in request_stats:
+                response.headers['X-Queue-Wait'] = f'{request_stats["queue_wait_ms"]:.1f}'
 
             return response
 
@@ -75,6 +114,7 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
                     'method': request.method,
                     'path': request.url.path,
                     'duration_ms': duration_ms,
+                    **_format_request_stats(request_stats, query_stats),
                     'error': str(e),
                 },
                 exc_info=True,
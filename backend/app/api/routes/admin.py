@@ -2,7 +2,7 @@
 
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 from sqlalchemy.orm import Session
 
 from app.api.routes.auth import require_auth
@@ -26,6 +26,9 @@ from app.services import AdminService
 
 router = APIRouter(prefix='/admin', tags=['admin'])
 
+# Response header carrying the number of rows matching a list request's filters
+TOTAL_COUNT_HEADER = 'X-Total-Count'
+
 
 def require_admin(current_user: User = Depends(require_auth)) -> User:
     """Verify that the current user is an admin."""
@@ -38,16 +41,23 @@ def require_admin(current_user: User = Depends(require_auth)) -> User:
 
 @router.get('/users', response_model=list[AdminUserResponse])
 async def get_users(
+    response: Response,
     search: str | None = Query(None),
     verified: bool | None = Query(None),
     limit: int = Query(100, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    after: str | None = Query(None, description='Last user ID of the previous page'),
     admin_user: User = Depends(require_admin),
     db: Session = Depends(get_db),
 ):
-    """Get all users with optional search and filtering (paginated, max 100 per page)."""
+    """Get users with optional search and filtering (paginated, max 100 per page).
+
+    Supports limit/offset and keyset (after) pagination. The number of users matching
+    the filters is returned in the X-Total-Count header.
+    """
     service = AdminService(db)
-    return service.get_users(search, verified, limit, offset)
+    response.headers[TOTAL_COUNT_HEADER] = str(service.count_users(search, verified))
+    return service.get_users(search, verified, limit, offset, after)
 
 
 @router.post('/users/{user_id}/verify', response_model=VerificationToggleResponse)
@@ -61,29 +71,43 @@ async def toggle_user_verification(
 
 @router.get('/groups', response_model=list[AdminGroupResponse])
 async def get_groups(
+    response: Response,
     search: str | None = Query(None),
     limit: int = Query(100, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    after: str | None = Query(None, description='Last group ID of the previous page'),
     admin_user: User = Depends(require_admin),
     db: Session = Depends(get_db),
 ):
-    """Get all groups with optional search (paginated, max 100 per page)."""
+    """Get groups with optional search (paginated, max 100 per page).
+
+    Supports limit/offset and keyset (after) pagination. The number of groups matching
+    the filters is returned in the X-Total-Count header.
+    """
     service = AdminService(db)
-    return service.get_groups(search, limit, offset)
+    response.headers[TOTAL_COUNT_HEADER] = str(service.count_groups(search))
+    return service.get_groups(search, limit, offset, after)
 
 
 @router.get('/products', response_model=list[AdminProductResponse])
 async def get_products(
+    response: Response,
     search: str | None = Query(None),
     verified: bool | None = Query(None),
     limit: int = Query(100, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    after: str | None = Query(None, description='Last product ID of the previous page'),
     admin_user: User = Depends(require_admin),
     db: Session = Depends(get_db),
 ):
-    """Get all products with optional search and filtering (paginated, max 100 per page)."""
+    """Get products with optional search and filtering (paginated, max 100 per page).
+
+    Supports limit/offset and keyset (after) pagination. The number of products matching
+    the filters is returned in the X-Total-Count header.
+    """
     service = AdminService(db)
-    return service.get_products(search, verified, limit, offset)
+    response.headers[TOTAL_COUNT_HEADER] = str(service.count_products(search, verified))
+    return service.get_products(search, verified, limit, offset, after)
 
 
 @router.post('/products/{product_id}/verify', response_model=VerificationToggleResponse)
@@ -97,16 +121,23 @@ async def toggle_product_verification(
 
 @router.get('/stores', response_model=list[AdminStoreResponse])
 async def get_stores(
+    response: Response,
     search: str | None = Query(None),
     verified: bool | None = Query(None),
     limit: int = Query(100, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    after: str | None = Query(None, description='Last store ID of the previous page'),
     admin_user: User = Depends(require_admin),
     db: Session = Depends(get_db),
 ):
-    """Get all stores with optional search and filtering (paginated, max 100 per page)."""
+    """Get stores with optional search and filtering (paginated, max 100 per page).
+
+    Supports limit/offset and keyset (after) pagination. The number of stores matching
+    the filters is returned in the X-Total-Count header.
+    """
     service = AdminService(db)
-    return service.get_stores(search, verified, limit, offset)
+    response.headers[TOTAL_COUNT_HEADER] = str(service.count_stores(search, verified))
+    return service.get_stores(search, verified, limit, offset, after)
 
 
 @router.post('/stores/{store_id}/verify', response_model=VerificationToggleResponse)
@@ -23,9 +23,15 @@ from app.core.error_codes import (
 from app.core.exceptions import BadRequestError, UnauthorizedError
 from app.core.models import User
 from app.core.success_codes import PASSWORD_CHANGED, USER_LOGGED_OUT
-from app.infrastructure.auth import create_session, delete_session, get_session, hash_password
-from app.infrastructure.config import SECURE_COOKIES, SESSION_EXPIRY_HOURS
+from app.infrastructure.auth import (
+    create_session,
+    delete_session,
+    get_session,
+    revoke_user_sessions,
+)
+from app.infrastructure.config import SECURE_COOKIES, SESSION_EXPIRY_HOURS, SESSION_TOKEN_MODE
 from app.infrastructure.database import get_db
+from app.infrastructure.password_hasher import password_hasher
 from app.infrastructure.request_context import get_logger
 from app.repositories import get_user_repository
 
@@ -94,7 +100,7 @@ async def register(
         )
 
     # Create new user
-    password_hash = hash_password(user_data.password)
+    password_hash = await password_hasher.hash(user_data.password)
     new_user = user_repo.create_user(
         name=user_data.name, username=user_data.username, password_hash=password_hash
     )
@@ -136,7 +142,7 @@ async def login(
 
     # Find user by username
     user = user_repo.get_user_by_username(user_data.username)
-    if not user or not user_repo.verify_password(user_data.password, user.password_hash):
+    if not user or not await user_repo.verify_password(user_data.password, user.password_hash):
         logger.warning('Failed login attempt', extra={'username': user_data.username})
         raise UnauthorizedError(
             code=AUTH_INVALID_CREDENTIALS, message='Invalid username or password'
@@ -215,6 +221,7 @@ async def get_profile_stats(
 @router.post('/change-password', response_model=SuccessResponse)
 async def change_password(
     request: ChangePasswordRequest,
+    response: Response,
     current_user: User = Depends(require_auth),
     db: Session = Depends(get_db),
 ) -> SuccessResponse:
@@ -223,7 +230,7 @@ async def change_password(
     user_repo = get_user_repository(db)
 
     # Verify current password using repository method (handles memory vs database)
-    if not user_repo.verify_password(request.current_password, current_user.password_hash):
+    if not await user_repo.verify_password(request.current_password, current_user.password_hash):
         logger.warning(
             'Password change failed - incorrect current password',
             extra={'user_id': str(current_user.id)},
@@ -231,11 +238,24 @@ async def change_password(
         raise UnauthorizedError(code=PASSWORD_INCORRECT, message='Current password is incorrect')
 
     # Hash new password and update
-    from app.infrastructure.auth import hash_password
-
-    new_password_hash = hash_password(request.new_password)
+    new_password_hash = await password_hasher.hash(request.new_password)
     user_repo.update_user(current_user.id, password_hash=new_password_hash)
 
+    # Invalidate tokens issued with the old password
+    revoke_user_sessions(str(current_user.id))
+    if SESSION_TOKEN_MODE == 'signed':
+        # The revocation also covers the current token, so hand out a fresh one
+        session_token = create_session(str(current_user.id))
+        response.set_cookie(
+            key='session_token',
+            value=session_token,
+            max_age=SESSION_EXPIRY_HOURS * 3600,  # Convert hours to seconds
+            httponly=True,
+            secure=SECURE_COOKIES,
+            samesite='lax',
+            path='/',
+        )
+
     logger.info('Password changed successfully', extra={'user_id': str(current_user.id)})
     return SuccessResponse(code=PASSWORD_CHANGED, details={'user_id': str(current_user.id)})
 
@@ -254,7 +274,7 @@ async def change_username(
     user_repo = get_user_repository(db)
 
     # Verify current password using repository method (handles memory vs database)
-    if not user_repo.verify_password(request.current_password, current_user.password_hash):
+    if not await user_repo.verify_password(request.current_password, current_user.password_hash):
         logger.warning(
             'Username change failed - incorrect password', extra={'user_id': str(current_user.id)}
         )
@@ -309,7 +329,7 @@ async def change_name(
     user_repo = get_user_repository(db)
 
     # Verify current password using repository method (handles memory vs database)
-    if not user_repo.verify_password(request.current_password, current_user.password_hash):
+    if not await user_repo.verify_password(request.current_password, current_user.password_hash):
         logger.warning(
             'Name change failed - incorrect password', extra={'user_id': str(current_user.id)}
         )
@@ -68,13 +68,17 @@ async def get_group_completed_cancelled_runs(
     group_id: str,
     limit: int = Query(10, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    after: str | None = Query(None, description='Last run ID of the previous page'),
     current_user: User = Depends(require_auth),
     db: Session = Depends(get_db),
 ):
-    """Get completed and cancelled runs for a specific group (paginated)."""
+    """Get completed and cancelled runs for a specific group (paginated).
+
+    Supports limit/offset and keyset (after) pagination.
+    """
     service = GroupService(db)
 
-    return service.get_group_completed_cancelled_runs(group_id, current_user, limit, offset)
+    return service.get_group_completed_cancelled_runs(group_id, current_user, limit, offset, after)
 
 
 @router.post('/{group_id}/regenerate-invite', response_model=RegenerateTokenResponse)
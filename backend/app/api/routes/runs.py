@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 
 from app.api.routes.auth import require_auth
@@ -20,6 +20,7 @@ from app.api.websocket_manager import manager
 from app.core.models import User
 from app.infrastructure.database import get_db
 from app.infrastructure.request_context import get_logger
+from app.infrastructure.service_executor import run_service_call
 from app.services import RunService
 
 router = APIRouter(prefix='/runs', tags=['runs'])
@@ -34,7 +35,9 @@ async def create_run(
 ):
     """Create a new run for a group."""
     service = RunService(db)
-    return service.create_run(request.group_id, request.store_id, current_user, request.comment)
+    return await run_service_call(
+        service.create_run, request.group_id, request.store_id, current_user, request.comment
+    )
 
 
 @router.get('/{run_id}', response_model=RunDetailResponse)
@@ -44,7 +47,7 @@ async def get_run_details(
     """Get detailed information about a specific run."""
     service = RunService(db)
 
-    return service.get_run_details(run_id, current_user)
+    return await run_service_call(service.get_run_details, run_id, current_user)
 
 
 @router.post('/{run_id}/bids', response_model=PlaceBidResponse)
@@ -56,7 +59,8 @@ async def place_bid(
 ):
     """Place or update a bid on a product in a run."""
     service = RunService(db)
-    result = service.place_bid(
+    result = await run_service_call(
+        service.place_bid,
         run_id,
         bid_request.product_id,
         bid_request.quantity,
@@ -76,7 +80,7 @@ async def retract_bid(
 ):
     """Retract a bid on a product in a run."""
     service = RunService(db)
-    return service.retract_bid(run_id, product_id, current_user)
+    return await run_service_call(service.retract_bid, run_id, product_id, current_user)
 
 
 @router.post('/{run_id}/ready', response_model=ReadyToggleResponse)
@@ -85,7 +89,7 @@ async def toggle_ready(
 ):
     """Toggle the current user's ready status for a run."""
     service = RunService(db)
-    return service.toggle_ready(run_id, current_user)
+    return await run_service_call(service.toggle_ready, run_id, current_user)
 
 
 @router.post('/{run_id}/force-confirm', response_model=StateChangeResponse)
@@ -97,7 +101,7 @@ async def force_confirm(
     # Set WebSocket manager for broadcasting
     service.notification_service.set_websocket_manager(manager)
 
-    result = service.force_confirm_run(run_id, current_user)
+    result = await run_service_call(service.force_confirm_run, run_id, current_user)
 
     # Broadcast state change using notification service
     await service.notification_service.broadcast_state_change(
@@ -116,7 +120,7 @@ async def start_shopping(
     # Set WebSocket manager for broadcasting
     service.notification_service.set_websocket_manager(manager)
 
-    result = service.start_run(run_id, current_user)
+    result = await run_service_call(service.start_run, run_id, current_user)
 
     # Broadcast state change using notification service
     await service.notification_service.broadcast_state_change(
@@ -142,7 +146,7 @@ async def finish_adjusting(
     # Set WebSocket manager for broadcasting
     service.notification_service.set_websocket_manager(manager)
 
-    result = service.finish_adjusting(run_id, current_user, force)
+    result = await run_service_call(service.finish_adjusting, run_id, current_user, force)
 
     # Broadcast state change using notification service
     await service.notification_service.broadcast_state_change(
@@ -161,7 +165,7 @@ async def toggle_helper(
 ):
     """Toggle helper status for a run participant (leader only)."""
     service = RunService(db)
-    result = service.toggle_helper(run_id, user_id, current_user)
+    result = await run_service_call(service.toggle_helper, run_id, user_id, current_user)
 
     # Broadcast helper status change to all participants
     await manager.broadcast(
@@ -173,12 +177,32 @@ async def toggle_helper(
 
 @router.get('/{run_id}/available-products', response_model=list[AvailableProductResponse])
 async def get_available_products(
-    run_id: str, current_user: User = Depends(require_auth), db: Session = Depends(get_db)
+    run_id: str,
+    search: str | None = Query(None),
+    store_only: bool = Query(False),
+    limit: int = Query(200, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+    after: str | None = Query(None, description='Last product ID of the previous page'),
+    current_user: User = Depends(require_auth),
+    db: Session = Depends(get_db),
 ):
-    """Get products available for bidding (products from the store that don't have bids yet)."""
+    """Get products available for bidding (products that don't have bids yet).
+
+    Products at the run's store come first. Supports name search, limit/offset and
+    keyset (after) pagination.
+    """
     service = RunService(db)
 
-    return service.get_available_products(run_id, current_user)
+    return await run_service_call(
+        service.get_available_products,
+        run_id,
+        current_user,
+        search,
+        store_only,
+        limit,
+        offset,
+        after,
+    )
 
 
 @router.post('/{run_id}/transition-shopping', response_model=StateChangeResponse)
@@ -190,7 +214,7 @@ async def transition_to_shopping(
     # Set WebSocket manager for broadcasting
     service.notification_service.set_websocket_manager(manager)
 
-    result = service.transition_to_shopping(run_id, current_user)
+    result = await run_service_call(service.transition_to_shopping, run_id, current_user)
 
     # Broadcast state change using notification service
     await service.notification_service.broadcast_state_change(
@@ -209,7 +233,7 @@ async def cancel_run(
     # Set WebSocket manager for broadcasting (state service handles state change notifications)
     service.notification_service.set_websocket_manager(manager)
 
-    result = service.cancel_run(run_id, current_user)
+    result = await run_service_call(service.cancel_run, run_id, current_user)
 
     # No additional broadcast needed - state service handles notifications
 
@@ -225,7 +249,9 @@ async def update_run_comment(
 ):
     """Update the comment/description for a run (leader only)."""
     service = RunService(db)
-    result = service.update_run_comment(run_id, request.comment, current_user)
+    result = await run_service_call(
+        service.update_run_comment, run_id, request.comment, current_user
+    )
 
     # Broadcast comment update to all participants
     await manager.broadcast(
@@ -246,4 +272,4 @@ async def export_run_state(
     Returns structured JSON with per-product and per-user breakdowns.
     """
     service = RunService(db)
-    return service.export_run_state(run_id, current_user)
+    return await run_service_call(service.export_run_state, run_id, current_user)
@@ -2,17 +2,18 @@ from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 
 from app.api.routes.auth import require_auth
-from app.api.schemas import (
-    GroupSearchResult,
-    SearchResponse,
-    StoreSearchResult,
-)
+from app.api.schemas import SearchResponse, Suggestion, SuggestResponse
 from app.core.models import User
 from app.infrastructure.database import get_db
-from app.services import ProductService
+from app.infrastructure.service_executor import run_service_call
+from app.infrastructure.suggest_index import suggest_index
+from app.services import SearchService
 
 router = APIRouter(prefix='/search', tags=['search'])
 
+# Suggestions returned per category unless the client asks for a different number
+SUGGESTION_LIMIT = 5
+
 
 @router.get('', response_model=SearchResponse)
 async def search_all(
@@ -24,30 +25,27 @@ async def search_all(
 
     Returns up to 3 results per category.
     """
-    # Search products
-    product_service = ProductService(db)
-    repo = product_service.repo
-    all_products = product_service.search_products(q)
-    products = all_products[:3]  # Limit to 3
-
-    # Search stores
-    all_stores = repo.search_stores(q)
-    stores = [
-        StoreSearchResult(id=str(store.id), name=store.name, address=store.address)
-        for store in all_stores[:3]  # Limit to 3
-    ]
-
-    # Search groups (only user's groups - Group objects from repository)
-    user_groups = repo.get_user_groups(current_user)
-    matching_groups = []
-    for group in user_groups:
-        if q.lower() in group.name.lower():
-            # Group object has members relationship set up by repository
-            member_count = len(group.members)
-            matching_groups.append(
-                GroupSearchResult(id=str(group.id), name=group.name, member_count=member_count)
-            )
-            if len(matching_groups) >= 3:
-                break
-
-    return SearchResponse(products=products, stores=stores, groups=matching_groups)
+    service = SearchService(db)
+    return await run_service_call(service.search_all, q, current_user)
+
+
+@router.get('/suggest', response_model=SuggestResponse)
+async def suggest(
+    q: str = Query(..., min_length=1, description='Name prefix'),
+    limit: int = Query(SUGGESTION_LIMIT, ge=1, le=20, description='Suggestions per category'),
+    current_user: User = Depends(require_auth),
+):
+    """Product and store names starting with the prefix, for typeahead.
+
+    Served from the in-process prefix index without touching the database.
+    """
+    return SuggestResponse(
+        products=[
+            Suggestion(id=str(key), name=name)
+            for key, name in suggest_index.products.suggest(q, limit)
+        ],
+        stores=[
+            Suggestion(id=str(key), name=name)
+            for key, name in suggest_index.stores.suggest(q, limit)
+        ],
+    )
@@ -1,11 +1,22 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from uuid import UUID
+
 from fastapi import APIRouter, Cookie, Depends, HTTPException, WebSocket, WebSocketDisconnect
 from sqlalchemy.orm import Session
 
 from app.api.websocket_manager import manager
+from app.core.models import User
 from app.infrastructure.auth import get_session
+from app.infrastructure.config import REPO_MODE
 from app.infrastructure.database import get_db
 from app.infrastructure.request_context import get_logger
-from app.repositories import get_user_repository, get_group_repository, get_run_repository
+from app.repositories import (
+    get_async_group_repository,
+    get_async_run_repository,
+    get_async_user_repository,
+    get_user_repository,
+)
 
 router = APIRouter()
 logger = get_logger(__name__)
@@ -22,7 +33,7 @@ async def get_current_user_ws(
     if not session_data:
         raise HTTPException(status_code=401, detail='Invalid or expired session')
 
-    user_repo = get_user_repository(db); group_repo = get_group_repository(db); run_repo = get_run_repository(db)
+    user_repo = get_user_repository(db)
     user = user_repo.get_user_by_id(session_data['user_id'])
     if not user:
         raise HTTPException(status_code=401, detail='User not found')
@@ -30,98 +41,80 @@ async def get_current_user_ws(
     return user
 
 
-@router.websocket('/ws/groups/{group_id}')
-async def websocket_group_endpoint(websocket: WebSocket, group_id: str) -> None:
-    """WebSocket endpoint for group-level updates (new runs, run state changes)."""
-    # IMPORTANT: Accept the WebSocket connection FIRST
-    await websocket.accept()
+def _get_websocket_session_token(websocket: WebSocket) -> str | None:
+    """Extract the session token from the cookie header, falling back to the query string.
 
-    try:
-        # Get database session manually
-        from app.infrastructure.database import SessionLocal
-
-        db = SessionLocal()
+    The token is resolved through the shared session store by `get_session`, so a
+    WebSocket can be authenticated by any worker, not just the one that handled login.
+    """
+    if 'cookie' in websocket.headers:
+        for cookie in websocket.headers['cookie'].split(';'):
+            if 'session_token=' in cookie:
+                return cookie.split('session_token=')[1].strip()
 
-        # Try to get session token from cookie or query parameter
-        session_token = None
+    return websocket.query_params.get('session_token')
 
-        logger.debug('WebSocket connection attempt', extra={'endpoint': 'group', 'group_id': group_id})
 
-        # Try cookie first
-        if 'cookie' in websocket.headers:
-            cookies = websocket.headers['cookie']
-            for cookie in cookies.split(';'):
-                if 'session_token=' in cookie:
-                    session_token = cookie.split('session_token=')[1].strip()
-                    break
+@asynccontextmanager
+async def _websocket_db() -> AsyncIterator:
+    """Open a database session for the WebSocket handshake.
 
-        # If no cookie, try query parameter
-        if not session_token and 'session_token' in websocket.query_params:
-            session_token = websocket.query_params['session_token']
+    The session is only held while authenticating; it is closed before the
+    long-lived receive loop so idle sockets don't pin pooled connections.
+    """
+    if REPO_MODE == 'async':
+        from app.infrastructure.async_database import AsyncSessionLocal
 
-        # Authenticate user
-        if not session_token:
-            logger.warning('WebSocket auth failed: No session token', extra={'group_id': group_id})
-            await websocket.close(code=1008, reason='Not authenticated - no session token')
-            return
-
-        session_data = get_session(session_token)
-        if not session_data:
-            logger.warning('WebSocket auth failed: Invalid session', extra={'group_id': group_id})
-            await websocket.close(code=1008, reason='Invalid or expired session')
-            return
-
-        user_repo = get_user_repository(db); group_repo = get_group_repository(db); run_repo = get_run_repository(db)
-        user_id = session_data['user_id']
-
-        # Convert to UUID if it's a string
-        if isinstance(user_id, str):
-            from uuid import UUID
+        async with AsyncSessionLocal() as db:
+            yield db
+    else:
+        from app.infrastructure.database import SessionLocal
 
-            user_id = UUID(user_id)
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
 
-        user = user_repo.get_user_by_id(user_id)
-        if not user:
-            logger.warning('WebSocket auth failed: User not found', extra={'user_id': str(user_id), 'group_id': group_id})
-            await websocket.close(code=1008, reason='User not found')
-            return
 
-        # Verify user is member of group
-        # Convert group_id to UUID
-        if isinstance(group_id, str):
-            from uuid import UUID
+async def _authenticate_websocket(websocket: WebSocket, db, log_extra: dict) -> User | None:
+    """Resolve the WebSocket's session to a user, closing the socket on failure."""
+    session_token = _get_websocket_session_token(websocket)
+    if not session_token:
+        logger.warning('WebSocket auth failed: No session token', extra=log_extra)
+        await websocket.close(code=1008, reason='Not authenticated - no session token')
+        return None
 
-            group_id_uuid = UUID(group_id)
-        else:
-            group_id_uuid = group_id
+    session_data = get_session(session_token)
+    if not session_data:
+        logger.warning('WebSocket auth failed: Invalid session', extra=log_extra)
+        await websocket.close(code=1008, reason='Invalid or expired session')
+        return None
 
-        group = group_repo.get_group_by_id(group_id_uuid)
-        if not group:
-            logger.warning('WebSocket auth failed: Group not found', extra={'user_id': str(user_id), 'group_id': group_id})
-            await websocket.close(code=1008, reason='Group not found')
-            return
+    user_id = UUID(session_data['user_id'])
+    user = await get_async_user_repository(db).get_user_by_id(user_id)
+    if not user:
+        logger.warning(
+            'WebSocket auth failed: User not found', extra={'user_id': str(user_id), **log_extra}
+        )
+        await websocket.close(code=1008, reason='User not found')
+        return None
 
-        # Check if user is member of group
-        user_groups = user_repo.get_user_groups(user)
-        is_member = any(g.id == group_id_uuid for g in user_groups)
-        if not is_member:
-            logger.warning('WebSocket auth failed: Not a member', extra={'user_id': str(user_id), 'group_id': group_id})
-            await websocket.close(code=1008, reason='Not a member of this group')
-            return
+    return user
 
-        logger.info('WebSocket connected', extra={'user_id': str(user_id), 'group_id': group_id, 'endpoint': 'group'})
 
-        # Connect to room
-        room_id = f'group:{group_id}'
-        # Don't call manager.connect again since we already accepted
-        if room_id not in manager.active_connections:
-            manager.active_connections[room_id] = set()
-        manager.active_connections[room_id].add(websocket)
+async def _serve_room(websocket: WebSocket, room_id: str) -> None:
+    """Join a room and answer heartbeats until the client disconnects."""
+    # Don't call manager.connect again since we already accepted
+    if room_id not in manager.active_connections:
+        manager.active_connections[room_id] = set()
+    manager.active_connections[room_id].add(websocket)
 
-        # Send connection confirmation
-        await manager.send_personal(websocket, {'type': 'connected', 'data': {'room': room_id}})
+    # Send connection confirmation
+    await manager.send_personal(websocket, {'type': 'connected', 'data': {'room': room_id}})
 
-        # Keep connection alive and listen for disconnection
+    # Keep connection alive and listen for disconnection
+    try:
         while True:
             # Receive messages (for heartbeat/ping-pong)
             data = await websocket.receive_text()
@@ -129,114 +122,93 @@ async def websocket_group_endpoint(websocket: WebSocket, group_id: str) -> None:
             # Echo back for heartbeat
             if data == 'ping':
                 await websocket.send_text('pong')
-
-    except WebSocketDisconnect:
-        manager.disconnect(websocket, room_id)
-        logger.debug('WebSocket disconnected', extra={'group_id': group_id, 'endpoint': 'group'})
     finally:
-        db.close()
+        manager.disconnect(websocket, room_id)
 
 
-@router.websocket('/ws/runs/{run_id}')
-async def websocket_run_endpoint(websocket: WebSocket, run_id: str) -> None:
-    """WebSocket endpoint for run-level updates (bids, ready status, state changes)."""
+@router.websocket('/ws/groups/{group_id}')
+async def websocket_group_endpoint(websocket: WebSocket, group_id: str) -> None:
+    """WebSocket endpoint for group-level updates (new runs, run state changes)."""
     # IMPORTANT: Accept the WebSocket connection FIRST
     await websocket.accept()
 
-    try:
-        # Get database session manually
-        from app.infrastructure.database import SessionLocal
+    logger.debug('WebSocket connection attempt', extra={'endpoint': 'group', 'group_id': group_id})
 
-        db = SessionLocal()
+    async with _websocket_db() as db:
+        user = await _authenticate_websocket(websocket, db, {'group_id': group_id})
+        if not user:
+            return
 
-        # Try to get session token from cookie or query parameter
-        session_token = None
-
-        # Try cookie first
-        if 'cookie' in websocket.headers:
-            cookies = websocket.headers['cookie']
-            for cookie in cookies.split(';'):
-                if 'session_token=' in cookie:
-                    session_token = cookie.split('session_token=')[1].strip()
-                    break
-
-        # If no cookie, try query parameter
-        if not session_token and 'session_token' in websocket.query_params:
-            session_token = websocket.query_params['session_token']
-
-        # Authenticate user
-        if not session_token:
-            logger.warning('WebSocket auth failed: No session token', extra={'run_id': str(run_id)})
-            await websocket.close(code=1008, reason='Not authenticated')
+        group_id_uuid = UUID(group_id)
+        group = await get_async_group_repository(db).get_group_by_id(group_id_uuid)
+        if not group:
+            logger.warning(
+                'WebSocket auth failed: Group not found',
+                extra={'user_id': str(user.id), 'group_id': group_id},
+            )
+            await websocket.close(code=1008, reason='Group not found')
             return
 
-        session_data = get_session(session_token)
-        if not session_data:
-            logger.warning('WebSocket auth failed: Invalid session', extra={'run_id': str(run_id)})
-            await websocket.close(code=1008, reason='Invalid or expired session')
+        # Check if user is member of group
+        user_groups = await get_async_user_repository(db).get_user_groups(user)
+        if not any(g.id == group_id_uuid for g in user_groups):
+            logger.warning(
+                'WebSocket auth failed: Not a member',
+                extra={'user_id': str(user.id), 'group_id': group_id},
+            )
+            await websocket.close(code=1008, reason='Not a member of this group')
             return
 
-        user_repo = get_user_repository(db); group_repo = get_group_repository(db); run_repo = get_run_repository(db)
-        user_id = session_data['user_id']
+    logger.info(
+        'WebSocket connected',
+        extra={'user_id': str(user.id), 'group_id': group_id, 'endpoint': 'group'},
+    )
 
-        # Convert to UUID if it's a string
-        if isinstance(user_id, str):
-            from uuid import UUID
+    try:
+        await _serve_room(websocket, f'group:{group_id}')
+    except WebSocketDisconnect:
+        logger.debug('WebSocket disconnected', extra={'group_id': group_id, 'endpoint': 'group'})
 
-            user_id = UUID(user_id)
 
-        user = user_repo.get_user_by_id(user_id)
+@router.websocket('/ws/runs/{run_id}')
+async def websocket_run_endpoint(websocket: WebSocket, run_id: str) -> None:
+    """WebSocket endpoint for run-level updates (bids, ready status, state changes)."""
+    # IMPORTANT: Accept the WebSocket connection FIRST
+    await websocket.accept()
+
+    async with _websocket_db() as db:
+        user = await _authenticate_websocket(websocket, db, {'run_id': run_id})
         if not user:
-            logger.warning('WebSocket auth failed: User not found', extra={'user_id': str(user_id), 'run_id': str(run_id)})
-            await websocket.close(code=1008, reason='User not found')
             return
 
-        # Verify run exists and user has access
-        # Convert run_id to UUID too
-        if isinstance(run_id, str):
-            from uuid import UUID
-
-            run_id = UUID(run_id)
-
-        run = run_repo.get_run_by_id(run_id)
+        run = await get_async_run_repository(db).get_run_by_id(UUID(run_id))
         if not run:
-            logger.warning('WebSocket auth failed: Run not found', extra={'user_id': str(user_id), 'run_id': str(run_id)})
+            logger.warning(
+                'WebSocket auth failed: Run not found',
+                extra={'user_id': str(user.id), 'run_id': run_id},
+            )
             await websocket.close(code=1008, reason='Run not found')
             return
 
         # Check if user is in the group that owns this run
-        user_groups = user_repo.get_user_groups(user)
+        user_groups = await get_async_user_repository(db).get_user_groups(user)
         if not any(g.id == run.group_id for g in user_groups):
-            logger.warning('WebSocket auth failed: Not authorized', extra={'user_id': str(user_id), 'run_id': str(run_id)})
+            logger.warning(
+                'WebSocket auth failed: Not authorized',
+                extra={'user_id': str(user.id), 'run_id': run_id},
+            )
             await websocket.close(code=1008, reason='Not authorized for this run')
             return
 
-        logger.info('WebSocket connected', extra={'user_id': str(user_id), 'run_id': str(run_id), 'endpoint': 'run'})
-
-        # Connect to room
-        room_id = f'run:{run_id}'
-        # Don't call manager.connect again since we already accepted
-        if room_id not in manager.active_connections:
-            manager.active_connections[room_id] = set()
-        manager.active_connections[room_id].add(websocket)
-
-        # Send connection confirmation
-        await manager.send_personal(websocket, {'type': 'connected', 'data': {'room': room_id}})
-
-        # Keep connection alive and listen for disconnection
-        while True:
-            # Receive messages (for heartbeat/ping-pong)
-            data = await websocket.receive_text()
-
-            # Echo back for heartbeat
-            if data == 'ping':
-                await websocket.send_text('pong')
+    logger.info(
+        'WebSocket connected',
+        extra={'user_id': str(user.id), 'run_id': run_id, 'endpoint': 'run'},
+    )
 
+    try:
+        await _serve_room(websocket, f'run:{run.id}')
     except WebSocketDisconnect:
-        manager.disconnect(websocket, room_id)
-        logger.debug('WebSocket disconnected', extra={'run_id': str(run_id), 'endpoint': 'run'})
-    finally:
-        db.close()
+        logger.debug('WebSocket disconnected', extra={'run_id': run_id, 'endpoint': 'run'})
 
 
 @router.websocket('/ws/user')
@@ -245,77 +217,14 @@ async def websocket_user_endpoint(websocket: WebSocket) -> None:
     # IMPORTANT: Accept the WebSocket connection FIRST
     await websocket.accept()
 
-    try:
-        # Get database session manually
-        from app.infrastructure.database import SessionLocal
-
-        db = SessionLocal()
-
-        # Try to get session token from cookie or query parameter
-        session_token = None
-
-        # Try cookie first
-        if 'cookie' in websocket.headers:
-            cookies = websocket.headers['cookie']
-            for cookie in cookies.split(';'):
-                if 'session_token=' in cookie:
-                    session_token = cookie.split('session_token=')[1].strip()
-                    break
-
-        # If no cookie, try query parameter
-        if not session_token and 'session_token' in websocket.query_params:
-            session_token = websocket.query_params['session_token']
-
-        # Authenticate user
-        if not session_token:
-            logger.warning('WebSocket auth failed: No session token', extra={'endpoint': 'user'})
-            await websocket.close(code=1008, reason='Not authenticated')
-            return
-
-        session_data = get_session(session_token)
-        if not session_data:
-            logger.warning('WebSocket auth failed: Invalid session', extra={'endpoint': 'user'})
-            await websocket.close(code=1008, reason='Invalid or expired session')
-            return
-
-        user_repo = get_user_repository(db); group_repo = get_group_repository(db); run_repo = get_run_repository(db)
-        user_id = session_data['user_id']
-
-        # Convert to UUID if it's a string
-        if isinstance(user_id, str):
-            from uuid import UUID
-
-            user_id = UUID(user_id)
-
-        user = user_repo.get_user_by_id(user_id)
+    async with _websocket_db() as db:
+        user = await _authenticate_websocket(websocket, db, {'endpoint': 'user'})
         if not user:
-            logger.warning('WebSocket auth failed: User not found', extra={'user_id': str(user_id), 'endpoint': 'user'})
-            await websocket.close(code=1008, reason='User not found')
             return
 
-        logger.info('WebSocket connected', extra={'user_id': str(user_id), 'endpoint': 'user'})
-
-        # Connect to user-specific room
-        room_id = f'user:{user_id}'
-        if room_id not in manager.active_connections:
-            manager.active_connections[room_id] = set()
-        manager.active_connections[room_id].add(websocket)
-
-        # Send connection confirmation
-        await manager.send_personal(websocket, {'type': 'connected', 'data': {'room': room_id}})
-
-        # Keep connection alive and listen for disconnection
-        while True:
-            # Receive messages (for heartbeat/ping-pong)
-            data = await websocket.receive_text()
-
-            # Echo back for heartbeat
-            if data == 'ping':
-                await websocket.send_text('pong')
+    logger.info('WebSocket connected', extra={'user_id': str(user.id), 'endpoint': 'user'})
 
+    try:
+        await _serve_room(websocket, f'user:{user.id}')
     except WebSocketDisconnect:
-        room_id_disconnect = f'user:{user_id}'
-        manager.disconnect(websocket, room_id_disconnect)
-        logger.debug('WebSocket disconnected', extra={'user_id': str(user_id), 'endpoint': 'user'})
-    finally:
-        db.close()
+        logger.debug('WebSocket disconnected', extra={'user_id': str(user.id), 'endpoint': 'user'})
@@ -82,6 +82,8 @@ from .search_schemas import (
     GroupSearchResult,
     SearchResponse,
     StoreSearchResult,
+    Suggestion,
+    SuggestResponse,
 )
 from .shopping_schemas import (
     AddMorePurchaseRequest,
@@ -120,6 +122,8 @@ __all__ = [
     'StoreSearchResult',
     'GroupSearchResult',
     'SearchResponse',
+    'SuggestResponse',
+    'Suggestion',
     # Admin schemas
     'AdminUserResponse',
     'AdminProductResponse',
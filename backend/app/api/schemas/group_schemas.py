@@ -65,6 +65,7 @@ class RunResponse(BaseModel):
     state: str
     leader_name: str
     leader_is_removed: bool = False
+    participant_count: int = 0
     planned_on: str | None
     planning_at: str | None
     active_at: str | None
@@ -27,3 +27,17 @@ class SearchResponse(BaseModel):
     products: list[ProductSearchResult]
     stores: list[StoreSearchResult]
     groups: list[GroupSearchResult]
+
+
+class Suggestion(BaseModel):
+    """Typeahead suggestion for a product or store name."""
+
+    id: str
+    name: str
+
+
+class SuggestResponse(BaseModel):
+    """Response model for name suggestions."""
+
+    products: list[Suggestion]
+    stores: list[Suggestion]
@@ -0,0 +1,158 @@
+"""Exact allocation of purchased quantities and costs across bids.
+
+Quantities and prices are stored as DECIMAL(10, 2). The allocation works on them as
+integers in minor units (hundredths of a unit, cents) and splits totals with the
+largest-remainder method, so the shares of a split always add up to its total
+exactly - no float rounding and no remainder dumped on the last bidder.
+"""
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from decimal import ROUND_HALF_UP, Decimal
+from uuid import UUID
+
+# Minor units per unit for quantities and prices (two decimal places)
+MINOR_UNITS = 100
+_MINOR_UNIT = Decimal(1) / MINOR_UNITS
+
+
+def to_minor_units(value: Decimal | float | int | None) -> int:
+    """Convert a quantity or amount to integer minor units (rounding half up)."""
+    if value is None:
+        return 0
+    if not isinstance(value, Decimal):
+        value = Decimal(str(value))
+    return int(value.quantize(_MINOR_UNIT, rounding=ROUND_HALF_UP) * MINOR_UNITS)
+
+
+def from_minor_units(units: int) -> Decimal:
+    """Convert integer minor units back to a two-place Decimal."""
+    return (Decimal(units) / MINOR_UNITS).quantize(_MINOR_UNIT)
+
+
+def largest_remainder_split(total: int, weights: Sequence[int]) -> list[int]:
+    """Split a non-negative integer total proportionally to non-negative integer weights.
+
+    Every share gets the floor of its exact quota; the units left over go one each to
+    the shares with the largest remainders (earlier shares win ties). The shares sum
+    to total exactly. With all weights zero, every share is zero.
+    """
+    total_weight = sum(weights)
+    if total_weight == 0:
+        return [0] * len(weights)
+
+    shares = []
+    remainders = []
+    for weight in weights:
+        share, remainder = divmod(total * weight, total_weight)
+        shares.append(share)
+        remainders.append(remainder)
+
+    leftover = total - sum(shares)
+    if leftover:
+        by_remainder = sorted(range(len(weights)), key=lambda i: -remainders[i])
+        for i in by_remainder[:leftover]:
+            shares[i] += 1
+    return shares
+
+
+def cost_in_cents(price_per_unit_cents: int, quantity_units: int) -> int:
+    """Cost in cents of a quantity in hundredths at a price in cents (rounding half up)."""
+    cost, remainder = divmod(price_per_unit_cents * quantity_units, MINOR_UNITS)
+    return cost + (1 if remainder * 2 >= MINOR_UNITS else 0)
+
+
+def split_cost(
+    price_per_unit: Decimal | float | None, quantities: Sequence[Decimal | float]
+) -> list[Decimal]:
+    """Split the cost of several quantities bought at one price.
+
+    The total is the price times the summed quantity, rounded once to the cent, and
+    each quantity gets its largest-remainder share of it.
+    """
+    quantity_units = [to_minor_units(quantity) for quantity in quantities]
+    total = cost_in_cents(to_minor_units(price_per_unit), sum(quantity_units))
+    return [from_minor_units(cents) for cents in largest_remainder_split(total, quantity_units)]
+
+
+@dataclass(frozen=True)
+class BidAllocation:
+    """Quantity and cost allocated to one bid."""
+
+    bid_id: UUID
+    quantity: Decimal
+    price_per_unit: Decimal | None
+    cost: Decimal
+
+    def as_update(self) -> dict:
+        """Values for a bulk bid update."""
+        return {
+            'id': self.bid_id,
+            'distributed_quantity': self.quantity,
+            'distributed_price_per_unit': self.price_per_unit,
+        }
+
+
+def allocate_purchase(
+    purchased_quantity: Decimal | float,
+    price_per_unit: Decimal | float | None,
+    bids: Sequence[tuple[UUID, Decimal | float]],
+) -> list[BidAllocation]:
+    """Allocate one purchased product across its bids.
+
+    When the bids ask for no more than was bought, each gets its full quantity (any
+    surplus is left to the caller). When they ask for more, the purchased quantity is
+    split in proportion to the requested quantities. The cost of the allocated
+    quantity is split the same way, so the bids' costs sum to the purchase cost.
+
+    Args:
+        purchased_quantity: Quantity bought
+        price_per_unit: Price paid per unit (None if unknown)
+        bids: (bid ID, requested quantity) pairs, in a stable order
+
+    Returns:
+        One allocation per bid, in the given order
+    """
+    requested = [to_minor_units(quantity) for _, quantity in bids]
+    purchased = to_minor_units(purchased_quantity)
+    quantities = (
+        largest_remainder_split(purchased, requested) if sum(requested) > purchased else requested
+    )
+
+    price_cents = to_minor_units(price_per_unit)
+    costs = largest_remainder_split(cost_in_cents(price_cents, sum(quantities)), quantities)
+    price = from_minor_units(price_cents) if price_per_unit is not None else None
+
+    return [
+        BidAllocation(
+            bid_id=bid_id,
+            quantity=from_minor_units(quantity),
+            price_per_unit=price,
+            cost=from_minor_units(cost),
+        )
+        for (bid_id, _), quantity, cost in zip(bids, quantities, costs, strict=True)
+    ]
+
+
+def allocate_run(
+    purchases: Iterable[
+        tuple[Decimal | float, Decimal | float | None, Sequence[tuple[UUID, Decimal | float]]]
+    ],
+) -> list[BidAllocation]:
+    """Allocate every purchased product of a run across its bids.
+
+    Each purchase is allocated as by allocate_purchase; products never share bids, so
+    the results are independent of each other.
+
+    Args:
+        purchases: (purchased quantity, price per unit, bids) per purchased product, with
+            bids as for allocate_purchase
+
+    Returns:
+        One allocation per bid, product by product in the given order
+    """
+    return [
+        allocation
+        for purchased_quantity, price_per_unit, bids in purchases
+        for allocation in allocate_purchase(purchased_quantity, price_per_unit, bids)
+    ]
@@ -216,6 +216,7 @@ HELPER_NOT_GROUP_MEMBER = 'HELPER_NOT_GROUP_MEMBER'
 
 DATABASE_SESSION_REQUIRED = 'DATABASE_SESSION_REQUIRED'
 INVALID_REPO_MODE = 'INVALID_REPO_MODE'
+INVALID_SESSION_BACKEND = 'INVALID_SESSION_BACKEND'
 CONFIGURATION_ERROR = 'CONFIGURATION_ERROR'
 
 
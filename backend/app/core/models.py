@@ -1,8 +1,10 @@
 import uuid
 
 from sqlalchemy import (
+    DDL,
     DECIMAL,
     JSON,
+    BigInteger,
     Boolean,
     Column,
     DateTime,
@@ -12,6 +14,7 @@ from sqlalchemy import (
     String,
     Table,
     Text,
+    event,
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.ext.declarative import declarative_base
@@ -22,6 +25,13 @@ from app.core.run_state import RunState
 
 Base = declarative_base()
 
+# Trigram indexes for name search need the pg_trgm extension (PostgreSQL only)
+event.listen(
+    Base.metadata,
+    'before_create',
+    DDL('CREATE EXTENSION IF NOT EXISTS pg_trgm').execute_if(dialect='postgresql'),
+)
+
 group_membership = Table(
     'group_membership',
     Base.metadata,
@@ -66,6 +76,11 @@ class User(Base):
         'Notification', back_populates='user', order_by='desc(Notification.created_at)'
     )
 
+    __table_args__ = (
+        # Keyset pagination of the admin list, newest first
+        Index('ix_users_created_id', 'created_at', 'id'),
+    )
+
 
 class Group(Base):
     """Group model representing friend groups for coordinated shopping."""
@@ -85,6 +100,11 @@ class Group(Base):
     members = relationship('User', secondary=group_membership, back_populates='groups')
     runs = relationship('Run', back_populates='group')
 
+    __table_args__ = (
+        # Keyset pagination of the admin list, newest first
+        Index('ix_groups_created_id', 'created_at', 'id'),
+    )
+
 
 class Store(Base):
     """Store model representing physical retail locations."""
@@ -107,6 +127,18 @@ class Store(Base):
     verifier = relationship('User', foreign_keys=[verified_by], back_populates='verified_stores')
     product_availabilities = relationship('ProductAvailability', back_populates='store')
 
+    __table_args__ = (
+        # Keyset pagination of the admin list, newest first
+        Index('ix_stores_created_id', 'created_at', 'id'),
+        # Trigram index for similarity and substring name search
+        Index(
+            'ix_stores_name_trgm',
+            'name',
+            postgresql_using='gin',
+            postgresql_ops={'name': 'gin_trgm_ops'},
+        ).ddl_if(dialect='postgresql'),
+    )
+
 
 class Run(Base):
     """Run model representing a shopping run coordinated by a group."""
@@ -163,6 +195,18 @@ class Product(Base):
     verifier = relationship('User', foreign_keys=[verified_by], back_populates='verified_products')
     availabilities = relationship('ProductAvailability', back_populates='product')
 
+    __table_args__ = (
+        # Keyset pagination of the admin list, newest first
+        Index('ix_products_created_id', 'created_at', 'id'),
+        # Trigram index for similarity and substring name search
+        Index(
+            'ix_products_name_trgm',
+            'name',
+            postgresql_using='gin',
+            postgresql_ops={'name': 'gin_trgm_ops'},
+        ).ddl_if(dialect='postgresql'),
+    )
+
 
 class RunParticipation(Base):
     """RunParticipation model tracking user participation in shopping runs."""
@@ -340,3 +384,30 @@ class AppSettings(Base):
     key = Column(String, primary_key=True)
     value = Column(String, nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
+class UserSession(Base):
+    """Login session shared between API workers (used when SESSION_BACKEND=database)."""
+
+    __tablename__ = 'user_sessions'
+
+    token = Column(String, primary_key=True)
+    user_id = Column(String, nullable=False, index=True)
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
+    created_at = Column(DateTime(timezone=True), nullable=False)
+
+
+class SessionRevocation(Base):
+    """Revoked signed session tokens, shared between API workers.
+
+    ``key`` is ``jti:<token id>`` (logout) or ``user:<user id>`` (password change); tokens
+    matching the key and issued at or before ``cutoff`` (microseconds) are rejected.
+    Workers fetch the entries revoked since their last sync by ``revoked_at``.
+    """
+
+    __tablename__ = 'session_revocations'
+
+    key = Column(String, primary_key=True)
+    cutoff = Column(BigInteger, nullable=False)
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
+    revoked_at = Column(DateTime(timezone=True), nullable=False, index=True)
@@ -7,8 +7,7 @@ from app.infrastructure.request_context import get_logger
 from ..domain_events import RunStateChangedEvent
 
 if TYPE_CHECKING:
-    from app.repositories.database.notification import DatabaseNotificationRepository
-    from app.repositories.memory.notification import MemoryNotificationRepository
+    from app.infrastructure.notification_writer import NotificationWriter
 
 logger = get_logger(__name__)
 
@@ -16,28 +15,25 @@ logger = get_logger(__name__)
 class NotificationEventHandler:
     """Handles domain events by creating database notifications.
 
-    This handler translates domain events into user notifications
-    stored in the database.
+    This handler translates domain events into user notifications. They are queued on
+    the notification writer, which stores them in batches.
     """
 
-    def __init__(self, notification_repo: "DatabaseNotificationRepository | MemoryNotificationRepository") -> None:
-        """Initialize handler with notification repository.
+    def __init__(self, notification_writer: 'NotificationWriter') -> None:
+        """Initialize handler with the notification writer.
 
         Args:
-            notification_repo: Notification repository for database operations
+            notification_writer: Buffered writer the notifications are queued on
         """
-        self._notification_repo = notification_repo
+        self._notification_writer = notification_writer
 
     async def handle_run_state_changed(self, event: RunStateChangedEvent) -> None:
-        """Create notifications for all participants when run state changes.
+        """Queue a notification for all participants when run state changes.
 
         Args:
             event: RunStateChangedEvent containing state change details
         """
         try:
-            # Get all participants of this run
-            participations = self._notification_repo.get_run_participations(event.run_id)
-
             notification_data = {
                 'run_id': str(event.run_id),
                 'store_name': event.store_name,
@@ -46,24 +42,22 @@ class NotificationEventHandler:
                 'group_id': str(event.group_id),
             }
 
-            # Create notification for each participant
-            for participation in participations:
-                self._notification_repo.create_notification(
-                    user_id=participation.user_id, type='run_state_changed', data=notification_data
-                )
+            # Participants are resolved when the writer flushes
+            self._notification_writer.enqueue_for_run(
+                event.run_id, 'run_state_changed', notification_data
+            )
 
             logger.debug(
-                'Created notifications for run state change',
+                'Queued notifications for run state change',
                 extra={
                     'run_id': str(event.run_id),
                     'old_state': event.old_state,
                     'new_state': event.new_state,
-                    'participant_count': len(participations),
                 },
             )
         except Exception as e:
             logger.error(
-                'Failed to create notifications for run state change',
+                'Failed to queue notifications for run state change',
                 extra={
                     'run_id': str(event.run_id),
                     'old_state': event.old_state,
@@ -0,0 +1,109 @@
+"""Async database engine and session factory (SQLAlchemy asyncio).
+
+Used by the async repositories when REPO_MODE=async. The engine is created lazily on
+first use so that importing this module never requires the async driver (asyncpg for
+PostgreSQL, installed with the ``async`` extra) unless async mode is actually enabled.
+"""
+
+from collections.abc import AsyncGenerator
+
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from app.core import error_codes
+from app.core.exceptions import ConfigurationError
+from app.infrastructure.database import (
+    DATABASE_URL,
+    MAX_OVERFLOW,
+    POOL_RECYCLE,
+    POOL_SIZE,
+    POOL_TIMEOUT,
+)
+from app.infrastructure.request_context import get_logger
+
+logger = get_logger(__name__)
+
+# Sync driver -> async driver for the same database
+_ASYNC_DRIVERS = {
+    'postgresql': 'postgresql+asyncpg',
+    'postgresql+psycopg2': 'postgresql+asyncpg',
+    'postgres': 'postgresql+asyncpg',
+    'sqlite': 'sqlite+aiosqlite',
+}
+
+_async_engine: AsyncEngine | None = None
+_async_session_factory: async_sessionmaker[AsyncSession] | None = None
+
+
+def get_async_database_url(url: str) -> str:
+    """Convert a sync database URL to its async driver equivalent.
+
+    URLs that already name an async driver are returned unchanged.
+    """
+    scheme, sep, rest = url.partition('://')
+    return f'{_ASYNC_DRIVERS.get(scheme, scheme)}{sep}{rest}'
+
+
+def get_async_engine() -> AsyncEngine:
+    """Get or create the async engine."""
+    global _async_engine
+    if _async_engine is None:
+        url = get_async_database_url(DATABASE_URL)
+        try:
+            if url.startswith('sqlite'):
+                _async_engine = create_async_engine(url)
+            else:
+                _async_engine = create_async_engine(
+                    url,
+                    pool_size=POOL_SIZE,
+                    max_overflow=MAX_OVERFLOW,
+                    pool_timeout=POOL_TIMEOUT,
+                    pool_recycle=POOL_RECYCLE,
+                    pool_pre_ping=True,
+                )
+        except ImportError as e:
+            raise ConfigurationError(
+                code=error_codes.CONFIGURATION_ERROR,
+                message=f'REPO_MODE=async requires the {e.name} driver (install bulq[async])',
+                repo_mode='async',
+            ) from e
+        logger.info('Async database engine created', extra={'driver': url.partition('://')[0]})
+    return _async_engine
+
+
+def get_async_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Get or create the async session factory.
+
+    Objects are not expired on commit, so attributes stay readable after a write
+    without an implicit (and in async code, forbidden) lazy refresh.
+    """
+    global _async_session_factory
+    if _async_session_factory is None:
+        _async_session_factory = async_sessionmaker(
+            get_async_engine(), autoflush=False, expire_on_commit=False
+        )
+    return _async_session_factory
+
+
+def AsyncSessionLocal() -> AsyncSession:  # noqa: N802 - mirrors SessionLocal
+    """Create a new async session."""
+    return get_async_session_factory()()
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """Dependency to get an async database session."""
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+async def dispose_async_engine() -> None:
+    """Close all pooled async connections."""
+    global _async_engine, _async_session_factory
+    if _async_engine is not None:
+        await _async_engine.dispose()
+    _async_engine = None
+    _async_session_factory = None
@@ -3,13 +3,47 @@ from datetime import UTC, datetime, timedelta
 
 import bcrypt
 
-from app.infrastructure.config import SESSION_EXPIRY_HOURS
+from app.infrastructure.config import (
+    SESSION_CLEANUP_BATCH_SIZE,
+    SESSION_EXPIRY_HOURS,
+    SESSION_TOKEN_MODE,
+)
 from app.infrastructure.request_context import get_logger
+from app.infrastructure.session_store import (
+    MemorySessionStore,
+    SessionStore,
+    create_session_store,
+)
+from app.infrastructure.signed_tokens import (
+    RevocationSet,
+    decode_signed_token,
+    encode_signed_token,
+)
 
 logger = get_logger(__name__)
 
-# In-memory session storage (use Redis in production)
-sessions: dict[str, dict] = {}
+# Shared session store, selected by SESSION_BACKEND
+_session_store: SessionStore = create_session_store()
+
+# Backing dict of the in-memory backend (empty and unused with other backends)
+sessions: dict[str, dict] = (
+    _session_store.sessions if isinstance(_session_store, MemorySessionStore) else {}
+)
+
+# Revoked signed tokens, recorded in the shared session store and checked against an
+# in-process copy synced from it (SESSION_TOKEN_MODE=signed)
+revoked_tokens = RevocationSet(lambda: _session_store)
+
+
+def get_session_store() -> SessionStore:
+    """Get the active session store."""
+    return _session_store
+
+
+def set_session_store(store: SessionStore) -> None:
+    """Replace the active session store (used by tests and alternative deployments)."""
+    global _session_store
+    _session_store = store
 
 
 def hash_password(password: str) -> str:
@@ -27,57 +61,87 @@ def verify_password(password: str, hashed: str) -> bool:
 
 def create_session(user_id: str) -> str:
     """Create a new session and return session token."""
-    session_token = secrets.token_urlsafe(32)
-    expires_at = datetime.now(UTC) + timedelta(hours=SESSION_EXPIRY_HOURS)
+    now = datetime.now(UTC)
+    expires_at = now + timedelta(hours=SESSION_EXPIRY_HOURS)
 
-    sessions[session_token] = {
-        'user_id': user_id,
-        'expires_at': expires_at,
-        'created_at': datetime.now(UTC),
-    }
+    if SESSION_TOKEN_MODE == 'signed':
+        return encode_signed_token(user_id, expires_at.timestamp())
+
+    session_token = secrets.token_urlsafe(32)
+    _session_store.save(
+        session_token,
+        {
+            'user_id': user_id,
+            'expires_at': expires_at,
+            'created_at': now,
+        },
+    )
 
     return session_token
 
 
 def get_session(session_token: str) -> dict | None:
     """Get session data if valid, None if expired or invalid."""
-    if session_token not in sessions:
-        return None
-
-    session = sessions[session_token]
+    if SESSION_TOKEN_MODE == 'signed':
+        claims = decode_signed_token(session_token)
+        if claims is None or revoked_tokens.is_revoked(claims):
+            return None
+        return {
+            'user_id': claims['sub'],
+            'expires_at': datetime.fromtimestamp(claims['exp'], UTC),
+            'created_at': datetime.fromtimestamp(claims['iat'] / 1_000_000, UTC),
+        }
 
-    # Check if session is expired
-    if datetime.now(UTC) > session['expires_at']:
-        del sessions[session_token]
-        return None
-
-    return session
+    return _session_store.get(session_token)
 
 
 def delete_session(session_token: str) -> bool:
     """Delete a session (logout)."""
-    if session_token in sessions:
-        del sessions[session_token]
+    if SESSION_TOKEN_MODE == 'signed':
+        claims = decode_signed_token(session_token)
+        if claims is None:
+            return False
+        revoked_tokens.revoke_token(claims)
         return True
-    return False
+
+    return _session_store.delete(session_token)
+
+
+def revoke_user_sessions(user_id: str) -> None:
+    """Revoke every signed token issued to a user so far (e.g. after a password change).
+
+    Opaque sessions are left untouched; they are removed individually on logout.
+    """
+    if SESSION_TOKEN_MODE == 'signed':
+        expires_at = datetime.now(UTC) + timedelta(hours=SESSION_EXPIRY_HOURS)
+        revoked_tokens.revoke_user(user_id, expires_at.timestamp())
 
 
-def cleanup_expired_sessions() -> int:
-    """Remove expired sessions from memory.
+def get_session_stats() -> dict:
+    """Get session counts and eviction statistics of the active session store."""
+    stats = _session_store.stats()
+    stats['token_mode'] = SESSION_TOKEN_MODE
+    if SESSION_TOKEN_MODE == 'signed':
+        stats['cached_revocations'] = len(revoked_tokens)
+    return stats
+
+
+def cleanup_expired_sessions(limit: int | None = SESSION_CLEANUP_BATCH_SIZE) -> int:
+    """Remove a batch of expired sessions and revocation entries from the session store.
+
+    Args:
+        limit: Maximum number of sessions (and of revocations) to remove
 
     Returns:
         Number of sessions cleaned up
     """
-    now = datetime.now(UTC)
-    expired_tokens = [token for token, session in sessions.items() if now > session['expires_at']]
-
-    for token in expired_tokens:
-        del sessions[token]
+    expired_count = _session_store.cleanup_expired(limit)
 
-    if expired_tokens:
-        logger.info(
-            'Cleaned up expired sessions',
-            extra={'expired_count': len(expired_tokens), 'active_count': len(sessions)},
-        )
+    if expired_count:
+        extra = {'expired_count': expired_count}
+        active_count = _session_store.count()
+        if active_count is not None:
+            extra['active_count'] = active_count
+        logger.info('Cleaned up expired sessions', extra=extra)
 
-    return len(expired_tokens)
+    return expired_count
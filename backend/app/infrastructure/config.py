@@ -8,14 +8,21 @@ ENV = os.getenv('ENV', 'development')
 IS_PRODUCTION = ENV == 'production'
 
 # Repository mode configuration
-REPO_MODE: Literal['database', 'memory'] = os.getenv('REPO_MODE', 'memory')  # type: ignore
+# 'async' uses AsyncSession repositories for WebSocket authentication and the sync
+# database repositories everywhere else; 'cached' uses the database repositories with an in-process
+# read-through cache in front of run, participation, user and group lookups. The cache only sees
+# this process's writes, so 'cached' requires a single API process (one uvicorn worker, one host);
+# on PostgreSQL a second process refuses to start
+REPO_MODE: Literal['database', 'async', 'cached', 'memory'] = os.getenv(  # type: ignore
+    'REPO_MODE', 'memory'
+)
 
 # Database configuration
 DATABASE_URL = os.getenv('DATABASE_URL')
 
 # Validate database configuration in production
-if IS_PRODUCTION and REPO_MODE == 'database' and not DATABASE_URL:
-    raise RuntimeError('DATABASE_URL must be set when REPO_MODE=database in production!')
+if IS_PRODUCTION and REPO_MODE != 'memory' and not DATABASE_URL:
+    raise RuntimeError(f'DATABASE_URL must be set when REPO_MODE={REPO_MODE} in production!')
 
 # Security configuration
 SECRET_KEY = os.getenv('SECRET_KEY')
@@ -24,8 +31,63 @@ if not SECRET_KEY:
 
 # Session configuration
 SESSION_EXPIRY_HOURS = int(os.getenv('SESSION_EXPIRY_HOURS', '24'))
+# Expired sessions (and revocations) removed per cleanup pass; a pass runs every minute
+SESSION_CLEANUP_BATCH_SIZE = int(os.getenv('SESSION_CLEANUP_BATCH_SIZE', '1000'))
 SECURE_COOKIES = os.getenv('SECURE_COOKIES', 'false').lower() == 'true'
 
+# Session storage backend: 'memory' (single worker only), 'database' or 'redis'
+SESSION_BACKEND: Literal['memory', 'database', 'redis'] = os.getenv(  # type: ignore
+    'SESSION_BACKEND', 'memory'
+)
+REDIS_URL = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
+
+# Session token mode: 'opaque' tokens are looked up in the session store, 'signed' tokens
+# carry user id and expiry signed with SECRET_KEY; only their revocations (logout, password
+# change) are recorded in the session store, so it must be shared between workers as well
+SESSION_TOKEN_MODE: Literal['opaque', 'signed'] = os.getenv(  # type: ignore
+    'SESSION_TOKEN_MODE', 'opaque'
+)
+# Signed tokens are checked against an in-process copy of the revocations, synced from the
+# session store at most this often; another worker's revocation takes up to this long to apply
+SESSION_REVOCATION_SYNC_SECONDS = float(os.getenv('SESSION_REVOCATION_SYNC_SECONDS', '5'))
+
+# Worker threads for synchronous service calls made from async routes. Memory mode
+# storage is not thread-safe and most routes use it on the event loop, so memory mode
+# runs service calls inline on the event loop instead of on the pool.
+SERVICE_POOL_SIZE = int(os.getenv('SERVICE_POOL_SIZE', '16'))
+
+# Notifications created from domain events are buffered and written in one multi-row
+# insert per flush; a flush runs every interval, or sooner once the batch size is reached
+NOTIFICATION_FLUSH_INTERVAL_MS = int(os.getenv('NOTIFICATION_FLUSH_INTERVAL_MS', '50'))
+NOTIFICATION_MAX_BATCH_SIZE = int(os.getenv('NOTIFICATION_MAX_BATCH_SIZE', '500'))
+
+# Durable memory mode: with a data directory set, memory mode journals every change there
+# and restores the data on startup. Changed rows are written every flush interval, and the
+# journal is folded into a snapshot once it grows past the given size
+MEMORY_DATA_DIR = os.getenv('MEMORY_DATA_DIR')
+MEMORY_JOURNAL_FLUSH_INTERVAL_MS = int(os.getenv('MEMORY_JOURNAL_FLUSH_INTERVAL_MS', '100'))
+MEMORY_SNAPSHOT_JOURNAL_BYTES = int(
+    os.getenv('MEMORY_SNAPSHOT_JOURNAL_BYTES', str(16 * 1024 * 1024))
+)
+
+# Stores, products and runtime settings are cached in process for this long; changes made
+# through this process invalidate them immediately, changes from other processes after the TTL
+REFERENCE_CACHE_TTL_SECONDS = float(os.getenv('REFERENCE_CACHE_TTL_SECONDS', '300'))
+
+# REPO_MODE=cached: entries kept in the repository cache (least recently used are evicted)
+# and how long an entry is trusted; writes through this process invalidate entries at once,
+# the TTL bounds staleness from writes made by other processes
+REPO_CACHE_MAX_ENTRIES = int(os.getenv('REPO_CACHE_MAX_ENTRIES', '10000'))
+REPO_CACHE_TTL_SECONDS = float(os.getenv('REPO_CACHE_TTL_SECONDS', '30'))
+
+# A statement shape executed this many times in one request is logged as a probable N+1
+N_PLUS_ONE_THRESHOLD = int(os.getenv('N_PLUS_ONE_THRESHOLD', '5'))
+
+# Maximum number of bcrypt hash/verify calls running at once (each occupies one core)
+PASSWORD_HASH_MAX_CONCURRENCY = int(
+    os.getenv('PASSWORD_HASH_MAX_CONCURRENCY', str(min(4, os.cpu_count() or 1)))
+)
+
 # Validate secure cookies in production
 if IS_PRODUCTION and not SECURE_COOKIES:
     raise RuntimeError('SECURE_COOKIES must be true in production (requires HTTPS)!')
@@ -48,6 +110,7 @@ else:
     ]
 
 # Business logic limits
+SEARCH_RESULT_LIMIT = int(os.getenv('SEARCH_RESULT_LIMIT', '50'))
 MAX_ACTIVE_RUNS_PER_GROUP = int(os.getenv('MAX_ACTIVE_RUNS_PER_GROUP', '100'))
 MAX_PRODUCTS_PER_RUN = int(os.getenv('MAX_PRODUCTS_PER_RUN', '100'))
 MAX_GROUPS_PER_USER = int(os.getenv('MAX_GROUPS_PER_USER', '100'))
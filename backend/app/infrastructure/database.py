@@ -6,6 +6,7 @@ from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import QueuePool
 
 from app.core.models import Base
+from app.infrastructure.query_counter import install_query_counter
 from app.infrastructure.request_context import get_logger
 
 logger = get_logger(__name__)
@@ -34,6 +35,9 @@ engine = create_engine(
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Per-request statement counting (X-DB-Queries / X-DB-Time, N+1 detection)
+install_query_counter()
+
 
 # Connection pool event listeners for monitoring
 @event.listens_for(engine, 'connect')
@@ -0,0 +1,163 @@
+"""Buffered writer for notifications created from domain events.
+
+Creating a notification per participant per event means one session and one commit per
+row, so a state change in a large group turns into hundreds of commits. Event handlers
+enqueue notifications here instead; a background loop flushes the buffer on a short
+interval, writing everything queued since the last flush with one multi-row insert
+and one commit.
+"""
+
+import asyncio
+import contextlib
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.infrastructure.config import NOTIFICATION_FLUSH_INTERVAL_MS, NOTIFICATION_MAX_BATCH_SIZE
+from app.infrastructure.request_context import get_logger
+
+logger = get_logger(__name__)
+
+
+def _default_session_factory() -> Session:
+    from app.infrastructure.database import SessionLocal
+
+    return SessionLocal()
+
+
+class NotificationWriter:
+    """Buffers notifications and writes them in batches."""
+
+    def __init__(
+        self,
+        flush_interval_ms: int = NOTIFICATION_FLUSH_INTERVAL_MS,
+        max_batch_size: int = NOTIFICATION_MAX_BATCH_SIZE,
+        session_factory: Callable[[], Session] = _default_session_factory,
+    ):
+        self.flush_interval_ms = flush_interval_ms
+        self.max_batch_size = max_batch_size
+        self._session_factory = session_factory
+        self._lock = threading.Lock()
+        # Serializes flushes from the background loop and from shutdown
+        self._flush_lock = threading.Lock()
+        self._pending: list[dict[str, Any]] = []
+        # (run_id, type, data) for notifications addressed to every run participant
+        self._pending_run_fan_outs: list[tuple[UUID, str, dict[str, Any]]] = []
+        self._wake: asyncio.Event | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._flushes = 0
+        self._written = 0
+        self._failed = 0
+        self._last_flush_ms = 0.0
+
+    def enqueue(self, user_id: UUID, type: str, data: dict[str, Any]) -> None:
+        """Queue a notification for one user."""
+        with self._lock:
+            self._pending.append({'user_id': user_id, 'type': type, 'data': data})
+            size = len(self._pending)
+        self._wake_if_full(size)
+
+    def enqueue_for_run(self, run_id: UUID, type: str, data: dict[str, Any]) -> None:
+        """Queue a notification for every participant of a run.
+
+        Participants are looked up when the buffer is flushed, in the flush's session.
+        """
+        with self._lock:
+            self._pending_run_fan_outs.append((run_id, type, data))
+            size = len(self._pending) + len(self._pending_run_fan_outs)
+        self._wake_if_full(size)
+
+    def _wake_if_full(self, size: int) -> None:
+        if size >= self.max_batch_size and self._loop is not None and self._wake is not None:
+            self._loop.call_soon_threadsafe(self._wake.set)
+
+    def flush(self) -> int:
+        """Write all queued notifications in one transaction.
+
+        Returns:
+            Number of notifications written (0 if the flush failed; the batch is dropped
+            and logged rather than retried forever)
+        """
+        from app.repositories import get_notification_repository, get_run_repository
+
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, []
+                fan_outs, self._pending_run_fan_outs = self._pending_run_fan_outs, []
+            if not pending and not fan_outs:
+                return 0
+
+            started_at = time.perf_counter()
+            db = self._session_factory()
+            try:
+                if fan_outs:
+                    run_repo = get_run_repository(db)
+                    participants: dict[UUID, list[UUID]] = {}
+                    for run_id, _, _ in fan_outs:
+                        if run_id not in participants:
+                            participants[run_id] = [
+                                participation.user_id
+                                for participation in run_repo.get_run_participations(run_id)
+                            ]
+                    pending.extend(
+                        {'user_id': user_id, 'type': type, 'data': data}
+                        for run_id, type, data in fan_outs
+                        for user_id in participants[run_id]
+                    )
+
+                notification_repo = get_notification_repository(db)
+                for start in range(0, len(pending), self.max_batch_size):
+                    notification_repo.create_notifications_bulk(
+                        pending[start : start + self.max_batch_size]
+                    )
+                db.commit()
+            except Exception as e:
+                db.rollback()
+                with self._lock:
+                    self._failed += len(pending)
+                logger.error(
+                    'Failed to write notification batch',
+                    extra={'notification_count': len(pending), 'error': str(e)},
+                    exc_info=True,
+                )
+                return 0
+            finally:
+                db.close()
+
+            with self._lock:
+                self._flushes += 1
+                self._written += len(pending)
+                self._last_flush_ms = (time.perf_counter() - started_at) * 1000
+            return len(pending)
+
+    async def run(self) -> None:
+        """Flush the buffer every interval (or sooner when a full batch is queued)."""
+        from app.infrastructure.service_executor import service_executor
+
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        while True:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wake.wait(), timeout=self.flush_interval_ms / 1000)
+            self._wake.clear()
+            if self._pending or self._pending_run_fan_outs:
+                # Flushes use the synchronous session, so they run on the service worker pool
+                await service_executor.run(self.flush)
+
+    def stats(self) -> dict:
+        """Return queued, written and failed notification counts."""
+        with self._lock:
+            return {
+                'pending': len(self._pending) + len(self._pending_run_fan_outs),
+                'flushes': self._flushes,
+                'written': self._written,
+                'failed': self._failed,
+                'last_flush_ms': round(self._last_flush_ms, 2),
+            }
+
+
+notification_writer = NotificationWriter()
@@ -0,0 +1,107 @@
+"""Bounded thread-pool password hasher.
+
+bcrypt takes roughly 100-300 ms per call. Running it inline in an ``async def`` route
+blocks the whole event loop (and every WebSocket broadcast in the process) for that
+long. `PasswordHasher` runs hashing and verification on a small dedicated thread pool
+instead; bcrypt releases the GIL while it works, so the loop stays responsive.
+
+The pool size caps how many hashes run at once, so a login burst queues up instead of
+saturating every core. Queue wait and hashing time are tracked for monitoring.
+"""
+
+import asyncio
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
+from app.infrastructure.auth import hash_password, verify_password
+from app.infrastructure.config import PASSWORD_HASH_MAX_CONCURRENCY
+from app.infrastructure.request_context import get_logger
+
+logger = get_logger(__name__)
+
+
+class PasswordHasher:
+    """Awaitable bcrypt hash/verify on a bounded thread pool."""
+
+    def __init__(self, max_concurrency: int = PASSWORD_HASH_MAX_CONCURRENCY):
+        self.max_concurrency = max_concurrency
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix='password-hasher'
+        )
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._metrics = {
+            'hash': {'count': 0, 'total_ms': 0.0, 'max_ms': 0.0, 'wait_total_ms': 0.0},
+            'verify': {'count': 0, 'total_ms': 0.0, 'max_ms': 0.0, 'wait_total_ms': 0.0},
+        }
+
+    async def hash(self, password: str) -> str:
+        """Hash a password without blocking the event loop."""
+        return await self._run('hash', hash_password, password)
+
+    async def verify(self, password: str, hashed: str) -> bool:
+        """Verify a password against its hash without blocking the event loop."""
+        return await self._run('verify', verify_password, password, hashed)
+
+    async def _run(self, operation: str, func: Callable, *args):
+        submitted_at = time.perf_counter()
+
+        def timed_call():
+            started_at = time.perf_counter()
+            try:
+                return func(*args)
+            finally:
+                finished_at = time.perf_counter()
+                self._record(
+                    operation,
+                    wait_ms=(started_at - submitted_at) * 1000,
+                    duration_ms=(finished_at - started_at) * 1000,
+                )
+
+        with self._lock:
+            self._in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, timed_call)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    def _record(self, operation: str, wait_ms: float, duration_ms: float) -> None:
+        with self._lock:
+            metrics = self._metrics[operation]
+            metrics['count'] += 1
+            metrics['total_ms'] += duration_ms
+            metrics['wait_total_ms'] += wait_ms
+            metrics['max_ms'] = max(metrics['max_ms'], duration_ms)
+
+        if wait_ms > 1000:
+            logger.warning(
+                'Password hashing queue is backed up',
+                extra={'operation': operation, 'queue_wait_ms': round(wait_ms, 2)},
+            )
+
+    def stats(self) -> dict:
+        """Return concurrency and latency statistics."""
+        with self._lock:
+            stats = {'max_concurrency': self.max_concurrency, 'in_flight': self._in_flight}
+            for operation, metrics in self._metrics.items():
+                count = metrics['count']
+                stats[operation] = {
+                    'count': count,
+                    'avg_ms': round(metrics['total_ms'] / count, 2) if count else 0.0,
+                    'max_ms': round(metrics['max_ms'], 2),
+                    'avg_queue_wait_ms': round(metrics['wait_total_ms'] / count, 2)
+                    if count
+                    else 0.0,
+                }
+            return stats
+
+    def shutdown(self) -> None:
+        """Stop the worker threads."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+password_hasher = PasswordHasher()
@@ -0,0 +1,99 @@
+"""Per-request SQL statement counting.
+
+SQLAlchemy cursor events record how many statements each request executes and how
+long they take. Statements are also grouped by shape (the SQL text with bound
+parameters and IN lists collapsed), so the same query issued once per item - the
+usual N+1 pattern - shows up as one shape with a high count.
+"""
+
+import re
+import threading
+import time
+from collections import Counter
+from contextvars import ContextVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.infrastructure.config import N_PLUS_ONE_THRESHOLD
+
+# Expanding IN lists render one placeholder per value: "(?, ?, ?)" or
+# "(%(id_1_1)s, %(id_1_2)s)". Collapse them so list length doesn't change the shape.
+_PLACEHOLDER = r'(?:\?|%\(\w+\)s|\$\d+|:\w+)'
+_IN_LIST_RE = re.compile(rf'\(\s*{_PLACEHOLDER}(?:\s*,\s*{_PLACEHOLDER})*\s*\)')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+class QueryStats:
+    """Statement count, total time and statement shapes for one request."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total_ms = 0.0
+        self.shapes: Counter[str] = Counter()
+
+    def record(self, statement: str, duration_ms: float) -> None:
+        """Record one executed statement."""
+        shape = statement_shape(statement)
+        with self._lock:
+            self.count += 1
+            self.total_ms += duration_ms
+            self.shapes[shape] += 1
+
+    def repeated_shapes(self, threshold: int = N_PLUS_ONE_THRESHOLD) -> list[tuple[str, int]]:
+        """Return statement shapes executed at least ``threshold`` times, most frequent first."""
+        with self._lock:
+            return [(shape, n) for shape, n in self.shapes.most_common() if n >= threshold]
+
+
+query_stats_var: ContextVar[QueryStats | None] = ContextVar('query_stats', default=None)
+
+
+def statement_shape(statement: str) -> str:
+    """Normalize a SQL statement so repeated executions of the same query compare equal."""
+    statement = _WHITESPACE_RE.sub(' ', statement).strip()
+    return _IN_LIST_RE.sub('(...)', statement)
+
+
+def start_query_stats() -> QueryStats:
+    """Start counting statements in the current context.
+
+    Returns:
+        The statistics object that statements executed in this context record into
+    """
+    stats = QueryStats()
+    query_stats_var.set(stats)
+    return stats
+
+
+def get_query_stats() -> QueryStats | None:
+    """Get the statement statistics of the current context, if counting was started."""
+    return query_stats_var.get()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if query_stats_var.get() is not None:
+        # Kept on the execution context, so a failed statement leaves nothing behind
+        context._query_start_time = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = query_stats_var.get()
+    if stats is None:
+        return
+    start_time = getattr(context, '_query_start_time', None)
+    if start_time is None:
+        return
+    stats.record(statement, (time.perf_counter() - start_time) * 1000)
+
+
+def install_query_counter() -> None:
+    """Register the cursor event listeners on all engines (idempotent).
+
+    Listening on the Engine class covers the sync engine, the async engine's
+    underlying sync engine and engines created by tests.
+    """
+    if not event.contains(Engine, 'before_cursor_execute', _before_cursor_execute):
+        event.listen(Engine, 'before_cursor_execute', _before_cursor_execute)
+        event.listen(Engine, 'after_cursor_execute', _after_cursor_execute)
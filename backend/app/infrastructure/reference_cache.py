@@ -0,0 +1,179 @@
+"""In-process cache for reference data: stores, products and runtime settings.
+
+Stores, products and settings change rarely but are read on hot paths: run details,
+run creation and state transitions need the run's store name, placing a bid checks
+the product exists, and registration checks a runtime setting. The cache serves
+these by key without a query.
+
+Entries expire after a TTL, which bounds staleness when another process changes the
+data. Within the process, the services that create, update, merge or delete stores
+and products, and runtime_settings.set_setting, invalidate the affected entries.
+Rows are cached as copies detached from any session, so they stay readable after
+the session that loaded them closes; callers must treat them as read-only. Loads run
+outside the lock, so each section counts its invalidations and a value loaded before
+an invalidation is returned but not cached.
+"""
+
+import threading
+import time
+from collections.abc import Callable, Hashable, Iterable
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session
+
+from app.core.models import Product, Store
+from app.infrastructure.config import REFERENCE_CACHE_TTL_SECONDS
+from app.infrastructure.request_context import get_logger
+
+logger = get_logger(__name__)
+
+
+def _detached_copy(row: Any) -> Any:
+    model = type(row)
+    return model(**{attr.key: getattr(row, attr.key) for attr in inspect(model).column_attrs})
+
+
+class _Section:
+    """Entries of one kind with expiry times and hit/miss counters."""
+
+    def __init__(self) -> None:
+        # key -> (value, monotonic expiry time)
+        self.entries: dict[Hashable, tuple[Any, float]] = {}
+        # Bumped by every invalidation; values loaded before it are not stored
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict:
+        return {'entries': len(self.entries), 'hits': self.hits, 'misses': self.misses}
+
+
+class ReferenceCache:
+    """TTL cache of stores, products and runtime settings."""
+
+    def __init__(
+        self,
+        ttl_seconds: float = REFERENCE_CACHE_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._stores = _Section()
+        self._products = _Section()
+        self._settings = _Section()
+
+    def _get(self, section: _Section, key: Hashable, load: Callable[[], Any]) -> Any:
+        with self._lock:
+            entry = section.entries.get(key)
+            if entry is not None and entry[1] > self._clock():
+                section.hits += 1
+                return entry[0]
+            section.misses += 1
+            generation = section.generation
+        value = load()
+        # Missing rows are not cached, so a row created elsewhere is found right away
+        if value is not None:
+            self._put(section, key, value, generation)
+        return value
+
+    def _put(self, section: _Section, key: Hashable, value: Any, generation: int) -> None:
+        with self._lock:
+            # Invalidated while the value was loaded, so it may be stale
+            if section.generation != generation:
+                return
+            section.entries[key] = (value, self._clock() + self.ttl_seconds)
+
+    @staticmethod
+    def _invalidate(section: _Section, keys: Iterable[Hashable] | None) -> None:
+        section.generation += 1
+        if keys is None:
+            section.entries.clear()
+            return
+        for key in keys:
+            section.entries.pop(key, None)
+
+    def get_store(self, db: Session | None, store_id: UUID) -> Store | None:
+        """Store by ID (a read-only copy), loaded through the store repository on a miss."""
+        from app.repositories import get_store_repository
+
+        def load() -> Store | None:
+            store = get_store_repository(db).get_store_by_id(store_id)
+            return _detached_copy(store) if store else None
+
+        return self._get(self._stores, store_id, load)
+
+    def get_product(self, db: Session | None, product_id: UUID) -> Product | None:
+        """Product by ID (a read-only copy), loaded through the product repository on a miss."""
+        from app.repositories import get_product_repository
+
+        def load() -> Product | None:
+            product = get_product_repository(db).get_product_by_id(product_id)
+            return _detached_copy(product) if product else None
+
+        return self._get(self._products, product_id, load)
+
+    def get_setting(self, db: Session, key: str) -> str | None:
+        """Runtime setting value (None if unset), read from the database on a miss."""
+        from app.infrastructure.runtime_settings import get_setting
+
+        return self._get(self._settings, key, lambda: get_setting(db, key))
+
+    def invalidate_stores(self, *store_ids: UUID) -> None:
+        """Drop the given stores (all stores if none are given)."""
+        with self._lock:
+            self._invalidate(self._stores, store_ids or None)
+
+    def invalidate_products(self, *product_ids: UUID) -> None:
+        """Drop the given products (all products if none are given)."""
+        with self._lock:
+            self._invalidate(self._products, product_ids or None)
+
+    def invalidate_settings(self, *keys: str) -> None:
+        """Drop the given settings (all settings if none are given)."""
+        with self._lock:
+            self._invalidate(self._settings, keys or None)
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._stores = _Section()
+            self._products = _Section()
+            self._settings = _Section()
+
+    def warm(self, db: Session | None) -> None:
+        """Load every store and product and the registration setting."""
+        from app.infrastructure.runtime_settings import get_setting
+        from app.repositories import get_product_repository, get_store_repository
+
+        with self._lock:
+            sections = self._stores, self._products, self._settings
+            store_gen, product_gen, setting_gen = (section.generation for section in sections)
+        stores = get_store_repository(db).get_all_stores()
+        products = get_product_repository(db).get_all_products()
+        for store in stores:
+            self._put(sections[0], store.id, _detached_copy(store), store_gen)
+        for product in products:
+            self._put(sections[1], product.id, _detached_copy(product), product_gen)
+        if db is not None:
+            value = get_setting(db, 'allow_registration')
+            if value is not None:
+                self._put(sections[2], 'allow_registration', value, setting_gen)
+        logger.info(
+            'Reference cache warmed',
+            extra={'store_count': len(stores), 'product_count': len(products)},
+        )
+
+    def stats(self) -> dict:
+        """Return entry counts and hits and misses per kind."""
+        with self._lock:
+            return {
+                'stores': self._stores.stats(),
+                'products': self._products.stats(),
+                'settings': self._settings.stats(),
+            }
+
+
+reference_cache = ReferenceCache()
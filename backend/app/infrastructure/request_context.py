@@ -7,6 +7,10 @@ from uuid import uuid4
 # Context variable for request ID (thread-safe)
 request_id_var: ContextVar[str | None] = ContextVar('request_id', default=None)
 
+# Per-request counters (e.g. worker pool queue wait). The dict itself is shared, so
+# updates made in child tasks and worker threads are visible to the middleware.
+request_stats_var: ContextVar[dict | None] = ContextVar('request_stats', default=None)
+
 
 def set_request_id(request_id: str) -> None:
     """Set the request ID in the current context.
@@ -26,6 +30,29 @@ def get_request_id() -> str | None:
     return request_id_var.get()
 
 
+def start_request_stats() -> dict:
+    """Start collecting per-request statistics in the current context.
+
+    Returns:
+        The (initially empty) statistics dict for this request
+    """
+    stats: dict = {}
+    request_stats_var.set(stats)
+    return stats
+
+
+def add_request_stat(key: str, amount: float) -> None:
+    """Add to a per-request counter. No-op outside a request.
+
+    Args:
+        key: Counter name
+        amount: Amount to add
+    """
+    stats = request_stats_var.get()
+    if stats is not None:
+        stats[key] = stats.get(key, 0) + amount
+
+
 def generate_request_id() -> str:
     """Generate a new request ID.
 
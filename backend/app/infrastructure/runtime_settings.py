@@ -3,6 +3,7 @@
 from sqlalchemy.orm import Session
 
 from app.core.models import AppSettings
+from app.infrastructure.reference_cache import reference_cache
 
 
 def get_setting(db: Session, key: str, default: str = None) -> str | None:
@@ -20,11 +21,12 @@ def set_setting(db: Session, key: str, value: str) -> None:
         setting = AppSettings(key=key, value=value)
         db.add(setting)
     db.commit()
+    reference_cache.invalidate_settings(key)
 
 
 def is_registration_allowed(db: Session) -> bool:
-    """Check if user registration is allowed."""
-    value = get_setting(db, 'allow_registration', 'true')
+    """Check if user registration is allowed (served from the reference cache)."""
+    value = reference_cache.get_setting(db, 'allow_registration') or 'true'
     return value.lower() == 'true'
 
 
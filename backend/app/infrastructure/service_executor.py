@@ -0,0 +1,125 @@
+"""Worker pool for running synchronous service calls from async routes.
+
+Services use the synchronous SQLAlchemy session. Called directly from an ``async def``
+route, every query blocks the event loop, so one slow request freezes all other
+requests and WebSockets in the worker. `run_service_call` runs the call on a sized
+thread pool instead, copying the caller's context (request ID included) into the
+worker thread and recording how long the call waited for a free worker.
+
+In memory mode the storage is plain dicts that the other routes use on the event loop,
+so calls run inline there instead: a worker thread would mutate the storage
+concurrently with the loop.
+"""
+
+import asyncio
+import contextvars
+import functools
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from app.infrastructure.config import REPO_MODE, SERVICE_POOL_SIZE
+from app.infrastructure.request_context import add_request_stat, get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar('T')
+
+# Queue waits above this are logged as a sign the pool is undersized
+SLOW_QUEUE_WAIT_MS = 100
+
+
+class ServiceExecutor:
+    """Sized thread pool that runs sync service calls and tracks queue wait."""
+
+    def __init__(self, max_workers: int = SERVICE_POOL_SIZE, inline: bool = False):
+        self.max_workers = max_workers
+        # Run calls on the calling thread (the event loop) instead of the pool
+        self.inline = inline
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix='service-worker'
+        )
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._calls = 0
+        self._queue_wait_total_ms = 0.0
+        self._queue_wait_max_ms = 0.0
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run ``func(*args, **kwargs)`` on the pool and await its result.
+
+        Exceptions raised by the call propagate to the caller unchanged.
+        """
+        if self.inline:
+            self._record_queue_wait(0.0)
+            return func(*args, **kwargs)
+
+        context = contextvars.copy_context()
+        submitted_at = time.perf_counter()
+        call = functools.partial(func, *args, **kwargs)
+
+        def run_in_context():
+            queue_wait_ms = (time.perf_counter() - submitted_at) * 1000
+            self._record_queue_wait(queue_wait_ms)
+            return context.run(self._call_with_wait, call, queue_wait_ms)
+
+        with self._lock:
+            self._in_flight += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, run_in_context)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    @staticmethod
+    def _call_with_wait(call: Callable[[], T], queue_wait_ms: float) -> T:
+        # Runs inside the copied context, so the stat lands on the caller's request
+        add_request_stat('queue_wait_ms', queue_wait_ms)
+        if queue_wait_ms > SLOW_QUEUE_WAIT_MS:
+            logger.warning(
+                'Service call waited for a worker',
+                extra={
+                    'service_call': getattr(call.func, '__qualname__', repr(call.func)),
+                    'queue_wait_ms': round(queue_wait_ms, 2),
+                },
+            )
+        return call()
+
+    def _record_queue_wait(self, queue_wait_ms: float) -> None:
+        with self._lock:
+            self._calls += 1
+            self._queue_wait_total_ms += queue_wait_ms
+            self._queue_wait_max_ms = max(self._queue_wait_max_ms, queue_wait_ms)
+
+    def stats(self) -> dict:
+        """Return pool size, in-flight calls and queue wait statistics."""
+        with self._lock:
+            return {
+                'max_workers': self.max_workers,
+                'inline': self.inline,
+                'in_flight': self._in_flight,
+                'calls': self._calls,
+                'avg_queue_wait_ms': round(self._queue_wait_total_ms / self._calls, 2)
+                if self._calls
+                else 0.0,
+                'max_queue_wait_ms': round(self._queue_wait_max_ms, 2),
+            }
+
+    def shutdown(self) -> None:
+        """Stop the worker threads."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+service_executor = ServiceExecutor(inline=REPO_MODE == 'memory')
+
+
+async def run_service_call(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a synchronous service method on the shared service worker pool.
+
+    Example:
+        service = RunService(db)
+        return await run_service_call(service.get_run_details, run_id, current_user)
+    """
+    return await service_executor.run(func, *args, **kwargs)
@@ -0,0 +1,488 @@
+"""Pluggable session storage backends.
+
+Sessions used to live in a module-level dict, which pins the API to a single worker
+process. The `SessionStore` interface lets every worker share the same sessions by
+selecting a backend with the SESSION_BACKEND environment variable:
+
+- ``memory``: process-local dict (development, tests, single worker)
+- ``database``: ``user_sessions`` table in the application database
+- ``redis``: a Redis (or Valkey) server, through the optional ``redis`` package
+"""
+
+import heapq
+import json
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import select
+
+from app.core import error_codes
+from app.core.exceptions import ConfigurationError
+from app.infrastructure.config import REDIS_URL, SESSION_BACKEND, SESSION_EXPIRY_HOURS
+from app.infrastructure.request_context import get_logger
+
+logger = get_logger(__name__)
+
+
+class SessionStore(ABC):
+    """Abstract storage for session tokens.
+
+    Session data is a dict with ``user_id`` (str), ``expires_at`` and ``created_at``
+    (timezone-aware datetimes). Implementations never return expired sessions.
+    """
+
+    @abstractmethod
+    def save(self, session_token: str, session: dict) -> None:
+        """Persist a session under the given token."""
+        raise NotImplementedError('Subclass must implement save')
+
+    @abstractmethod
+    def get(self, session_token: str) -> dict | None:
+        """Get session data, or None if it does not exist or has expired."""
+        raise NotImplementedError('Subclass must implement get')
+
+    @abstractmethod
+    def delete(self, session_token: str) -> bool:
+        """Delete a session. Returns True if a session was removed."""
+        raise NotImplementedError('Subclass must implement delete')
+
+    @abstractmethod
+    def cleanup_expired(self, limit: int | None = None) -> int:
+        """Remove expired sessions and revocations.
+
+        Args:
+            limit: Maximum number of sessions (and of revocations) to remove, so a pass
+                stays short however many have expired (None for no limit)
+
+        Returns:
+            Number of sessions removed
+        """
+        raise NotImplementedError('Subclass must implement cleanup_expired')
+
+    @abstractmethod
+    def save_revocation(self, key: str, cutoff: int, expires_at: datetime) -> None:
+        """Record a signed-token revocation, visible to every worker sharing the store.
+
+        Args:
+            key: ``jti:<token id>`` (one token) or ``user:<user id>`` (all of a user's tokens)
+            cutoff: Matching tokens issued at or before this time (microseconds) are revoked
+            expires_at: When the entry can be dropped (expiry of the latest affected token)
+        """
+        raise NotImplementedError('Subclass must implement save_revocation')
+
+    @abstractmethod
+    def get_revocations_since(self, since: datetime | None) -> dict[str, tuple[int, datetime]]:
+        """Return ``{key: (cutoff, expires_at)}`` for unexpired revocations.
+
+        Args:
+            since: Only revocations saved at or after this time (None for all of them)
+        """
+        raise NotImplementedError('Subclass must implement get_revocations_since')
+
+    def count(self) -> int | None:
+        """Return the number of stored sessions (may include not-yet-evicted ones).
+
+        Returns None for backends that cannot count without scanning the whole store.
+        Not meant for request paths; only periodic maintenance logs it.
+        """
+        return None
+
+    def stats(self) -> dict:
+        """Return cheap, in-process statistics for monitoring (never queries the backend)."""
+        return {'backend': type(self).__name__}
+
+
+class MemorySessionStore(SessionStore):
+    """Process-local session store. Only suitable for a single worker.
+
+    A min-heap of ``(expires_at, token)`` is kept next to the token map so expired
+    sessions can be evicted in O(expired * log n) instead of scanning every session.
+    Heap entries are not removed on delete; stale ones (token gone or re-saved with a
+    different expiry) are skipped when popped and compacted away when they pile up.
+    Revocations are expired through a heap of their own the same way.
+    """
+
+    # Expired sessions evicted opportunistically on each save, to amortize cleanup
+    EVICT_ON_SAVE = 8
+
+    def __init__(self, sessions: dict[str, dict] | None = None):
+        self.sessions: dict[str, dict] = sessions if sessions is not None else {}
+        self._expiry_heap: list[tuple[datetime, str]] = [
+            (session['expires_at'], token) for token, session in self.sessions.items()
+        ]
+        heapq.heapify(self._expiry_heap)
+        # Sync dependencies run in the threadpool, so heap updates must be serialized
+        self._heap_lock = threading.Lock()
+        # key -> (cutoff, expires_at, revoked_at)
+        self.revocations: dict[str, tuple[int, datetime, datetime]] = {}
+        self._revocation_heap: list[tuple[datetime, str]] = []
+        self.evicted_on_access = 0
+        self.evicted_from_heap = 0
+        self.heap_compactions = 0
+
+    def save(self, session_token: str, session: dict) -> None:
+        self.sessions[session_token] = session
+        with self._heap_lock:
+            heapq.heappush(self._expiry_heap, (session['expires_at'], session_token))
+        self.evict_expired(limit=self.EVICT_ON_SAVE)
+
+    def get(self, session_token: str) -> dict | None:
+        session = self.sessions.get(session_token)
+        if session is None:
+            return None
+
+        if datetime.now(UTC) > session['expires_at']:
+            self.sessions.pop(session_token, None)
+            self.evicted_on_access += 1
+            return None
+
+        return session
+
+    def delete(self, session_token: str) -> bool:
+        return self.sessions.pop(session_token, None) is not None
+
+    def evict_expired(self, limit: int | None = None) -> int:
+        """Pop expired entries off the expiry heap and drop their sessions.
+
+        Args:
+            limit: Maximum number of heap entries to pop (None for no limit)
+
+        Returns:
+            Number of sessions evicted
+        """
+        now = datetime.now(UTC)
+        popped = 0
+        evicted = 0
+
+        with self._heap_lock:
+            heap = self._expiry_heap
+            while heap and heap[0][0] < now and (limit is None or popped < limit):
+                expires_at, token = heapq.heappop(heap)
+                popped += 1
+                session = self.sessions.get(token)
+                # Skip stale entries: session deleted, or re-saved with another expiry
+                if session is not None and session['expires_at'] == expires_at:
+                    self.sessions.pop(token, None)
+                    evicted += 1
+
+            self.evicted_from_heap += evicted
+            self._maybe_compact()
+        return evicted
+
+    def _maybe_compact(self) -> None:
+        """Rebuild the heap once stale entries outnumber live sessions (lock must be held)."""
+        if len(self._expiry_heap) > 2 * len(self.sessions) + 64:
+            self._expiry_heap = [
+                (session['expires_at'], token) for token, session in self.sessions.items()
+            ]
+            heapq.heapify(self._expiry_heap)
+            self.heap_compactions += 1
+
+    def save_revocation(self, key: str, cutoff: int, expires_at: datetime) -> None:
+        with self._heap_lock:
+            self.revocations[key] = (cutoff, expires_at, datetime.now(UTC))
+            heapq.heappush(self._revocation_heap, (expires_at, key))
+
+    def get_revocations_since(self, since: datetime | None) -> dict[str, tuple[int, datetime]]:
+        now = datetime.now(UTC)
+        with self._heap_lock:
+            return {
+                key: (cutoff, expires_at)
+                for key, (cutoff, expires_at, revoked_at) in self.revocations.items()
+                if expires_at > now and (since is None or revoked_at >= since)
+            }
+
+    def evict_expired_revocations(self, limit: int | None = None) -> int:
+        """Pop expired entries off the revocation heap and drop their revocations.
+
+        Args:
+            limit: Maximum number of heap entries to pop (None for no limit)
+
+        Returns:
+            Number of revocations removed
+        """
+        now = datetime.now(UTC)
+        popped = 0
+        removed = 0
+        with self._heap_lock:
+            heap = self._revocation_heap
+            while heap and heap[0][0] <= now and (limit is None or popped < limit):
+                expires_at, key = heapq.heappop(heap)
+                popped += 1
+                entry = self.revocations.get(key)
+                # Skip stale entries: revocation saved again with another expiry
+                if entry is not None and entry[1] == expires_at:
+                    del self.revocations[key]
+                    removed += 1
+        return removed
+
+    def cleanup_expired(self, limit: int | None = None) -> int:
+        self.evict_expired_revocations(limit)
+        return self.evict_expired(limit)
+
+    def count(self) -> int:
+        return len(self.sessions)
+
+    def stats(self) -> dict:
+        next_expiry = self._expiry_heap[0][0].isoformat() if self._expiry_heap else None
+        return {
+            'backend': type(self).__name__,
+            'session_count': len(self.sessions),
+            'expiry_heap_size': len(self._expiry_heap),
+            'next_expiry': next_expiry,
+            'evicted_on_access': self.evicted_on_access,
+            'evicted_from_heap': self.evicted_from_heap,
+            'heap_compactions': self.heap_compactions,
+            'revocation_count': len(self.revocations),
+        }
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Normalize a datetime read back from storage to timezone-aware UTC."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value.astimezone(UTC)
+
+
+class DatabaseSessionStore(SessionStore):
+    """Session store backed by the ``user_sessions`` table.
+
+    Each operation uses its own short-lived database session so that session lookups
+    never interfere with the request's unit of work.
+    """
+
+    def __init__(self, session_factory: Callable | None = None):
+        if session_factory is None:
+            from app.infrastructure.database import SessionLocal
+
+            session_factory = SessionLocal
+        self.session_factory = session_factory
+
+    def save(self, session_token: str, session: dict) -> None:
+        from app.core.models import UserSession
+
+        db = self.session_factory()
+        try:
+            db.merge(
+                UserSession(
+                    token=session_token,
+                    user_id=session['user_id'],
+                    expires_at=session['expires_at'],
+                    created_at=session['created_at'],
+                )
+            )
+            db.commit()
+        finally:
+            db.close()
+
+    def get(self, session_token: str) -> dict | None:
+        from app.core.models import UserSession
+
+        db = self.session_factory()
+        try:
+            row = db.query(UserSession).filter(UserSession.token == session_token).first()
+            if row is None:
+                return None
+
+            expires_at = _as_utc(row.expires_at)
+            if datetime.now(UTC) > expires_at:
+                db.delete(row)
+                db.commit()
+                return None
+
+            return {
+                'user_id': row.user_id,
+                'expires_at': expires_at,
+                'created_at': _as_utc(row.created_at),
+            }
+        finally:
+            db.close()
+
+    def delete(self, session_token: str) -> bool:
+        from app.core.models import UserSession
+
+        db = self.session_factory()
+        try:
+            deleted = (
+                db.query(UserSession)
+                .filter(UserSession.token == session_token)
+                .delete(synchronize_session=False)
+            )
+            db.commit()
+            return deleted > 0
+        finally:
+            db.close()
+
+    def save_revocation(self, key: str, cutoff: int, expires_at: datetime) -> None:
+        from app.core.models import SessionRevocation
+
+        db = self.session_factory()
+        try:
+            db.merge(
+                SessionRevocation(
+                    key=key, cutoff=cutoff, expires_at=expires_at, revoked_at=datetime.now(UTC)
+                )
+            )
+            db.commit()
+        finally:
+            db.close()
+
+    def get_revocations_since(self, since: datetime | None) -> dict[str, tuple[int, datetime]]:
+        from app.core.models import SessionRevocation
+
+        db = self.session_factory()
+        try:
+            query = db.query(
+                SessionRevocation.key, SessionRevocation.cutoff, SessionRevocation.expires_at
+            ).filter(SessionRevocation.expires_at > datetime.now(UTC))
+            if since is not None:
+                query = query.filter(SessionRevocation.revoked_at >= since)
+            return {key: (cutoff, _as_utc(expires_at)) for key, cutoff, expires_at in query}
+        finally:
+            db.close()
+
+    def cleanup_expired(self, limit: int | None = None) -> int:
+        from app.core.models import SessionRevocation, UserSession
+
+        db = self.session_factory()
+        try:
+            now = datetime.now(UTC)
+            deleted = self._delete_expired(db, UserSession, UserSession.token, now, limit)
+            self._delete_expired(db, SessionRevocation, SessionRevocation.key, now, limit)
+            db.commit()
+            return deleted
+        finally:
+            db.close()
+
+    @staticmethod
+    def _delete_expired(db, model, key, now: datetime, limit: int | None) -> int:
+        expired = model.expires_at < now
+        if limit is not None:
+            # One batch of the oldest, found through the expires_at index
+            batch = select(key).where(expired).order_by(model.expires_at).limit(limit)
+            expired = key.in_(batch.scalar_subquery())
+        return db.query(model).filter(expired).delete(synchronize_session=False)
+
+    def count(self) -> int:
+        from app.core.models import UserSession
+
+        db = self.session_factory()
+        try:
+            return db.query(UserSession).count()
+        finally:
+            db.close()
+
+
+class RedisSessionStore(SessionStore):
+    """Session store backed by a Redis server.
+
+    Sessions are stored as JSON under ``<prefix><token>`` with a millisecond TTL, so the
+    server evicts expired sessions on its own. Revocations are members
+    ``<key> <cutoff> <expiry ms>`` of one sorted set scored by the time they were made, so
+    workers read the ones made since their last sync with a single range query;
+    `cleanup_expired` trims members older than the session lifetime, which cannot cover
+    a live token. Counting sessions would mean scanning the keyspace, so `count` is not
+    supported.
+
+    Args:
+        client: ``redis.Redis`` client created with ``decode_responses=True``
+        key_prefix: Prefix for session keys
+        revocations_key: Key of the revocations sorted set
+    """
+
+    def __init__(self, client, key_prefix: str = 'session:', revocations_key: str = 'revocations'):
+        self.client = client
+        self.key_prefix = key_prefix
+        self.revocations_key = revocations_key
+
+    def save(self, session_token: str, session: dict) -> None:
+        ttl_ms = int((session['expires_at'] - datetime.now(UTC)).total_seconds() * 1000)
+        if ttl_ms <= 0:
+            return
+
+        payload = json.dumps(
+            {
+                'user_id': session['user_id'],
+                'expires_at': session['expires_at'].isoformat(),
+                'created_at': session['created_at'].isoformat(),
+            }
+        )
+        self.client.set(self.key_prefix + session_token, payload, px=ttl_ms)
+
+    def get(self, session_token: str) -> dict | None:
+        payload = self.client.get(self.key_prefix + session_token)
+        if payload is None:
+            return None
+
+        data = json.loads(payload)
+        session = {
+            'user_id': data['user_id'],
+            'expires_at': datetime.fromisoformat(data['expires_at']),
+            'created_at': datetime.fromisoformat(data['created_at']),
+        }
+        # Guard against clock skew between the API host and the server
+        if datetime.now(UTC) > session['expires_at']:
+            return None
+        return session
+
+    def delete(self, session_token: str) -> bool:
+        return self.client.delete(self.key_prefix + session_token) > 0
+
+    def save_revocation(self, key: str, cutoff: int, expires_at: datetime) -> None:
+        member = f'{key} {cutoff} {int(expires_at.timestamp() * 1000)}'
+        self.client.zadd(self.revocations_key, {member: int(time.time() * 1000)})
+
+    def get_revocations_since(self, since: datetime | None) -> dict[str, tuple[int, datetime]]:
+        low = '-inf' if since is None else int(since.timestamp() * 1000)
+        now = datetime.now(UTC)
+        found = {}
+        for member in self.client.zrangebyscore(self.revocations_key, low, '+inf'):
+            key, cutoff, expires_ms = member.rsplit(' ', 2)
+            expires_at = datetime.fromtimestamp(int(expires_ms) / 1000, UTC)
+            if expires_at > now:
+                # Members come oldest first, so a later revocation of the same key wins
+                found[key] = (int(cutoff), expires_at)
+        return found
+
+    def cleanup_expired(self, limit: int | None = None) -> int:
+        # Sessions expire through their TTL; trimming revocations is a single range removal
+        oldest = time.time() - timedelta(hours=SESSION_EXPIRY_HOURS).total_seconds()
+        self.client.zremrangebyscore(self.revocations_key, '-inf', int(oldest * 1000))
+        return 0
+
+
+def create_redis_client(url: str = REDIS_URL):
+    """Create a pooled ``redis.Redis`` client for a ``redis://`` or ``rediss://`` URL.
+
+    The ``redis`` package is an optional dependency (``pip install bulq[redis]``) and is
+    only imported when a Redis-backed store is configured.
+    """
+    try:
+        import redis
+    except ImportError as e:
+        raise ConfigurationError(
+            code=error_codes.CONFIGURATION_ERROR,
+            message='SESSION_BACKEND=redis requires the redis package (install bulq[redis])',
+            session_backend='redis',
+        ) from e
+
+    return redis.Redis.from_url(url, decode_responses=True, health_check_interval=30)
+
+
+def create_session_store(backend: str = SESSION_BACKEND) -> SessionStore:
+    """Create a session store for the configured backend."""
+    if backend == 'memory':
+        return MemorySessionStore()
+    if backend == 'database':
+        return DatabaseSessionStore()
+    if backend == 'redis':
+        return RedisSessionStore(create_redis_client(REDIS_URL))
+
+    raise ConfigurationError(
+        code=error_codes.INVALID_SESSION_BACKEND,
+        message=f'Invalid session backend: {backend}',
+        session_backend=backend,
+    )
@@ -0,0 +1,203 @@
+"""Stateless HMAC-signed session tokens.
+
+A signed token carries the user id, issue time and expiry, signed with SECRET_KEY, so
+any worker can validate it without loading session data. Tokens look like
+``<base64url payload>.<base64url signature>``.
+
+Revocation (logout, password change) goes through `RevocationSet` into the shared
+session store, so a token revoked on one worker is rejected by all of them. Each worker
+checks tokens against its own copy of the revocations, synced from the store every few
+seconds, so validating a token needs no store lookup. Entries drop out on their own once
+the tokens they refer to would have expired anyway.
+"""
+
+import base64
+import hashlib
+import hmac
+import json
+import secrets
+import threading
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+
+from app.infrastructure.config import SECRET_KEY, SESSION_REVOCATION_SYNC_SECONDS
+from app.infrastructure.session_store import SessionStore
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b'=').decode('ascii')
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + '=' * (-len(data) % 4))
+
+
+def _sign(payload: str, key: bytes) -> str:
+    return _b64encode(hmac.new(key, payload.encode('utf-8'), hashlib.sha256).digest())
+
+
+_issue_lock = threading.Lock()
+_last_issued_at = 0
+
+
+def _issued_at() -> int:
+    """Current time in microseconds, strictly increasing across calls in this process.
+
+    Lets `RevocationSet.revoke_user` cut off everything issued so far while any token
+    issued right after the revocation stays valid.
+    """
+    global _last_issued_at
+    with _issue_lock:
+        _last_issued_at = max(time.time_ns() // 1000, _last_issued_at + 1)
+        return _last_issued_at
+
+
+def encode_signed_token(user_id: str, expires_at: float, secret_key: str = SECRET_KEY) -> str:
+    """Create a signed token.
+
+    Args:
+        user_id: User the token authenticates
+        expires_at: Expiry as a UNIX timestamp (seconds)
+        secret_key: Signing key
+
+    Returns:
+        The encoded token
+    """
+    claims = {
+        'sub': user_id,
+        'iat': _issued_at(),
+        'exp': int(expires_at),
+        'jti': secrets.token_urlsafe(8),
+    }
+    payload = _b64encode(json.dumps(claims, separators=(',', ':')).encode('utf-8'))
+    return f'{payload}.{_sign(payload, secret_key.encode("utf-8"))}'
+
+
+def decode_signed_token(token: str, secret_key: str = SECRET_KEY) -> dict | None:
+    """Verify a signed token and return its claims.
+
+    Returns:
+        Claims dict (``sub``, ``iat`` in microseconds, ``exp`` in seconds, ``jti``), or
+        None if the token is malformed, has a bad signature or has expired
+    """
+    payload, _, signature = token.partition('.')
+    if not payload or not signature:
+        return None
+
+    # Compare bytes: compare_digest rejects str arguments containing non-ASCII characters
+    expected = _sign(payload, secret_key.encode('utf-8'))
+    if not hmac.compare_digest(signature.encode('utf-8'), expected.encode('ascii')):
+        return None
+
+    try:
+        claims = json.loads(_b64decode(payload))
+    except ValueError:
+        return None
+
+    if time.time() > claims.get('exp', 0):
+        return None
+
+    return claims
+
+
+class RevocationSet:
+    """Revoked token ids and per-user revocation cut-offs, checked in process.
+
+    - ``revoke_token`` revokes a single token by its ``jti`` (logout).
+    - ``revoke_user`` revokes every token a user was issued up to now (password change).
+
+    Revocations are recorded in the shared session store and kept in a local dict that
+    `is_revoked` reads, so checking a token never waits on the store. The dict is synced
+    with the revocations made since the last sync at most every ``sync_interval``
+    seconds, so a revocation made on another worker applies there within that interval
+    (on this worker, at once). Entries are dropped once the latest token they can
+    affect has expired.
+
+    Args:
+        get_store: Returns the session store to keep entries in (resolved on every sync,
+            so replacing the active store also moves revocations)
+        sync_interval: Seconds between syncs from the store
+    """
+
+    # Each sync re-reads this much before the previous one, covering clock skew between
+    # workers and revocations committed while the previous sync ran
+    SYNC_OVERLAP = timedelta(seconds=60)
+
+    def __init__(
+        self,
+        get_store: Callable[[], SessionStore],
+        sync_interval: float = SESSION_REVOCATION_SYNC_SECONDS,
+    ):
+        self.get_store = get_store
+        self.sync_interval = sync_interval
+        self._lock = threading.Lock()
+        # Held by the thread syncing; others keep using the current entries meanwhile
+        self._sync_lock = threading.Lock()
+        # key -> (cutoff, expiry as a UNIX timestamp)
+        self._entries: dict[str, tuple[int, float]] = {}
+        self._synced_at: float | None = None
+        self._synced_since: datetime | None = None
+
+    def revoke_token(self, claims: dict) -> None:
+        """Revoke one token, given its decoded claims."""
+        self._revoke(f'jti:{claims["jti"]}', claims['iat'], claims['exp'])
+
+    def revoke_user(self, user_id: str, expires_at: float) -> None:
+        """Revoke all tokens issued to a user before now.
+
+        Args:
+            user_id: User whose tokens are revoked
+            expires_at: When the longest-lived affected token expires
+        """
+        self._revoke(f'user:{user_id}', _issued_at(), expires_at)
+
+    def _revoke(self, key: str, cutoff: int, expires_at: float) -> None:
+        self.get_store().save_revocation(key, cutoff, datetime.fromtimestamp(expires_at, UTC))
+        self._add(key, cutoff, expires_at)
+
+    def _add(self, key: str, cutoff: int, expires_at: float) -> None:
+        with self._lock:
+            current = self._entries.get(key)
+            if current is None or cutoff > current[0]:
+                self._entries[key] = (cutoff, expires_at)
+
+    def is_revoked(self, claims: dict) -> bool:
+        """Whether a token is revoked, by its decoded claims."""
+        if self._synced_at is None or time.monotonic() - self._synced_at >= self.sync_interval:
+            self.sync(wait=self._synced_at is None)
+        now = time.time()
+        with self._lock:
+            for key in (f'jti:{claims["jti"]}', f'user:{claims["sub"]}'):
+                entry = self._entries.get(key)
+                if entry is not None and entry[1] > now and claims['iat'] <= entry[0]:
+                    return True
+        return False
+
+    def sync(self, wait: bool = True) -> None:
+        """Merge the revocations made since the last sync and drop expired entries.
+
+        Args:
+            wait: Wait for a sync already running on another thread instead of returning
+        """
+        if not self._sync_lock.acquire(blocking=wait):
+            return
+        try:
+            started_at = datetime.now(UTC)
+            since = self._synced_since - self.SYNC_OVERLAP if self._synced_since else None
+            revocations = self.get_store().get_revocations_since(since)
+            for key, (cutoff, expires_at) in revocations.items():
+                self._add(key, cutoff, expires_at.timestamp())
+            now = time.time()
+            with self._lock:
+                self._entries = {
+                    key: entry for key, entry in self._entries.items() if entry[1] > now
+                }
+            self._synced_since = started_at
+            self._synced_at = time.monotonic()
+        finally:
+            self._sync_lock.release()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
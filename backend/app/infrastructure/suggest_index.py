@@ -0,0 +1,146 @@
+"""In-process prefix index for product and store name suggestions.
+
+Typeahead asks for suggestions on every keystroke, so it is served from sorted arrays
+in memory rather than the database. Names are kept lowercased in one sorted array
+and every later word start (the suffix of the name from that word on) in a second,
+so "ri" suggests both "Rice" and "Brown Rice". A lookup is a bisect to the first
+entry with the prefix followed by a short scan.
+
+The index is built from the repositories at startup and kept current by the services
+that create, rename, merge and delete products and stores.
+"""
+
+import re
+import threading
+from bisect import bisect_left, insort
+from collections.abc import Hashable, Iterable
+
+from sqlalchemy.orm import Session
+
+from app.infrastructure.request_context import get_logger
+
+logger = get_logger(__name__)
+
+_WORD_RE = re.compile(r'[^\W_]+')
+
+
+def _normalize(text: str) -> str:
+    return ' '.join(text.lower().split())
+
+
+def _discard(entries: list[tuple[str, Hashable]], entry: tuple[str, Hashable]) -> None:
+    i = bisect_left(entries, entry)
+    if i < len(entries) and entries[i] == entry:
+        del entries[i]
+
+
+class PrefixIndex:
+    """Sorted prefix index from names to keys."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        # (lowercased name, key), sorted
+        self._names: list[tuple[str, Hashable]] = []
+        # (lowercased name from a later word on, key), sorted
+        self._word_starts: list[tuple[str, Hashable]] = []
+        self._display_names: dict[Hashable, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._display_names)
+
+    @staticmethod
+    def _terms(name: str) -> tuple[str, list[str]]:
+        normalized = _normalize(name)
+        word_starts = [match.start() for match in _WORD_RE.finditer(normalized)]
+        return normalized, [normalized[start:] for start in word_starts if start > 0]
+
+    def add(self, key: Hashable, name: str) -> None:
+        """Index name under key, replacing any name indexed under it before."""
+        with self._lock:
+            self._remove(key)
+            normalized, suffixes = self._terms(name)
+            insort(self._names, (normalized, key))
+            for suffix in suffixes:
+                insort(self._word_starts, (suffix, key))
+            self._display_names[key] = name
+
+    def remove(self, key: Hashable) -> None:
+        """Drop key from the index (no-op if it is not indexed)."""
+        with self._lock:
+            self._remove(key)
+
+    def _remove(self, key: Hashable) -> None:
+        name = self._display_names.pop(key, None)
+        if name is None:
+            return
+        normalized, suffixes = self._terms(name)
+        _discard(self._names, (normalized, key))
+        for suffix in suffixes:
+            _discard(self._word_starts, (suffix, key))
+
+    def rebuild(self, entries: Iterable[tuple[Hashable, str]]) -> None:
+        """Replace the whole index with (key, name) entries."""
+        names = []
+        word_starts = []
+        display_names = {}
+        for key, name in entries:
+            normalized, suffixes = self._terms(name)
+            names.append((normalized, key))
+            word_starts.extend((suffix, key) for suffix in suffixes)
+            display_names[key] = name
+        names.sort()
+        word_starts.sort()
+        with self._lock:
+            self._names, self._word_starts = names, word_starts
+            self._display_names = display_names
+
+    def suggest(self, prefix: str, limit: int) -> list[tuple[Hashable, str]]:
+        """(key, name) pairs whose name or one of its words starts with prefix.
+
+        Names starting with the prefix come first, then names with a later word starting
+        with it, each alphabetically.
+        """
+        needle = _normalize(prefix)
+        if not needle or limit <= 0:
+            return []
+
+        results: list[tuple[Hashable, str]] = []
+        seen: set[Hashable] = set()
+        with self._lock:
+            for entries in (self._names, self._word_starts):
+                i = bisect_left(entries, (needle,))
+                while i < len(entries) and len(results) < limit:
+                    term, key = entries[i]
+                    if not term.startswith(needle):
+                        break
+                    if key not in seen:
+                        seen.add(key)
+                        results.append((key, self._display_names[key]))
+                    i += 1
+        return results
+
+
+class SuggestIndex:
+    """Prefix indexes over product and store names."""
+
+    def __init__(self) -> None:
+        self.products = PrefixIndex()
+        self.stores = PrefixIndex()
+
+    def build(self, db: Session) -> None:
+        """Load every product and store name from the repositories."""
+        from app.repositories import get_product_repository, get_store_repository
+
+        self.products.rebuild(
+            (product.id, product.name) for product in get_product_repository(db).get_all_products()
+        )
+        self.stores.rebuild(
+            (store.id, store.name) for store in get_store_repository(db).get_all_stores()
+        )
+        logger.info(
+            'Suggestion index built',
+            extra={'product_count': len(self.products), 'store_count': len(self.stores)},
+        )
+
+
+suggest_index = SuggestIndex()
@@ -1,12 +1,13 @@
 import asyncio
 import os
 
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy.exc import SQLAlchemyError
 
 from .api.middleware import RequestLoggingMiddleware
+from .api.routes.admin import require_admin
 from .api.routes.admin import router as admin_router
 from .api.routes.auth import router as auth_router
 from .api.routes.distribution import router as distribution_router
@@ -29,7 +30,7 @@ from .errors.handlers import (
 from .infrastructure.config import ALLOWED_ORIGINS
 from .infrastructure.database import create_tables
 from .infrastructure.logging_config import setup_logging
-from .utils.background_tasks import create_background_task
+from .utils.background_tasks import create_background_task, set_main_loop
 
 # Setup logging
 log_level = os.getenv('LOG_LEVEL', 'INFO')
@@ -67,6 +68,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=['*'],
     allow_headers=['*'],
+    expose_headers=['X-Total-Count'],
 )
 
 
@@ -91,7 +93,10 @@ async def startup_event():
     from .events.event_bus import event_bus
     from .events.handlers.notification_handler import NotificationEventHandler
     from .events.handlers.websocket_handler import WebSocketEventHandler
-    from .repositories import get_notification_repository
+    from .infrastructure.notification_writer import notification_writer
+
+    # Service calls run on worker threads; their background tasks are handed back to this loop
+    set_main_loop(asyncio.get_running_loop())
 
     # Create event handlers
     ws_handler = WebSocketEventHandler(manager)
@@ -107,23 +112,9 @@ async def startup_event():
     event_bus.subscribe(MemberRemovedEvent, ws_handler.handle_member_removed)
     event_bus.subscribe(MemberLeftEvent, ws_handler.handle_member_left)
 
-    # Note: NotificationEventHandler needs repository which is per-request
-    # We'll create a handler factory that gets repo from database session
-    # For now, we subscribe a lambda that creates handler on-demand
-    async def handle_run_state_changed_notification(event: RunStateChangedEvent):
-        """Handle run state changed event for notifications."""
-        from .infrastructure.database import SessionLocal
-
-        db = SessionLocal()
-        try:
-            notification_repo = get_notification_repository(db)
-            notification_handler = NotificationEventHandler(notification_repo)
-            await notification_handler.handle_run_state_changed(event)
-            db.commit()
-        finally:
-            db.close()
-
-    event_bus.subscribe(RunStateChangedEvent, handle_run_state_changed_notification)
+    # Notifications are queued on the buffered writer and stored in batches
+    notification_handler = NotificationEventHandler(notification_writer)
+    event_bus.subscribe(RunStateChangedEvent, notification_handler.handle_run_state_changed)
 
     from .infrastructure.request_context import get_logger
 
@@ -142,12 +133,29 @@ async def startup_event():
     except Exception as e:
         logger.error(f'Failed to initialize default settings: {e}', exc_info=True)
 
+    # Durable memory mode: restore the stored data before anything else writes to storage
+    from .infrastructure.config import MEMORY_DATA_DIR, REPO_MODE
+
+    # The cached repositories are only invalidated in process: refuse to run a second process
+    if REPO_MODE == 'cached':
+        from .infrastructure.database import engine
+        from .repositories.cached import claim_single_process
+
+        app.state.cache_process_lock = claim_single_process(engine)
+
+    recovered = False
+    if REPO_MODE == 'memory' and MEMORY_DATA_DIR:
+        from .repositories import get_memory_storage
+        from .repositories.memory import MemoryJournal
+
+        app.state.memory_journal = MemoryJournal(get_memory_storage(), MEMORY_DATA_DIR)
+        recovered = app.state.memory_journal.recover()
+
     # Create seed data if in development
     import os
 
-    if os.getenv('ENV') == 'development':
+    if os.getenv('ENV') == 'development' and not recovered:
         try:
-            from .infrastructure.config import REPO_MODE
             from .scripts.seed_data import create_seed_data
 
             if REPO_MODE == 'memory':
@@ -172,6 +180,30 @@ async def startup_event():
             logger.error(f'Failed to create seed data: {e}', exc_info=True)
             raise
 
+    # Build the name suggestion index and warm the reference cache once the catalog (and
+    # any seed data) is in place
+    from .infrastructure.database import SessionLocal
+    from .infrastructure.reference_cache import reference_cache
+    from .infrastructure.suggest_index import suggest_index
+
+    try:
+        db = SessionLocal()
+        try:
+            suggest_index.build(db)
+        finally:
+            db.close()
+    except Exception as e:
+        logger.error(f'Failed to build suggestion index: {e}', exc_info=True)
+
+    try:
+        db = SessionLocal()
+        try:
+            reference_cache.warm(db)
+        finally:
+            db.close()
+    except Exception as e:
+        logger.error(f'Failed to warm reference cache: {e}', exc_info=True)
+
     # Start background task for session cleanup
     from .infrastructure.auth import cleanup_expired_sessions
     from .infrastructure.database import log_pool_status
@@ -179,8 +211,13 @@ async def startup_event():
     async def session_cleanup_loop():
         """Periodically clean up expired sessions to prevent memory leak."""
         while True:
-            await asyncio.sleep(3600)  # Run every hour
-            cleanup_expired_sessions()
+            # Each pass removes one bounded batch, off the event loop (it may query the
+            # session database)
+            await asyncio.sleep(60)
+            try:
+                await asyncio.to_thread(cleanup_expired_sessions)
+            except Exception as e:
+                logger.error(f'Failed to clean up expired sessions: {e}', exc_info=True)
 
     async def pool_monitoring_loop():
         """Periodically log connection pool statistics."""
@@ -190,6 +227,27 @@ async def startup_event():
 
     create_background_task(session_cleanup_loop(), task_name='session_cleanup_loop')
     create_background_task(pool_monitoring_loop(), task_name='pool_monitoring_loop')
+    create_background_task(notification_writer.run(), task_name='notification_flush_loop')
+    memory_journal = getattr(app.state, 'memory_journal', None)
+    if memory_journal is not None:
+        memory_journal.attach()
+        create_background_task(memory_journal.run(), task_name='memory_journal_loop')
+
+
+@app.on_event('shutdown')
+def shutdown_event():
+    """Flush buffered notifications, snapshot durable memory storage and release the cache lock."""
+    from .infrastructure.notification_writer import notification_writer
+
+    notification_writer.flush()
+    memory_journal = getattr(app.state, 'memory_journal', None)
+    if memory_journal is not None:
+        memory_journal.close()
+    cache_process_lock = getattr(app.state, 'cache_process_lock', None)
+    if cache_process_lock is not None:
+        from .repositories.cached import release_single_process
+
+        release_single_process(cache_process_lock)
 
 
 @app.get('/')
@@ -204,6 +262,34 @@ async def health_check():
     return {'status': 'healthy'}
 
 
+@app.get('/session-health', dependencies=[Depends(require_admin)])
+async def session_health_check():
+    """Report session, worker pool, background writer and cache statistics (admin only).
+
+    Only in-process counters are reported; nothing here queries the session store backend.
+    """
+    from .infrastructure.auth import get_session_stats
+    from .infrastructure.config import REPO_MODE
+    from .infrastructure.notification_writer import notification_writer
+    from .infrastructure.password_hasher import password_hasher
+    from .infrastructure.reference_cache import reference_cache
+    from .infrastructure.service_executor import service_executor
+    from .repositories.cached import repository_cache
+
+    return {
+        'status': 'healthy',
+        'sessions': get_session_stats(),
+        'password_hasher': password_hasher.stats(),
+        'service_pool': service_executor.stats(),
+        'notification_writer': notification_writer.stats(),
+        'reference_cache': reference_cache.stats(),
+        'repository_cache': repository_cache.stats() if REPO_MODE == 'cached' else None,
+        'memory_journal': (
+            app.state.memory_journal.stats() if hasattr(app.state, 'memory_journal') else None
+        ),
+    }
+
+
 @app.get('/db-health')
 async def db_health_check():
     """Check database connectivity and connection pool status."""
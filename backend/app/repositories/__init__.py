@@ -1,5 +1,6 @@
 """Repository implementations and factory functions."""
 
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.core import error_codes
@@ -7,6 +8,17 @@ from app.core.exceptions import ConfigurationError
 from app.infrastructure.config import REPO_MODE
 
 # Import all domain repositories
+from app.repositories.async_database import (
+    AsyncDatabaseGroupRepository,
+    AsyncDatabaseRunRepository,
+    AsyncDatabaseUserRepository,
+)
+from app.repositories.awaitable import AwaitableRepository
+from app.repositories.cached import (
+    CachedGroupRepository,
+    CachedRunRepository,
+    CachedUserRepository,
+)
 from app.repositories.database import (
     DatabaseBidRepository,
     DatabaseGroupRepository,
@@ -32,6 +44,15 @@ from app.repositories.memory import (
 )
 
 __all__ = [
+    # Async database repositories
+    'AsyncDatabaseGroupRepository',
+    'AsyncDatabaseRunRepository',
+    'AsyncDatabaseUserRepository',
+    'AwaitableRepository',
+    # Cached database repositories
+    'CachedGroupRepository',
+    'CachedRunRepository',
+    'CachedUserRepository',
     # Database repositories
     'DatabaseBidRepository',
     'DatabaseGroupRepository',
@@ -54,6 +75,8 @@ __all__ = [
     'MemoryStoreRepository',
     'MemoryUserRepository',
     # Factory functions
+    'get_memory_storage',
+    'set_memory_storage',
     'get_user_repository',
     'get_group_repository',
     'get_store_repository',
@@ -63,23 +86,32 @@ __all__ = [
     'get_shopping_repository',
     'get_notification_repository',
     'get_reassignment_repository',
+    'get_async_user_repository',
+    'get_async_group_repository',
+    'get_async_run_repository',
 ]
 
-# Singleton storage for memory mode
-_memory_storage = None
+# Storage shared by the memory mode repositories of this process
+_memory_storage: MemoryStorage | None = None
 
 
-def _get_memory_storage() -> MemoryStorage:
-    """Get or create singleton memory storage."""
+def get_memory_storage() -> MemoryStorage:
+    """Get the memory mode storage, creating it on first use."""
     global _memory_storage
     if _memory_storage is None:
         _memory_storage = MemoryStorage()
     return _memory_storage
 
 
+def set_memory_storage(storage: MemoryStorage | None) -> None:
+    """Install the storage used by memory mode repositories (None: a fresh one on next use)."""
+    global _memory_storage
+    _memory_storage = storage
+
+
 def _validate_database_session(db: Session | None):
     """Validate that database session is provided when in database mode."""
-    if REPO_MODE == 'database' and db is None:
+    if REPO_MODE != 'memory' and db is None:
         raise ConfigurationError(
             code=error_codes.DATABASE_SESSION_REQUIRED,
             message='Database session required for database mode',
@@ -90,7 +122,10 @@ def _validate_database_session(db: Session | None):
 def get_user_repository(db: Session = None):
     """Get user repository based on configuration mode."""
     if REPO_MODE == 'memory':
-        return MemoryUserRepository(_get_memory_storage())
+        return MemoryUserRepository(get_memory_storage())
+    elif REPO_MODE == 'cached':
+        _validate_database_session(db)
+        return CachedUserRepository(db)
     else:
         _validate_database_session(db)
         return DatabaseUserRepository(db)
@@ -99,7 +134,10 @@ def get_user_repository(db: Session = None):
 def get_group_repository(db: Session = None):
     """Get group repository based on configuration mode."""
     if REPO_MODE == 'memory':
-        return MemoryGroupRepository(_get_memory_storage())
+        return MemoryGroupRepository(get_memory_storage())
+    elif REPO_MODE == 'cached':
+        _validate_database_session(db)
+        return CachedGroupRepository(db)
     else:
         _validate_database_session(db)
         return DatabaseGroupRepository(db)
@@ -108,7 +146,7 @@ def get_group_repository(db: Session = None):
 def get_store_repository(db: Session = None):
     """Get store repository based on configuration mode."""
     if REPO_MODE == 'memory':
-        return MemoryStoreRepository(_get_memory_storage())
+        return MemoryStoreRepository(get_memory_storage())
     else:
         _validate_database_session(db)
         return DatabaseStoreRepository(db)
@@ -117,7 +155,7 @@ def get_store_repository(db: Session = None):
 def get_product_repository(db: Session = None):
     """Get product repository based on configuration mode."""
     if REPO_MODE == 'memory':
-        return MemoryProductRepository(_get_memory_storage())
+        return MemoryProductRepository(get_memory_storage())
     else:
         _validate_database_session(db)
         return DatabaseProductRepository(db)
@@ -126,7 +164,10 @@ def get_product_repository(db: Session = None):
 def get_run_repository(db: Session = None):
     """Get run repository based on configuration mode."""
     if REPO_MODE == 'memory':
-        return MemoryRunRepository(_get_memory_storage())
+        return MemoryRunRepository(get_memory_storage())
+    elif REPO_MODE == 'cached':
+        _validate_database_session(db)
+        return CachedRunRepository(db)
     else:
         _validate_database_session(db)
         return DatabaseRunRepository(db)
@@ -135,7 +176,7 @@ def get_run_repository(db: Session = None):
 def get_bid_repository(db: Session = None):
     """Get bid repository based on configuration mode."""
     if REPO_MODE == 'memory':
-        return MemoryBidRepository(_get_memory_storage())
+        return MemoryBidRepository(get_memory_storage())
     else:
         _validate_database_session(db)
         return DatabaseBidRepository(db)
@@ -144,7 +185,7 @@ def get_bid_repository(db: Session = None):
 def get_shopping_repository(db: Session = None):
     """Get shopping repository based on configuration mode."""
     if REPO_MODE == 'memory':
-        return MemoryShoppingRepository(_get_memory_storage())
+        return MemoryShoppingRepository(get_memory_storage())
     else:
         _validate_database_session(db)
         return DatabaseShoppingRepository(db)
@@ -153,7 +194,7 @@ def get_shopping_repository(db: Session = None):
 def get_notification_repository(db: Session = None):
     """Get notification repository based on configuration mode."""
     if REPO_MODE == 'memory':
-        return MemoryNotificationRepository(_get_memory_storage())
+        return MemoryNotificationRepository(get_memory_storage())
     else:
         _validate_database_session(db)
         return DatabaseNotificationRepository(db)
@@ -162,7 +203,45 @@ def get_notification_repository(db: Session = None):
 def get_reassignment_repository(db: Session = None):
     """Get reassignment repository based on configuration mode."""
     if REPO_MODE == 'memory':
-        return MemoryReassignmentRepository(_get_memory_storage())
+        return MemoryReassignmentRepository(get_memory_storage())
     else:
         _validate_database_session(db)
         return DatabaseReassignmentRepository(db)
+
+
+# Async repositories: AsyncSession implementations in REPO_MODE=async; otherwise the
+# regular repository behind an awaitable facade (the sync Database* fallback).
+
+
+def _validate_async_session(db: AsyncSession | None):
+    """Validate that an async database session is provided when in async mode."""
+    if not isinstance(db, AsyncSession):
+        raise ConfigurationError(
+            code=error_codes.DATABASE_SESSION_REQUIRED,
+            message='Async database session required for async mode',
+            repo_mode=REPO_MODE,
+        )
+
+
+def get_async_user_repository(db: AsyncSession | Session = None):
+    """Get awaitable user repository based on configuration mode."""
+    if REPO_MODE == 'async':
+        _validate_async_session(db)
+        return AsyncDatabaseUserRepository(db)
+    return AwaitableRepository(get_user_repository(db))
+
+
+def get_async_group_repository(db: AsyncSession | Session = None):
+    """Get awaitable group repository based on configuration mode."""
+    if REPO_MODE == 'async':
+        _validate_async_session(db)
+        return AsyncDatabaseGroupRepository(db)
+    return AwaitableRepository(get_group_repository(db))
+
+
+def get_async_run_repository(db: AsyncSession | Session = None):
+    """Get awaitable run (and participation) repository based on configuration mode."""
+    if REPO_MODE == 'async':
+        _validate_async_session(db)
+        return AsyncDatabaseRunRepository(db)
+    return AwaitableRepository(get_run_repository(db))
@@ -64,6 +64,25 @@ class AbstractBidRepository(ABC):
         """Update the distributed quantity and price for a bid."""
         raise NotImplementedError('Subclass must implement update_bid_distributed_quantities')
 
+    @abstractmethod
+    def bulk_update_bids(self, updates: list[dict]) -> None:
+        """Update several bids in one round trip.
+
+        Each dict holds the bid 'id' and the columns to set, e.g. 'quantity',
+        'distributed_quantity' and 'distributed_price_per_unit'. Changes are flushed but not
+        committed, so callers control the transaction.
+        """
+        raise NotImplementedError('Subclass must implement bulk_update_bids')
+
+    @abstractmethod
+    def bulk_create_bids(self, bids: list[dict]) -> None:
+        """Insert several bids in one round trip (flushed, not committed).
+
+        Each dict holds 'participation_id', 'product_id', 'quantity' and optionally
+        'interested_only', 'comment', 'distributed_quantity' and 'distributed_price_per_unit'.
+        """
+        raise NotImplementedError('Subclass must implement bulk_create_bids')
+
     @abstractmethod
     def commit_changes(self) -> None:
         """Commit any pending changes (no-op for memory repository, commits transaction for database repository)."""
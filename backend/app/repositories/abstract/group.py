@@ -61,7 +61,47 @@ class AbstractGroupRepository(ABC):
         """Set the admin status of a group member."""
         raise NotImplementedError('Subclass must implement set_group_member_admin')
 
+    @abstractmethod
+    def get_user_group_summaries(self, user_id: UUID) -> list[dict]:
+        """Get the groups a user belongs to with member and run counts.
+
+        Each dict holds 'group', 'creator_name', 'member_count', 'active_runs_count',
+        'completed_runs_count' and 'active_runs' (dicts with 'id', 'state' and 'store_name'
+        for runs that are neither completed nor cancelled).
+        """
+        raise NotImplementedError('Subclass must implement get_user_group_summaries')
+
+    @abstractmethod
+    def search_user_groups(self, user_id: UUID, query: str, limit: int) -> list[dict]:
+        """Find the groups a user belongs to whose name contains query, by name.
+
+        Each dict holds 'group' and 'member_count'.
+        """
+        raise NotImplementedError('Subclass must implement search_user_groups')
+
     @abstractmethod
     def get_all_groups(self) -> list[Group]:
         """Get all groups."""
         raise NotImplementedError('Subclass must implement get_all_groups')
+
+    @abstractmethod
+    def get_group_admin_listings(
+        self,
+        search: str | None = None,
+        limit: int = 100,
+        offset: int = 0,
+        after_group_id: UUID | None = None,
+    ) -> list[dict] | None:
+        """Get one page of groups for the admin panel, newest first.
+
+        search matches name or ID (case-insensitive substring). after_group_id is a
+        keyset cursor: the page continues after that group. Each dict holds 'group',
+        'creator_name' and 'member_count'. Returns None if after_group_id is not a matching
+        group.
+        """
+        raise NotImplementedError('Subclass must implement get_group_admin_listings')
+
+    @abstractmethod
+    def count_groups(self, search: str | None = None) -> int:
+        """Count groups matching the get_group_admin_listings search."""
+        raise NotImplementedError('Subclass must implement count_groups')
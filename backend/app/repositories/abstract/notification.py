@@ -15,6 +15,16 @@ class AbstractNotificationRepository(ABC):
         """Create a new notification for a user."""
         raise NotImplementedError('Subclass must implement create_notification')
 
+    @abstractmethod
+    def create_notifications_bulk(self, notifications: list[dict[str, Any]]) -> list[Notification]:
+        """Create many notifications at once without committing.
+
+        Each dict holds the user_id, type and data of one notification. IDs and
+        creation times are assigned up front, so the returned notifications can be
+        broadcast before the surrounding transaction commits.
+        """
+        raise NotImplementedError('Subclass must implement create_notifications_bulk')
+
     @abstractmethod
     def get_user_notifications(
         self, user_id: UUID, limit: int = 20, offset: int = 0
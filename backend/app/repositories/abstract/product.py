@@ -1,10 +1,12 @@
 """Abstract product repository interface."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 from typing import Any
 from uuid import UUID
 
 from app.core.models import Product
+from app.infrastructure.config import SEARCH_RESULT_LIMIT
 
 
 class AbstractProductRepository(ABC):
@@ -16,8 +18,12 @@ class AbstractProductRepository(ABC):
         raise NotImplementedError('Subclass must implement get_products_by_store')
 
     @abstractmethod
-    def search_products(self, query: str) -> list[Product]:
-        """Search for products by name."""
+    def search_products(self, query: str, limit: int = SEARCH_RESULT_LIMIT) -> list[Product]:
+        """Search for products by name, most similar first.
+
+        Matches names containing the query or trigram-similar to it (typos, word
+        order), ordered by similarity and then name.
+        """
         raise NotImplementedError('Subclass must implement search_products')
 
     @abstractmethod
@@ -25,6 +31,11 @@ class AbstractProductRepository(ABC):
         """Get product by ID."""
         raise NotImplementedError('Subclass must implement get_product_by_id')
 
+    @abstractmethod
+    def get_products_by_ids(self, product_ids: Iterable[UUID]) -> list[Product]:
+        """Get all products whose ID is in product_ids (missing IDs are skipped)."""
+        raise NotImplementedError('Subclass must implement get_products_by_ids')
+
     @abstractmethod
     def create_product(
         self, name: str, brand: str | None = None, unit: str | None = None
@@ -37,6 +48,28 @@ class AbstractProductRepository(ABC):
         """Get all products."""
         raise NotImplementedError('Subclass must implement get_all_products')
 
+    @abstractmethod
+    def get_products_page(
+        self,
+        search: str | None = None,
+        verified: bool | None = None,
+        limit: int = 100,
+        offset: int = 0,
+        after_product_id: UUID | None = None,
+    ) -> list[Product] | None:
+        """Get one page of products, newest first.
+
+        search matches name, brand or ID (case-insensitive substring), verified filters
+        by verification status. after_product_id is a keyset cursor: the page continues
+        after that product. Returns None if after_product_id is not a matching product.
+        """
+        raise NotImplementedError('Subclass must implement get_products_page')
+
+    @abstractmethod
+    def count_products(self, search: str | None = None, verified: bool | None = None) -> int:
+        """Count products matching the get_products_page filters."""
+        raise NotImplementedError('Subclass must implement count_products')
+
     @abstractmethod
     def update_product(self, product_id: UUID, **fields) -> Product | None:
         """Update product fields. Returns updated product or None if not found."""
@@ -70,6 +103,56 @@ class AbstractProductRepository(ABC):
         """Get a specific product availability by product and store."""
         raise NotImplementedError('Subclass must implement get_availability_by_product_and_store')
 
+    @abstractmethod
+    def get_latest_availabilities_by_store(
+        self, store_id: UUID, product_ids: Iterable[UUID] | None = None
+    ) -> dict[UUID, Any]:
+        """Get the most recent availability at a store for each product, keyed by product ID.
+
+        Restricted to product_ids when given; products never observed at the store are absent.
+        """
+        raise NotImplementedError('Subclass must implement get_latest_availabilities_by_store')
+
+    @abstractmethod
+    def get_latest_day_prices_by_store(
+        self, store_id: UUID, product_ids: Iterable[UUID]
+    ) -> dict[UUID, list[Any]]:
+        """Get each product's priced observations at a store from its most recent observation day.
+
+        Returns availabilities keyed by product ID, newest first. Products without a priced
+        observation at the store are absent.
+        """
+        raise NotImplementedError('Subclass must implement get_latest_day_prices_by_store')
+
+    @abstractmethod
+    def get_store_prices_by_products(self, product_ids: Iterable[UUID]) -> dict[UUID, list[dict]]:
+        """Get the stores each product was observed at, with the latest price at each.
+
+        Returns dicts with 'store_id', 'store_name' and 'price' keyed by product ID,
+        ordered by store name. Products never observed at a store are absent.
+        """
+        raise NotImplementedError('Subclass must implement get_store_prices_by_products')
+
+    @abstractmethod
+    def get_available_products_for_run(
+        self,
+        run_id: UUID,
+        store_id: UUID,
+        search: str | None = None,
+        store_only: bool = False,
+        limit: int = 200,
+        offset: int = 0,
+        after_product_id: UUID | None = None,
+    ) -> list[tuple[Product, Any | None]] | None:
+        """Get products without a bid in the run, each with its latest availability at the store.
+
+        Products available at the store come first, then the rest (when store_only is False),
+        each ordered by case-insensitive name. search filters by name. Pages are selected with
+        limit/offset, or with after_product_id (the last product of the previous page) for
+        keyset pagination. Returns None if after_product_id is not a known product.
+        """
+        raise NotImplementedError('Subclass must implement get_available_products_for_run')
+
     @abstractmethod
     def update_product_availability_price(
         self, availability_id: UUID, price: float, notes: str = ''
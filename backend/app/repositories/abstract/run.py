@@ -21,6 +21,42 @@ class AbstractRunRepository(ABC):
         """Get completed and cancelled runs for a group (paginated)."""
         raise NotImplementedError('Subclass must implement get_completed_cancelled_runs_by_group')
 
+    @abstractmethod
+    def get_run_listings_by_group(self, group_id: UUID) -> list[dict]:
+        """Get all runs for a group with their store, group and leader details.
+
+        Each dict holds 'run', 'store_name', 'group_name', 'leader_name',
+        'leader_is_removed' and 'participant_count' (participants not removed).
+        """
+        raise NotImplementedError('Subclass must implement get_run_listings_by_group')
+
+    @abstractmethod
+    def get_completed_cancelled_run_listings_by_group(
+        self,
+        group_id: UUID,
+        limit: int = 10,
+        offset: int = 0,
+        after_run_id: UUID | None = None,
+    ) -> list[dict] | None:
+        """Get completed and cancelled run listings for a group, most recently finished first.
+
+        Pages either by limit/offset or, with after_run_id, by keyset on the finish
+        timestamp of the previous page's last run. Returns None if after_run_id is not a
+        completed or cancelled run of the group.
+        """
+        raise NotImplementedError(
+            'Subclass must implement get_completed_cancelled_run_listings_by_group'
+        )
+
+    @abstractmethod
+    def get_active_run_listings_by_store_for_user(
+        self, store_id: UUID, user_id: UUID
+    ) -> list[dict]:
+        """Get listings of active runs at a store across all of the user's groups."""
+        raise NotImplementedError(
+            'Subclass must implement get_active_run_listings_by_store_for_user'
+        )
+
     @abstractmethod
     def create_run(
         self, group_id: UUID, store_id: UUID, leader_id: UUID, comment: str | None = None
@@ -1,6 +1,7 @@
 """Abstract shopping repository interface."""
 
 from abc import ABC, abstractmethod
+from decimal import Decimal
 from uuid import UUID
 
 from app.core.models import ShoppingListItem
@@ -16,6 +17,20 @@ class AbstractShoppingRepository(ABC):
         """Create a shopping list item."""
         raise NotImplementedError('Subclass must implement create_shopping_list_item')
 
+    @abstractmethod
+    def bulk_create_shopping_list_items(
+        self, run_id: UUID, requested_quantities: dict[UUID, Decimal]
+    ) -> None:
+        """Create one shopping list item per product in one round trip.
+
+        Args:
+            run_id: The run the items belong to
+            requested_quantities: Requested quantity keyed by product ID
+
+        Changes are flushed but not committed, so callers control the transaction.
+        """
+        raise NotImplementedError('Subclass must implement bulk_create_shopping_list_items')
+
     @abstractmethod
     def get_shopping_list_items(self, run_id: UUID) -> list[ShoppingListItem]:
         """Get all shopping list items for a run."""
@@ -96,3 +111,14 @@ class AbstractShoppingRepository(ABC):
         raise NotImplementedError(
             'Subclass must implement update_shopping_list_item_requested_quantity'
         )
+
+    @abstractmethod
+    def bulk_update_requested_quantities(self, requested_quantities: dict[UUID, Decimal]) -> None:
+        """Update the requested quantity of several shopping list items in one round trip.
+
+        Args:
+            requested_quantities: New requested quantity keyed by shopping list item ID
+
+        Changes are flushed but not committed, so callers control the transaction.
+        """
+        raise NotImplementedError('Subclass must implement bulk_update_requested_quantities')
@@ -4,14 +4,19 @@ from abc import ABC, abstractmethod
 from uuid import UUID
 
 from app.core.models import Product, Run, Store
+from app.infrastructure.config import SEARCH_RESULT_LIMIT
 
 
 class AbstractStoreRepository(ABC):
     """Abstract base class for store repository operations."""
 
     @abstractmethod
-    def search_stores(self, query: str) -> list[Store]:
-        """Search stores by name."""
+    def search_stores(self, query: str, limit: int = SEARCH_RESULT_LIMIT) -> list[Store]:
+        """Search stores by name, most similar first.
+
+        Matches names containing the query or trigram-similar to it (typos, word
+        order), ordered by similarity and then name.
+        """
         raise NotImplementedError('Subclass must implement search_stores')
 
     @abstractmethod
@@ -19,6 +24,28 @@ class AbstractStoreRepository(ABC):
         """Get all stores (optionally paginated)."""
         raise NotImplementedError('Subclass must implement get_all_stores')
 
+    @abstractmethod
+    def get_stores_page(
+        self,
+        search: str | None = None,
+        verified: bool | None = None,
+        limit: int = 100,
+        offset: int = 0,
+        after_store_id: UUID | None = None,
+    ) -> list[Store] | None:
+        """Get one page of stores, newest first.
+
+        search matches name, address, chain or ID (case-insensitive substring), verified
+        filters by verification status. after_store_id is a keyset cursor: the page
+        continues after that store. Returns None if after_store_id is not a matching store.
+        """
+        raise NotImplementedError('Subclass must implement get_stores_page')
+
+    @abstractmethod
+    def count_stores(self, search: str | None = None, verified: bool | None = None) -> int:
+        """Count stores matching the get_stores_page filters."""
+        raise NotImplementedError('Subclass must implement count_stores')
+
     @abstractmethod
     def create_store(self, name: str) -> Store:
         """Create a new store."""
@@ -34,6 +34,28 @@ class AbstractUserRepository(ABC):
         """Get all users."""
         raise NotImplementedError('Subclass must implement get_all_users')
 
+    @abstractmethod
+    def get_users_page(
+        self,
+        search: str | None = None,
+        verified: bool | None = None,
+        limit: int = 100,
+        offset: int = 0,
+        after_user_id: UUID | None = None,
+    ) -> list[User] | None:
+        """Get one page of users, newest first.
+
+        search matches name, username or ID (case-insensitive substring), verified
+        filters by verification status. after_user_id is a keyset cursor: the page
+        continues after that user. Returns None if after_user_id is not a matching user.
+        """
+        raise NotImplementedError('Subclass must implement get_users_page')
+
+    @abstractmethod
+    def count_users(self, search: str | None = None, verified: bool | None = None) -> int:
+        """Count users matching the get_users_page filters."""
+        raise NotImplementedError('Subclass must implement count_users')
+
     @abstractmethod
     def update_user(self, user_id: UUID, **fields) -> User | None:
         """Update user fields. Returns updated user or None if not found."""
@@ -45,8 +67,8 @@ class AbstractUserRepository(ABC):
         raise NotImplementedError('Subclass must implement delete_user')
 
     @abstractmethod
-    def verify_password(self, password: str, stored_hash: str) -> bool:
-        """Verify a password."""
+    async def verify_password(self, password: str, stored_hash: str) -> bool:
+        """Verify a password without blocking the event loop."""
         raise NotImplementedError('Subclass must implement verify_password')
 
     @abstractmethod
@@ -0,0 +1,16 @@
+"""Async database repository implementations (SQLAlchemy AsyncSession).
+
+Only WebSocket authentication runs on the async path, so these repositories hold just
+the lookups it makes; all other routes use the sync repositories. Relationships are
+never lazy-loaded in async code.
+"""
+
+from app.repositories.async_database.group import AsyncDatabaseGroupRepository
+from app.repositories.async_database.run import AsyncDatabaseRunRepository
+from app.repositories.async_database.user import AsyncDatabaseUserRepository
+
+__all__ = [
+    'AsyncDatabaseGroupRepository',
+    'AsyncDatabaseRunRepository',
+    'AsyncDatabaseUserRepository',
+]
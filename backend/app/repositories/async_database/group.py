@@ -0,0 +1,18 @@
+"""Async database group repository implementation."""
+
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.models import Group
+
+
+class AsyncDatabaseGroupRepository:
+    """AsyncSession implementation of the group lookups used by WebSockets."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_group_by_id(self, group_id: UUID) -> Group | None:
+        """Get group by ID."""
+        return await self.db.get(Group, group_id)
@@ -0,0 +1,18 @@
+"""Async database run repository implementation."""
+
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.models import Run
+
+
+class AsyncDatabaseRunRepository:
+    """AsyncSession implementation of the run lookups used by WebSockets."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_run_by_id(self, run_id: UUID) -> Run | None:
+        """Get run by ID."""
+        return await self.db.get(Run, run_id)
@@ -0,0 +1,32 @@
+"""Async database user repository implementation.
+
+Only the lookups WebSocket authentication needs; everything else uses the sync
+`DatabaseUserRepository`.
+"""
+
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.models import Group, User, group_membership
+
+
+class AsyncDatabaseUserRepository:
+    """AsyncSession implementation of the user lookups used by WebSockets."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_user_by_id(self, user_id: UUID) -> User | None:
+        """Get user by ID."""
+        return await self.db.get(User, user_id)
+
+    async def get_user_groups(self, user: User) -> list[Group]:
+        """Get all groups that a user is a member of."""
+        result = await self.db.execute(
+            select(Group)
+            .join(group_membership, Group.id == group_membership.c.group_id)
+            .where(group_membership.c.user_id == user.id)
+        )
+        return list(result.scalars().all())
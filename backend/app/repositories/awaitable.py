@@ -0,0 +1,27 @@
+"""Awaitable facade over a synchronous repository."""
+
+import functools
+import inspect
+
+
+class AwaitableRepository:
+    """Expose a sync repository through the same awaitable API as the async ones.
+
+    Used by the `get_async_*_repository` factories outside REPO_MODE=async, so async
+    callers can always ``await repo.method(...)`` whichever backend is configured.
+    Methods that are already coroutines are passed through unchanged.
+    """
+
+    def __init__(self, repository):
+        self.repository = repository
+
+    def __getattr__(self, name: str):
+        attr = getattr(self.repository, name)
+        if not callable(attr) or inspect.iscoroutinefunction(attr):
+            return attr
+
+        @functools.wraps(attr)
+        async def call(*args, **kwargs):
+            return attr(*args, **kwargs)
+
+        return call
@@ -0,0 +1,27 @@
+"""Cached database repository implementations (REPO_MODE=cached).
+
+The database repositories with a read-through cache in front of their hot lookups:
+runs, participations, users, groups, group membership and group admin status.
+Everything else, writes included, goes straight to the database repositories.
+The cache is invalidated in process only, so this mode serves from a single process.
+"""
+
+from app.repositories.cached.cache import (
+    RepositoryCache,
+    claim_single_process,
+    release_single_process,
+    repository_cache,
+)
+from app.repositories.cached.group import CachedGroupRepository
+from app.repositories.cached.run import CachedRunRepository
+from app.repositories.cached.user import CachedUserRepository
+
+__all__ = [
+    'CachedGroupRepository',
+    'CachedRunRepository',
+    'CachedUserRepository',
+    'RepositoryCache',
+    'claim_single_process',
+    'release_single_process',
+    'repository_cache',
+]
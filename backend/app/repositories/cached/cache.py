@@ -0,0 +1,293 @@
+"""Read-through cache shared by the cached repositories.
+
+Entries are plain data (column values of a row, or a flag) keyed by section and
+lookup key, kept in one LRU. Every key hashes to a version stripe of its section;
+an entry records the section generation and stripe version read before its row
+was loaded and is only served while both are unchanged. Writes bump the stripe of
+each key they touch, or the whole section generation when the keys are unknown, so
+an entry loaded concurrently with a write is never served afterwards.
+
+Writes are picked up from the session rather than from individual repository
+methods: rows flushed by the ORM (repository writes as well as services changing
+attributes of loaded rows) bump the keys they belong to, and UPDATE, INSERT and
+DELETE statements bump the sections of their table. A session's writes are bumped
+again when its transaction commits or rolls back, and until then the session
+bypasses the cache for what it wrote, so uncommitted data is never cached.
+
+Cached rows are attached to the caller's session as persistent, unmodified
+instances without a query; a row already in the session's identity map is
+returned as is.
+
+Invalidation is in-process only: writes made by another process are never seen
+before the entry's TTL runs out. REPO_MODE=cached is therefore limited to a single
+API process, which claim_single_process enforces at startup on PostgreSQL.
+"""
+
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from collections.abc import Callable, Hashable, Iterable
+from typing import Any
+
+from sqlalchemy import Connection, Engine, event, func, inspect, select
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from app.core import error_codes
+from app.core.exceptions import ConfigurationError
+from app.core.models import Group, Run, RunParticipation, User
+from app.infrastructure.config import REPO_CACHE_MAX_ENTRIES, REPO_CACHE_TTL_SECONDS
+
+MISSING = object()
+
+# Version stripes per section; keys sharing a stripe are invalidated together
+STRIPES = 256
+
+# session.info key holding the (section, key) pairs written in the current transaction;
+# a key of None stands for the whole section
+_WRITES_KEY = 'repository_cache_writes'
+
+# PostgreSQL advisory lock held by the one process serving REPO_MODE=cached
+SINGLE_PROCESS_LOCK_KEY = 0x62756C7163616368
+
+# Sections affected by DML statements on each table
+TABLE_SECTIONS = {
+    'runs': ('runs', 'participations'),
+    'run_participations': ('participations',),
+    'users': ('users',),
+    'groups': ('groups', 'user_groups'),
+    'group_membership': ('user_groups', 'group_admins'),
+}
+
+
+def row_values(row: Any) -> dict[str, Any]:
+    """Column values of a loaded row."""
+    return {attr.key: getattr(row, attr.key) for attr in inspect(type(row)).column_attrs}
+
+
+def attach_row(db: Session, model: type, values: dict[str, Any]) -> Any:
+    """Persistent instance of model with values in db, without a query."""
+    existing = db.identity_map.get(db.identity_key(model, values['id']))
+    if existing is not None:
+        return existing
+    row = model(**values)
+    make_transient_to_detached(row)
+    db.add(row)
+    return row
+
+
+def _changed(row: Any, attr: str) -> bool:
+    return inspect(row).attrs[attr].history.has_changes()
+
+
+def _row_writes(row: Any, deleted: bool) -> list[tuple[str, Hashable | None]]:
+    """(section, key) pairs made stale by flushing row (key None: the whole section)."""
+    if isinstance(row, Run):
+        return [('runs', row.id)] + ([('participations', None)] if deleted else [])
+    if isinstance(row, RunParticipation):
+        writes = [('participations', (row.user_id, row.run_id))]
+        if _changed(row, 'user_id') or _changed(row, 'run_id'):
+            writes.append(('participations', None))
+        return writes
+    if isinstance(row, User):
+        writes = [('users', row.id)]
+        if deleted:
+            writes += [('participations', None), ('user_groups', None), ('group_admins', None)]
+        elif _changed(row, 'groups'):
+            writes += [('user_groups', row.id), ('group_admins', None)]
+        return writes
+    if isinstance(row, Group):
+        writes = [('groups', row.id), ('user_groups', None)]
+        if deleted or _changed(row, 'members'):
+            writes.append(('group_admins', None))
+        return writes
+    return []
+
+
+class _SectionStats:
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+
+    def as_dict(self) -> dict:
+        return {'hits': self.hits, 'misses': self.misses}
+
+
+class RepositoryCache:
+    """LRU of repository lookups with versioned invalidation."""
+
+    def __init__(
+        self,
+        max_entries: int = REPO_CACHE_MAX_ENTRIES,
+        ttl_seconds: float = REPO_CACHE_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        # (section, key) -> (version, expiry time, value), least recently used first
+        self._entries: OrderedDict[tuple[str, Hashable], tuple[tuple[int, int], float, Any]] = (
+            OrderedDict()
+        )
+        self._generations: defaultdict[str, int] = defaultdict(int)
+        self._stripes: defaultdict[str, list[int]] = defaultdict(lambda: [0] * STRIPES)
+        self._stats: defaultdict[str, _SectionStats] = defaultdict(_SectionStats)
+        self._evictions = 0
+        self._installed = False
+
+    def install(self) -> None:
+        """Listen to session events so writes invalidate entries (idempotent)."""
+        with self._lock:
+            if self._installed:
+                return
+            self._installed = True
+        event.listen(Session, 'after_flush', self._after_flush)
+        event.listen(Session, 'do_orm_execute', self._on_execute)
+        event.listen(Session, 'after_commit', self._after_transaction)
+        event.listen(Session, 'after_soft_rollback', self._after_rollback)
+
+    def _version(self, section: str, key: Hashable) -> tuple[int, int]:
+        return self._generations[section], self._stripes[section][hash(key) % STRIPES]
+
+    def get(self, db: Session, section: str, key: Hashable) -> tuple[Any, Any]:
+        """Look up key.
+
+        Returns:
+            (cached value or MISSING, token for put()); the token is None when db has
+            uncommitted writes to the key, which must then not be cached
+        """
+        writes = db.info.get(_WRITES_KEY)
+        if writes and ((section, key) in writes or (section, None) in writes):
+            return MISSING, None
+        with self._lock:
+            version = self._version(section, key)
+            entry = self._entries.get((section, key))
+            if entry is not None and entry[0] == version and entry[1] > self._clock():
+                self._entries.move_to_end((section, key))
+                self._stats[section].hits += 1
+                return entry[2], version
+            self._stats[section].misses += 1
+            return MISSING, version
+
+    def put(self, section: str, key: Hashable, token: Any, value: Any) -> None:
+        """Store a value loaded after get() returned token."""
+        if token is None:
+            return
+        with self._lock:
+            if token != self._version(section, key):
+                return
+            self._entries[(section, key)] = (token, self._clock() + self.ttl_seconds, value)
+            self._entries.move_to_end((section, key))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, writes: Iterable[tuple[str, Hashable | None]]) -> None:
+        """Make entries for the (section, key) pairs stale (key None: the whole section)."""
+        with self._lock:
+            for section, key in writes:
+                if key is None:
+                    self._generations[section] += 1
+                else:
+                    self._stripes[section][hash(key) % STRIPES] += 1
+                    self._entries.pop((section, key), None)
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            for section in list(self._generations):
+                self._generations[section] += 1
+            self._stats.clear()
+            self._evictions = 0
+
+    def stats(self) -> dict:
+        """Return entry count, evictions and hits and misses per section."""
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'evictions': self._evictions,
+                'sections': {section: stats.as_dict() for section, stats in self._stats.items()},
+            }
+
+    def _record(self, session: Session, writes: list[tuple[str, Hashable | None]]) -> None:
+        if writes:
+            self.invalidate(writes)
+            session.info.setdefault(_WRITES_KEY, set()).update(writes)
+
+    def _after_flush(self, session: Session, flush_context: Any) -> None:
+        writes = []
+        for row in (*session.new, *session.dirty):
+            writes.extend(_row_writes(row, deleted=False))
+        for row in session.deleted:
+            writes.extend(_row_writes(row, deleted=True))
+        self._record(session, writes)
+
+    def _on_execute(self, orm_execute_state: Any) -> None:
+        if not (
+            orm_execute_state.is_update
+            or orm_execute_state.is_insert
+            or orm_execute_state.is_delete
+        ):
+            return
+        table = getattr(orm_execute_state.statement, 'table', None)
+        sections = TABLE_SECTIONS.get(getattr(table, 'name', None), ())
+        self._record(orm_execute_state.session, [(section, None) for section in sections])
+
+    def _after_transaction(self, session: Session) -> None:
+        writes = session.info.pop(_WRITES_KEY, None)
+        if writes:
+            self.invalidate(writes)
+
+    def _after_rollback(self, session: Session, previous_transaction: Any) -> None:
+        self._after_transaction(session)
+
+
+def cached_row(
+    db: Session, section: str, key: Hashable, model: type, load: Callable[[], Any]
+) -> Any:
+    """Row for key from the cache, or from load() (which is then cached)."""
+    value, token = repository_cache.get(db, section, key)
+    if value is not MISSING:
+        return attach_row(db, model, value) if value is not None else None
+    row = load()
+    repository_cache.put(section, key, token, row_values(row) if row is not None else None)
+    return row
+
+
+def claim_single_process(engine: Engine) -> Connection | None:
+    """Take the cached mode's advisory lock, or refuse to start if another process holds it.
+
+    A second process (another worker or host) would keep serving entries this one has
+    invalidated, so it must not start. The lock lives on a dedicated connection for the
+    life of the process; pass it to release_single_process on shutdown. Returns None on
+    databases without advisory locks (SQLite in development and tests).
+    """
+    if engine.dialect.name != 'postgresql':
+        return None
+    connection = engine.connect()
+    locked = connection.execute(select(func.pg_try_advisory_lock(SINGLE_PROCESS_LOCK_KEY)))
+    if not locked.scalar():
+        connection.close()
+        raise ConfigurationError(
+            code=error_codes.CONFIGURATION_ERROR,
+            message='REPO_MODE=cached runs in a single process; another process is already '
+            'serving this database (run one worker, or use REPO_MODE=database)',
+            repo_mode='cached',
+        )
+    # The lock is session-level; end the transaction so the connection does not sit idle in it
+    connection.commit()
+    return connection
+
+
+def release_single_process(connection: Connection | None) -> None:
+    """Release the lock taken by claim_single_process and close its connection."""
+    if connection is None:
+        return
+    connection.execute(select(func.pg_advisory_unlock(SINGLE_PROCESS_LOCK_KEY)))
+    connection.commit()
+    connection.close()
+
+
+repository_cache = RepositoryCache()
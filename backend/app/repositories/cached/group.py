@@ -0,0 +1,31 @@
+"""Cached group repository implementation."""
+
+from functools import partial
+from uuid import UUID
+
+from app.core.models import Group
+from app.repositories.cached.cache import MISSING, cached_row, repository_cache
+from app.repositories.database.group import DatabaseGroupRepository
+
+
+class CachedGroupRepository(DatabaseGroupRepository):
+    """Database group repository with cached group and admin status lookups."""
+
+    def __init__(self, db):
+        super().__init__(db)
+        repository_cache.install()
+
+    def get_group_by_id(self, group_id: UUID) -> Group | None:
+        """Get group by ID."""
+        return cached_row(
+            self.db, 'groups', group_id, Group, partial(super().get_group_by_id, group_id)
+        )
+
+    def is_user_group_admin(self, group_id: UUID, user_id: UUID) -> bool:
+        """Check if a user is an admin of a group."""
+        value, token = repository_cache.get(self.db, 'group_admins', (group_id, user_id))
+        if value is not MISSING:
+            return value
+        is_admin = super().is_user_group_admin(group_id, user_id)
+        repository_cache.put('group_admins', (group_id, user_id), token, is_admin)
+        return is_admin
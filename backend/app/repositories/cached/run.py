@@ -0,0 +1,30 @@
+"""Cached run repository implementation (runs and participations)."""
+
+from functools import partial
+from uuid import UUID
+
+from app.core.models import Run, RunParticipation
+from app.repositories.cached.cache import cached_row, repository_cache
+from app.repositories.database.run import DatabaseRunRepository
+
+
+class CachedRunRepository(DatabaseRunRepository):
+    """Database run repository with cached run and participation lookups."""
+
+    def __init__(self, db):
+        super().__init__(db)
+        repository_cache.install()
+
+    def get_run_by_id(self, run_id: UUID) -> Run | None:
+        """Get run by ID."""
+        return cached_row(self.db, 'runs', run_id, Run, partial(super().get_run_by_id, run_id))
+
+    def get_participation(self, user_id: UUID, run_id: UUID) -> RunParticipation | None:
+        """Get a user's participation in a run."""
+        return cached_row(
+            self.db,
+            'participations',
+            (user_id, run_id),
+            RunParticipation,
+            partial(super().get_participation, user_id, run_id),
+        )
@@ -0,0 +1,37 @@
+"""Cached user repository implementation."""
+
+from functools import partial
+from uuid import UUID
+
+from app.core.models import Group, User
+from app.repositories.cached.cache import (
+    MISSING,
+    attach_row,
+    cached_row,
+    repository_cache,
+    row_values,
+)
+from app.repositories.database.user import DatabaseUserRepository
+
+
+class CachedUserRepository(DatabaseUserRepository):
+    """Database user repository with cached user and group membership lookups."""
+
+    def __init__(self, db):
+        super().__init__(db)
+        repository_cache.install()
+
+    def get_user_by_id(self, user_id: UUID) -> User | None:
+        """Get user by ID."""
+        return cached_row(self.db, 'users', user_id, User, partial(super().get_user_by_id, user_id))
+
+    def get_user_groups(self, user: User) -> list[Group]:
+        """Get all groups that a user is a member of."""
+        value, token = repository_cache.get(self.db, 'user_groups', user.id)
+        if value is not MISSING:
+            return [attach_row(self.db, Group, values) for values in value]
+        groups = super().get_user_groups(user)
+        repository_cache.put(
+            'user_groups', user.id, token, tuple(row_values(group) for group in groups)
+        )
+        return groups
@@ -3,6 +3,7 @@
 from decimal import Decimal
 from uuid import UUID
 
+from sqlalchemy import insert, update
 from sqlalchemy.orm import Session, joinedload
 
 from app.core.models import ProductBid, RunParticipation
@@ -116,6 +117,16 @@ class DatabaseBidRepository(AbstractBidRepository):
             bid.distributed_price_per_unit = price_per_unit
             self.db.commit()
 
+    def bulk_update_bids(self, updates: list[dict]) -> None:
+        """Update several bids in one round trip (executemany, flushed but not committed)."""
+        if updates:
+            self.db.execute(update(ProductBid), updates)
+
+    def bulk_create_bids(self, bids: list[dict]) -> None:
+        """Insert several bids in one round trip (executemany, flushed but not committed)."""
+        if bids:
+            self.db.execute(insert(ProductBid), bids)
+
     def commit_changes(self) -> None:
         """Commit any pending changes to the database."""
         self.db.commit()
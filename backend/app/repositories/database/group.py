@@ -2,11 +2,13 @@
 
 from uuid import UUID, uuid4
 
-from sqlalchemy import delete, insert, select, update
+from sqlalchemy import case, delete, func, insert, select, update
 from sqlalchemy.orm import Session
 
-from app.core.models import Group, User, group_membership
+from app.core.models import Group, Run, Store, User, group_membership
+from app.core.run_state import RunState
 from app.repositories.abstract.group import AbstractGroupRepository
+from app.repositories.database.listing import newest_first_page, search_filter
 
 
 class DatabaseGroupRepository(AbstractGroupRepository):
@@ -124,6 +126,144 @@ class DatabaseGroupRepository(AbstractGroupRepository):
         self.db.commit()
         return result.rowcount > 0
 
+    def get_user_group_summaries(self, user_id: UUID) -> list[dict]:
+        """Get the groups a user belongs to with member and run counts.
+
+        Two queries regardless of group count or run history: one row per group with
+        aggregated member and run counts, and the active runs of those groups with their
+        store names. The counts only aggregate the user's own groups.
+        """
+        finished_states = (RunState.COMPLETED, RunState.CANCELLED)
+        user_group_ids = select(group_membership.c.group_id).where(
+            group_membership.c.user_id == user_id
+        )
+        member_counts = (
+            select(group_membership.c.group_id, func.count().label('member_count'))
+            .where(group_membership.c.group_id.in_(user_group_ids))
+            .group_by(group_membership.c.group_id)
+            .subquery()
+        )
+        run_counts = (
+            select(
+                Run.group_id,
+                func.sum(case((Run.state.notin_(finished_states), 1), else_=0)).label('active'),
+                func.sum(case((Run.state == RunState.COMPLETED, 1), else_=0)).label('completed'),
+            )
+            .where(Run.group_id.in_(user_group_ids))
+            .group_by(Run.group_id)
+            .subquery()
+        )
+        user_membership = group_membership.alias('user_membership')
+
+        rows = (
+            self.db.query(
+                Group,
+                User.name,
+                func.coalesce(member_counts.c.member_count, 0),
+                func.coalesce(run_counts.c.active, 0),
+                func.coalesce(run_counts.c.completed, 0),
+            )
+            .join(user_membership, user_membership.c.group_id == Group.id)
+            .outerjoin(User, User.id == Group.created_by)
+            .outerjoin(member_counts, member_counts.c.group_id == Group.id)
+            .outerjoin(run_counts, run_counts.c.group_id == Group.id)
+            .filter(user_membership.c.user_id == user_id)
+            .order_by(Group.created_at, Group.id)
+            .all()
+        )
+        if not rows:
+            return []
+
+        active_runs: dict[UUID, list[dict]] = {}
+        run_rows = (
+            self.db.query(Run.id, Run.group_id, Run.state, Store.name)
+            .outerjoin(Store, Store.id == Run.store_id)
+            .filter(
+                Run.group_id.in_([group.id for group, *_ in rows]),
+                Run.state.notin_(finished_states),
+            )
+            .all()
+        )
+        for run_id, group_id, state, store_name in run_rows:
+            active_runs.setdefault(group_id, []).append(
+                {'id': run_id, 'state': state, 'store_name': store_name}
+            )
+
+        return [
+            {
+                'group': group,
+                'creator_name': creator_name,
+                'member_count': member_count,
+                'active_runs_count': active_count,
+                'completed_runs_count': completed_count,
+                'active_runs': active_runs.get(group.id, []),
+            }
+            for group, creator_name, member_count, active_count, completed_count in rows
+        ]
+
+    def search_user_groups(self, user_id: UUID, query: str, limit: int) -> list[dict]:
+        """Find the groups a user belongs to whose name contains query, by name.
+
+        One query, with member counts of the user's groups aggregated in a subquery.
+        """
+        user_group_ids = select(group_membership.c.group_id).where(
+            group_membership.c.user_id == user_id
+        )
+        member_counts = (
+            select(group_membership.c.group_id, func.count().label('member_count'))
+            .where(group_membership.c.group_id.in_(user_group_ids))
+            .group_by(group_membership.c.group_id)
+            .subquery()
+        )
+        user_membership = group_membership.alias('user_membership')
+
+        rows = (
+            self.db.query(Group, func.coalesce(member_counts.c.member_count, 0))
+            .join(user_membership, user_membership.c.group_id == Group.id)
+            .outerjoin(member_counts, member_counts.c.group_id == Group.id)
+            .filter(user_membership.c.user_id == user_id, search_filter(query, Group.name))
+            .order_by(Group.name, Group.id)
+            .limit(limit)
+            .all()
+        )
+        return [{'group': group, 'member_count': member_count} for group, member_count in rows]
+
     def get_all_groups(self) -> list[Group]:
         """Get all groups."""
         return self.db.query(Group).all()
+
+    def get_group_admin_listings(
+        self,
+        search: str | None = None,
+        limit: int = 100,
+        offset: int = 0,
+        after_group_id: UUID | None = None,
+    ) -> list[dict] | None:
+        """Get one page of groups with creator name and member count, newest first."""
+        member_counts = (
+            select(group_membership.c.group_id, func.count().label('member_count'))
+            .group_by(group_membership.c.group_id)
+            .subquery()
+        )
+        query = (
+            self.db.query(Group, User.name, func.coalesce(member_counts.c.member_count, 0))
+            .outerjoin(User, User.id == Group.created_by)
+            .outerjoin(member_counts, member_counts.c.group_id == Group.id)
+        )
+        if search:
+            query = query.filter(search_filter(search, Group.name, Group.id))
+
+        rows = newest_first_page(query, Group, limit, offset, after_group_id)
+        if rows is None:
+            return None
+        return [
+            {'group': group, 'creator_name': creator_name, 'member_count': member_count}
+            for group, creator_name, member_count in rows
+        ]
+
+    def count_groups(self, search: str | None = None) -> int:
+        """Count groups matching the get_group_admin_listings search."""
+        query = self.db.query(func.count(Group.id))
+        if search:
+            query = query.filter(search_filter(search, Group.name, Group.id))
+        return query.scalar()
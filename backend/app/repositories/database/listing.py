@@ -0,0 +1,84 @@
+"""Search and pagination helpers shared by the database repositories."""
+
+from uuid import UUID
+
+from sqlalchemy import String, cast, desc, func, or_, tuple_
+from sqlalchemy.orm import Query
+
+# Escape character for LIKE patterns built by contains_pattern
+LIKE_ESCAPE = '\\'
+
+
+def contains_pattern(text: str) -> str:
+    """LIKE pattern matching text anywhere, with %, _ and the escape character literal.
+
+    Use with ``escape=LIKE_ESCAPE``.
+    """
+    escaped = (
+        text.replace(LIKE_ESCAPE, LIKE_ESCAPE * 2)
+        .replace('%', LIKE_ESCAPE + '%')
+        .replace('_', LIKE_ESCAPE + '_')
+    )
+    return f'%{escaped}%'
+
+
+def search_filter(search: str, *columns):
+    """Case-insensitive substring match of search against any of the columns.
+
+    UUID columns are compared as text, so partial IDs match too.
+    """
+    pattern = contains_pattern(search)
+    return or_(*(cast(column, String).ilike(pattern, escape=LIKE_ESCAPE) for column in columns))
+
+
+def newest_first_page(
+    query: Query,
+    model,
+    limit: int,
+    offset: int = 0,
+    after_id: UUID | None = None,
+) -> list | None:
+    """Order a query by (created_at, id) descending and return one page of it.
+
+    Args:
+        query: Query selecting from model, with any filters applied
+        model: Mapped class with created_at and id columns
+        limit: Maximum number of rows
+        offset: Rows to skip (after the cursor, if any)
+        after_id: Keyset cursor: continue after the row with this ID
+
+    Returns:
+        The rows of the page, or None if after_id is not a row of the query
+    """
+    if after_id is not None:
+        # The cursor must be part of the listing; a deleted or filtered-out row would
+        # otherwise restart at the first page
+        cursor = (
+            query.filter(model.id == after_id).with_entities(model.created_at, model.id).first()
+        )
+        if cursor is None:
+            return None
+        query = query.filter(tuple_(model.created_at, model.id) < tuple_(*cursor))
+
+    query = query.order_by(desc(model.created_at), desc(model.id))
+    if offset:
+        query = query.offset(offset)
+    return query.limit(limit).all()
+
+
+def ranked_name_search(query: Query, column, text: str, limit: int) -> list:
+    """Rows whose column contains text or is similar to it, most similar first.
+
+    On PostgreSQL this uses pg_trgm: both the ILIKE and the % (similarity above
+    pg_trgm.similarity_threshold) conditions are served by the column's trigram GIN
+    index, and rows are ranked by similarity(). Other databases have no trigram
+    support and fall back to a substring match, shortest names first.
+    """
+    contains = column.ilike(contains_pattern(text), escape=LIKE_ESCAPE)
+    if query.session.get_bind().dialect.name == 'postgresql':
+        query = query.filter(or_(contains, column.op('%')(text))).order_by(
+            desc(func.similarity(column, text)), column
+        )
+    else:
+        query = query.filter(contains).order_by(func.length(column), column)
+    return query.limit(limit).all()
@@ -1,8 +1,10 @@
 """Database notification repository implementation."""
 
+from datetime import UTC, datetime
 from typing import Any
-from uuid import UUID
+from uuid import UUID, uuid4
 
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from app.core.models import Notification
@@ -23,6 +25,25 @@ class DatabaseNotificationRepository(AbstractNotificationRepository):
         self.db.refresh(notification)
         return notification
 
+    def create_notifications_bulk(self, notifications: list[dict[str, Any]]) -> list[Notification]:
+        """Create many notifications with one multi-row insert (flushed, not committed)."""
+        if not notifications:
+            return []
+        created_at = datetime.now(UTC)
+        rows = [
+            {
+                'id': uuid4(),
+                'user_id': notification['user_id'],
+                'type': notification['type'],
+                'data': notification['data'],
+                'read': False,
+                'created_at': created_at,
+            }
+            for notification in notifications
+        ]
+        self.db.execute(insert(Notification), rows)
+        return [Notification(**row) for row in rows]
+
     def get_user_notifications(
         self, user_id: UUID, limit: int = 20, offset: int = 0
     ) -> list[Notification]:
@@ -1,13 +1,47 @@
 """Database product repository implementation."""
 
+from collections.abc import Iterable
 from decimal import Decimal
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy.orm import Session
+from sqlalchemy import Date, and_, case, func, select, tuple_
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy.sql.functions import FunctionElement
 
-from app.core.models import Product, ProductAvailability, ProductBid, ShoppingListItem
+from app.core.models import (
+    Product,
+    ProductAvailability,
+    ProductBid,
+    RunParticipation,
+    ShoppingListItem,
+    Store,
+)
+from app.infrastructure.config import SEARCH_RESULT_LIMIT
 from app.repositories.abstract.product import AbstractProductRepository
+from app.repositories.database.listing import (
+    newest_first_page,
+    ranked_name_search,
+    search_filter,
+)
+
+
+class _day_of(FunctionElement):  # noqa: N801 - SQL function name
+    """Calendar day of a timestamp (CAST AS DATE; SQLite's CAST would yield the year)."""
+
+    type = Date()
+    inherit_cache = True
+
+
+@compiles(_day_of)
+def _compile_day_of(element, compiler, **kw):
+    return f'CAST({compiler.process(element.clauses, **kw)} AS DATE)'
+
+
+@compiles(_day_of, 'sqlite')
+def _compile_day_of_sqlite(element, compiler, **kw):
+    return f'date({compiler.process(element.clauses, **kw)})'
 
 
 class DatabaseProductRepository(AbstractProductRepository):
@@ -28,14 +62,21 @@ class DatabaseProductRepository(AbstractProductRepository):
         product_ids = [pid[0] for pid in product_ids]
         return self.db.query(Product).filter(Product.id.in_(product_ids)).all()
 
-    def search_products(self, query: str) -> list[Product]:
-        """Search for products by name."""
-        return self.db.query(Product).filter(Product.name.ilike(f'%{query}%')).all()
+    def search_products(self, query: str, limit: int = SEARCH_RESULT_LIMIT) -> list[Product]:
+        """Search for products by name, most similar first."""
+        return ranked_name_search(self.db.query(Product), Product.name, query, limit)
 
     def get_product_by_id(self, product_id: UUID) -> Product | None:
         """Get product by ID."""
         return self.db.query(Product).filter(Product.id == product_id).first()
 
+    def get_products_by_ids(self, product_ids: Iterable[UUID]) -> list[Product]:
+        """Get all products whose ID is in product_ids (missing IDs are skipped)."""
+        product_ids = list(product_ids)
+        if not product_ids:
+            return []
+        return self.db.query(Product).filter(Product.id.in_(product_ids)).all()
+
     def create_product(
         self, name: str, brand: str | None = None, unit: str | None = None
     ) -> Product:
@@ -50,6 +91,35 @@ class DatabaseProductRepository(AbstractProductRepository):
         """Get all products."""
         return self.db.query(Product).all()
 
+    @staticmethod
+    def _admin_filters(search: str | None, verified: bool | None) -> list:
+        filters = []
+        if search:
+            filters.append(search_filter(search, Product.name, Product.brand, Product.id))
+        if verified is not None:
+            filters.append(Product.verified == verified)
+        return filters
+
+    def get_products_page(
+        self,
+        search: str | None = None,
+        verified: bool | None = None,
+        limit: int = 100,
+        offset: int = 0,
+        after_product_id: UUID | None = None,
+    ) -> list[Product] | None:
+        """Get one page of products, newest first."""
+        query = self.db.query(Product).filter(*self._admin_filters(search, verified))
+        return newest_first_page(query, Product, limit, offset, after_product_id)
+
+    def count_products(self, search: str | None = None, verified: bool | None = None) -> int:
+        """Count products matching the get_products_page filters."""
+        return (
+            self.db.query(func.count(Product.id))
+            .filter(*self._admin_filters(search, verified))
+            .scalar()
+        )
+
     def update_product(self, product_id: UUID, **fields) -> Product | None:
         """Update product fields. Returns updated product or None if not found."""
         product = self.db.query(Product).filter(Product.id == product_id).first()
@@ -99,6 +169,183 @@ class DatabaseProductRepository(AbstractProductRepository):
             .first()
         )
 
+    def _latest_availabilities(self, store_id: UUID, product_ids: list[UUID] | None = None):
+        """Subquery of availabilities at a store ranked newest-first per product.
+
+        Rank 1 is each product's latest observation. ROW_NUMBER() is used rather than
+        DISTINCT ON so the same query runs on SQLite.
+        """
+        ranked = select(
+            ProductAvailability,
+            func.row_number()
+            .over(
+                partition_by=ProductAvailability.product_id,
+                order_by=ProductAvailability.created_at.desc(),
+            )
+            .label('rank'),
+        ).where(ProductAvailability.store_id == store_id)
+        if product_ids is not None:
+            ranked = ranked.where(ProductAvailability.product_id.in_(product_ids))
+        return ranked.subquery()
+
+    def get_latest_availabilities_by_store(
+        self, store_id: UUID, product_ids: Iterable[UUID] | None = None
+    ) -> dict[UUID, ProductAvailability]:
+        """Get the most recent availability at a store for each product, keyed by product ID."""
+        if product_ids is not None:
+            product_ids = list(product_ids)
+            if not product_ids:
+                return {}
+
+        ranked = self._latest_availabilities(store_id, product_ids)
+        latest = aliased(ProductAvailability, ranked)
+        availabilities = self.db.query(latest).filter(ranked.c.rank == 1).all()
+        return {availability.product_id: availability for availability in availabilities}
+
+    def get_latest_day_prices_by_store(
+        self, store_id: UUID, product_ids: Iterable[UUID]
+    ) -> dict[UUID, list[ProductAvailability]]:
+        """Get each product's priced observations at a store from its most recent observation day.
+
+        One query: the latest observation day per product (GROUP BY) joined back to that
+        day's priced observations.
+        """
+        product_ids = list(product_ids)
+        if not product_ids:
+            return {}
+
+        priced = and_(
+            ProductAvailability.store_id == store_id,
+            ProductAvailability.product_id.in_(product_ids),
+            ProductAvailability.price.isnot(None),
+            ProductAvailability.price != 0,
+            ProductAvailability.created_at.isnot(None),
+        )
+        latest_day = (
+            select(
+                ProductAvailability.product_id,
+                func.max(_day_of(ProductAvailability.created_at)).label('day'),
+            )
+            .where(priced)
+            .group_by(ProductAvailability.product_id)
+            .subquery()
+        )
+        availabilities = (
+            self.db.query(ProductAvailability)
+            .join(
+                latest_day,
+                and_(
+                    latest_day.c.product_id == ProductAvailability.product_id,
+                    _day_of(ProductAvailability.created_at) == latest_day.c.day,
+                ),
+            )
+            .filter(priced)
+            .order_by(ProductAvailability.created_at.desc())
+            .all()
+        )
+
+        prices: dict[UUID, list[ProductAvailability]] = {}
+        for availability in availabilities:
+            prices.setdefault(availability.product_id, []).append(availability)
+        return prices
+
+    def get_store_prices_by_products(self, product_ids: Iterable[UUID]) -> dict[UUID, list[dict]]:
+        """Get the stores each product was observed at, with the latest price at each.
+
+        One query: availabilities ranked newest-first per (product, store), rank 1 joined
+        to its store.
+        """
+        product_ids = list(product_ids)
+        if not product_ids:
+            return {}
+
+        ranked = (
+            select(
+                ProductAvailability.product_id,
+                ProductAvailability.store_id,
+                ProductAvailability.price,
+                func.row_number()
+                .over(
+                    partition_by=(ProductAvailability.product_id, ProductAvailability.store_id),
+                    order_by=ProductAvailability.created_at.desc(),
+                )
+                .label('rank'),
+            )
+            .where(ProductAvailability.product_id.in_(product_ids))
+            .subquery()
+        )
+        rows = (
+            self.db.query(ranked.c.product_id, Store.id, Store.name, ranked.c.price)
+            .join(Store, Store.id == ranked.c.store_id)
+            .filter(ranked.c.rank == 1)
+            .order_by(Store.name, Store.id)
+            .all()
+        )
+
+        prices: dict[UUID, list[dict]] = {}
+        for product_id, store_id, store_name, price in rows:
+            prices.setdefault(product_id, []).append(
+                {'store_id': store_id, 'store_name': store_name, 'price': price}
+            )
+        return prices
+
+    def get_available_products_for_run(
+        self,
+        run_id: UUID,
+        store_id: UUID,
+        search: str | None = None,
+        store_only: bool = False,
+        limit: int = 200,
+        offset: int = 0,
+        after_product_id: UUID | None = None,
+    ) -> list[tuple[Product, ProductAvailability | None]] | None:
+        """Get products without a bid in the run, each with its latest availability at the store.
+
+        A single query: products LEFT JOIN their latest store availability, excluding those
+        with a bid in the run, ordered store products first and then by name. Returns None if
+        after_product_id is not a known product.
+        """
+        ranked = self._latest_availabilities(store_id)
+        latest = aliased(ProductAvailability, ranked)
+        has_bid = (
+            select(ProductBid.id)
+            .join(RunParticipation, ProductBid.participation_id == RunParticipation.id)
+            .where(RunParticipation.run_id == run_id, ProductBid.product_id == Product.id)
+            .exists()
+        )
+        store_rank = case((latest.id.is_(None), 1), else_=0)
+        sort_name = func.lower(Product.name)
+
+        query = (
+            self.db.query(Product, latest)
+            .outerjoin(latest, and_(latest.product_id == Product.id, ranked.c.rank == 1))
+            .filter(~has_bid)
+        )
+        if store_only:
+            query = query.filter(latest.id.isnot(None))
+        if search:
+            query = query.filter(search_filter(search, Product.name))
+
+        if after_product_id is not None:
+            # Keyset: continue after the sort position of the previous page's last product
+            cursor = (
+                self.db.query(store_rank, sort_name, Product.id)
+                .select_from(Product)
+                .outerjoin(latest, and_(latest.product_id == Product.id, ranked.c.rank == 1))
+                .filter(Product.id == after_product_id)
+                .first()
+            )
+            if cursor is None:
+                return None
+            query = query.filter(tuple_(store_rank, sort_name, Product.id) > tuple_(*cursor))
+
+        query = query.order_by(store_rank, sort_name, Product.id)
+        if offset:
+            query = query.offset(offset)
+        query = query.limit(limit)
+
+        return [(product, availability) for product, availability in query.all()]
+
     def create_product_availability(
         self,
         product_id: UUID,
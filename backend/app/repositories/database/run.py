@@ -3,10 +3,10 @@
 from datetime import UTC, datetime
 from uuid import UUID
 
-from sqlalchemy import case, desc
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import and_, case, desc, func, select, tuple_
+from sqlalchemy.orm import Session, aliased, joinedload
 
-from app.core.models import Run, RunParticipation
+from app.core.models import Group, Run, RunParticipation, Store, User, group_membership
 from app.core.run_state import RunState, state_machine
 from app.infrastructure.request_context import get_logger
 from app.repositories.abstract.run import AbstractRunRepository
@@ -46,6 +46,109 @@ class DatabaseRunRepository(AbstractRunRepository):
 
         return query.limit(limit).offset(offset).all()
 
+    def _run_listing_query(self):
+        """Runs joined with store, group, leader and participant count in one statement."""
+        leader = aliased(RunParticipation)
+        leader_user = aliased(User)
+        # Correlated, so only the participations of the listed runs are counted
+        participant_count = (
+            select(func.count())
+            .where(RunParticipation.run_id == Run.id, RunParticipation.is_removed.is_(False))
+            .correlate(Run)
+            .scalar_subquery()
+        )
+        return (
+            self.db.query(
+                Run,
+                Store.name,
+                Group.name,
+                leader_user.name,
+                leader.is_removed,
+                participant_count,
+            )
+            .outerjoin(Store, Store.id == Run.store_id)
+            .outerjoin(Group, Group.id == Run.group_id)
+            .outerjoin(leader, and_(leader.run_id == Run.id, leader.is_leader.is_(True)))
+            .outerjoin(leader_user, leader_user.id == leader.user_id)
+        )
+
+    @staticmethod
+    def _run_listing(row) -> dict:
+        run, store_name, group_name, leader_name, leader_is_removed, participant_count = row
+        return {
+            'run': run,
+            'store_name': store_name,
+            'group_name': group_name,
+            'leader_name': leader_name,
+            'leader_is_removed': bool(leader_is_removed),
+            'participant_count': participant_count,
+        }
+
+    def get_run_listings_by_group(self, group_id: UUID) -> list[dict]:
+        """Get all runs for a group with their store, group and leader details."""
+        rows = self._run_listing_query().filter(Run.group_id == group_id).all()
+        return [self._run_listing(row) for row in rows]
+
+    def get_completed_cancelled_run_listings_by_group(
+        self,
+        group_id: UUID,
+        limit: int = 10,
+        offset: int = 0,
+        after_run_id: UUID | None = None,
+    ) -> list[dict] | None:
+        """Get completed and cancelled run listings for a group, most recently finished first.
+
+        Returns None if after_run_id is not a completed or cancelled run of the group.
+        """
+        # Runs finished before timestamps were recorded sort by their creation time
+        finished_at = func.coalesce(
+            case(
+                (Run.state == RunState.COMPLETED, Run.completed_at),
+                (Run.state == RunState.CANCELLED, Run.cancelled_at),
+                else_=None,
+            ),
+            Run.planning_at,
+        )
+        in_history = and_(
+            Run.group_id == group_id, Run.state.in_([RunState.COMPLETED, RunState.CANCELLED])
+        )
+        query = self._run_listing_query().filter(in_history)
+
+        if after_run_id is not None:
+            # Keyset: continue after the finish position of the previous page's last run
+            cursor = (
+                self.db.query(finished_at, Run.id)
+                .filter(Run.id == after_run_id, in_history)
+                .first()
+            )
+            if cursor is None:
+                return None
+            query = query.filter(tuple_(finished_at, Run.id) < tuple_(*cursor))
+
+        query = query.order_by(desc(finished_at), desc(Run.id))
+        if offset:
+            query = query.offset(offset)
+        rows = query.limit(limit).all()
+        return [self._run_listing(row) for row in rows]
+
+    def get_active_run_listings_by_store_for_user(
+        self, store_id: UUID, user_id: UUID
+    ) -> list[dict]:
+        """Get listings of active runs at a store across all of the user's groups."""
+        user_group_ids = select(group_membership.c.group_id).where(
+            group_membership.c.user_id == user_id
+        )
+        rows = (
+            self._run_listing_query()
+            .filter(
+                Run.store_id == store_id,
+                Run.state.notin_([RunState.COMPLETED, RunState.CANCELLED]),
+                Run.group_id.in_(user_group_ids),
+            )
+            .all()
+        )
+        return [self._run_listing(row) for row in rows]
+
     def get_run_by_id(self, run_id: UUID) -> Run | None:
         """Get run by ID."""
         return self.db.query(Run).filter(Run.id == run_id).first()
@@ -3,6 +3,7 @@
 from decimal import Decimal
 from uuid import UUID
 
+from sqlalchemy import insert, update
 from sqlalchemy.orm import Session
 
 from app.core.models import ShoppingListItem
@@ -30,6 +31,24 @@ class DatabaseShoppingRepository(AbstractShoppingRepository):
         self.db.refresh(item)
         return item
 
+    def bulk_create_shopping_list_items(
+        self, run_id: UUID, requested_quantities: dict[UUID, Decimal]
+    ) -> None:
+        """Create one shopping list item per product (executemany, flushed but not committed)."""
+        if requested_quantities:
+            self.db.execute(
+                insert(ShoppingListItem),
+                [
+                    {
+                        'run_id': run_id,
+                        'product_id': product_id,
+                        'requested_quantity': quantity,
+                        'is_purchased': False,
+                    }
+                    for product_id, quantity in requested_quantities.items()
+                ],
+            )
+
     def get_shopping_list_items(self, run_id: UUID) -> list[ShoppingListItem]:
         """Get all shopping list items for a run."""
         return self.db.query(ShoppingListItem).filter(ShoppingListItem.run_id == run_id).all()
@@ -115,3 +134,14 @@ class DatabaseShoppingRepository(AbstractShoppingRepository):
         if item:
             item.requested_quantity = requested_quantity
             self.db.commit()
+
+    def bulk_update_requested_quantities(self, requested_quantities: dict[UUID, Decimal]) -> None:
+        """Update several requested quantities (executemany, flushed but not committed)."""
+        if requested_quantities:
+            self.db.execute(
+                update(ShoppingListItem),
+                [
+                    {'id': item_id, 'requested_quantity': quantity}
+                    for item_id, quantity in requested_quantities.items()
+                ],
+            )
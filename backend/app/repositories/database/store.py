@@ -2,12 +2,18 @@
 
 from uuid import UUID
 
-from sqlalchemy import and_, distinct
+from sqlalchemy import and_, distinct, func
 from sqlalchemy.orm import Session
 
 from app.core.models import Product, ProductAvailability, Run, Store
 from app.core.run_state import RunState
+from app.infrastructure.config import SEARCH_RESULT_LIMIT
 from app.repositories.abstract.store import AbstractStoreRepository
+from app.repositories.database.listing import (
+    newest_first_page,
+    ranked_name_search,
+    search_filter,
+)
 
 
 class DatabaseStoreRepository(AbstractStoreRepository):
@@ -16,9 +22,9 @@ class DatabaseStoreRepository(AbstractStoreRepository):
     def __init__(self, db: Session):
         self.db = db
 
-    def search_stores(self, query: str) -> list[Store]:
-        """Search stores by name."""
-        return self.db.query(Store).filter(Store.name.ilike(f'%{query}%')).all()
+    def search_stores(self, query: str, limit: int = SEARCH_RESULT_LIMIT) -> list[Store]:
+        """Search stores by name, most similar first."""
+        return ranked_name_search(self.db.query(Store), Store.name, query, limit)
 
     def get_all_stores(self, limit: int = None, offset: int = 0) -> list[Store]:
         """Get all stores (optionally paginated)."""
@@ -27,6 +33,35 @@ class DatabaseStoreRepository(AbstractStoreRepository):
             query = query.limit(limit).offset(offset)
         return query.all()
 
+    @staticmethod
+    def _admin_filters(search: str | None, verified: bool | None) -> list:
+        filters = []
+        if search:
+            filters.append(search_filter(search, Store.name, Store.address, Store.chain, Store.id))
+        if verified is not None:
+            filters.append(Store.verified == verified)
+        return filters
+
+    def get_stores_page(
+        self,
+        search: str | None = None,
+        verified: bool | None = None,
+        limit: int = 100,
+        offset: int = 0,
+        after_store_id: UUID | None = None,
+    ) -> list[Store] | None:
+        """Get one page of stores, newest first."""
+        query = self.db.query(Store).filter(*self._admin_filters(search, verified))
+        return newest_first_page(query, Store, limit, offset, after_store_id)
+
+    def count_stores(self, search: str | None = None, verified: bool | None = None) -> int:
+        """Count stores matching the get_stores_page filters."""
+        return (
+            self.db.query(func.count(Store.id))
+            .filter(*self._admin_filters(search, verified))
+            .scalar()
+        )
+
     def create_store(self, name: str) -> Store:
         """Create a new store."""
         store = Store(name=name)
@@ -2,10 +2,12 @@
 
 from uuid import UUID
 
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from app.core.models import Group, LeaderReassignmentRequest, Notification, Product, ProductAvailability, ProductBid, Run, RunParticipation, Store, User, group_membership
 from app.repositories.abstract.user import AbstractUserRepository
+from app.repositories.database.listing import newest_first_page, search_filter
 
 
 class DatabaseUserRepository(AbstractUserRepository):
@@ -38,6 +40,35 @@ class DatabaseUserRepository(AbstractUserRepository):
         """Get all users."""
         return self.db.query(User).all()
 
+    @staticmethod
+    def _admin_filters(search: str | None, verified: bool | None) -> list:
+        filters = []
+        if search:
+            filters.append(search_filter(search, User.name, User.username, User.id))
+        if verified is not None:
+            filters.append(User.verified == verified)
+        return filters
+
+    def get_users_page(
+        self,
+        search: str | None = None,
+        verified: bool | None = None,
+        limit: int = 100,
+        offset: int = 0,
+        after_user_id: UUID | None = None,
+    ) -> list[User] | None:
+        """Get one page of users, newest first."""
+        query = self.db.query(User).filter(*self._admin_filters(search, verified))
+        return newest_first_page(query, User, limit, offset, after_user_id)
+
+    def count_users(self, search: str | None = None, verified: bool | None = None) -> int:
+        """Count users matching the get_users_page filters."""
+        return (
+            self.db.query(func.count(User.id))
+            .filter(*self._admin_filters(search, verified))
+            .scalar()
+        )
+
     def update_user(self, user_id: UUID, **fields) -> User | None:
         """Update user fields. Returns updated user or None if not found."""
         user = self.db.query(User).filter(User.id == user_id).first()
@@ -62,11 +93,11 @@ class DatabaseUserRepository(AbstractUserRepository):
         self.db.commit()
         return True
 
-    def verify_password(self, password: str, stored_hash: str) -> bool:
-        """Verify a password against a hash."""
-        import bcrypt
+    async def verify_password(self, password: str, stored_hash: str) -> bool:
+        """Verify a password against a hash on the password hasher's thread pool."""
+        from app.infrastructure.password_hasher import password_hasher
 
-        return bcrypt.checkpw(password.encode('utf-8'), stored_hash.encode('utf-8'))
+        return await password_hasher.verify(password, stored_hash)
 
     def get_user_stats(self, user_id: UUID) -> dict:
         """Get user statistics including runs, bids, and spending."""
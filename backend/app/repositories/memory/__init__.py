@@ -2,6 +2,7 @@
 
 from app.repositories.memory.bid import MemoryBidRepository
 from app.repositories.memory.group import MemoryGroupRepository
+from app.repositories.memory.journal import MemoryJournal
 from app.repositories.memory.notification import MemoryNotificationRepository
 from app.repositories.memory.product import MemoryProductRepository
 from app.repositories.memory.reassignment import MemoryReassignmentRepository
@@ -14,6 +15,7 @@ from app.repositories.memory.user import MemoryUserRepository
 __all__ = [
     'MemoryBidRepository',
     'MemoryGroupRepository',
+    'MemoryJournal',
     'MemoryNotificationRepository',
     'MemoryProductRepository',
     'MemoryReassignmentRepository',
@@ -16,25 +16,18 @@ class MemoryBidRepository(AbstractBidRepository):
         self.storage = storage
 
     def get_bids_by_run(self, run_id: UUID) -> list[ProductBid]:
-        participations = [p for p in self.storage.participations.values() if p.run_id == run_id]
-        participation_ids = {p.id for p in participations}
-        return [bid for bid in self.storage.bids.values() if bid.participation_id in participation_ids]
+        participations = self.storage.participations.where(run_id=run_id)
+        return self.storage.bids.where_in('participation_id', (p.id for p in participations))
 
     def get_bids_by_run_with_participations(self, run_id: UUID) -> list[ProductBid]:
         """Get bids with participation and user data eagerly loaded to avoid N+1 queries."""
-        participations = [p for p in self.storage.participations.values() if p.run_id == run_id]
-        participation_ids = {p.id for p in participations}
-
-        for participation in participations:
-            participation.user = self.storage.users.get(participation.user_id)
-            participation.run = self.storage.runs.get(run_id)
-
+        run = self.storage.runs.get(run_id)
         bids = []
-        for bid in self.storage.bids.values():
-            if bid.participation_id in participation_ids:
-                bid.participation = next(
-                    (p for p in participations if p.id == bid.participation_id), None
-                )
+        for participation in self.storage.participations.where(run_id=run_id):
+            participation.user = self.storage.users.get(participation.user_id)
+            participation.run = run
+            for bid in self.storage.bids.where(participation_id=participation.id):
+                bid.participation = participation
                 bids.append(bid)
 
         return bids
@@ -73,21 +66,16 @@ class MemoryBidRepository(AbstractBidRepository):
 
     def delete_bid(self, participation_id: UUID, product_id: UUID) -> bool:
         """Delete a product bid."""
-        bid_to_delete = None
-        for bid_id, bid in self.storage.bids.items():
-            if bid.participation_id == participation_id and bid.product_id == product_id:
-                bid_to_delete = bid_id
-                break
-
-        if bid_to_delete:
-            del self.storage.bids[bid_to_delete]
-            return True
+        for bid in self.storage.bids.where(participation_id=participation_id):
+            if bid.product_id == product_id:
+                del self.storage.bids[bid.id]
+                return True
         return False
 
     def get_bid(self, participation_id: UUID, product_id: UUID) -> ProductBid | None:
         """Get a specific bid."""
-        for bid in self.storage.bids.values():
-            if bid.participation_id == participation_id and bid.product_id == product_id:
+        for bid in self.storage.bids.where(participation_id=participation_id):
+            if bid.product_id == product_id:
                 bid.participation = self.storage.participations.get(participation_id)
                 bid.product = self.storage.products.get(product_id)
                 return bid
@@ -99,12 +87,11 @@ class MemoryBidRepository(AbstractBidRepository):
 
     def get_bids_by_participation(self, participation_id: UUID) -> list[ProductBid]:
         """Get all bids for a participation."""
-        bids = []
-        for bid in self.storage.bids.values():
-            if bid.participation_id == participation_id:
-                bid.participation = self.storage.participations.get(participation_id)
-                bid.product = self.storage.products.get(bid.product_id)
-                bids.append(bid)
+        participation = self.storage.participations.get(participation_id)
+        bids = self.storage.bids.where(participation_id=participation_id)
+        for bid in bids:
+            bid.participation = participation
+            bid.product = self.storage.products.get(bid.product_id)
         return bids
 
     def update_bid_distributed_quantities(
@@ -116,6 +103,34 @@ class MemoryBidRepository(AbstractBidRepository):
             bid.distributed_quantity = quantity
             bid.distributed_price_per_unit = price_per_unit
 
+    def bulk_update_bids(self, updates: list[dict]) -> None:
+        """Update several bids."""
+        for values in updates:
+            bid = self.storage.bids.get(values['id'])
+            if bid:
+                for column, value in values.items():
+                    if column != 'id':
+                        setattr(bid, column, value)
+                self.storage.bids.reindex(bid.id)
+
+    def bulk_create_bids(self, bids: list[dict]) -> None:
+        """Insert several bids."""
+        now = datetime.now(UTC)
+        for values in bids:
+            bid = ProductBid(
+                **{
+                    'id': uuid4(),
+                    'interested_only': False,
+                    'comment': None,
+                    'created_at': now,
+                    'updated_at': now,
+                    **values,
+                }
+            )
+            bid.participation = self.storage.participations.get(bid.participation_id)
+            bid.product = self.storage.products.get(bid.product_id)
+            self.storage.bids[bid.id] = bid
+
     def commit_changes(self) -> None:
         """Commit any pending changes (no-op for in-memory repository)."""
         pass
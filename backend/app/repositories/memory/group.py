@@ -3,7 +3,9 @@
 from uuid import UUID, uuid4
 
 from app.core.models import Group, User
+from app.core.run_state import RunState
 from app.repositories.abstract.group import AbstractGroupRepository
+from app.repositories.memory.listing import matches_search, newest_first_page
 from app.repositories.memory.storage import MemoryStorage
 
 
@@ -54,7 +56,9 @@ class MemoryGroupRepository(AbstractGroupRepository):
 
     def add_group_member(self, group_id: UUID, user: User, is_group_admin: bool = False) -> bool:
         if group_id in self.storage.group_memberships and user.id not in self.storage.group_memberships[group_id]:
-            self.storage.group_memberships[group_id].append(user.id)
+            # Stored anew rather than appended in place, so the change is recorded
+            members = self.storage.group_memberships[group_id]
+            self.storage.group_memberships[group_id] = [*members, user.id]
             self.storage.group_admin_status[(group_id, user.id)] = is_group_admin
             return True
         return False
@@ -62,7 +66,8 @@ class MemoryGroupRepository(AbstractGroupRepository):
     def remove_group_member(self, group_id: UUID, user_id: UUID) -> bool:
         """Remove a user from a group."""
         if group_id in self.storage.group_memberships and user_id in self.storage.group_memberships[group_id]:
-            self.storage.group_memberships[group_id].remove(user_id)
+            members = self.storage.group_memberships[group_id]
+            self.storage.group_memberships[group_id] = [m for m in members if m != user_id]
             # Remove admin status
             key = (group_id, user_id)
             if key in self.storage.group_admin_status:
@@ -108,6 +113,48 @@ class MemoryGroupRepository(AbstractGroupRepository):
             return True
         return False
 
+    def get_user_group_summaries(self, user_id: UUID) -> list[dict]:
+        """Get the groups a user belongs to with member and run counts."""
+        summaries = {}
+        for group_id, member_ids in self.storage.group_memberships.items():
+            group = self.storage.groups.get(group_id)
+            if group and user_id in member_ids:
+                creator = self.storage.users.get(group.created_by)
+                summaries[group_id] = {
+                    'group': group,
+                    'creator_name': creator.name if creator else None,
+                    'member_count': len(member_ids),
+                    'active_runs_count': 0,
+                    'completed_runs_count': 0,
+                    'active_runs': [],
+                }
+
+        # Single pass over runs for counts and active run summaries
+        for run in self.storage.runs.values():
+            summary = summaries.get(run.group_id)
+            if summary is None:
+                continue
+            if run.state == RunState.COMPLETED:
+                summary['completed_runs_count'] += 1
+            elif run.state != RunState.CANCELLED:
+                summary['active_runs_count'] += 1
+                store = self.storage.stores.get(run.store_id)
+                summary['active_runs'].append(
+                    {'id': run.id, 'state': run.state, 'store_name': store.name if store else None}
+                )
+
+        return list(summaries.values())
+
+    def search_user_groups(self, user_id: UUID, query: str, limit: int) -> list[dict]:
+        """Find the groups a user belongs to whose name contains query, by name."""
+        matches = []
+        for group_id, member_ids in self.storage.group_memberships.items():
+            group = self.storage.groups.get(group_id)
+            if group and user_id in member_ids and matches_search(query, group.name):
+                matches.append({'group': group, 'member_count': len(member_ids)})
+        matches.sort(key=lambda match: (match['group'].name, str(match['group'].id)))
+        return matches[:limit]
+
     def get_all_groups(self) -> list[Group]:
         """Get all groups."""
         groups = []
@@ -118,3 +165,37 @@ class MemoryGroupRepository(AbstractGroupRepository):
             group.members = [self.storage.users.get(uid) for uid in member_ids if uid in self.storage.users]
             groups.append(group)
         return groups
+
+    def _admin_matches(self, search: str | None) -> list[Group]:
+        return [
+            group
+            for group in self.storage.groups.values()
+            if not search or matches_search(search, group.name, group.id)
+        ]
+
+    def get_group_admin_listings(
+        self,
+        search: str | None = None,
+        limit: int = 100,
+        offset: int = 0,
+        after_group_id: UUID | None = None,
+    ) -> list[dict] | None:
+        """Get one page of groups with creator name and member count, newest first."""
+        groups = newest_first_page(self._admin_matches(search), limit, offset, after_group_id)
+        if groups is None:
+            return None
+        listings = []
+        for group in groups:
+            creator = self.storage.users.get(group.created_by)
+            listings.append(
+                {
+                    'group': group,
+                    'creator_name': creator.name if creator else None,
+                    'member_count': len(self.storage.group_memberships.get(group.id, [])),
+                }
+            )
+        return listings
+
+    def count_groups(self, search: str | None = None) -> int:
+        """Count groups matching the get_group_admin_listings search."""
+        return len(self._admin_matches(search))
@@ -0,0 +1,170 @@
+"""Dicts backing the memory storage: observable tables and tables with secondary indexes.
+
+Every storage collection is a Table, which reports the keys stored or removed to an
+optional observer (the durable memory journal uses this to record changes). Rows are
+stored and removed under the table's lock, and index lookups read under it, so another
+thread can copy the rows out consistently by holding it.
+
+Memory repositories also look rows up by foreign key (bids of a participation,
+participations of a run). Scanning the whole table for each lookup makes every such
+query O(rows), and nested lookups O(rows squared). An IndexedTable keeps a hash index
+per declared field combination, updated whenever a row is stored or removed, so these
+lookups cost O(matches).
+
+Rows are mutable model instances: code that changes an indexed attribute of a stored
+row in place must call reindex() afterwards.
+"""
+
+import threading
+from collections import defaultdict
+from collections.abc import Callable, Hashable, Iterable
+from typing import Any, TypeVar
+from uuid import UUID
+
+Key = TypeVar('Key', bound=Hashable)
+Row = TypeVar('Row')
+
+
+class Table(dict[Key, Row]):
+    """Dict that reports stored and removed keys to an optional observer."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        # Called with the key after every store or removal
+        self.on_change: Callable[[Key], None] | None = None
+        # Held while rows are stored or removed
+        self.lock = threading.Lock()
+
+    def _init_args(self) -> tuple:
+        return ()
+
+    def __reduce__(self):
+        # Rebuild through __setitem__ so copies and unpickled tables are complete;
+        # the observer is not carried over
+        return type(self), self._init_args(), None, None, iter(self.items())
+
+    def __setitem__(self, key: Key, row: Row) -> None:
+        with self.lock:
+            self._unindex(key)
+            super().__setitem__(key, row)
+            self._index(key, row)
+        if self.on_change is not None:
+            self.on_change(key)
+
+    def __delitem__(self, key: Key) -> None:
+        with self.lock:
+            super().__delitem__(key)
+            self._unindex(key)
+        if self.on_change is not None:
+            self.on_change(key)
+
+    def pop(self, key: Key, *default: Any) -> Any:
+        """Remove and return the row with key (or default)."""
+        if key not in self:
+            return super().pop(key, *default)
+        row = self[key]
+        del self[key]
+        return row
+
+    def popitem(self) -> tuple[Key, Row]:
+        """Remove and return the last stored (key, row) pair."""
+        with self.lock:
+            key, row = super().popitem()
+            self._unindex(key)
+        if self.on_change is not None:
+            self.on_change(key)
+        return key, row
+
+    def setdefault(self, key: Key, default: Any = None) -> Any:
+        """Return the row with key, storing default first if there is none."""
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        """Store every (key, row) pair given, as dict.update does."""
+        for key, row in dict(*args, **kwargs).items():
+            self[key] = row
+
+    def clear(self) -> None:
+        """Remove every row."""
+        with self.lock:
+            keys = list(self)
+            super().clear()
+            self._clear_indexes()
+        if self.on_change is not None:
+            for key in keys:
+                self.on_change(key)
+
+    def _index(self, key: Key, row: Row) -> None:
+        pass
+
+    def _unindex(self, key: Key) -> None:
+        pass
+
+    def _clear_indexes(self) -> None:
+        pass
+
+
+class IndexedTable(Table[UUID, Row]):
+    """Rows keyed by ID, indexed on the given field combinations."""
+
+    def __init__(self, *indexes: tuple[str, ...]):
+        super().__init__()
+        # fields -> indexed values -> {row ID: row}; inner dicts keep insertion order
+        self._indexes: dict[tuple[str, ...], defaultdict[tuple, dict]] = {
+            fields: defaultdict(dict) for fields in indexes
+        }
+        self._index_by_field_set = {frozenset(fields): fields for fields in indexes}
+        # Row ID -> the values it is indexed under, one tuple per index
+        self._indexed_values: dict[UUID, tuple[tuple, ...]] = {}
+
+    def _init_args(self) -> tuple:
+        return tuple(self._indexes)
+
+    def reindex(self, row_id: UUID) -> None:
+        """Re-index a stored row after its indexed attributes changed in place."""
+        with self.lock:
+            self._unindex(row_id)
+            self._index(row_id, self[row_id])
+
+    def where(self, **criteria: Any) -> list[Row]:
+        """Rows whose attributes equal the criteria, in insertion order.
+
+        The criteria fields must match one declared index exactly.
+        """
+        fields = self._index_by_field_set.get(frozenset(criteria))
+        if fields is None:
+            raise KeyError(f'No index on {sorted(criteria)}')
+        with self.lock:
+            rows = self._indexes[fields].get(tuple(criteria[field] for field in fields))
+            return list(rows.values()) if rows else []
+
+    def where_in(self, field: str, values: Iterable[Any]) -> list[Row]:
+        """Rows whose single indexed field is any of values."""
+        rows = []
+        for value in values:
+            rows.extend(self.where(**{field: value}))
+        return rows
+
+    def _index(self, row_id: UUID, row: Row) -> None:
+        values = tuple(tuple(getattr(row, field) for field in fields) for fields in self._indexes)
+        self._indexed_values[row_id] = values
+        for index, value in zip(self._indexes.values(), values, strict=True):
+            index[value][row_id] = row
+
+    def _unindex(self, row_id: UUID) -> None:
+        values = self._indexed_values.pop(row_id, None)
+        if values is None:
+            return
+        for index, value in zip(self._indexes.values(), values, strict=True):
+            rows = index.get(value)
+            if rows is not None:
+                rows.pop(row_id, None)
+                if not rows:
+                    del index[value]
+
+    def _clear_indexes(self) -> None:
+        for index in self._indexes.values():
+            index.clear()
+        self._indexed_values.clear()
@@ -0,0 +1,380 @@
+"""Durable memory mode: an append-only journal of row changes plus periodic snapshots.
+
+Memory mode normally loses everything on restart. With a data directory configured,
+every change to the memory storage is recorded: tables report stored and removed keys,
+and attribute listeners on the models report rows changed in place. The changed rows
+are written on a short interval as one checksummed journal frame holding their current
+column values. Once the journal grows past a threshold, the whole storage is written
+to a compact snapshot (column names once, rows as value tuples) and the journal is
+truncated.
+
+On startup the last snapshot is loaded and the journal frames written after it are
+replayed. A frame cut short by a crash (or failing its checksum) ends the replay and
+is truncated away, so at most one flush interval of changes is lost.
+
+Requests change the storage on the event loop while the journal reads it on its own
+thread, keeping file writes off the loop. Snapshots copy each table's rows under its lock; a row
+changed while the snapshot is written is marked again and lands in the next frame. A
+failed write keeps its rows pending and is retried on the next interval.
+"""
+
+import asyncio
+import contextlib
+import functools
+import os
+import pickle
+import struct
+import threading
+import time
+import zlib
+from collections.abc import Hashable
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from sqlalchemy import event, inspect
+
+from app.core.models import (
+    Group,
+    LeaderReassignmentRequest,
+    Notification,
+    Product,
+    ProductAvailability,
+    ProductBid,
+    Run,
+    RunParticipation,
+    ShoppingListItem,
+    Store,
+    User,
+)
+from app.infrastructure.config import (
+    MEMORY_JOURNAL_FLUSH_INTERVAL_MS,
+    MEMORY_SNAPSHOT_JOURNAL_BYTES,
+)
+from app.infrastructure.request_context import get_logger
+from app.repositories.memory.indexed_table import Table
+from app.repositories.memory.storage import MemoryStorage
+
+logger = get_logger(__name__)
+
+# Model stored in each table; the other tables hold plain values
+TABLE_MODELS: dict[str, type] = {
+    'users': User,
+    'groups': Group,
+    'stores': Store,
+    'runs': Run,
+    'products': Product,
+    'participations': RunParticipation,
+    'bids': ProductBid,
+    'shopping_list_items': ShoppingListItem,
+    'product_availabilities': ProductAvailability,
+    'notifications': Notification,
+    'reassignment_requests': LeaderReassignmentRequest,
+}
+
+SNAPSHOT_FILE = 'snapshot.pickle'
+JOURNAL_FILE = 'journal.log'
+
+# Frame header: payload length, frame sequence number, CRC32 of the payload
+_FRAME_HEADER = struct.Struct('>IQI')
+
+
+@functools.cache
+def _columns(model: type) -> tuple[str, ...]:
+    return tuple(attr.key for attr in inspect(model).column_attrs)
+
+
+class MemoryJournal:
+    """Records memory storage changes to disk and restores them on startup."""
+
+    def __init__(
+        self,
+        storage: MemoryStorage,
+        data_dir: str | os.PathLike,
+        flush_interval_ms: int = MEMORY_JOURNAL_FLUSH_INTERVAL_MS,
+        snapshot_journal_bytes: int = MEMORY_SNAPSHOT_JOURNAL_BYTES,
+    ):
+        self.storage = storage
+        self.data_dir = Path(data_dir)
+        self.flush_interval_ms = flush_interval_ms
+        self.snapshot_journal_bytes = snapshot_journal_bytes
+        self._lock = threading.Lock()
+        # Serializes flushes and snapshots from the background loop and from shutdown
+        self._flush_lock = threading.RLock()
+        # (table name, key) of rows changed since the last flush, in change order
+        self._dirty: dict[tuple[str, Hashable], None] = {}
+        self._journal: BinaryIO | None = None
+        self._seq = 0
+        self._listeners: list[tuple[Any, Any]] = []
+        self._flushes = 0
+        self._rows_written = 0
+        self._snapshots = 0
+        self._failures = 0
+        self._last_flush_ms = 0.0
+        self._last_snapshot_ms = 0.0
+
+    @property
+    def snapshot_path(self) -> Path:
+        return self.data_dir / SNAPSHOT_FILE
+
+    @property
+    def journal_path(self) -> Path:
+        return self.data_dir / JOURNAL_FILE
+
+    def recover(self) -> bool:
+        """Load the last snapshot and replay the journal written after it.
+
+        Returns:
+            True if any stored data was found
+        """
+        started_at = time.perf_counter()
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        tables = self.storage.tables()
+        found = False
+
+        if self.snapshot_path.exists():
+            with self.snapshot_path.open('rb') as f:
+                snapshot = pickle.load(f)
+            self._seq = snapshot['seq']
+            for name, (columns, rows) in snapshot['tables'].items():
+                table = tables[name]
+                table.clear()
+                for key, values in rows:
+                    if columns is not None:
+                        values = dict(zip(columns, values, strict=True))
+                    table[key] = self._load_row(name, values)
+            found = True
+
+        frames = 0
+        if self.journal_path.exists():
+            with self.journal_path.open('rb') as f:
+                valid_end = 0
+                for seq, changes in self._read_frames(f):
+                    valid_end = f.tell()
+                    if seq <= self._seq:
+                        continue
+                    for name, key, values in changes:
+                        if values is None:
+                            tables[name].pop(key, None)
+                        else:
+                            tables[name][key] = self._load_row(name, values)
+                    self._seq = seq
+                    frames += 1
+            if valid_end < self.journal_path.stat().st_size:
+                logger.warning(
+                    'Truncating incomplete memory journal tail',
+                    extra={'valid_bytes': valid_end},
+                )
+                os.truncate(self.journal_path, valid_end)
+            found = found or frames > 0
+
+        self.storage.rebuild_derived()
+        logger.info(
+            'Memory storage recovered',
+            extra={
+                'data_dir': str(self.data_dir),
+                'rows': sum(len(table) for table in tables.values()),
+                'journal_frames': frames,
+                'duration_ms': round((time.perf_counter() - started_at) * 1000, 2),
+            },
+        )
+        return found
+
+    def attach(self) -> None:
+        """Start recording storage changes (after recovery and seeding).
+
+        The current contents are snapshotted first, so seed data and a replayed journal
+        do not depend on later frames.
+        """
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        self._journal = self.journal_path.open('ab')
+        tables = self.storage.tables()
+        for name, table in tables.items():
+            table.on_change = functools.partial(self._mark, name)
+        for name, model in TABLE_MODELS.items():
+            handler = functools.partial(self._on_attribute_set, name, tables[name])
+            for column in _columns(model):
+                attr = getattr(model, column)
+                event.listen(attr, 'set', handler)
+                self._listeners.append((attr, handler))
+        self.snapshot()
+
+    def close(self) -> None:
+        """Write a final snapshot and stop recording."""
+        if self._journal is None:
+            return
+        self.snapshot()
+        self.detach()
+
+    def detach(self) -> None:
+        """Stop recording without writing pending changes."""
+        for table in self.storage.tables().values():
+            table.on_change = None
+        for attr, handler in self._listeners:
+            event.remove(attr, 'set', handler)
+        self._listeners.clear()
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+
+    def _mark(self, name: str, key: Hashable) -> None:
+        with self._lock:
+            self._dirty[(name, key)] = None
+
+    def _on_attribute_set(
+        self, name: str, table: dict, target: Any, value: Any, oldvalue: Any, initiator: Any
+    ) -> None:
+        # Only rows already stored are journaled; new instances are recorded when stored
+        row_id = target.__dict__.get('id')
+        if row_id is not None and table.get(row_id) is target:
+            self._mark(name, row_id)
+
+    def flush(self) -> int:
+        """Append the rows changed since the last flush to the journal.
+
+        Returns:
+            Number of changed rows written
+        """
+        with self._flush_lock:
+            with self._lock:
+                dirty, self._dirty = self._dirty, {}
+            if not dirty or self._journal is None:
+                return 0
+
+            started_at = time.perf_counter()
+            position = self._journal.tell()
+            try:
+                tables = self.storage.tables()
+                changes = []
+                for name, key in dirty:
+                    row = tables[name].get(key)
+                    changes.append((name, key, None if row is None else self._dump_row(name, row)))
+                payload = pickle.dumps(changes, protocol=pickle.HIGHEST_PROTOCOL)
+                header = _FRAME_HEADER.pack(len(payload), self._seq + 1, zlib.crc32(payload))
+                self._journal.write(header + payload)
+                self._journal.flush()
+                os.fsync(self._journal.fileno())
+            except BaseException:
+                # Drop a partly written frame (replay would stop at it) and keep the rows
+                # pending, ahead of the ones changed since
+                with contextlib.suppress(OSError):
+                    self._journal.seek(position)
+                    self._journal.truncate()
+                with self._lock:
+                    self._dirty = {**dirty, **self._dirty}
+                raise
+            self._seq += 1
+
+            with self._lock:
+                self._flushes += 1
+                self._rows_written += len(changes)
+                self._last_flush_ms = (time.perf_counter() - started_at) * 1000
+            return len(changes)
+
+    def snapshot(self) -> None:
+        """Write the whole storage to a new snapshot and truncate the journal."""
+        with self._flush_lock:
+            self.flush()
+            started_at = time.perf_counter()
+            snapshot = {
+                'seq': self._seq,
+                'tables': {
+                    name: self._dump_table(name, table)
+                    for name, table in self.storage.tables().items()
+                },
+            }
+            temp_path = self.snapshot_path.with_suffix('.tmp')
+            with temp_path.open('wb') as f:
+                pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.snapshot_path)
+
+            # Frames up to the snapshot's sequence number are skipped on replay, so a
+            # crash before the truncate below is harmless
+            if self._journal is not None:
+                self._journal.seek(0)
+                self._journal.truncate()
+                self._journal.flush()
+                os.fsync(self._journal.fileno())
+
+            with self._lock:
+                self._snapshots += 1
+                self._last_snapshot_ms = (time.perf_counter() - started_at) * 1000
+
+    def journal_bytes(self) -> int:
+        """Current size of the journal file."""
+        return self._journal.tell() if self._journal is not None else 0
+
+    async def run(self) -> None:
+        """Flush changes every interval and snapshot once the journal is large."""
+        while True:
+            await asyncio.sleep(self.flush_interval_ms / 1000)
+            try:
+                if self._dirty:
+                    await asyncio.to_thread(self.flush)
+                if self.journal_bytes() >= self.snapshot_journal_bytes:
+                    await asyncio.to_thread(self.snapshot)
+            except Exception as e:
+                with self._lock:
+                    self._failures += 1
+                logger.error(f'Failed to write memory journal: {e}', exc_info=True)
+
+    def stats(self) -> dict:
+        """Return pending changes, journal size and flush and snapshot counts."""
+        with self._lock:
+            return {
+                'pending': len(self._dirty),
+                'journal_bytes': self.journal_bytes(),
+                'flushes': self._flushes,
+                'rows_written': self._rows_written,
+                'snapshots': self._snapshots,
+                'failures': self._failures,
+                'last_flush_ms': round(self._last_flush_ms, 2),
+                'last_snapshot_ms': round(self._last_snapshot_ms, 2),
+            }
+
+    @staticmethod
+    def _dump_row(name: str, row: Any) -> Any:
+        model = TABLE_MODELS.get(name)
+        if model is None:
+            return row
+        return {column: getattr(row, column) for column in _columns(model)}
+
+    @staticmethod
+    def _dump_table(name: str, table: Table) -> tuple[tuple[str, ...] | None, list]:
+        # Rows stored or removed meanwhile are in the next frame
+        with table.lock:
+            items = list(table.items())
+        model = TABLE_MODELS.get(name)
+        if model is None:
+            return None, items
+        columns = _columns(model)
+        return columns, [
+            (key, tuple(getattr(row, column) for column in columns)) for key, row in items
+        ]
+
+    @staticmethod
+    def _load_row(name: str, values: Any) -> Any:
+        model = TABLE_MODELS.get(name)
+        if model is None:
+            return values
+        # Columns dropped since the data was written are ignored
+        known = _columns(model)
+        return model(**{column: values[column] for column in known if column in values})
+
+    @staticmethod
+    def _read_frames(f: BinaryIO):
+        """Yield (seq, changes) for each complete, intact frame."""
+        while True:
+            header = f.read(_FRAME_HEADER.size)
+            if len(header) < _FRAME_HEADER.size:
+                return
+            length, seq, checksum = _FRAME_HEADER.unpack(header)
+            payload = f.read(length)
+            if len(payload) < length or zlib.crc32(payload) != checksum:
+                return
+            try:
+                changes = pickle.loads(payload)
+            except Exception:
+                return
+            yield seq, changes
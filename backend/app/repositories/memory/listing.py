@@ -0,0 +1,33 @@
+"""Search and newest-first pagination shared by the memory repositories' admin listings."""
+
+from collections.abc import Iterable
+from datetime import UTC, datetime
+from uuid import UUID
+
+
+def matches_search(search: str, *values) -> bool:
+    """Case-insensitive substring match of search against any of the values (None skipped)."""
+    search = search.lower()
+    return any(search in str(value).lower() for value in values if value is not None)
+
+
+def _newest_first_key(item) -> tuple:
+    return item.created_at or datetime.min.replace(tzinfo=UTC), str(item.id)
+
+
+def newest_first_page(
+    items: Iterable, limit: int, offset: int = 0, after_id: UUID | None = None
+) -> list | None:
+    """Sort items by (created_at, id) descending and return one page of them.
+
+    Mirrors the database repositories: with after_id, the page continues after the
+    item with that ID, and None is returned if no item has that ID.
+    """
+    items = sorted(items, key=_newest_first_key, reverse=True)
+    if after_id is not None:
+        cursor = next((item for item in items if item.id == after_id), None)
+        if cursor is None:
+            return None
+        cursor_key = _newest_first_key(cursor)
+        items = [item for item in items if _newest_first_key(item) < cursor_key]
+    return items[offset : offset + limit]
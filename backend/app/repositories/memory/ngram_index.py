@@ -0,0 +1,97 @@
+"""Trigram inverted index for fuzzy name search in memory mode.
+
+Mirrors PostgreSQL's pg_trgm, which backs name search in database mode: text is
+lowercased, split into words, each word padded with two spaces in front and one
+behind, and broken into three-character grams. Similarity is the number of shared
+trigrams over the number of distinct trigrams of both strings.
+"""
+
+import re
+from collections import Counter, defaultdict
+from collections.abc import Hashable, Iterable
+
+# Minimum similarity for a fuzzy match (pg_trgm's default similarity_threshold)
+SIMILARITY_THRESHOLD = 0.3
+
+_WORD_RE = re.compile(r'[^\W_]+')
+
+
+def trigrams(text: str) -> frozenset[str]:
+    """Return the pg_trgm trigram set of text."""
+    grams = set()
+    for word in _WORD_RE.findall(text.lower()):
+        padded = f'  {word} '
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return frozenset(grams)
+
+
+class NgramIndex:
+    """Inverted index from trigrams to the keys whose text contains them."""
+
+    def __init__(self) -> None:
+        self._postings: defaultdict[str, set[Hashable]] = defaultdict(set)
+        self._grams: dict[Hashable, frozenset[str]] = {}
+        self._texts: dict[Hashable, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def add(self, key: Hashable, text: str) -> None:
+        """Index text under key, replacing any text indexed under it before."""
+        self.remove(key)
+        grams = trigrams(text)
+        self._grams[key] = grams
+        self._texts[key] = text.lower()
+        for gram in grams:
+            self._postings[gram].add(key)
+
+    def remove(self, key: Hashable) -> None:
+        """Drop key from the index (no-op if it is not indexed)."""
+        for gram in self._grams.pop(key, ()):
+            keys = self._postings[gram]
+            keys.discard(key)
+            if not keys:
+                del self._postings[gram]
+        self._texts.pop(key, None)
+
+    def rebuild(self, entries: Iterable[tuple[Hashable, str]]) -> None:
+        """Replace the whole index with (key, text) entries."""
+        self._postings.clear()
+        self._grams.clear()
+        self._texts.clear()
+        for key, text in entries:
+            self.add(key, text)
+
+    def search(
+        self, query: str, limit: int, threshold: float = SIMILARITY_THRESHOLD
+    ) -> list[Hashable]:
+        """Keys whose text contains query or is similar to it, most similar first.
+
+        Ties are broken by text. Candidates come from the posting lists of the query's
+        trigrams; a query without a word of three or more characters can be a substring
+        of text sharing none of its trigrams, so it is checked against every entry.
+        """
+        needle = query.strip().lower()
+        if not needle:
+            return []
+        query_grams = trigrams(needle)
+
+        shared: Counter[Hashable] = Counter()
+        for gram in query_grams:
+            shared.update(self._postings.get(gram, ()))
+        if not any(len(word) >= 3 for word in _WORD_RE.findall(needle)):
+            candidates = self._texts.keys()
+        else:
+            candidates = shared.keys()
+
+        matches = []
+        for key in candidates:
+            common = shared[key]
+            union = len(query_grams) + len(self._grams[key]) - common
+            similarity = common / union if union else 0.0
+            text = self._texts[key]
+            if needle in text or similarity >= threshold:
+                matches.append((-similarity, text, key))
+
+        matches.sort(key=lambda match: match[:2])
+        return [key for _, _, key in matches[:limit]]
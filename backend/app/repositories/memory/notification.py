@@ -28,11 +28,28 @@ class MemoryNotificationRepository(AbstractNotificationRepository):
         self.storage.notifications[notification.id] = notification
         return notification
 
+    def create_notifications_bulk(self, notifications: list[dict[str, Any]]) -> list[Notification]:
+        """Create many notifications at once."""
+        created_at = datetime.now(UTC)
+        created = []
+        for notification in notifications:
+            new_notification = Notification(
+                id=uuid4(),
+                user_id=notification['user_id'],
+                type=notification['type'],
+                data=notification['data'],
+                read=False,
+                created_at=created_at,
+            )
+            self.storage.notifications[new_notification.id] = new_notification
+            created.append(new_notification)
+        return created
+
     def get_user_notifications(
         self, user_id: UUID, limit: int = 20, offset: int = 0
     ) -> list[Notification]:
         """Get notifications for a user (paginated)."""
-        user_notifications = [n for n in self.storage.notifications.values() if n.user_id == user_id]
+        user_notifications = self.storage.notifications.where(user_id=user_id)
         user_notifications.sort(
             key=lambda n: n.created_at or datetime.min.replace(tzinfo=UTC), reverse=True
         )
@@ -40,13 +57,13 @@ class MemoryNotificationRepository(AbstractNotificationRepository):
 
     def get_unread_notifications(self, user_id: UUID) -> list[Notification]:
         """Get all unread notifications for a user."""
-        unread = [n for n in self.storage.notifications.values() if n.user_id == user_id and not n.read]
+        unread = [n for n in self.storage.notifications.where(user_id=user_id) if not n.read]
         unread.sort(key=lambda n: n.created_at, reverse=True)
         return unread
 
     def get_unread_count(self, user_id: UUID) -> int:
         """Get count of unread notifications for a user."""
-        return sum(1 for n in self.storage.notifications.values() if n.user_id == user_id and not n.read)
+        return sum(1 for n in self.storage.notifications.where(user_id=user_id) if not n.read)
 
     def mark_notification_as_read(self, notification_id: UUID) -> bool:
         """Mark a notification as read."""
@@ -59,8 +76,8 @@ class MemoryNotificationRepository(AbstractNotificationRepository):
     def mark_all_notifications_as_read(self, user_id: UUID) -> int:
         """Mark all notifications as read for a user. Returns count of marked notifications."""
         count = 0
-        for notification in self.storage.notifications.values():
-            if notification.user_id == user_id and not notification.read:
+        for notification in self.storage.notifications.where(user_id=user_id):
+            if not notification.read:
                 notification.read = True
                 count += 1
         return count
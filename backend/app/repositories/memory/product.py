@@ -1,14 +1,24 @@
 """Memory product repository implementation."""
 
+from collections.abc import Iterable
 from datetime import UTC, datetime
 from decimal import Decimal
 from typing import Any
 from uuid import UUID, uuid4
 
 from app.core.models import Product, ProductAvailability
+from app.infrastructure.config import SEARCH_RESULT_LIMIT
 from app.repositories.abstract.product import AbstractProductRepository
+from app.repositories.memory.listing import matches_search, newest_first_page
+from app.repositories.memory.ngram_index import NgramIndex
 from app.repositories.memory.storage import MemoryStorage
 
+_NEVER = datetime.min.replace(tzinfo=UTC)
+
+
+def _observed_at(availability: ProductAvailability) -> datetime:
+    return availability.created_at or _NEVER
+
 
 class MemoryProductRepository(AbstractProductRepository):
     """Memory implementation of product repository."""
@@ -18,22 +28,37 @@ class MemoryProductRepository(AbstractProductRepository):
 
     def get_products_by_store(self, store_id: UUID) -> list[Product]:
         """Get all products for a store (via product availabilities)."""
-        product_ids = {
+        product_ids = dict.fromkeys(
             avail.product_id
-            for avail in self.storage.product_availabilities.values()
-            if avail.store_id == store_id
-        }
-        return [product for product in self.storage.products.values() if product.id in product_ids]
-
-    def search_products(self, query: str) -> list[Product]:
-        query_lower = query.lower()
+            for avail in self.storage.product_availabilities.where(store_id=store_id)
+        )
         return [
-            product for product in self.storage.products.values() if query_lower in product.name.lower()
+            self.storage.products[product_id]
+            for product_id in product_ids
+            if product_id in self.storage.products
         ]
 
+    def _name_index(self) -> NgramIndex:
+        # Rebuilt when products were added or removed without going through the repository
+        index = self.storage.product_name_index
+        if len(index) != len(self.storage.products):
+            index.rebuild((product.id, product.name) for product in self.storage.products.values())
+        return index
+
+    def search_products(self, query: str, limit: int = SEARCH_RESULT_LIMIT) -> list[Product]:
+        """Search for products by name, most similar first."""
+        product_ids = self._name_index().search(query, limit)
+        products = (self.storage.products.get(product_id) for product_id in product_ids)
+        return [product for product in products if product is not None]
+
     def get_product_by_id(self, product_id: UUID) -> Product | None:
         return self.storage.products.get(product_id)
 
+    def get_products_by_ids(self, product_ids: Iterable[UUID]) -> list[Product]:
+        """Get all products whose ID is in product_ids (missing IDs are skipped)."""
+        products = (self.storage.products.get(product_id) for product_id in set(product_ids))
+        return [product for product in products if product is not None]
+
     def create_product(
         self, name: str, brand: str | None = None, unit: str | None = None
     ) -> Product:
@@ -48,11 +73,37 @@ class MemoryProductRepository(AbstractProductRepository):
             updated_at=datetime.now(UTC),
         )
         self.storage.products[product.id] = product
+        self.storage.product_name_index.add(product.id, product.name)
         return product
 
     def get_all_products(self) -> list[Product]:
         return list(self.storage.products.values())
 
+    def _admin_matches(self, search: str | None, verified: bool | None) -> list[Product]:
+        return [
+            product
+            for product in self.storage.products.values()
+            if (not search or matches_search(search, product.name, product.brand, product.id))
+            and (verified is None or product.verified == verified)
+        ]
+
+    def get_products_page(
+        self,
+        search: str | None = None,
+        verified: bool | None = None,
+        limit: int = 100,
+        offset: int = 0,
+        after_product_id: UUID | None = None,
+    ) -> list[Product] | None:
+        """Get one page of products, newest first."""
+        return newest_first_page(
+            self._admin_matches(search, verified), limit, offset, after_product_id
+        )
+
+    def count_products(self, search: str | None = None, verified: bool | None = None) -> int:
+        """Count products matching the get_products_page filters."""
+        return len(self._admin_matches(search, verified))
+
     def update_product(self, product_id: UUID, **fields) -> Product | None:
         """Update product fields. Returns updated product or None if not found."""
         product = self.storage.products.get(product_id)
@@ -62,6 +113,8 @@ class MemoryProductRepository(AbstractProductRepository):
         for key, value in fields.items():
             if hasattr(product, key):
                 setattr(product, key, value)
+        if 'name' in fields:
+            self.storage.product_name_index.add(product.id, product.name)
 
         return product
 
@@ -71,30 +124,134 @@ class MemoryProductRepository(AbstractProductRepository):
             return False
 
         del self.storage.products[product_id]
+        self.storage.product_name_index.remove(product_id)
         return True
 
     def get_product_availabilities(self, product_id: UUID, store_id: UUID = None) -> list:
         """Get product availabilities, optionally filtered by store."""
-        results = []
-        for avail in self.storage.product_availabilities.values():
-            if avail.product_id == product_id and (store_id is None or avail.store_id == store_id):
-                results.append(avail)
-        return results
+        if store_id is None:
+            return self.storage.product_availabilities.where(product_id=product_id)
+        return self.storage.product_availabilities.where(product_id=product_id, store_id=store_id)
 
     def get_availability_by_product_and_store(
         self, product_id: UUID, store_id: UUID
     ) -> ProductAvailability | None:
         """Get the most recent product availability by product and store."""
-        matches = []
-        for avail in self.storage.product_availabilities.values():
-            if avail.product_id == product_id and avail.store_id == store_id:
-                matches.append(avail)
+        matches = self.storage.product_availabilities.where(
+            product_id=product_id, store_id=store_id
+        )
 
         if not matches:
             return None
 
         return sorted(matches, key=lambda x: x.created_at if x.created_at else '', reverse=True)[0]
 
+    def get_latest_availabilities_by_store(
+        self, store_id: UUID, product_ids: Iterable[UUID] | None = None
+    ) -> dict[UUID, ProductAvailability]:
+        """Get the most recent availability at a store for each product, keyed by product ID."""
+        latest: dict[UUID, ProductAvailability] = {}
+        for avail in self._availabilities_at_store(store_id, product_ids):
+            current = latest.get(avail.product_id)
+            if current is None or _observed_at(avail) > _observed_at(current):
+                latest[avail.product_id] = avail
+        return latest
+
+    def get_latest_day_prices_by_store(
+        self, store_id: UUID, product_ids: Iterable[UUID]
+    ) -> dict[UUID, list[ProductAvailability]]:
+        """Get each product's priced observations at a store from its most recent observation day."""
+        by_product: dict[UUID, list[ProductAvailability]] = {}
+        for avail in self._availabilities_at_store(store_id, product_ids):
+            if avail.price and avail.created_at:
+                by_product.setdefault(avail.product_id, []).append(avail)
+
+        prices = {}
+        for product_id, observations in by_product.items():
+            observations.sort(key=_observed_at, reverse=True)
+            latest_day = observations[0].created_at.date()
+            prices[product_id] = [a for a in observations if a.created_at.date() == latest_day]
+        return prices
+
+    def _availabilities_at_store(
+        self, store_id: UUID, product_ids: Iterable[UUID] | None
+    ) -> list[ProductAvailability]:
+        availabilities = self.storage.product_availabilities
+        if product_ids is None:
+            return availabilities.where(store_id=store_id)
+        return [
+            avail
+            for product_id in set(product_ids)
+            for avail in availabilities.where(product_id=product_id, store_id=store_id)
+        ]
+
+    def get_store_prices_by_products(self, product_ids: Iterable[UUID]) -> dict[UUID, list[dict]]:
+        """Get the stores each product was observed at, with the latest price at each."""
+        latest: dict[tuple[UUID, UUID], ProductAvailability] = {}
+        for avail in self.storage.product_availabilities.where_in('product_id', set(product_ids)):
+            key = (avail.product_id, avail.store_id)
+            current = latest.get(key)
+            if current is None or _observed_at(avail) > _observed_at(current):
+                latest[key] = avail
+
+        prices: dict[UUID, list[dict]] = {}
+        for (product_id, store_id), avail in latest.items():
+            store = self.storage.stores.get(store_id)
+            if store:
+                prices.setdefault(product_id, []).append(
+                    {'store_id': store.id, 'store_name': store.name, 'price': avail.price}
+                )
+        for stores in prices.values():
+            stores.sort(key=lambda entry: (entry['store_name'], str(entry['store_id'])))
+        return prices
+
+    def get_available_products_for_run(
+        self,
+        run_id: UUID,
+        store_id: UUID,
+        search: str | None = None,
+        store_only: bool = False,
+        limit: int = 200,
+        offset: int = 0,
+        after_product_id: UUID | None = None,
+    ) -> list[tuple[Product, ProductAvailability | None]] | None:
+        """Get products without a bid in the run, each with its latest availability at the store.
+
+        Returns None if after_product_id is not a known product.
+        """
+        run_participations = self.storage.participations.where(run_id=run_id)
+        products_with_bids = {
+            bid.product_id
+            for bid in self.storage.bids.where_in(
+                'participation_id', (p.id for p in run_participations)
+            )
+        }
+        latest = self.get_latest_availabilities_by_store(store_id)
+        search_lower = search.lower() if search else None
+
+        def sort_key(product: Product) -> tuple:
+            return (product.id not in latest, product.name.lower(), str(product.id))
+
+        candidates = [
+            product
+            for product in self.storage.products.values()
+            if product.id not in products_with_bids
+            and (not store_only or product.id in latest)
+            and (search_lower is None or search_lower in product.name.lower())
+        ]
+        candidates.sort(key=sort_key)
+
+        if after_product_id is not None:
+            cursor_product = self.storage.products.get(after_product_id)
+            if cursor_product is None:
+                return None
+            cursor = sort_key(cursor_product)
+            candidates = [product for product in candidates if sort_key(product) > cursor]
+
+        return [
+            (product, latest.get(product.id)) for product in candidates[offset : offset + limit]
+        ]
+
     def create_product_availability(
         self,
         product_id: UUID,
@@ -134,21 +291,19 @@ class MemoryProductRepository(AbstractProductRepository):
 
     def bulk_update_product_bids(self, old_product_id: UUID, new_product_id: UUID) -> int:
         """Update all product bids from old product to new product. Returns count of updated records."""
-        count = 0
-        for bid in self.storage.bids.values():
-            if bid.product_id == old_product_id:
-                bid.product_id = new_product_id
-                count += 1
-        return count
+        bids = self.storage.bids.where(product_id=old_product_id)
+        for bid in bids:
+            bid.product_id = new_product_id
+            self.storage.bids.reindex(bid.id)
+        return len(bids)
 
     def bulk_update_product_availabilities(self, old_product_id: UUID, new_product_id: UUID) -> int:
         """Update all product availabilities from old product to new product. Returns count of updated records."""
-        count = 0
-        for avail in self.storage.product_availabilities.values():
-            if avail.product_id == old_product_id:
-                avail.product_id = new_product_id
-                count += 1
-        return count
+        availabilities = self.storage.product_availabilities.where(product_id=old_product_id)
+        for avail in availabilities:
+            avail.product_id = new_product_id
+            self.storage.product_availabilities.reindex(avail.id)
+        return len(availabilities)
 
     def bulk_update_shopping_list_items(self, old_product_id: UUID, new_product_id: UUID) -> int:
         """Update all shopping list items from old product to new product. Returns count of updated records."""
@@ -161,4 +316,4 @@ class MemoryProductRepository(AbstractProductRepository):
 
     def count_product_bids(self, product_id: UUID) -> int:
         """Count how many bids reference this product."""
-        return sum(1 for bid in self.storage.bids.values() if bid.product_id == product_id)
+        return len(self.storage.bids.where(product_id=product_id))
@@ -41,6 +41,98 @@ class MemoryRunRepository(AbstractRunRepository):
         runs.sort(key=get_timestamp, reverse=True)
         return runs[offset : offset + limit]
 
+    def _run_listings(self, runs: list[Run]) -> list[dict]:
+        """Attach store, group, leader and participant count to each run."""
+        run_ids = {run.id for run in runs}
+        leaders = {}
+        participant_counts = dict.fromkeys(run_ids, 0)
+        for participation in self.storage.participations.where_in('run_id', run_ids):
+            if participation.is_leader:
+                leaders[participation.run_id] = participation
+            if not participation.is_removed:
+                participant_counts[participation.run_id] += 1
+
+        listings = []
+        for run in runs:
+            store = self.storage.stores.get(run.store_id)
+            group = self.storage.groups.get(run.group_id)
+            leader = leaders.get(run.id)
+            leader_user = self.storage.users.get(leader.user_id) if leader else None
+            listings.append(
+                {
+                    'run': run,
+                    'store_name': store.name if store else None,
+                    'group_name': group.name if group else None,
+                    'leader_name': leader_user.name if leader_user else None,
+                    'leader_is_removed': bool(leader.is_removed) if leader else False,
+                    'participant_count': participant_counts[run.id],
+                }
+            )
+        return listings
+
+    def get_run_listings_by_group(self, group_id: UUID) -> list[dict]:
+        """Get all runs for a group with their store, group and leader details."""
+        return self._run_listings(self.get_runs_by_group(group_id))
+
+    def get_completed_cancelled_run_listings_by_group(
+        self,
+        group_id: UUID,
+        limit: int = 10,
+        offset: int = 0,
+        after_run_id: UUID | None = None,
+    ) -> list[dict] | None:
+        """Get completed and cancelled run listings for a group, most recently finished first.
+
+        Returns None if after_run_id is not a completed or cancelled run of the group.
+        """
+
+        def sort_key(run):
+            if run.state == RunState.COMPLETED and run.completed_at:
+                finished_at = run.completed_at
+            elif run.state == RunState.CANCELLED and run.cancelled_at:
+                finished_at = run.cancelled_at
+            else:
+                finished_at = run.planning_at or datetime.min.replace(tzinfo=UTC)
+            return finished_at, str(run.id)
+
+        runs = sorted(
+            (
+                run
+                for run in self.storage.runs.values()
+                if run.group_id == group_id
+                and run.state in (RunState.COMPLETED, RunState.CANCELLED)
+            ),
+            key=sort_key,
+            reverse=True,
+        )
+
+        if after_run_id is not None:
+            cursor_run = self.storage.runs.get(after_run_id)
+            if cursor_run is None or cursor_run not in runs:
+                return None
+            cursor = sort_key(cursor_run)
+            runs = [run for run in runs if sort_key(run) < cursor]
+
+        return self._run_listings(runs[offset : offset + limit])
+
+    def get_active_run_listings_by_store_for_user(
+        self, store_id: UUID, user_id: UUID
+    ) -> list[dict]:
+        """Get listings of active runs at a store across all of the user's groups."""
+        user_group_ids = {
+            group_id
+            for group_id, member_ids in self.storage.group_memberships.items()
+            if user_id in member_ids
+        }
+        runs = [
+            run
+            for run in self.storage.runs.values()
+            if run.store_id == store_id
+            and run.state not in (RunState.COMPLETED, RunState.CANCELLED)
+            and run.group_id in user_group_ids
+        ]
+        return self._run_listings(runs)
+
     def get_run_by_id(self, run_id: UUID) -> Run | None:
         return self.storage.runs.get(run_id)
 
@@ -69,31 +161,24 @@ class MemoryRunRepository(AbstractRunRepository):
         return None
 
     def get_participation(self, user_id: UUID, run_id: UUID) -> RunParticipation | None:
-        for participation in self.storage.participations.values():
-            if participation.user_id == user_id and participation.run_id == run_id:
+        for participation in self.storage.participations.where(run_id=run_id):
+            if participation.user_id == user_id:
                 participation.user = self.storage.users.get(user_id)
                 participation.run = self.storage.runs.get(run_id)
                 return participation
         return None
 
     def get_run_participations(self, run_id: UUID) -> list[RunParticipation]:
-        participations = []
-        for participation in self.storage.participations.values():
-            if participation.run_id == run_id:
-                participation.user = self.storage.users.get(participation.user_id)
-                participation.run = self.storage.runs.get(run_id)
-                participations.append(participation)
+        run = self.storage.runs.get(run_id)
+        participations = self.storage.participations.where(run_id=run_id)
+        for participation in participations:
+            participation.user = self.storage.users.get(participation.user_id)
+            participation.run = run
         return participations
 
     def get_run_participations_with_users(self, run_id: UUID) -> list[RunParticipation]:
         """Get participations with user data eagerly loaded to avoid N+1 queries."""
-        participations = []
-        for participation in self.storage.participations.values():
-            if participation.run_id == run_id:
-                participation.user = self.storage.users.get(participation.user_id)
-                participation.run = self.storage.runs.get(run_id)
-                participations.append(participation)
-        return participations
+        return self.get_run_participations(run_id)
 
     def create_participation(
         self, user_id: UUID, run_id: UUID, is_leader: bool = False, is_helper: bool = False
@@ -125,8 +210,8 @@ class MemoryRunRepository(AbstractRunRepository):
         self, user_id: UUID, run_id: UUID, is_helper: bool
     ) -> RunParticipation | None:
         """Update the helper status of a participation."""
-        for participation in self.storage.participations.values():
-            if participation.user_id == user_id and participation.run_id == run_id:
+        for participation in self.storage.participations.where(run_id=run_id):
+            if participation.user_id == user_id:
                 participation.is_helper = is_helper
                 return participation
         return None
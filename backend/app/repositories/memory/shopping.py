@@ -29,6 +29,12 @@ class MemoryShoppingRepository(AbstractShoppingRepository):
         self.storage.shopping_list_items[item.id] = item
         return item
 
+    def bulk_create_shopping_list_items(
+        self, run_id: UUID, requested_quantities: dict[UUID, Decimal]
+    ) -> None:
+        for product_id, quantity in requested_quantities.items():
+            self.create_shopping_list_item(run_id, product_id, quantity)
+
     def get_shopping_list_items(self, run_id: UUID) -> list[ShoppingListItem]:
         items = []
         for item in self.storage.shopping_list_items.values():
@@ -111,3 +117,8 @@ class MemoryShoppingRepository(AbstractShoppingRepository):
         item = self.storage.shopping_list_items.get(item_id)
         if item:
             item.requested_quantity = requested_quantity
+
+    def bulk_update_requested_quantities(self, requested_quantities: dict[UUID, Decimal]) -> None:
+        """Update the requested quantity of several shopping list items."""
+        for item_id, quantity in requested_quantities.items():
+            self.update_shopping_list_item_requested_quantity(item_id, quantity)
@@ -1,5 +1,6 @@
-"""Shared storage for memory repositories - Singleton pattern."""
+"""Storage for memory repositories."""
 
+import copy
 from uuid import UUID
 
 from app.core.models import (
@@ -15,42 +16,80 @@ from app.core.models import (
     Store,
     User,
 )
+from app.repositories.memory.indexed_table import IndexedTable, Table
+from app.repositories.memory.ngram_index import NgramIndex
 
 
 class MemoryStorage:
-    """Singleton storage for in-memory repositories."""
+    """Storage for in-memory repositories.
 
-    _instance = None
-    _initialized = False
+    Each instance is independent. The repository factories share one instance per
+    process (see app.repositories.get_memory_storage); tests can install their own.
+    """
 
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._init_storage()
-        return cls._instance
-
-    def _init_storage(self):
-        """Initialize storage dictionaries. Called once by __new__."""
+    def __init__(self):
         # Storage dictionaries
-        self._users: dict[UUID, User] = {}
-        self._users_by_username: dict[str, User] = {}
-        self._groups: dict[UUID, Group] = {}
-        self._group_memberships: dict[UUID, list[UUID]] = {}  # group_id -> [user_ids]
-        self._group_admin_status: dict[tuple, bool] = {}  # (group_id, user_id) -> is_admin
-        self._stores: dict[UUID, Store] = {}
-        self._runs: dict[UUID, Run] = {}
-        self._products: dict[UUID, Product] = {}
-        self._participations: dict[UUID, RunParticipation] = {}
-        self._bids: dict[UUID, ProductBid] = {}
-        self._shopping_list_items: dict[UUID, ShoppingListItem] = {}
-        self._product_availabilities: dict[UUID, ProductAvailability] = {}
-        self._notifications: dict[UUID, Notification] = {}
-        self._reassignment_requests: dict[UUID, LeaderReassignmentRequest] = {}
-
-        MemoryStorage._initialized = True
-
-    @property
-    def users(self) -> dict[UUID, User]:
+        self._users: Table[UUID, User] = Table()
+        self._users_by_username: dict[str, User] = {}  # derived from users
+        self._groups: Table[UUID, Group] = Table()
+        self._group_memberships: Table[UUID, list[UUID]] = Table()  # group_id -> [user_ids]
+        self._group_admin_status: Table[tuple, bool] = Table()  # (group_id, user_id) -> is_admin
+        self._stores: Table[UUID, Store] = Table()
+        self._runs: Table[UUID, Run] = Table()
+        self._products: Table[UUID, Product] = Table()
+        # Tables looked up by foreign key keep secondary indexes on those keys
+        self._participations: IndexedTable[RunParticipation] = IndexedTable(
+            ('run_id',), ('user_id',)
+        )
+        self._bids: IndexedTable[ProductBid] = IndexedTable(('participation_id',), ('product_id',))
+        self._shopping_list_items: Table[UUID, ShoppingListItem] = Table()
+        self._product_availabilities: IndexedTable[ProductAvailability] = IndexedTable(
+            ('product_id',), ('store_id',), ('product_id', 'store_id')
+        )
+        self._notifications: IndexedTable[Notification] = IndexedTable(('user_id',))
+        self._reassignment_requests: Table[UUID, LeaderReassignmentRequest] = Table()
+
+        # Trigram indexes over names for search, maintained by the repositories
+        self._product_name_index = NgramIndex()
+        self._store_name_index = NgramIndex()
+
+    def reset(self) -> None:
+        """Remove all data, keeping the table objects (and their observers) in place."""
+        for table in self.tables().values():
+            table.clear()
+        self.rebuild_derived()
+
+    def copy(self) -> 'MemoryStorage':
+        """Independent deep copy of the storage, rows included (observers are not copied)."""
+        return copy.deepcopy(self)
+
+    def tables(self) -> dict[str, Table]:
+        """The stored collections by name (derived lookups and name indexes excluded)."""
+        return {
+            'users': self._users,
+            'groups': self._groups,
+            'group_memberships': self._group_memberships,
+            'group_admin_status': self._group_admin_status,
+            'stores': self._stores,
+            'runs': self._runs,
+            'products': self._products,
+            'participations': self._participations,
+            'bids': self._bids,
+            'shopping_list_items': self._shopping_list_items,
+            'product_availabilities': self._product_availabilities,
+            'notifications': self._notifications,
+            'reassignment_requests': self._reassignment_requests,
+        }
+
+    def rebuild_derived(self) -> None:
+        """Rebuild the username lookup and name indexes from the stored rows."""
+        self._users_by_username.clear()
+        self._users_by_username.update((user.username, user) for user in self._users.values())
+        self._product_name_index.rebuild((p.id, p.name) for p in self._products.values())
+        self._store_name_index.rebuild((s.id, s.name) for s in self._stores.values())
+
+    @property
+    def users(self) -> Table[UUID, User]:
         return self._users
 
     @property
@@ -58,49 +97,57 @@ class MemoryStorage:
         return self._users_by_username
 
     @property
-    def groups(self) -> dict[UUID, Group]:
+    def groups(self) -> Table[UUID, Group]:
         return self._groups
 
     @property
-    def group_memberships(self) -> dict[UUID, list[UUID]]:
+    def group_memberships(self) -> Table[UUID, list[UUID]]:
         return self._group_memberships
 
     @property
-    def group_admin_status(self) -> dict[tuple, bool]:
+    def group_admin_status(self) -> Table[tuple, bool]:
         return self._group_admin_status
 
     @property
-    def stores(self) -> dict[UUID, Store]:
+    def stores(self) -> Table[UUID, Store]:
         return self._stores
 
     @property
-    def runs(self) -> dict[UUID, Run]:
+    def runs(self) -> Table[UUID, Run]:
         return self._runs
 
     @property
-    def products(self) -> dict[UUID, Product]:
+    def products(self) -> Table[UUID, Product]:
         return self._products
 
     @property
-    def participations(self) -> dict[UUID, RunParticipation]:
+    def participations(self) -> IndexedTable[RunParticipation]:
         return self._participations
 
     @property
-    def bids(self) -> dict[UUID, ProductBid]:
+    def bids(self) -> IndexedTable[ProductBid]:
         return self._bids
 
     @property
-    def shopping_list_items(self) -> dict[UUID, ShoppingListItem]:
+    def shopping_list_items(self) -> Table[UUID, ShoppingListItem]:
         return self._shopping_list_items
 
     @property
-    def product_availabilities(self) -> dict[UUID, ProductAvailability]:
+    def product_availabilities(self) -> IndexedTable[ProductAvailability]:
         return self._product_availabilities
 
     @property
-    def notifications(self) -> dict[UUID, Notification]:
+    def notifications(self) -> IndexedTable[Notification]:
         return self._notifications
 
     @property
-    def reassignment_requests(self) -> dict[UUID, LeaderReassignmentRequest]:
+    def reassignment_requests(self) -> Table[UUID, LeaderReassignmentRequest]:
         return self._reassignment_requests
+
+    @property
+    def product_name_index(self) -> NgramIndex:
+        return self._product_name_index
+
+    @property
+    def store_name_index(self) -> NgramIndex:
+        return self._store_name_index
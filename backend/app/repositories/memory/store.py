@@ -4,7 +4,10 @@ from uuid import UUID, uuid4
 
 from app.core.models import Product, Run, Store
 from app.core.run_state import RunState
+from app.infrastructure.config import SEARCH_RESULT_LIMIT
 from app.repositories.abstract.store import AbstractStoreRepository
+from app.repositories.memory.listing import matches_search, newest_first_page
+from app.repositories.memory.ngram_index import NgramIndex
 from app.repositories.memory.storage import MemoryStorage
 
 
@@ -14,9 +17,18 @@ class MemoryStoreRepository(AbstractStoreRepository):
     def __init__(self, storage: MemoryStorage):
         self.storage = storage
 
-    def search_stores(self, query: str) -> list[Store]:
-        query_lower = query.lower()
-        return [store for store in self.storage.stores.values() if query_lower in store.name.lower()]
+    def _name_index(self) -> NgramIndex:
+        # Rebuilt when stores were added or removed without going through the repository
+        index = self.storage.store_name_index
+        if len(index) != len(self.storage.stores):
+            index.rebuild((store.id, store.name) for store in self.storage.stores.values())
+        return index
+
+    def search_stores(self, query: str, limit: int = SEARCH_RESULT_LIMIT) -> list[Store]:
+        """Search stores by name, most similar first."""
+        store_ids = self._name_index().search(query, limit)
+        stores = (self.storage.stores.get(store_id) for store_id in store_ids)
+        return [store for store in stores if store is not None]
 
     def get_all_stores(self, limit: int = None, offset: int = 0) -> list[Store]:
         stores = list(self.storage.stores.values())
@@ -25,10 +37,39 @@ class MemoryStoreRepository(AbstractStoreRepository):
             return stores[offset : offset + limit]
         return stores
 
+    def _admin_matches(self, search: str | None, verified: bool | None) -> list[Store]:
+        return [
+            store
+            for store in self.storage.stores.values()
+            if (
+                not search
+                or matches_search(search, store.name, store.address, store.chain, store.id)
+            )
+            and (verified is None or store.verified == verified)
+        ]
+
+    def get_stores_page(
+        self,
+        search: str | None = None,
+        verified: bool | None = None,
+        limit: int = 100,
+        offset: int = 0,
+        after_store_id: UUID | None = None,
+    ) -> list[Store] | None:
+        """Get one page of stores, newest first."""
+        return newest_first_page(
+            self._admin_matches(search, verified), limit, offset, after_store_id
+        )
+
+    def count_stores(self, search: str | None = None, verified: bool | None = None) -> int:
+        """Count stores matching the get_stores_page filters."""
+        return len(self._admin_matches(search, verified))
+
     def create_store(self, name: str) -> Store:
         """Create a new store."""
         store = Store(id=uuid4(), name=name, verified=False)
         self.storage.stores[store.id] = store
+        self.storage.store_name_index.add(store.id, store.name)
         return store
 
     def get_store_by_id(self, store_id: UUID) -> Store | None:
@@ -36,12 +77,15 @@ class MemoryStoreRepository(AbstractStoreRepository):
 
     def get_products_by_store_from_availabilities(self, store_id: UUID) -> list[Product]:
         """Get all unique products that are available at a store."""
-        product_ids = {
+        product_ids = dict.fromkeys(
             avail.product_id
-            for avail in self.storage.product_availabilities.values()
-            if avail.store_id == store_id
-        }
-        return [product for product in self.storage.products.values() if product.id in product_ids]
+            for avail in self.storage.product_availabilities.where(store_id=store_id)
+        )
+        return [
+            self.storage.products[product_id]
+            for product_id in product_ids
+            if product_id in self.storage.products
+        ]
 
     def get_active_runs_by_store_for_user(self, store_id: UUID, user_id: UUID) -> list[Run]:
         """Get all active runs for a store across all user's groups."""
@@ -77,6 +121,8 @@ class MemoryStoreRepository(AbstractStoreRepository):
         for key, value in fields.items():
             if hasattr(store, key):
                 setattr(store, key, value)
+        if 'name' in fields:
+            self.storage.store_name_index.add(store.id, store.name)
 
         return store
 
@@ -86,6 +132,7 @@ class MemoryStoreRepository(AbstractStoreRepository):
             return False
 
         del self.storage.stores[store_id]
+        self.storage.store_name_index.remove(store_id)
         return True
 
     def bulk_update_runs(self, old_store_id: UUID, new_store_id: UUID) -> int:
@@ -99,12 +146,11 @@ class MemoryStoreRepository(AbstractStoreRepository):
 
     def bulk_update_store_availabilities(self, old_store_id: UUID, new_store_id: UUID) -> int:
         """Update all store availabilities from old store to new store. Returns count of updated records."""
-        count = 0
-        for avail in self.storage.product_availabilities.values():
-            if avail.store_id == old_store_id:
-                avail.store_id = new_store_id
-                count += 1
-        return count
+        availabilities = self.storage.product_availabilities.where(store_id=old_store_id)
+        for avail in availabilities:
+            avail.store_id = new_store_id
+            self.storage.product_availabilities.reindex(avail.id)
+        return len(availabilities)
 
     def count_store_runs(self, store_id: UUID) -> int:
         """Count how many runs reference this store."""
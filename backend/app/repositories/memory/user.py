@@ -4,6 +4,7 @@ from uuid import UUID, uuid4
 
 from app.core.models import Group, User
 from app.repositories.abstract.user import AbstractUserRepository
+from app.repositories.memory.listing import matches_search, newest_first_page
 from app.repositories.memory.storage import MemoryStorage
 
 
@@ -35,6 +36,31 @@ class MemoryUserRepository(AbstractUserRepository):
     def get_all_users(self) -> list[User]:
         return list(self.storage.users.values())
 
+    def _admin_matches(self, search: str | None, verified: bool | None) -> list[User]:
+        return [
+            user
+            for user in self.storage.users.values()
+            if (not search or matches_search(search, user.name, user.username, user.id))
+            and (verified is None or user.verified == verified)
+        ]
+
+    def get_users_page(
+        self,
+        search: str | None = None,
+        verified: bool | None = None,
+        limit: int = 100,
+        offset: int = 0,
+        after_user_id: UUID | None = None,
+    ) -> list[User] | None:
+        """Get one page of users, newest first."""
+        return newest_first_page(
+            self._admin_matches(search, verified), limit, offset, after_user_id
+        )
+
+    def count_users(self, search: str | None = None, verified: bool | None = None) -> int:
+        """Count users matching the get_users_page filters."""
+        return len(self._admin_matches(search, verified))
+
     def get_user_groups(self, user: User) -> list[Group]:
         user_groups = []
         for group_id, member_ids in self.storage.group_memberships.items():
@@ -81,7 +107,7 @@ class MemoryUserRepository(AbstractUserRepository):
         del self.storage.users[user_id]
         return True
 
-    def verify_password(self, password: str, stored_hash: str) -> bool:
+    async def verify_password(self, password: str, stored_hash: str) -> bool:
         # In memory mode, accept any password for ease of testing
         return True
 
@@ -91,20 +117,14 @@ class MemoryUserRepository(AbstractUserRepository):
         total_quantity = 0.0
         total_spent = 0.0
 
-        for bid in self.storage.bids.values():
-            participation = self.storage.participations.get(bid.participation_id)
-            if (
-                participation
-                and participation.user_id == user_id
-                and bid.is_picked_up
-                and bid.distributed_quantity
-                and bid.distributed_price_per_unit
-            ):
+        user_participations = self.storage.participations.where(user_id=user_id)
+        user_bids = self.storage.bids.where_in('participation_id', (p.id for p in user_participations))
+        for bid in user_bids:
+            if bid.is_picked_up and bid.distributed_quantity and bid.distributed_price_per_unit:
                 total_quantity += float(bid.distributed_quantity)
                 total_spent += float(bid.distributed_quantity * bid.distributed_price_per_unit)
 
         # Get runs participated count (distinct runs)
-        user_participations = [p for p in self.storage.participations.values() if p.user_id == user_id]
         runs_participated = len({p.run_id for p in user_participations})
 
         # Get runs where user was helper
@@ -129,12 +149,11 @@ class MemoryUserRepository(AbstractUserRepository):
 
     def bulk_update_run_participations(self, old_user_id: UUID, new_user_id: UUID) -> int:
         """Update all run participations from old user to new user. Returns count of updated records."""
-        count = 0
-        for participation in self.storage.participations.values():
-            if participation.user_id == old_user_id:
-                participation.user_id = new_user_id
-                count += 1
-        return count
+        participations = self.storage.participations.where(user_id=old_user_id)
+        for participation in participations:
+            participation.user_id = new_user_id
+            self.storage.participations.reindex(participation.id)
+        return len(participations)
 
     def bulk_update_group_creator(self, old_user_id: UUID, new_user_id: UUID) -> int:
         """Update group creator from old user to new user. Returns count of updated records."""
@@ -192,12 +211,11 @@ class MemoryUserRepository(AbstractUserRepository):
 
     def bulk_update_notifications(self, old_user_id: UUID, new_user_id: UUID) -> int:
         """Update notifications from old user to new user. Returns count of updated records."""
-        count = 0
-        for notification in self.storage.notifications.values():
-            if notification.user_id == old_user_id:
-                notification.user_id = new_user_id
-                count += 1
-        return count
+        notifications = self.storage.notifications.where(user_id=old_user_id)
+        for notification in notifications:
+            notification.user_id = new_user_id
+            self.storage.notifications.reindex(notification.id)
+        return len(notifications)
 
     def bulk_update_reassignment_from_user(self, old_user_id: UUID, new_user_id: UUID) -> int:
         """Update reassignment requests from_user from old user to new user. Returns count of updated records."""
@@ -233,6 +251,6 @@ class MemoryUserRepository(AbstractUserRepository):
 
     def check_overlapping_run_participations(self, user1_id: UUID, user2_id: UUID) -> list[UUID]:
         """Check if two users participate in any of the same runs. Returns list of overlapping run IDs."""
-        user1_runs = {p.run_id for p in self.storage.participations.values() if p.user_id == user1_id}
-        user2_runs = {p.run_id for p in self.storage.participations.values() if p.user_id == user2_id}
+        user1_runs = {p.run_id for p in self.storage.participations.where(user_id=user1_id)}
+        user2_runs = {p.run_id for p in self.storage.participations.where(user_id=user2_id)}
         return list(user1_runs & user2_runs)
@@ -8,6 +8,7 @@ from .reassignment_service import ReassignmentService
 from .run_notification_service import RunNotificationService
 from .run_service import RunService
 from .run_state_service import RunStateService
+from .search_service import SearchService
 from .shopping_service import ShoppingService
 from .store_service import StoreService
 
@@ -24,4 +25,5 @@ __all__ = [
     'NotificationService',
     'ReassignmentService',
     'AdminService',
+    'SearchService',
 ]
@@ -21,6 +21,7 @@ from app.core.error_codes import (
     CANNOT_MERGE_SAME_STORE,
     CANNOT_MERGE_SAME_USER,
     CANNOT_REMOVE_OWN_ADMIN_STATUS,
+    GROUP_NOT_FOUND,
     PRODUCT_HAS_ACTIVE_BIDS,
     PRODUCT_NOT_FOUND,
     STORE_HAS_ACTIVE_RUNS,
@@ -44,12 +45,15 @@ from app.core.success_codes import (
     USER_VERIFIED,
     USERS_MERGED,
 )
+from app.infrastructure.reference_cache import reference_cache
+from app.infrastructure.suggest_index import suggest_index
 from app.repositories import (
     get_group_repository,
     get_product_repository,
     get_store_repository,
     get_user_repository,
 )
+from app.utils.validation import validate_uuid
 
 from .base_service import BaseService
 
@@ -71,42 +75,32 @@ class AdminService(BaseService):
         verified: bool | None = None,
         limit: int = 100,
         offset: int = 0,
+        after: str | None = None,
     ) -> list[AdminUserResponse]:
-        """Get all users with optional search and filtering (paginated).
+        """Get users with optional search and filtering (paginated, newest first).
 
         Args:
             search: Optional search query for name, username, or ID
             verified: Optional filter by verification status
             limit: Maximum number of results (max 100)
             offset: Number of results to skip
+            after: User ID of the last user of the previous page (keyset pagination)
 
         Returns:
             List of user dictionaries with formatted data
+
+        Raises:
+            BadRequestError: If after is not a valid UUID
+            NotFoundError: If after is not a user matching the filters
         """
-        users = self.user_repo.get_all_users()
-
-        # Filter by search query (name, username, or ID)
-        if search:
-            search_lower = search.lower()
-            users = [
-                u
-                for u in users
-                if (
-                    search_lower in u.name.lower()
-                    or search_lower in u.username.lower()
-                    or search_lower in str(u.id).lower()
-                )
-            ]
-
-        # Filter by verification status
-        if verified is not None:
-            users = [u for u in users if u.verified == verified]
-
-        # Sort by created_at (most recent first) or by name if no created_at
-        users.sort(key=lambda u: u.created_at if u.created_at else datetime.min, reverse=True)
-
-        # Apply pagination
-        paginated_users = users[offset : offset + limit]
+        after_uuid = validate_uuid(after, 'User') if after else None
+        users = self.user_repo.get_users_page(search, verified, limit, offset, after_uuid)
+        if users is None:
+            raise NotFoundError(
+                code=USER_NOT_FOUND,
+                message='Pagination cursor user not found',
+                user_id=str(after_uuid),
+            )
 
         return [
             AdminUserResponse(
@@ -117,9 +111,13 @@ class AdminService(BaseService):
                 is_admin=u.is_admin,
                 created_at=u.created_at.isoformat() if u.created_at else None,
             )
-            for u in paginated_users
+            for u in users
         ]
 
+    def count_users(self, search: str | None = None, verified: bool | None = None) -> int:
+        """Count the users get_users pages through."""
+        return self.user_repo.count_users(search, verified)
+
     def toggle_user_verification(
         self, user_id: UUID, admin_user: User
     ) -> VerificationToggleResponse:
@@ -153,88 +151,82 @@ class AdminService(BaseService):
         search: str | None = None,
         limit: int = 100,
         offset: int = 0,
+        after: str | None = None,
     ) -> list[AdminGroupResponse]:
-        """Get all groups with optional search and filtering (paginated).
+        """Get groups with optional search (paginated, newest first).
 
         Args:
             search: Optional search query for group name or ID
             limit: Maximum number of results (max 100)
             offset: Number of results to skip
+            after: Group ID of the last group of the previous page (keyset pagination)
 
         Returns:
             List of AdminGroupResponse with formatted data
-        """
-        groups = self.group_repo.get_all_groups()
 
-        # Filter by search query (name or ID)
-        if search:
-            search_lower = search.lower()
-            groups = [
-                g
-                for g in groups
-                if (search_lower in g.name.lower() or search_lower in str(g.id).lower())
-            ]
-
-        # Sort by created_at (most recent first)
-        groups.sort(key=lambda g: g.created_at if g.created_at else datetime.min, reverse=True)
-
-        # Apply pagination
-        paginated_groups = groups[offset : offset + limit]
+        Raises:
+            BadRequestError: If after is not a valid UUID
+            NotFoundError: If after is not a group matching the filters
+        """
+        after_uuid = validate_uuid(after, 'Group') if after else None
+        listings = self.group_repo.get_group_admin_listings(search, limit, offset, after_uuid)
+        if listings is None:
+            raise NotFoundError(
+                code=GROUP_NOT_FOUND,
+                message='Pagination cursor group not found',
+                group_id=str(after_uuid),
+            )
 
         return [
             AdminGroupResponse(
-                id=str(g.id),
-                name=g.name,
-                created_by=str(g.created_by),
-                creator_name=g.creator.name if g.creator else 'Unknown',
-                member_count=len(g.members) if g.members else 0,
-                created_at=g.created_at.isoformat() if g.created_at else None,
+                id=str(listing['group'].id),
+                name=listing['group'].name,
+                created_by=str(listing['group'].created_by),
+                creator_name=listing['creator_name'] or 'Unknown',
+                member_count=listing['member_count'],
+                created_at=listing['group'].created_at.isoformat()
+                if listing['group'].created_at
+                else None,
             )
-            for g in paginated_groups
+            for listing in listings
         ]
 
+    def count_groups(self, search: str | None = None) -> int:
+        """Count the groups get_groups pages through."""
+        return self.group_repo.count_groups(search)
+
     def get_products(
         self,
         search: str | None = None,
         verified: bool | None = None,
         limit: int = 100,
         offset: int = 0,
+        after: str | None = None,
     ) -> list[AdminProductResponse]:
-        """Get all products with optional search and filtering (paginated).
+        """Get products with optional search and filtering (paginated, newest first).
 
         Args:
             search: Optional search query for name, brand, or ID
             verified: Optional filter by verification status
             limit: Maximum number of results (max 100)
             offset: Number of results to skip
+            after: Product ID of the last product of the previous page (keyset pagination)
 
         Returns:
             List of AdminProductResponse with formatted data
+
+        Raises:
+            BadRequestError: If after is not a valid UUID
+            NotFoundError: If after is not a product matching the filters
         """
-        products = self.product_repo.get_all_products()
-
-        # Filter by search query (name, brand, or ID)
-        if search:
-            search_lower = search.lower()
-            products = [
-                p
-                for p in products
-                if (
-                    search_lower in p.name.lower()
-                    or (p.brand and search_lower in p.brand.lower())
-                    or search_lower in str(p.id).lower()
-                )
-            ]
-
-        # Filter by verification status
-        if verified is not None:
-            products = [p for p in products if p.verified == verified]
-
-        # Sort by created_at (most recent first) or by name if no created_at
-        products.sort(key=lambda p: p.created_at if p.created_at else datetime.min, reverse=True)
-
-        # Apply pagination
-        paginated_products = products[offset : offset + limit]
+        after_uuid = validate_uuid(after, 'Product') if after else None
+        products = self.product_repo.get_products_page(search, verified, limit, offset, after_uuid)
+        if products is None:
+            raise NotFoundError(
+                code=PRODUCT_NOT_FOUND,
+                message='Pagination cursor product not found',
+                product_id=str(after_uuid),
+            )
 
         return [
             AdminProductResponse(
@@ -245,9 +237,13 @@ class AdminService(BaseService):
                 verified=p.verified if p.verified is not None else False,
                 created_at=p.created_at.isoformat() if p.created_at else None,
             )
-            for p in paginated_products
+            for p in products
         ]
 
+    def count_products(self, search: str | None = None, verified: bool | None = None) -> int:
+        """Count the products get_products pages through."""
+        return self.product_repo.count_products(search, verified)
+
     def toggle_product_verification(
         self, product_id: UUID, admin_user: User
     ) -> VerificationToggleResponse:
@@ -277,6 +273,7 @@ class AdminService(BaseService):
         else:
             product.verified_by = None
             product.verified_at = None
+        reference_cache.invalidate_products(product.id)
 
         return VerificationToggleResponse(
             code=PRODUCT_VERIFIED if product.verified else PRODUCT_UNVERIFIED,
@@ -290,43 +287,32 @@ class AdminService(BaseService):
         verified: bool | None = None,
         limit: int = 100,
         offset: int = 0,
+        after: str | None = None,
     ) -> list[AdminStoreResponse]:
-        """Get all stores with optional search and filtering (paginated).
+        """Get stores with optional search and filtering (paginated, newest first).
 
         Args:
             search: Optional search query for name, address, chain, or ID
             verified: Optional filter by verification status
             limit: Maximum number of results (max 100)
             offset: Number of results to skip
+            after: Store ID of the last store of the previous page (keyset pagination)
 
         Returns:
             List of AdminStoreResponse with formatted data
+
+        Raises:
+            BadRequestError: If after is not a valid UUID
+            NotFoundError: If after is not a store matching the filters
         """
-        stores = self.store_repo.get_all_stores()
-
-        # Filter by search query (name, address, chain, or ID)
-        if search:
-            search_lower = search.lower()
-            stores = [
-                s
-                for s in stores
-                if (
-                    search_lower in s.name.lower()
-                    or (s.address and search_lower in s.address.lower())
-                    or (s.chain and search_lower in s.chain.lower())
-                    or search_lower in str(s.id).lower()
-                )
-            ]
-
-        # Filter by verification status
-        if verified is not None:
-            stores = [s for s in stores if s.verified == verified]
-
-        # Sort by created_at (most recent first) or by name if no created_at
-        stores.sort(key=lambda s: s.created_at if s.created_at else datetime.min, reverse=True)
-
-        # Apply pagination
-        paginated_stores = stores[offset : offset + limit]
+        after_uuid = validate_uuid(after, 'Store') if after else None
+        stores = self.store_repo.get_stores_page(search, verified, limit, offset, after_uuid)
+        if stores is None:
+            raise NotFoundError(
+                code=STORE_NOT_FOUND,
+                message='Pagination cursor store not found',
+                store_id=str(after_uuid),
+            )
 
         return [
             AdminStoreResponse(
@@ -337,9 +323,13 @@ class AdminService(BaseService):
                 verified=s.verified if s.verified is not None else False,
                 created_at=s.created_at.isoformat() if s.created_at else None,
             )
-            for s in paginated_stores
+            for s in stores
         ]
 
+    def count_stores(self, search: str | None = None, verified: bool | None = None) -> int:
+        """Count the stores get_stores pages through."""
+        return self.store_repo.count_stores(search, verified)
+
     def toggle_store_verification(
         self, store_id: UUID, admin_user: User
     ) -> VerificationToggleResponse:
@@ -369,6 +359,7 @@ class AdminService(BaseService):
         else:
             store.verified_by = None
             store.verified_at = None
+        reference_cache.invalidate_stores(store.id)
 
         return VerificationToggleResponse(
             code=STORE_VERIFIED if store.verified else STORE_UNVERIFIED,
@@ -399,6 +390,8 @@ class AdminService(BaseService):
             raise NotFoundError(
                 code=PRODUCT_NOT_FOUND, message='Product not found', product_id=str(product_id)
             )
+        suggest_index.products.add(product.id, product.name)
+        reference_cache.invalidate_products(product.id)
 
         return AdminProductResponse(
             id=str(product.id),
@@ -428,6 +421,8 @@ class AdminService(BaseService):
             raise NotFoundError(
                 code=STORE_NOT_FOUND, message='Store not found', store_id=str(store_id)
             )
+        suggest_index.stores.add(store.id, store.name)
+        reference_cache.invalidate_stores(store.id)
 
         return AdminStoreResponse(
             id=str(store.id),
@@ -528,6 +523,8 @@ class AdminService(BaseService):
 
         # Delete source product
         self.product_repo.delete_product(source_id)
+        suggest_index.products.remove(source_id)
+        reference_cache.invalidate_products(source_id, target_id)
 
         total_affected = bids_count + avails_count + items_count
 
@@ -586,6 +583,8 @@ class AdminService(BaseService):
 
         # Delete source store
         self.store_repo.delete_store(source_id)
+        suggest_index.stores.remove(source_id)
+        reference_cache.invalidate_stores(source_id, target_id)
 
         total_affected = runs_count + avails_count
 
@@ -737,6 +736,8 @@ class AdminService(BaseService):
 
         # Delete the product
         self.product_repo.delete_product(product_id)
+        suggest_index.products.remove(product_id)
+        reference_cache.invalidate_products(product_id)
 
         from app.api.schemas import DeleteResponse
 
@@ -780,6 +781,8 @@ class AdminService(BaseService):
 
         # Delete the store
         self.store_repo.delete_store(store_id)
+        suggest_index.stores.remove(store_id)
+        reference_cache.invalidate_stores(store_id)
 
         from app.api.schemas import DeleteResponse
 
@@ -28,6 +28,7 @@ from app.core.success_codes import BID_PLACED, BID_RETRACTED
 from app.events.domain_events import BidPlacedEvent, BidRetractedEvent
 from app.events.event_bus import event_bus
 from app.infrastructure.config import MAX_PRODUCTS_PER_RUN
+from app.infrastructure.reference_cache import reference_cache
 from app.infrastructure.request_context import get_logger
 from app.repositories import (
     get_bid_repository,
@@ -254,7 +255,7 @@ class BidService(BaseService):
             )
 
         # Verify product exists (products don't need store availability to be bid on)
-        product = self.product_repo.get_product_by_id(product_uuid)
+        product = reference_cache.get_product(self.db, product_uuid)
         if not product:
             raise NotFoundError(
                 code=PRODUCT_NOT_FOUND, message='Product not found', product_id=product_id
@@ -1,5 +1,7 @@
 """Distribution service for handling distribution-related business logic."""
 
+from collections import defaultdict
+from decimal import Decimal
 from typing import Any
 from uuid import UUID
 
@@ -12,6 +14,7 @@ from app.api.schemas import (
     SuccessResponse,
 )
 from app.api.schemas.notification_data import RunStateChangedData
+from app.core.allocation import split_cost
 from app.core.error_codes import (
     BID_NOT_FOUND,
     CANNOT_COMPLETE_DISTRIBUTION_UNPURCHASED_ITEMS,
@@ -27,9 +30,10 @@ from app.core.exceptions import (
     ForbiddenError,
     NotFoundError,
 )
-from app.core.models import Product, ProductBid, User
+from app.core.models import ProductBid, User
 from app.core.run_state import RunState, state_machine
 from app.core.success_codes import BID_MARKED_PICKED_UP, DISTRIBUTION_COMPLETED
+from app.infrastructure.reference_cache import reference_cache
 from app.infrastructure.request_context import get_logger
 from app.infrastructure.transaction import transaction
 from app.repositories import (
@@ -153,14 +157,23 @@ class DistributionService(BaseService):
     def _aggregate_bids_by_user(self, all_bids: list[ProductBid]) -> dict[str, dict[str, Any]]:
         """Group bids by user and aggregate totals."""
         users_data = {}
+        # Skip interested-only bids or bids with no distributed quantity
+        distributed_bids = [
+            bid
+            for bid in all_bids
+            if not bid.interested_only
+            and bid.distributed_quantity is not None
+            and bid.distributed_quantity > 0
+        ]
+        subtotals = self._calculate_subtotals(distributed_bids)
+        products_by_id = {
+            product.id: product
+            for product in self.product_repo.get_products_by_ids(
+                {bid.product_id for bid in distributed_bids}
+            )
+        }
 
-        for bid in all_bids:
-            # Skip interested-only bids or bids with no distributed quantity
-            if bid.interested_only:
-                continue
-            if bid.distributed_quantity is None or float(bid.distributed_quantity) <= 0:
-                continue
-
+        for bid in distributed_bids:
             if not bid.participation or not bid.participation.user:
                 continue
 
@@ -171,17 +184,15 @@ class DistributionService(BaseService):
                     'user_id': user_id,
                     'user_name': bid.participation.user.name,
                     'products': [],
-                    'total_cost': 0.0,
+                    'total_cost': Decimal('0'),
                 }
 
-            product = self._get_product(bid.product_id)
+            product = products_by_id.get(bid.product_id)
             if not product:
                 continue
 
-            price_per_unit = (
-                float(bid.distributed_price_per_unit) if bid.distributed_price_per_unit else 0.0
-            )
-            subtotal = self._calculate_subtotal(price_per_unit, bid.distributed_quantity)
+            price_per_unit = bid.distributed_price_per_unit or Decimal('0')
+            subtotal = subtotals[bid.id]
 
             users_data[user_id]['products'].append(
                 DistributionProduct(
@@ -201,9 +212,21 @@ class DistributionService(BaseService):
 
         return users_data
 
-    def _calculate_subtotal(self, price_per_unit: float, quantity: float) -> float:
-        """Calculate subtotal for a product."""
-        return price_per_unit * float(quantity)
+    def _calculate_subtotals(self, bids: list[ProductBid]) -> dict[UUID, Decimal]:
+        """Calculate each bid's subtotal in exact cents.
+
+        Bids for the same product at the same price share the cost of their combined
+        quantity, split so the subtotals add up to it exactly.
+        """
+        bids_by_purchase = defaultdict(list)
+        for bid in bids:
+            bids_by_purchase[(bid.product_id, bid.distributed_price_per_unit)].append(bid)
+
+        subtotals = {}
+        for (_, price_per_unit), purchase_bids in bids_by_purchase.items():
+            costs = split_cost(price_per_unit, [bid.distributed_quantity for bid in purchase_bids])
+            subtotals.update(zip((bid.id for bid in purchase_bids), costs, strict=True))
+        return subtotals
 
     def _build_user_distribution(self, user_data: dict[str, Any]) -> DistributionUser:
         """Build DistributionUser from aggregated user data."""
@@ -351,10 +374,6 @@ class DistributionService(BaseService):
             group_id=str(run.group_id),
         )
 
-    def _get_product(self, product_id: UUID) -> Product:
-        """Get product from repository."""
-        return self.product_repo.get_product_by_id(product_id)
-
     def _get_bid(self, bid_id: UUID) -> ProductBid:
         """Get bid from repository."""
         return self.bid_repo.get_bid_by_id(bid_id)
@@ -371,9 +390,7 @@ class DistributionService(BaseService):
             old_state: Previous state
             new_state: New state
         """
-        # Get store name for notification
-        all_stores = self.store_repo.get_all_stores()
-        store = next((s for s in all_stores if s.id == run.store_id), None)
+        store = reference_cache.get_store(self.db, run.store_id)
         store_name = store.name if store else 'Unknown Store'
 
         # Get all participants of this run
@@ -386,23 +403,27 @@ class DistributionService(BaseService):
             old_state=old_state,
             new_state=new_state,
             group_id=str(run.group_id),
+        ).model_dump(mode='json')
+
+        # One multi-row insert for all participants, committed with the state change
+        notifications = self.notification_repo.create_notifications_bulk(
+            [
+                {
+                    'user_id': participation.user_id,
+                    'type': 'run_state_changed',
+                    'data': notification_data,
+                }
+                for participation in participations
+            ]
         )
 
-        # Create notification for each participant and broadcast via WebSocket
-
+        # Broadcast each notification to its user's WebSocket connection
         from app.api.websocket_manager import manager
 
-        for participation in participations:
-            notification = self.notification_repo.create_notification(
-                user_id=participation.user_id,
-                type='run_state_changed',
-                data=notification_data.model_dump(mode='json'),
-            )
-
-            # Broadcast to user's WebSocket connection
+        for notification in notifications:
             create_background_task(
                 manager.broadcast(
-                    f'user:{participation.user_id}',
+                    f'user:{notification.user_id}',
                     {
                         'type': 'new_notification',
                         'data': {
@@ -416,7 +437,7 @@ class DistributionService(BaseService):
                         },
                     },
                 ),
-                task_name=f'broadcast_distribution_notification_{participation.user_id}',
+                task_name=f'broadcast_distribution_notification_{notification.user_id}',
             )
 
         logger.debug(
@@ -32,6 +32,7 @@ from app.core.error_codes import (
     NOT_A_GROUP_MEMBER,
     NOT_GROUP_ADMIN,
     NOT_GROUP_MEMBER,
+    RUN_NOT_FOUND,
     USER_ALREADY_GROUP_ADMIN,
     USER_MAX_GROUPS_EXCEEDED,
 )
@@ -82,12 +83,8 @@ class GroupService(BaseService):
         """
         logger.debug('Fetching groups for user', extra={'user_id': str(user.id)})
 
-        # Get groups where the user is a member
-        groups = self.user_repo.get_user_groups(user)
-
-        # Get all stores for lookups
-        all_stores = self.store_repo.get_all_stores()
-        store_lookup = {store.id: store.name for store in all_stores}
+        # Groups with member/run counts and active runs, aggregated by the repository
+        summaries = self.group_repo.get_user_group_summaries(user.id)
 
         # State ordering for sorting (reverse order: distributing > adjusting > shopping > confirmed > active > planning)
         state_order = {
@@ -101,25 +98,20 @@ class GroupService(BaseService):
 
         # Convert to response format
         group_responses = []
-        for group in groups:
-            # Get runs for this group
-            runs = self.run_repo.get_runs_by_group(group.id)
-            active_runs = [
-                run for run in runs if run.state not in (RunState.COMPLETED, RunState.CANCELLED)
-            ]
-            completed_runs = [run for run in runs if run.state == RunState.COMPLETED]
+        for summary in summaries:
+            group = summary['group']
 
             # Sort active runs by state (reverse state order)
             sorted_active_runs = sorted(
-                active_runs, key=lambda r: state_order.get(r.state, 0), reverse=True
+                summary['active_runs'], key=lambda r: state_order.get(r['state'], 0), reverse=True
             )
 
             # Convert to run summary format
             active_runs_summary = [
                 RunSummary(
-                    id=str(run.id),
-                    store_name=store_lookup.get(run.store_id, 'Unknown Store'),
-                    state=run.state,
+                    id=str(run['id']),
+                    store_name=run['store_name'] or 'Unknown Store',
+                    state=run['state'],
                 )
                 for run in sorted_active_runs
             ]
@@ -128,12 +120,12 @@ class GroupService(BaseService):
                 GroupResponse(
                     id=str(group.id),
                     name=group.name,
-                    description=f'Group created by {group.creator.name}'
-                    if group.creator
+                    description=f'Group created by {summary["creator_name"]}'
+                    if summary['creator_name']
                     else 'Group',
-                    member_count=len(group.members),
-                    active_runs_count=len(active_runs),
-                    completed_runs_count=len(completed_runs),
+                    member_count=summary['member_count'],
+                    active_runs_count=summary['active_runs_count'],
+                    completed_runs_count=summary['completed_runs_count'],
                     active_runs=active_runs_summary,
                     created_at=group.created_at.isoformat() if group.created_at else '',
                 )
@@ -261,45 +253,17 @@ class GroupService(BaseService):
         logger.debug(
             'Fetching runs for group', extra={'user_id': str(user.id), 'group_id': str(group_uuid)}
         )
-        runs = self.run_repo.get_runs_by_group(group_uuid)
+        listings = self.run_repo.get_run_listings_by_group(group_uuid)
 
-        # Convert to response format with store names
-        all_stores = self.store_repo.get_all_stores()
-        store_lookup = {store.id: store.name for store in all_stores}
-
-        run_responses = []
-        for run in runs:
-            # Get leader from participations
-            participations = self.run_repo.get_run_participations(run.id)
-            leader = next((p for p in participations if p.is_leader), None)
-            leader_name = leader.user.name if leader and leader.user else 'Unknown'
-            leader_is_removed = leader.is_removed if leader else False
-
-            run_responses.append(
-                RunResponse(
-                    id=str(run.id),
-                    group_id=str(run.group_id),
-                    store_id=str(run.store_id),
-                    store_name=store_lookup.get(run.store_id, 'Unknown Store'),
-                    state=run.state,
-                    leader_name=leader_name,
-                    leader_is_removed=leader_is_removed,
-                    planned_on=run.planned_on.isoformat() if run.planned_on else None,
-                    planning_at=run.planning_at.isoformat() if run.planning_at else None,
-                    active_at=run.active_at.isoformat() if run.active_at else None,
-                    confirmed_at=run.confirmed_at.isoformat() if run.confirmed_at else None,
-                    shopping_at=run.shopping_at.isoformat() if run.shopping_at else None,
-                    adjusting_at=run.adjusting_at.isoformat() if run.adjusting_at else None,
-                    distributing_at=run.distributing_at.isoformat() if run.distributing_at else None,
-                    completed_at=run.completed_at.isoformat() if run.completed_at else None,
-                    cancelled_at=run.cancelled_at.isoformat() if run.cancelled_at else None,
-                )
-            )
-
-        return run_responses
+        return [self._run_response(listing) for listing in listings]
 
     def get_group_completed_cancelled_runs(
-        self, group_id: str, user: User, limit: int = 10, offset: int = 0
+        self,
+        group_id: str,
+        user: User,
+        limit: int = 10,
+        offset: int = 0,
+        after: str | None = None,
     ) -> list[RunResponse]:
         """Get completed and cancelled runs for a specific group with pagination.
 
@@ -308,17 +272,19 @@ class GroupService(BaseService):
             user: The requesting user
             limit: Maximum number of runs to return (default 10)
             offset: Number of runs to skip (default 0)
+            after: Run ID of the last run of the previous page (keyset pagination)
 
         Returns:
             List of run dictionaries with store names
 
         Raises:
             BadRequestError: If group ID format is invalid
-            NotFoundError: If group doesn't exist
+            NotFoundError: If group doesn't exist, or after is not a finished run of it
             ForbiddenError: If user is not a member of the group
         """
-        # Verify group ID format
+        # Verify group and cursor ID format
         group_uuid = validate_uuid(group_id, 'Group')
+        after_uuid = validate_uuid(after, 'Run') if after else None
 
         # Get the group
         group = self.group_repo.get_group_by_id(group_uuid)
@@ -346,47 +312,45 @@ class GroupService(BaseService):
                 'offset': offset,
             },
         )
-        runs = self.run_repo.get_completed_cancelled_runs_by_group(group_uuid, limit, offset)
-
-        # Convert to response format with store names
-        all_stores = self.store_repo.get_all_stores()
-        store_lookup = {store.id: store.name for store in all_stores}
-
-        run_responses = []
-        for run in runs:
-            # Get leader from participations
-            participations = self.run_repo.get_run_participations(run.id)
-            leader = next((p for p in participations if p.is_leader), None)
-            leader_name = leader.user.name if leader and leader.user else 'Unknown'
-
-            run_responses.append(
-                RunResponse(
-                    id=str(run.id),
-                    group_id=str(run.group_id),
-                    store_id=str(run.store_id),
-                    store_name=store_lookup.get(run.store_id, 'Unknown Store'),
-                    state=run.state,
-                    leader_name=leader_name,
-                    leader_is_removed=False,
-                    planned_on=run.planned_on.isoformat() if run.planned_on else None,
-                    planning_at=run.planning_at.isoformat() if run.planning_at else None,
-                    active_at=run.active_at.isoformat() if run.active_at else None,
-                    confirmed_at=run.confirmed_at.isoformat() if run.confirmed_at else None,
-                    shopping_at=run.shopping_at.isoformat() if run.shopping_at else None,
-                    adjusting_at=run.adjusting_at.isoformat() if run.adjusting_at else None,
-                    distributing_at=run.distributing_at.isoformat() if run.distributing_at else None,
-                    completed_at=run.completed_at.isoformat() if run.completed_at else None,
-                    cancelled_at=run.cancelled_at.isoformat() if run.cancelled_at else None,
-                )
+        # Ordered most recently finished first by the repository
+        listings = self.run_repo.get_completed_cancelled_run_listings_by_group(
+            group_uuid, limit, offset, after_uuid
+        )
+        if listings is None:
+            # A stale or foreign cursor would otherwise silently restart at page one
+            raise NotFoundError(
+                code=RUN_NOT_FOUND,
+                message='Pagination cursor run not found in group history',
+                group_id=str(group_uuid),
+                run_id=str(after_uuid),
             )
 
-        # Sort by completed_at or cancelled_at descending (latest first)
-        run_responses.sort(
-            key=lambda r: r.completed_at or r.cancelled_at or '', reverse=True
+        return [self._run_response(listing) for listing in listings]
+
+    @staticmethod
+    def _run_response(listing: dict) -> RunResponse:
+        """Build a RunResponse from a repository run listing."""
+        run = listing['run']
+        return RunResponse(
+            id=str(run.id),
+            group_id=str(run.group_id),
+            store_id=str(run.store_id),
+            store_name=listing['store_name'] or 'Unknown Store',
+            state=run.state,
+            leader_name=listing['leader_name'] or 'Unknown',
+            leader_is_removed=listing['leader_is_removed'],
+            participant_count=listing['participant_count'],
+            planned_on=run.planned_on.isoformat() if run.planned_on else None,
+            planning_at=run.planning_at.isoformat() if run.planning_at else None,
+            active_at=run.active_at.isoformat() if run.active_at else None,
+            confirmed_at=run.confirmed_at.isoformat() if run.confirmed_at else None,
+            shopping_at=run.shopping_at.isoformat() if run.shopping_at else None,
+            adjusting_at=run.adjusting_at.isoformat() if run.adjusting_at else None,
+            distributing_at=run.distributing_at.isoformat() if run.distributing_at else None,
+            completed_at=run.completed_at.isoformat() if run.completed_at else None,
+            cancelled_at=run.cancelled_at.isoformat() if run.cancelled_at else None,
         )
 
-        return run_responses
-
     def regenerate_invite_token(self, group_id: str, user: User) -> RegenerateTokenResponse:
         """Regenerate the invite token for a group (only creator can do this).
 
@@ -21,6 +21,9 @@ from app.core.error_codes import (
 )
 from app.core.exceptions import NotFoundError, ValidationError
 from app.core.models import Product
+from app.infrastructure.config import SEARCH_RESULT_LIMIT
+from app.infrastructure.reference_cache import reference_cache
+from app.infrastructure.suggest_index import suggest_index
 from app.repositories import (
     get_product_repository,
     get_run_repository,
@@ -42,48 +45,43 @@ class ProductService(BaseService):
         self.shopping_repo = get_shopping_repository(db)
         self.store_repo = get_store_repository(db)
 
-    def search_products(self, query: str) -> list[ProductSearchResult]:
-        """Search for products by name across all stores."""
-        products = self.product_repo.search_products(query)
-
-        result = []
-        for product in products:
-            # Get availabilities to show store information
-            availabilities = self.product_repo.get_product_availabilities(product.id)
-            stores_info = []
-            for avail in availabilities:
-                store = self.store_repo.get_store_by_id(avail.store_id)
-                if store:
-                    stores_info.append(
-                        StoreInfo(
-                            store_id=str(store.id),
-                            store_name=store.name,
-                            price=float(avail.price) if avail.price else None,
-                        )
-                    )
+    def search_products(
+        self, query: str, limit: int = SEARCH_RESULT_LIMIT
+    ) -> list[ProductSearchResult]:
+        """Search for products by name across all stores, most similar first.
 
-            result.append(
-                ProductSearchResult(
-                    id=str(product.id), name=product.name, brand=product.brand, stores=stores_info
-                )
+        Each result lists the stores the product was seen at with the latest price there.
+        """
+        products = self.product_repo.search_products(query, limit)
+        store_prices = self.product_repo.get_store_prices_by_products(p.id for p in products)
+
+        return [
+            ProductSearchResult(
+                id=str(product.id),
+                name=product.name,
+                brand=product.brand,
+                stores=[
+                    StoreInfo(
+                        store_id=str(entry['store_id']),
+                        store_name=entry['store_name'],
+                        price=float(entry['price']) if entry['price'] else None,
+                    )
+                    for entry in store_prices.get(product.id, [])
+                ],
             )
-
-        return result
+            for product in products
+        ]
 
     def get_similar_products(self, name: str, limit: int = 5) -> list[ProductSearchResult]:
         """Get products with similar names for duplicate detection.
 
-        Uses case-insensitive search to find products with names similar to the input.
+        Finds products whose names contain the input or are trigram-similar to it.
         Returns up to `limit` results, ordered by similarity.
         """
         if not name or not name.strip():
             return []
 
-        # Use the search_products method which does case-insensitive matching
-        results = self.search_products(name.strip())
-
-        # Limit results
-        return results[:limit]
+        return self.search_products(name.strip(), limit)
 
     def get_product_details(self, product_id: UUID) -> ProductDetailResponse | None:
         """Get detailed product information including price history from shopping list items and availabilities.
@@ -104,10 +102,8 @@ class ProductService(BaseService):
 
         # Collect price data by store
         stores_data = []
-        all_stores = {s.id: s for s in self.store_repo.get_all_stores()}
-
         for store_id, store_availabilities in stores_map.items():
-            store = all_stores.get(store_id)
+            store = reference_cache.get_store(self.db, store_id)
             if not store:
                 continue
 
@@ -204,7 +200,7 @@ class ProductService(BaseService):
 
         # Verify store exists if provided
         if store_id:
-            store = self.store_repo.get_store_by_id(store_id)
+            store = reference_cache.get_store(self.db, store_id)
             if not store:
                 raise NotFoundError(
                     code=STORE_NOT_FOUND, message='Store not found', store_id=str(store_id)
@@ -224,4 +220,6 @@ class ProductService(BaseService):
                 user_id=user_id,
             )
 
+        suggest_index.products.add(product.id, product.name)
+        reference_cache.invalidate_products(product.id)
         return product, availability
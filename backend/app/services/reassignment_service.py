@@ -24,7 +24,8 @@ from app.core.error_codes import (
     RUN_NOT_FOUND,
 )
 from app.core.exceptions import ConflictError, ForbiddenError, NotFoundError, ValidationError
-from app.core.models import LeaderReassignmentRequest, Run, User
+from app.core.models import LeaderReassignmentRequest, Notification, Run, User
+from app.infrastructure.reference_cache import reference_cache
 from app.infrastructure.request_context import get_logger
 from app.infrastructure.transaction import transaction
 from app.repositories import (
@@ -175,6 +176,13 @@ class ReassignmentService(BaseService):
         store = self.store_repo.get_store_by_id(store_id)
         return store.name if store else 'Unknown Store'
 
+    def _create_notification(self, user_id: UUID, type: str, data: dict) -> Notification:
+        """Create a notification as part of the surrounding transaction (no separate commit)."""
+        [notification] = self.notification_repo.create_notifications_bulk(
+            [{'user_id': user_id, 'type': type, 'data': data}]
+        )
+        return notification
+
     async def _notify_reassignment_participants(
         self, run_id: UUID, from_user: User, to_user_id: UUID, request_id: UUID, store_name: str
     ) -> None:
@@ -187,7 +195,7 @@ class ReassignmentService(BaseService):
             store_name=store_name,
         )
 
-        notification = self.notification_repo.create_notification(
+        notification = self._create_notification(
             to_user_id, 'leader_reassignment_request', notification_data.model_dump(mode='json')
         )
 
@@ -361,7 +369,7 @@ class ReassignmentService(BaseService):
             store_name=store_name,
         )
 
-        notification = self.notification_repo.create_notification(
+        notification = self._create_notification(
             request.from_user_id,
             'leader_reassignment_accepted',
             notification_data.model_dump(mode='json'),
@@ -512,7 +520,7 @@ class ReassignmentService(BaseService):
             store_name=store_name,
         )
 
-        notification = self.notification_repo.create_notification(
+        notification = self._create_notification(
             request.from_user_id,
             'leader_reassignment_declined',
             notification_data.model_dump(mode='json'),
@@ -673,7 +681,7 @@ class ReassignmentService(BaseService):
         # Get store name
         store_name = 'Unknown Store'
         if run:
-            store = self.store_repo.get_store_by_id(run.store_id)
+            store = reference_cache.get_store(self.db, run.store_id)
             store_name = store.name if store else 'Unknown Store'
 
         return ReassignmentDetailResponse(
@@ -13,6 +13,7 @@ from app.api.schemas.notification_data import (
 from app.api.websocket_manager import ConnectionManager
 from app.core.models import Run
 from app.core.run_state import RunState
+from app.infrastructure.reference_cache import reference_cache
 from app.infrastructure.request_context import get_logger
 from app.repositories import (
     get_notification_repository,
@@ -214,8 +215,7 @@ class RunNotificationService(BaseService):
             new_state: New state
         """
         # Get store name for notification
-        all_stores = self.store_repo.get_all_stores()
-        store = next((s for s in all_stores if s.id == run.store_id), None)
+        store = reference_cache.get_store(self.db, run.store_id)
         store_name = store.name if store else 'Unknown Store'
 
         # Get all participants of this run
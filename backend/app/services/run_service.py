@@ -28,6 +28,7 @@ from app.core.error_codes import (
     NOT_RUN_LEADER,
     NOT_RUN_LEADER_OR_HELPER,
     NOT_RUN_PARTICIPANT,
+    PRODUCT_NOT_FOUND,
     RESOURCE_NOT_FOUND,
     RUN_EXPORT_INVALID_STATE,
     RUN_NOT_FOUND,
@@ -35,12 +36,13 @@ from app.core.error_codes import (
     USER_NOT_FOUND,
 )
 from app.core.exceptions import BadRequestError, ForbiddenError, NotFoundError
-from app.core.models import Product, ProductBid, Run, User
+from app.core.models import Product, ProductAvailability, ProductBid, Run, User
 from app.core.run_state import RunState, state_machine
 from app.core.success_codes import HELPER_ADDED, HELPER_REMOVED, RUN_COMMENT_UPDATED
 from app.events.domain_events import RunCreatedEvent
 from app.events.event_bus import event_bus
 from app.infrastructure.config import MAX_ACTIVE_RUNS_PER_GROUP
+from app.infrastructure.reference_cache import reference_cache
 from app.infrastructure.request_context import get_logger
 from app.repositories import (
     get_bid_repository,
@@ -128,8 +130,7 @@ class RunService(BaseService):
             )
 
         # Verify store exists
-        all_stores = self.store_repo.get_all_stores()
-        store = next((s for s in all_stores if s.id == store_uuid), None)
+        store = reference_cache.get_store(self.db, store_uuid)
         if not store:
             raise NotFoundError(code=STORE_NOT_FOUND, message='Store not found', store_id=store_id)
 
@@ -203,8 +204,7 @@ class RunService(BaseService):
 
         # Get related entities
         group = self.group_repo.get_group_by_id(run.group_id)
-        all_stores = self.store_repo.get_all_stores()
-        store = next((s for s in all_stores if s.id == run.store_id), None)
+        store = reference_cache.get_store(self.db, run.store_id)
 
         if not group or not store:
             raise NotFoundError(
@@ -416,25 +416,40 @@ class RunService(BaseService):
             details={'run_id': run_id},
         )
 
-    def get_available_products(self, run_id: str, user: User) -> list[AvailableProductResponse]:
-        """Get products available for bidding (all products without bids yet).
+    def get_available_products(
+        self,
+        run_id: str,
+        user: User,
+        search: str | None = None,
+        store_only: bool = False,
+        limit: int = 200,
+        offset: int = 0,
+        after: str | None = None,
+    ) -> list[AvailableProductResponse]:
+        """Get products available for bidding (products without bids in the run yet).
 
-        Products with availability at the run's store are sorted first.
+        Products with availability at the run's store are sorted first, then by name.
 
         Args:
             run_id: Run ID as string
             user: Current user
+            search: Optional case-insensitive name filter
+            store_only: Only return products available at the run's store
+            limit: Maximum number of products to return
+            offset: Number of products to skip
+            after: Product ID of the last product of the previous page (keyset pagination)
 
         Returns:
             List of AvailableProductResponse, sorted with store products first
 
         Raises:
-            BadRequestError: If run ID format is invalid
-            NotFoundError: If run not found
+            BadRequestError: If run or product ID format is invalid
+            NotFoundError: If run not found, or after is not a known product
             ForbiddenError: If user not authorized
         """
         # Validate run ID
         run_uuid = validate_uuid(run_id, 'Run')
+        after_uuid = validate_uuid(after, 'Product') if after else None
 
         # Verify run exists and user has access
         run = self.run_repo.get_run_by_id(run_uuid)
@@ -447,40 +462,38 @@ class RunService(BaseService):
                 code=NOT_GROUP_MEMBER, message='Not authorized to view this run', run_id=run_id
             )
 
-        # Get all products
-        all_products = self.product_repo.get_all_products()
-        run_bids = self.bid_repo.get_bids_by_run(run.id)
-
-        # Get products that have bids
-        products_with_bids = {bid.product_id for bid in run_bids}
-
-        # Return products that don't have bids, sorted by availability at run's store
-        available_products = []
-        for product in all_products:
-            if product.id not in products_with_bids:
-                # Get product availability/price for this store
-                availability = self.product_repo.get_availability_by_product_and_store(
-                    product.id, run.store_id
-                )
-                current_price = (
-                    str(availability.price) if availability and availability.price else None
-                )
-                has_store_availability = availability is not None
-
-                available_products.append(
-                    AvailableProductResponse(
-                        id=str(product.id),
-                        name=product.name,
-                        brand=product.brand,
-                        current_price=current_price,
-                        has_store_availability=has_store_availability,
-                    )
-                )
-
-        # Sort: products with store availability first, then alphabetically by name
-        available_products.sort(key=lambda p: (not p.has_store_availability, p.name.lower()))
+        # Products without bids in this run with their latest price at the run's store,
+        # filtered, ordered and paginated by the repository
+        rows = self.product_repo.get_available_products_for_run(
+            run.id,
+            run.store_id,
+            search=search,
+            store_only=store_only,
+            limit=limit,
+            offset=offset,
+            after_product_id=after_uuid,
+        )
+        if rows is None:
+            # A stale cursor would otherwise silently restart at page one
+            raise NotFoundError(
+                code=PRODUCT_NOT_FOUND,
+                message='Pagination cursor product not found',
+                run_id=run_id,
+                product_id=str(after_uuid),
+            )
 
-        return available_products
+        return [
+            AvailableProductResponse(
+                id=str(product.id),
+                name=product.name,
+                brand=product.brand,
+                current_price=str(availability.price)
+                if availability and availability.price
+                else None,
+                has_store_availability=availability is not None,
+            )
+            for product, availability in rows
+        ]
 
     def _validate_run_id(self, run_id: str) -> UUID:
         """Validate and convert run ID string to UUID."""
@@ -558,10 +571,23 @@ class RunService(BaseService):
         )
 
     def _get_products_data(self, run: Run, current_user_id: UUID) -> list[ProductResponse]:
-        """Get products data with bids for a run."""
+        """Get products data with bids for a run.
+
+        Runs a fixed number of queries however many products and bids the run has:
+        bids (with participations and users), the bid products, their latest prices at
+        the run's store and, in later states, the shopping list.
+        """
         # Get bids with participations and users eagerly loaded to avoid N+1 queries
         run_bids = self.bid_repo.get_bids_by_run_with_participations(run.id)
 
+        # Group bids by product in a single pass (insertion order = first bid per product)
+        bids_by_product: dict[UUID, list[ProductBid]] = {}
+        for bid in run_bids:
+            bids_by_product.setdefault(bid.product_id, []).append(bid)
+
+        if not bids_by_product:
+            return []
+
         # Get shopping list items if in adjusting, distributing, or completed state
         shopping_list_map = (
             self._get_shopping_list_map(run)
@@ -569,28 +595,26 @@ class RunService(BaseService):
             else {}
         )
 
-        # Get all unique product IDs that have bids
-        product_ids_with_bids = {bid.product_id for bid in run_bids}
-
         # Fetch all products that have bids (whether or not they have store availability)
-        products_map = {}
-        for product_id in product_ids_with_bids:
-            product = self.product_repo.get_product_by_id(product_id)
-            if product:
-                products_map[product_id] = product
-
-        # Calculate product statistics
-        products_data = []
-        for product_id, product in products_map.items():
-            product_bids = [bid for bid in run_bids if bid.product_id == product_id]
-
-            if len(product_bids) > 0:  # Only include products with bids
-                product_response = self._build_product_response(
-                    product, product_bids, current_user_id, run, shopping_list_map
-                )
-                products_data.append(product_response)
+        products_map = {
+            product.id: product
+            for product in self.product_repo.get_products_by_ids(bids_by_product.keys())
+        }
+        availabilities = self.product_repo.get_latest_availabilities_by_store(
+            run.store_id, products_map.keys()
+        )
 
-        return products_data
+        return [
+            self._build_product_response(
+                products_map[product_id],
+                product_bids,
+                current_user_id,
+                availabilities.get(product_id),
+                shopping_list_map,
+            )
+            for product_id, product_bids in bids_by_product.items()
+            if product_id in products_map
+        ]
 
     def _get_shopping_list_map(self, run: Run) -> dict[UUID, Any]:
         """Get shopping list items mapped by product ID."""
@@ -602,10 +626,10 @@ class RunService(BaseService):
         product: Product,
         product_bids: list[ProductBid],
         current_user_id: UUID,
-        run: Run,
+        availability: ProductAvailability | None,
         shopping_list_map: dict[UUID, Any],
     ) -> ProductResponse:
-        """Build a ProductResponse from product and its bids."""
+        """Build a ProductResponse from product, its bids and its latest store availability."""
         # Calculate statistics
         total_quantity, interested_count = self._calculate_product_statistics(product_bids)
 
@@ -617,8 +641,6 @@ class RunService(BaseService):
         if product.id in shopping_list_map:
             purchased_qty = shopping_list_map[product.id].purchased_quantity
 
-        # Get product availability/price for this store
-        availability = self.product_repo.get_availability_by_product_and_store(product.id, run.store_id)
         current_price = str(availability.price) if availability and availability.price else None
 
         return ProductResponse(
@@ -1,5 +1,6 @@
 """Run state service for managing run state transitions."""
 
+from collections import defaultdict
 from decimal import Decimal
 from typing import TYPE_CHECKING
 from uuid import UUID
@@ -7,6 +8,7 @@ from uuid import UUID
 from sqlalchemy.orm import Session
 
 from app.api.schemas import CancelRunResponse, ReadyToggleResponse, StateChangeResponse
+from app.core.allocation import allocate_run
 from app.core.error_codes import (
     BID_QUANTITY_EXCEEDS_PURCHASED,
     CANNOT_CANCEL_COMPLETED_RUN,
@@ -20,7 +22,7 @@ from app.core.error_codes import (
     RUN_NOT_IN_CONFIRMED_STATE,
 )
 from app.core.exceptions import BadRequestError, ForbiddenError, NotFoundError
-from app.core.models import Run, User
+from app.core.models import ProductBid, Run, ShoppingListItem, User
 from app.core.run_state import RunState, state_machine
 from app.core.success_codes import (
     ADJUSTING_FINISHED,
@@ -32,6 +34,7 @@ from app.core.success_codes import (
 )
 from app.events.domain_events import ReadyToggledEvent, RunCancelledEvent, RunStateChangedEvent
 from app.events.event_bus import event_bus
+from app.infrastructure.reference_cache import reference_cache
 from app.infrastructure.request_context import get_logger
 from app.infrastructure.transaction import transaction
 from app.repositories import (
@@ -271,9 +274,12 @@ class RunStateService(BaseService):
 
         # Wrap verification, distribution, and state change in transaction
         with transaction(self.db, 'finish adjusting and distribute items'):
+            # Shopping list and bids are loaded once for verification and distribution
+            shopping_items = self.shopping_repo.get_shopping_list_items(run_uuid)
+            bids_by_product = self._bids_by_product(run_uuid)
             if not force:
-                self._verify_quantities_match(run_uuid)
-            self._distribute_items_to_bidders(run_uuid)
+                self._verify_quantities_match(shopping_items, bids_by_product)
+            self._distribute_items_to_bidders(run_uuid, shopping_items, bids_by_product)
             self._transition_run_state(run, RunState.DISTRIBUTING)
 
         return StateChangeResponse(
@@ -338,8 +344,7 @@ class RunStateService(BaseService):
         self._transition_run_state(run, RunState.CANCELLED)
 
         # Get store name for event
-        all_stores = self.store_repo.get_all_stores()
-        store = next((s for s in all_stores if s.id == run.store_id), None)
+        store = reference_cache.get_store(self.db, run.store_id)
         store_name = store.name if store else 'Unknown Store'
 
         # Emit run cancelled event
@@ -384,8 +389,7 @@ class RunStateService(BaseService):
 
         if notify:
             # Get store name for event
-            all_stores = self.store_repo.get_all_stores()
-            store = next((s for s in all_stores if s.id == run.store_id), None)
+            store = reference_cache.get_store(self.db, run.store_id)
             store_name = store.name if store else 'Unknown Store'
 
             # Emit domain event for state change
@@ -456,26 +460,28 @@ class RunStateService(BaseService):
         all_participations = self.run_repo.get_run_participations(run_id)
         return len(all_participations) > 0 and all(p.is_ready for p in all_participations)
 
+    def _bids_by_product(self, run_id: UUID) -> dict[UUID, list[ProductBid]]:
+        """Load the run's bids once and group them by product."""
+        bids_by_product: dict[UUID, list[ProductBid]] = defaultdict(list)
+        for bid in self.bid_repo.get_bids_by_run(run_id):
+            bids_by_product[bid.product_id].append(bid)
+        return bids_by_product
+
     def _generate_shopping_list(self, run_uuid: UUID) -> None:
         """Generate shopping list items from bids.
 
         Args:
             run_uuid: Run UUID
         """
-        # Get all bids for this run and aggregate by product
-        bids = self.bid_repo.get_bids_by_run(run_uuid)
+        # Aggregate requested quantities by product
         product_quantities = {}
+        for product_id, bids in self._bids_by_product(run_uuid).items():
+            quantity = sum(bid.quantity for bid in bids if not bid.interested_only)
+            if quantity > 0:
+                product_quantities[product_id] = quantity
 
-        for bid in bids:
-            if not bid.interested_only and bid.quantity > 0:
-                product_id = bid.product_id
-                if product_id not in product_quantities:
-                    product_quantities[product_id] = 0
-                product_quantities[product_id] += bid.quantity
-
-        # Create shopping list items
-        for product_id, quantity in product_quantities.items():
-            self.shopping_repo.create_shopping_list_item(run_uuid, product_id, quantity)
+        # Create all shopping list items in one round trip
+        self.shopping_repo.bulk_create_shopping_list_items(run_uuid, product_quantities)
 
     def _validate_finish_adjusting_request(self, run_id: str, user: User) -> tuple[UUID, Run]:
         """Validate finish adjusting request and return run UUID and run object."""
@@ -512,27 +518,26 @@ class RunStateService(BaseService):
 
         return run_uuid, run
 
-    def _verify_quantities_match(self, run_id: UUID) -> None:
+    def _verify_quantities_match(
+        self,
+        shopping_items: list[ShoppingListItem],
+        bids_by_product: dict[UUID, list[ProductBid]],
+    ) -> None:
         """Verify that bid quantities match purchased quantities."""
-        shopping_items = self.shopping_repo.get_shopping_list_items(run_id)
-        all_bids = self.bid_repo.get_bids_by_run(run_id)
-
         for shopping_item in shopping_items:
             if not shopping_item.is_purchased:
                 continue
 
-            product_bids = [
-                bid
-                for bid in all_bids
-                if bid.product_id == shopping_item.product_id and not bid.interested_only
-            ]
-            total_requested = sum(bid.quantity for bid in product_bids)
-
             # Skip items that were not purchased (purchased_quantity is None or 0)
             # Bids for unpurchased items are kept for record-keeping but not distributed
             if shopping_item.purchased_quantity is None or shopping_item.purchased_quantity == 0:
                 continue
 
+            total_requested = sum(
+                bid.quantity
+                for bid in bids_by_product.get(shopping_item.product_id, [])
+                if not bid.interested_only
+            )
             if total_requested != shopping_item.purchased_quantity:
                 shortage = total_requested - shopping_item.purchased_quantity
                 raise BadRequestError(
@@ -542,137 +547,127 @@ class RunStateService(BaseService):
                     product_id=str(shopping_item.product_id),
                 )
 
-    def _distribute_items_to_bidders(self, run_id: UUID) -> None:
+    def _distribute_items_to_bidders(
+        self,
+        run_id: UUID,
+        shopping_items: list[ShoppingListItem],
+        bids_by_product: dict[UUID, list[ProductBid]],
+    ) -> None:
         """Distribute purchased items to bidders.
 
         When quantities match exactly, each bidder gets their full bid quantity.
-        When quantities don't match (force mode), distribute proportionally.
-        """
-        shopping_items = self.shopping_repo.get_shopping_list_items(run_id)
-        all_bids = self.bid_repo.get_bids_by_run(run_id)
+        When quantities don't match (force mode), distribute proportionally with an
+        exact largest-remainder split (see app.core.allocation). Any surplus goes to the
+        leader.
 
+        The purchased products are collected in one pass over the run's bids grouped by
+        product and allocated with a single allocate_run call; all allocations are then
+        written with one bulk update (plus one bulk insert for new leader bids).
+        """
         logger.info(
-            f'Distributing items: found {len(shopping_items)} shopping items and {len(all_bids)} bids',
+            f'Distributing items: found {len(shopping_items)} shopping items and {len(bids_by_product)} bid products',
             extra={'run_id': str(run_id)},
         )
 
-        for shopping_item in shopping_items:
-            logger.info(
-                f'Processing shopping item: product={shopping_item.product_id}, is_purchased={shopping_item.is_purchased}, purchased_qty={shopping_item.purchased_quantity}',
-                extra={'run_id': str(run_id)},
-            )
+        bid_updates: dict[UUID, dict] = {}
+        new_bids: list[dict] = []
+        requested_quantities: dict[UUID, Decimal] = {}
+        purchases = []
+        surpluses: list[tuple[ShoppingListItem, list[ProductBid], Decimal]] = []
 
-            if not shopping_item.is_purchased:
-                logger.info(
-                    f'Skipping unpurchased item: product={shopping_item.product_id}',
-                    extra={'run_id': str(run_id)},
-                )
-                continue
-
-            # Skip items with 0 purchased quantity (not actually bought)
-            if not shopping_item.purchased_quantity or shopping_item.purchased_quantity == 0:
-                logger.info(
-                    f'Skipping item with 0 quantity: product={shopping_item.product_id}',
+        for shopping_item in shopping_items:
+            # Skip unpurchased items and items with 0 purchased quantity (not actually bought)
+            if not shopping_item.is_purchased or not shopping_item.purchased_quantity:
+                logger.debug(
+                    f'Skipping item not purchased: product={shopping_item.product_id}',
                     extra={'run_id': str(run_id)},
                 )
                 continue
 
-            product_bids = [
-                bid
-                for bid in all_bids
-                if bid.product_id == shopping_item.product_id and not bid.interested_only
-            ]
+            purchased = shopping_item.purchased_quantity
+            all_product_bids = bids_by_product.get(shopping_item.product_id, [])
+            product_bids = [bid for bid in all_product_bids if not bid.interested_only]
             total_requested = sum(bid.quantity for bid in product_bids)
-            logger.info(
-                f'Product {shopping_item.product_id}: {len(product_bids)} bids, total_requested={total_requested}, purchased={shopping_item.purchased_quantity}',
+            requested_quantities[shopping_item.id] = total_requested
+            logger.debug(
+                f'Product {shopping_item.product_id}: {len(product_bids)} bids, total_requested={total_requested}, purchased={purchased}',
                 extra={'run_id': str(run_id)},
             )
-            self.shopping_repo.update_shopping_list_item_requested_quantity(
-                shopping_item.id, total_requested
-            )
 
-            # Check if we need proportional distribution
-            if total_requested > shopping_item.purchased_quantity:
-                # Proportional distribution: scale down each bid
-                ratio = shopping_item.purchased_quantity / total_requested
-
-                # Distribute with rounding to 2 decimal places
-                # Track total to ensure we don't exceed purchased quantity
-                total_distributed = Decimal('0')
-                for i, bid in enumerate(product_bids):
-                    if i == len(product_bids) - 1:
-                        # Last bid gets the remainder to avoid rounding errors
-                        distributed_qty = shopping_item.purchased_quantity - total_distributed
-                    else:
-                        # Convert to Decimal to maintain precision
-                        distributed_qty = Decimal(str(round(float(bid.quantity * ratio), 2)))
-                        total_distributed += distributed_qty
-
-                    self.bid_repo.update_bid_distributed_quantities(
-                        bid.id, distributed_qty, shopping_item.purchased_price_per_unit
-                    )
+            purchases.append(
+                (
+                    purchased,
+                    shopping_item.purchased_price_per_unit,
+                    [(bid.id, bid.quantity) for bid in product_bids],
+                )
+            )
+            if total_requested < purchased:
+                surpluses.append((shopping_item, all_product_bids, purchased - total_requested))
+
+        # Full bids when enough was bought, otherwise an exact proportional split
+        for allocation in allocate_run(purchases):
+            bid_updates[allocation.bid_id] = allocation.as_update()
+
+        # Surplus goes to the leader (participations are looked up once per run)
+        leader_participation = None
+        if surpluses:
+            participations = self.run_repo.get_run_participations(run_id)
+            leader_participation = next((p for p in participations if p.is_leader), None)
+
+        for shopping_item, all_product_bids, surplus in surpluses:
+            if not leader_participation:
+                break
+            price = shopping_item.purchased_price_per_unit
+            leader_bid = next(
+                (
+                    bid
+                    for bid in all_product_bids
+                    if bid.participation_id == leader_participation.id
+                ),
+                None,
+            )
+            if leader_bid and not leader_bid.interested_only:
+                # Leader has a bid, add surplus to their bid quantity and allocation
+                new_quantity = leader_bid.quantity + surplus
+                bid_updates[leader_bid.id] = {
+                    **self._bid_allocation(leader_bid.id, new_quantity, price),
+                    'quantity': new_quantity,
+                }
+            elif leader_bid:
+                # Leader only marked interest, turn it into a bid for the surplus
+                bid_updates[leader_bid.id] = {
+                    **self._bid_allocation(leader_bid.id, surplus, price),
+                    'quantity': surplus,
+                    'interested_only': False,
+                    'comment': None,
+                }
             else:
-                # Exact match or over-purchased: give everyone their full bid
-                for bid in product_bids:
-                    self.bid_repo.update_bid_distributed_quantities(
-                        bid.id, bid.quantity, shopping_item.purchased_price_per_unit
-                    )
-
-                # If there's a surplus, assign it to the leader
-                if total_requested < shopping_item.purchased_quantity:
-                    surplus = shopping_item.purchased_quantity - total_requested
-                    # Find the leader's bid for this product
-                    run = self.run_repo.get_run_by_id(run_id)
-                    participations = self.run_repo.get_run_participations(run_id)
-                    leader_participation = next(
-                        (p for p in participations if p.is_leader), None
-                    )
-                    if leader_participation:
-                        leader_bid = next(
-                            (bid for bid in product_bids if bid.participation_id == leader_participation.id),
-                            None
-                        )
-                        if leader_bid:
-                            # Leader has a bid, add surplus to their bid quantity and allocation
-                            new_quantity = leader_bid.quantity + surplus
-                            # Update the bid quantity to reflect the surplus
-                            updated_bid = self.bid_repo.create_or_update_bid(
-                                leader_participation.id,
-                                shopping_item.product_id,
-                                new_quantity,
-                                leader_bid.interested_only,
-                                leader_bid.comment
-                            )
-                            # Update distributed quantities
-                            self.bid_repo.update_bid_distributed_quantities(
-                                updated_bid.id, new_quantity, shopping_item.purchased_price_per_unit
-                            )
-                            # Update the shopping list requested quantity to include the surplus
-                            self.shopping_repo.update_shopping_list_item_requested_quantity(
-                                shopping_item.id, shopping_item.purchased_quantity
-                            )
-                            logger.info(
-                                f'Assigned surplus to leader (existing bid): product={shopping_item.product_id}, surplus={surplus}, new_quantity={new_quantity}',
-                                extra={'run_id': str(run_id), 'leader_id': str(leader_participation.user_id)},
-                            )
-                        else:
-                            # Leader doesn't have a bid, create one with the surplus
-                            new_bid = self.bid_repo.create_or_update_bid(
-                                leader_participation.id,
-                                shopping_item.product_id,
-                                surplus,
-                                False,  # not interested_only
-                                None    # no comment
-                            )
-                            # Set distributed quantities for the new bid
-                            self.bid_repo.update_bid_distributed_quantities(
-                                new_bid.id, surplus, shopping_item.purchased_price_per_unit
-                            )
-                            # Update the shopping list requested quantity to include the surplus
-                            self.shopping_repo.update_shopping_list_item_requested_quantity(
-                                shopping_item.id, shopping_item.purchased_quantity
-                            )
-                            logger.info(
-                                f'Assigned surplus to leader (new bid): product={shopping_item.product_id}, surplus={surplus}',
-                                extra={'run_id': str(run_id), 'leader_id': str(leader_participation.user_id)},
-                            )
+                # Leader doesn't have a bid, create one with the surplus
+                new_bids.append(
+                    {
+                        'participation_id': leader_participation.id,
+                        'product_id': shopping_item.product_id,
+                        'quantity': surplus,
+                        'distributed_quantity': surplus,
+                        'distributed_price_per_unit': price,
+                    }
+                )
+            # The shopping list requested quantity includes the surplus
+            requested_quantities[shopping_item.id] = shopping_item.purchased_quantity
+            logger.info(
+                f'Assigned surplus to leader: product={shopping_item.product_id}, surplus={surplus}',
+                extra={'run_id': str(run_id), 'leader_id': str(leader_participation.user_id)},
+            )
+
+        self.shopping_repo.bulk_update_requested_quantities(requested_quantities)
+        self.bid_repo.bulk_update_bids(list(bid_updates.values()))
+        self.bid_repo.bulk_create_bids(new_bids)
+
+    @staticmethod
+    def _bid_allocation(bid_id: UUID, quantity: Decimal, price_per_unit: Decimal | None) -> dict:
+        """Bulk update values distributing quantity to a bid at the purchased price."""
+        return {
+            'id': bid_id,
+            'distributed_quantity': quantity,
+            'distributed_price_per_unit': price_per_unit,
+        }
@@ -0,0 +1,73 @@
+"""Search service for the consolidated search across products, stores and groups."""
+
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.api.schemas import (
+    GroupSearchResult,
+    ProductSearchResult,
+    SearchResponse,
+    StoreSearchResult,
+)
+from app.core.models import User
+from app.repositories import get_group_repository, get_store_repository
+
+from .base_service import BaseService
+from .product_service import ProductService
+
+# Results returned per category by the consolidated search
+RESULTS_PER_CATEGORY = 3
+
+
+class SearchService(BaseService):
+    """Service for searching products, stores and the user's groups at once."""
+
+    def __init__(self, db: Session):
+        """Initialize service with necessary repositories."""
+        super().__init__(db)
+        self.product_service = ProductService(db)
+        self.store_repo = get_store_repository(db)
+        self.group_repo = get_group_repository(db)
+
+    def search_products(
+        self, query: str, limit: int = RESULTS_PER_CATEGORY
+    ) -> list[ProductSearchResult]:
+        """Search products by name, with the stores each was seen at."""
+        return self.product_service.search_products(query, limit)
+
+    def search_stores(
+        self, query: str, limit: int = RESULTS_PER_CATEGORY
+    ) -> list[StoreSearchResult]:
+        """Search stores by name."""
+        return [
+            StoreSearchResult(id=str(store.id), name=store.name, address=store.address)
+            for store in self.store_repo.search_stores(query, limit)
+        ]
+
+    def search_groups(
+        self, query: str, user_id: UUID, limit: int = RESULTS_PER_CATEGORY
+    ) -> list[GroupSearchResult]:
+        """Search the groups the user belongs to by name."""
+        return [
+            GroupSearchResult(
+                id=str(match['group'].id),
+                name=match['group'].name,
+                member_count=match['member_count'],
+            )
+            for match in self.group_repo.search_user_groups(user_id, query, limit)
+        ]
+
+    def search_all(
+        self, query: str, user: User, limit: int = RESULTS_PER_CATEGORY
+    ) -> SearchResponse:
+        """Search all three categories, one after the other on this service's session.
+
+        Each category is a small LIMIT query, so running them in turn on the request's
+        connection costs less than checking out a pooled connection per category.
+        """
+        return SearchResponse(
+            products=self.search_products(query, limit),
+            stores=self.search_stores(query, limit),
+            groups=self.search_groups(query, user.id, limit),
+        )
@@ -1,6 +1,6 @@
 """Shopping service for handling shopping list operations."""
 
-from datetime import UTC, datetime, timedelta
+from datetime import UTC, datetime
 from typing import Any
 from uuid import UUID
 
@@ -37,6 +37,7 @@ from app.core.success_codes import (
     SHOPPING_COMPLETED_DISTRIBUTING,
     SHOPPING_COMPLETED_NO_PURCHASES,
 )
+from app.infrastructure.reference_cache import reference_cache
 from app.infrastructure.request_context import get_logger
 from app.infrastructure.transaction import transaction
 from app.repositories import (
@@ -173,59 +174,27 @@ class ShoppingService(BaseService):
         # Get shopping list items
         items = self.shopping_repo.get_shopping_list_items(run_uuid)
 
+        # Products and the most recent day's prices at the run's store, for all items at once
+        product_ids = {item.product_id for item in items}
+        products_map = {
+            product.id: product for product in self.product_repo.get_products_by_ids(product_ids)
+        }
+        recent_prices_map = self.product_repo.get_latest_day_prices_by_store(
+            run.store_id, product_ids
+        )
+
         # Convert to response format
         response_items = []
         for item in items:
-            # Get product directly by ID
-            product = self.product_repo.get_product_by_id(item.product_id)
-
-            # Get all product availabilities for this product at this store
-            all_availabilities = self.product_repo.get_product_availabilities(
-                product_id=item.product_id, store_id=run.store_id
-            )
-
-            # Find the most recent price observation
-            most_recent = None
-            for avail in all_availabilities:
-                if (
-                    avail.price
-                    and avail.created_at
-                    and (most_recent is None or avail.created_at > most_recent.created_at)
-                ):
-                    most_recent = avail
-
-            # Get all prices from the same day as the most recent observation
-            recent_day_prices = []
-            if most_recent:
-                # Get the day boundaries for the most recent price
-                recent_date = most_recent.created_at.replace(
-                    hour=0, minute=0, second=0, microsecond=0
-                )
-                recent_date_end = recent_date + timedelta(days=1)
-
-                # Filter to only prices from that day
-                for avail in all_availabilities:
-                    if (
-                        avail.price
-                        and avail.created_at
-                        and recent_date <= avail.created_at < recent_date_end
-                    ):
-                        recent_day_prices.append(
-                            {
-                                'price': float(avail.price),
-                                'notes': avail.notes or '',
-                                'created_at': avail.created_at.isoformat()
-                                if avail.created_at
-                                else None,
-                            }
-                        )
-
-                # Sort by created_at descending (newest first)
-                recent_day_prices.sort(
-                    key=lambda x: x['created_at'] if x['created_at'] else '', reverse=True
+            product = products_map.get(item.product_id)
+            recent_prices_models = [
+                PriceObservation(
+                    price=float(avail.price),
+                    notes=avail.notes or '',
+                    created_at=avail.created_at.isoformat(),
                 )
-
-            recent_prices_models = [PriceObservation(**p) for p in recent_day_prices]
+                for avail in recent_prices_map.get(item.product_id, [])
+            ]
 
             response_items.append(
                 ShoppingListItemResponse(
@@ -1011,8 +980,7 @@ class ShoppingService(BaseService):
             new_state: New state
         """
         # Get store name for notification
-        all_stores = self.store_repo.get_all_stores()
-        store = next((s for s in all_stores if s.id == run.store_id), None)
+        store = reference_cache.get_store(self.db, run.store_id)
         store_name = store.name if store else 'Unknown Store'
 
         # Get all participants of this run
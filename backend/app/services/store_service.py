@@ -8,6 +8,8 @@ from app.api.schemas import StorePageResponse, StoreProductResponse, StoreRespon
 from app.core.error_codes import STORE_NAME_EMPTY, STORE_NOT_FOUND
 from app.core.exceptions import NotFoundError, ValidationError
 from app.core.models import Store
+from app.infrastructure.reference_cache import reference_cache
+from app.infrastructure.suggest_index import suggest_index
 from app.repositories import (
     get_group_repository,
     get_product_repository,
@@ -36,23 +38,22 @@ class StoreService(BaseService):
     def get_similar_stores(self, name: str, limit: int = 5) -> list[Store]:
         """Get stores with similar names for duplicate detection.
 
-        Uses case-insensitive search to find stores with names similar to the input.
+        Finds stores whose names contain the input or are trigram-similar to it.
         Returns up to `limit` results, ordered by similarity.
         """
         if not name or not name.strip():
             return []
 
-        # Use the search_stores method which does case-insensitive matching
-        results = self.store_repo.search_stores(name.strip())
-
-        # Limit results
-        return results[:limit]
+        return self.store_repo.search_stores(name.strip(), limit)
 
     def create_store(self, name: str) -> Store:
         """Create a new store."""
         if not name or not name.strip():
             raise ValidationError(code=STORE_NAME_EMPTY, message='Store name cannot be empty')
-        return self.store_repo.create_store(name.strip())
+        store = self.store_repo.create_store(name.strip())
+        suggest_index.stores.add(store.id, store.name)
+        reference_cache.invalidate_stores(store.id)
+        return store
 
     def get_store_by_id(self, store_id: UUID) -> Store:
         """Get store by ID."""
@@ -71,12 +72,15 @@ class StoreService(BaseService):
         """
         store = self.get_store_by_id(store_id)
         products = self.store_repo.get_products_by_store_from_availabilities(store_id)
-        active_runs = self.store_repo.get_active_runs_by_store_for_user(store_id, user_id)
+        active_runs = self.run_repo.get_active_run_listings_by_store_for_user(store_id, user_id)
 
         # Format products with availability prices
+        latest_availabilities = self.product_repo.get_latest_availabilities_by_store(
+            store_id, [p.id for p in products]
+        )
         products_response = []
         for p in products:
-            availability = self.product_repo.get_availability_by_product_and_store(p.id, store_id)
+            availability = latest_availabilities.get(p.id)
             current_price = str(availability.price) if availability and availability.price else None
 
             products_response.append(
@@ -91,23 +95,16 @@ class StoreService(BaseService):
 
         # Format active runs with complete details
         runs_response = []
-        for r in active_runs:
-            group = self.group_repo.get_group_by_id(r.group_id)
-            store_obj = self.store_repo.get_store_by_id(r.store_id)
-
-            # Get leader from participations
-            participations = self.run_repo.get_run_participations(r.id)
-            leader = next((p for p in participations if p.is_leader), None)
-            leader_name = leader.user.name if leader and leader.user else 'Unknown'
-
+        for listing in active_runs:
+            r = listing['run']
             runs_response.append(
                 StoreRunResponse(
                     id=str(r.id),
                     state=r.state,
                     group_id=str(r.group_id),
-                    group_name=group.name if group else 'Unknown',
-                    store_name=store_obj.name if store_obj else 'Unknown',
-                    leader_name=leader_name,
+                    group_name=listing['group_name'] or 'Unknown',
+                    store_name=listing['store_name'] or 'Unknown',
+                    leader_name=listing['leader_name'] or 'Unknown',
                     planned_on=r.planned_on.isoformat() if r.planned_on else None,
                 )
             )
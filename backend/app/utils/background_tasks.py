@@ -1,6 +1,7 @@
 """Utilities for managing background tasks with proper error handling."""
 
 import asyncio
+import concurrent.futures
 from collections.abc import Coroutine
 from typing import Any
 
@@ -8,23 +9,49 @@ from app.infrastructure.request_context import get_logger
 
 logger = get_logger(__name__)
 
+# Application event loop, used when a task is started from a worker thread
+_main_loop: asyncio.AbstractEventLoop | None = None
+
+
+def set_main_loop(loop: asyncio.AbstractEventLoop | None) -> None:
+    """Register the application's event loop for tasks started from worker threads.
+
+    Args:
+        loop: The running application event loop (None to unregister)
+    """
+    global _main_loop
+    _main_loop = loop
+
 
 def create_background_task(
     coro: Coroutine[Any, Any, Any], task_name: str = 'background_task'
-) -> asyncio.Task:
+) -> asyncio.Task | concurrent.futures.Future:
     """Create a background task with proper error handling and logging.
 
     This wrapper ensures that exceptions in background tasks are logged
-    and don't fail silently.
+    and don't fail silently. When called from a worker thread (a service call
+    run off the event loop), the task is scheduled on the main loop instead,
+    keeping the caller's context (request ID included).
 
     Args:
         coro: The coroutine to run as a background task
         task_name: Name for the task (used in logging)
 
     Returns:
-        The created asyncio Task
+        The created asyncio Task, or a concurrent Future when called off the loop
     """
-    task = asyncio.create_task(_wrap_task_with_error_handling(coro, task_name))
+    wrapped = _wrap_task_with_error_handling(coro, task_name)
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        if _main_loop is None or _main_loop.is_closed():
+            wrapped.close()
+            raise RuntimeError(
+                f'Cannot start background task {task_name!r}: no running event loop'
+            ) from None
+        return asyncio.run_coroutine_threadsafe(wrapped, _main_loop)
+
+    task = asyncio.create_task(wrapped)
     return task
 
 
@@ -11,6 +11,10 @@ from app.main import app
 from app.infrastructure.database import get_db
 from app.core.models import Base
 from app.infrastructure.auth import sessions  # Import sessions dict to clear between tests
+from app.events.event_bus import event_bus
+from app.infrastructure.reference_cache import reference_cache
+from app.repositories import MemoryStorage, get_memory_storage, set_memory_storage
+from app.utils.background_tasks import set_main_loop
 
 # Use in-memory SQLite for testing
 SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
@@ -36,6 +40,44 @@ def override_get_db():
 app.dependency_overrides[get_db] = override_get_db
 
 
+@pytest.fixture(autouse=True)
+def memory_storage():
+    """
+    Give each test its own memory mode storage.
+    Tests see no rows from other tests, so they can run in any order or in parallel.
+    """
+    previous = get_memory_storage()
+    storage = MemoryStorage()
+    set_memory_storage(storage)
+    yield storage
+    set_memory_storage(previous)
+
+
+@pytest.fixture(autouse=True)
+def clear_reference_cache():
+    """
+    Start each test with an empty reference cache.
+    Cached stores, products and settings from other tests' databases must not leak in.
+    """
+    reference_cache.clear()
+    yield
+    reference_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def isolate_event_bus():
+    """
+    Start each test with no event handlers and no registered main loop.
+    TestClient startup subscribes the app's handlers and registers its loop, which is
+    closed once the client exits; service calls in later tests must not emit to them.
+    """
+    event_bus.clear_handlers()
+    set_main_loop(None)
+    yield
+    event_bus.clear_handlers()
+    set_main_loop(None)
+
+
 @pytest.fixture(scope="function")
 def db():
     """
@@ -251,6 +293,12 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "websocket: marks tests that require WebSocket support"
     )
+    config.addinivalue_line(
+        "markers", "query_budget: marks tests asserting SQL statement counts per endpoint"
+    )
+    config.addinivalue_line(
+        "markers", "benchmark: marks timing benchmarks (deselect with '-m \"not benchmark\"')"
+    )
 
 
 def pytest_collection_modifyitems(config, items):
@@ -0,0 +1,128 @@
+"""
+Tests and benchmark for the integer-cent allocation engine.
+"""
+import random
+import time
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from app.core.allocation import (
+    allocate_purchase,
+    allocate_run,
+    cost_in_cents,
+    from_minor_units,
+    largest_remainder_split,
+    split_cost,
+    to_minor_units,
+)
+
+# Runs in the benchmark: (bidders, products)
+BENCHMARK_RUN = (1000, 100)
+BENCHMARK_SECONDS = 5.0
+
+
+def test_minor_unit_conversion():
+    """Values round half up to hundredths and convert back exactly"""
+    assert to_minor_units(Decimal("2.345")) == 235
+    assert to_minor_units(0.1 + 0.2) == 30
+    assert to_minor_units(None) == 0
+    assert from_minor_units(235) == Decimal("2.35")
+    assert cost_in_cents(333, 150) == 500  # 3.33 * 1.50 = 4.995
+
+
+def test_largest_remainder_split():
+    """Shares sum to the total, leftovers go to the largest remainders"""
+    assert largest_remainder_split(10, [1, 1, 1]) == [4, 3, 3]
+    assert largest_remainder_split(200, [300, 100]) == [150, 50]
+    assert largest_remainder_split(7, [2, 5, 3]) == [1, 4, 2]
+    assert largest_remainder_split(5, [0, 0]) == [0, 0]
+    assert largest_remainder_split(0, [3, 4]) == [0, 0]
+
+
+def test_allocate_purchase_short():
+    """A short purchase is split proportionally and the costs reconcile"""
+    bids = [(uuid4(), Decimal(1)), (uuid4(), Decimal(1)), (uuid4(), Decimal(1))]
+    allocations = allocate_purchase(Decimal(2), Decimal("3.33"), bids)
+
+    assert [a.quantity for a in allocations] == [Decimal("0.67"), Decimal("0.67"), Decimal("0.66")]
+    assert sum(a.quantity for a in allocations) == Decimal(2)
+    assert sum(a.cost for a in allocations) == Decimal("6.66")
+    assert [a.bid_id for a in allocations] == [bid_id for bid_id, _ in bids]
+    assert allocations[0].as_update() == {
+        "id": bids[0][0],
+        "distributed_quantity": Decimal("0.67"),
+        "distributed_price_per_unit": Decimal("3.33"),
+    }
+
+
+def test_allocate_purchase_enough():
+    """Bids get their full quantity when enough was bought"""
+    bids = [(uuid4(), Decimal("1.5")), (uuid4(), Decimal(2))]
+    allocations = allocate_purchase(Decimal(5), None, bids)
+
+    assert [a.quantity for a in allocations] == [Decimal("1.5"), Decimal(2)]
+    assert [a.cost for a in allocations] == [Decimal(0), Decimal(0)]
+    assert allocations[0].price_per_unit is None
+    assert allocate_purchase(Decimal(5), Decimal(1), []) == []
+
+
+def test_split_cost():
+    """Costs of quantities bought at one price add up to the rounded total"""
+    costs = split_cost(Decimal("0.99"), [Decimal("0.33"), Decimal("0.33"), Decimal("0.34")])
+    assert sum(costs) == Decimal("0.99")
+    assert costs == [Decimal("0.33"), Decimal("0.33"), Decimal("0.33")]
+
+
+def random_purchases(bidders, products):
+    """Seeded purchases of products, each bid on by every bidder"""
+    rng = random.Random(42)
+    purchases = []
+    for _ in range(products):
+        bids = [(uuid4(), Decimal(rng.randint(1, 1000)) / 100) for _ in range(bidders)]
+        requested = sum(quantity for _, quantity in bids)
+        # Mix of short purchases (proportional split) and full ones
+        purchased = (requested * Decimal(rng.uniform(0.5, 1.2))).quantize(Decimal("0.01"))
+        price = Decimal(rng.randint(1, 5000)) / 100
+        purchases.append((purchased, price, bids))
+    return purchases
+
+
+def assert_reconciled(purchases, results):
+    """Every product allocates what was bought, at the rounded total cost, within each bid"""
+    assert [a.bid_id for a in results] == [
+        bid_id for _, _, bids in purchases for bid_id, _ in bids
+    ]
+    start = 0
+    for purchased, price, bids in purchases:
+        allocations = results[start : start + len(bids)]
+        start += len(bids)
+        allocated = sum(a.quantity for a in allocations)
+        assert allocated == min(purchased, sum(quantity for _, quantity in bids))
+        assert sum(a.cost for a in allocations) == from_minor_units(
+            cost_in_cents(to_minor_units(price), to_minor_units(allocated))
+        )
+        for allocation, (_, quantity) in zip(allocations, bids, strict=True):
+            assert allocation.quantity <= quantity
+
+
+def test_run_allocation_reconciles():
+    """Every product of a run with random bids and purchases reconciles"""
+    purchases = random_purchases(100, 20)
+    assert_reconciled(purchases, allocate_run(purchases))
+    assert allocate_run([]) == []
+
+
+@pytest.mark.benchmark
+@pytest.mark.slow
+def test_benchmark_run_allocation():
+    """A 1k bidder x 100 product run allocates quickly and every product reconciles"""
+    purchases = random_purchases(*BENCHMARK_RUN)
+
+    start = time.perf_counter()
+    results = allocate_run(purchases)
+    elapsed = time.perf_counter() - start
+
+    assert_reconciled(purchases, results)
+    assert elapsed < BENCHMARK_SECONDS
@@ -0,0 +1,90 @@
+"""
+Tests for the AsyncSession repositories and the awaitable repository facade.
+"""
+import pytest
+import pytest_asyncio
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.core.models import Base, Group, Run, Store, User, group_membership
+from app.core.run_state import RunState
+from app.infrastructure.async_database import get_async_database_url
+from app.repositories import (
+    AsyncDatabaseGroupRepository,
+    AsyncDatabaseRunRepository,
+    AsyncDatabaseUserRepository,
+    AwaitableRepository,
+)
+
+pytest.importorskip("aiosqlite")
+
+
+@pytest_asyncio.fixture
+async def async_db():
+    """Provide an AsyncSession bound to a fresh in-memory SQLite database"""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with session_factory() as session:
+        yield session
+
+    await engine.dispose()
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("postgresql://u:p@db:5432/bulq", "postgresql+asyncpg://u:p@db:5432/bulq"),
+        ("postgresql+psycopg2://u:p@db/bulq", "postgresql+asyncpg://u:p@db/bulq"),
+        ("sqlite:///./test.db", "sqlite+aiosqlite:///./test.db"),
+        ("postgresql+asyncpg://u:p@db/bulq", "postgresql+asyncpg://u:p@db/bulq"),
+    ],
+)
+def test_get_async_database_url(url, expected):
+    """Sync URLs are mapped to their async driver"""
+    assert get_async_database_url(url) == expected
+
+
+@pytest.mark.asyncio
+async def test_websocket_lookups(async_db):
+    """Users, their groups, groups and runs are loaded through the async repositories"""
+    user = User(name="Alice", username="alice", password_hash="hash")
+    store = Store(name="Costco")
+    async_db.add_all([user, store])
+    await async_db.flush()
+    group = Group(name="Friends", created_by=user.id, invite_token="token")
+    async_db.add(group)
+    await async_db.flush()
+    await async_db.execute(
+        insert(group_membership).values(group_id=group.id, user_id=user.id, is_group_admin=True)
+    )
+    run = Run(group_id=group.id, store_id=store.id, state=RunState.PLANNING)
+    async_db.add(run)
+    await async_db.commit()
+
+    users = AsyncDatabaseUserRepository(async_db)
+    assert (await users.get_user_by_id(user.id)).username == "alice"
+    assert [g.id for g in await users.get_user_groups(user)] == [group.id]
+    assert (await AsyncDatabaseGroupRepository(async_db).get_group_by_id(group.id)).name == (
+        "Friends"
+    )
+    assert (await AsyncDatabaseRunRepository(async_db).get_run_by_id(run.id)).group_id == group.id
+
+
+@pytest.mark.asyncio
+async def test_awaitable_repository_wraps_sync_methods():
+    """Sync repositories can be awaited through the facade"""
+
+    class SyncRepo:
+        def get_value(self, value):
+            return value * 2
+
+        async def already_async(self):
+            return "async"
+
+    repo = AwaitableRepository(SyncRepo())
+
+    assert await repo.get_value(21) == 42
+    assert await repo.already_async() == "async"
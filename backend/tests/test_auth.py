@@ -1,9 +1,12 @@
 """
 Tests for authentication and authorization functionality.
 """
+import asyncio
+
 import pytest
 from app.infrastructure.auth import hash_password, verify_password, create_session, get_session, delete_session
 from app.core.models import User
+from app.infrastructure.password_hasher import PasswordHasher
 
 
 def test_hash_password():
@@ -264,3 +267,45 @@ class TestAuthIntegration:
         assert response1.json()["email"] == "test@example.com"
         assert response2.json()["email"] == "test@example.com"
         assert response3.json()["email"] == "test@example.com"
+
+
+@pytest.mark.asyncio
+async def test_password_hasher_hash_and_verify():
+    """Test awaitable hashing on the bounded thread pool"""
+    hasher = PasswordHasher(max_concurrency=2)
+    try:
+        hashed = await hasher.hash("testpassword123")
+
+        assert await hasher.verify("testpassword123", hashed) is True
+        assert await hasher.verify("wrongpassword", hashed) is False
+
+        stats = hasher.stats()
+        assert stats["max_concurrency"] == 2
+        assert stats["in_flight"] == 0
+        assert stats["hash"]["count"] == 1
+        assert stats["verify"]["count"] == 2
+        assert stats["verify"]["avg_ms"] > 0
+    finally:
+        hasher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_password_hasher_does_not_block_event_loop():
+    """Test that the event loop keeps running while hashes are computed"""
+    hasher = PasswordHasher(max_concurrency=1)
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.001)
+
+    task = asyncio.create_task(ticker())
+    try:
+        await asyncio.gather(*(hasher.hash("testpassword123") for _ in range(3)))
+    finally:
+        task.cancel()
+        hasher.shutdown()
+
+    assert ticks > 10
@@ -0,0 +1,649 @@
+"""
+Tests for batched repository methods, against both the database and memory repositories.
+"""
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from app.core.models import (
+    Group,
+    Product,
+    ProductAvailability,
+    ProductBid,
+    Run,
+    RunParticipation,
+    Store,
+    User,
+    group_membership,
+)
+from app.repositories import (
+    DatabaseBidRepository,
+    DatabaseGroupRepository,
+    DatabaseNotificationRepository,
+    DatabaseProductRepository,
+    DatabaseRunRepository,
+    DatabaseShoppingRepository,
+    DatabaseStoreRepository,
+    MemoryBidRepository,
+    MemoryGroupRepository,
+    MemoryNotificationRepository,
+    MemoryProductRepository,
+    MemoryRunRepository,
+    MemoryShoppingRepository,
+    MemoryStorage,
+    MemoryStoreRepository,
+)
+
+
+@pytest.fixture(params=["database", "memory"])
+def product_repo(request, db_session):
+    """Database and memory product repositories (tests only query by fresh IDs)"""
+    if request.param == "database":
+        return DatabaseProductRepository(db_session)
+    return MemoryProductRepository(MemoryStorage())
+
+
+@pytest.fixture(params=["database", "memory"])
+def group_repo(request, db_session):
+    """Database and memory group repositories (tests only query by fresh IDs)"""
+    if request.param == "database":
+        return DatabaseGroupRepository(db_session)
+    return MemoryGroupRepository(MemoryStorage())
+
+
+@pytest.fixture(params=["database", "memory"])
+def run_repo(request, db_session):
+    """Database and memory run repositories (tests only query by fresh IDs)"""
+    if request.param == "database":
+        return DatabaseRunRepository(db_session)
+    return MemoryRunRepository(MemoryStorage())
+
+
+def add_row(repo, obj, collection):
+    """Add a model instance directly to the repository's backing storage"""
+    if hasattr(repo, "db"):
+        repo.db.add(obj)
+        repo.db.commit()
+    else:
+        getattr(repo.storage, collection)[obj.id] = obj
+    return obj
+
+
+def add_store(repo, name):
+    """Add a store directly to the repository's backing storage"""
+    return add_row(repo, Store(id=uuid4(), name=name), "stores")
+
+
+def add_availability(repo, product, store, price, days_ago):
+    """Add a price observation made days_ago days ago"""
+    availability = ProductAvailability(
+        id=uuid4(),
+        product_id=product.id,
+        store_id=store.id,
+        price=Decimal(price),
+        created_at=datetime.now(UTC) - timedelta(days=days_ago),
+    )
+    return add_row(repo, availability, "product_availabilities")
+
+
+def add_run_with_bid(repo, store, product):
+    """Add a run at the store with one participant bidding on product"""
+    user = add_row(
+        repo,
+        User(id=uuid4(), name="Bidder", username=f"u{uuid4().hex}", password_hash="x"),
+        "users",
+    )
+    group = add_row(repo, Group(id=uuid4(), name="Group", created_by=user.id), "groups")
+    run = add_row(
+        repo, Run(id=uuid4(), group_id=group.id, store_id=store.id, state="active"), "runs"
+    )
+    participation = add_row(
+        repo, RunParticipation(id=uuid4(), user_id=user.id, run_id=run.id), "participations"
+    )
+    add_row(
+        repo,
+        ProductBid(
+            id=uuid4(), participation_id=participation.id, product_id=product.id, quantity=1
+        ),
+        "bids",
+    )
+    return run
+
+
+def test_get_products_by_ids(product_repo):
+    """Only the requested, existing products are returned"""
+    rice = product_repo.create_product("Rice")
+    beans = product_repo.create_product("Beans")
+    product_repo.create_product("Oats")
+
+    products = product_repo.get_products_by_ids([rice.id, beans.id, uuid4()])
+
+    assert {p.name for p in products} == {"Rice", "Beans"}
+    assert product_repo.get_products_by_ids([]) == []
+
+
+def test_get_latest_availabilities_by_store(product_repo):
+    """The newest observation per product at the store wins"""
+    store = add_store(product_repo, "Costco")
+    other_store = add_store(product_repo, "Sam's Club")
+    rice = product_repo.create_product("Rice")
+    beans = product_repo.create_product("Beans")
+    oats = product_repo.create_product("Oats")
+
+    add_availability(product_repo, rice, store, "10.00", days_ago=3)
+    add_availability(product_repo, rice, store, "9.50", days_ago=1)
+    add_availability(product_repo, rice, other_store, "8.00", days_ago=0)
+    add_availability(product_repo, beans, store, "2.00", days_ago=2)
+    add_availability(product_repo, oats, other_store, "4.00", days_ago=1)
+
+    latest = product_repo.get_latest_availabilities_by_store(store.id)
+    assert {pid: a.price for pid, a in latest.items()} == {
+        rice.id: Decimal("9.50"),
+        beans.id: Decimal("2.00"),
+    }
+
+    only_rice = product_repo.get_latest_availabilities_by_store(store.id, [rice.id, oats.id])
+    assert list(only_rice) == [rice.id]
+    assert product_repo.get_latest_availabilities_by_store(store.id, []) == {}
+
+
+def test_get_available_products_for_run(product_repo):
+    """Products without a bid in the run, store products first, then by name"""
+    store = add_store(product_repo, "Costco")
+    other_store = add_store(product_repo, "Sam's Club")
+    suffix = uuid4().hex[:8]
+    names = ["Rice", "beans", "Oats", "Flour", "Sugar"]
+    rice, beans, oats, flour, sugar = (
+        product_repo.create_product(f"{name} {suffix}") for name in names
+    )
+    add_availability(product_repo, rice, store, "9.50", days_ago=1)
+    add_availability(product_repo, beans, store, "2.00", days_ago=1)
+    add_availability(product_repo, oats, store, "4.00", days_ago=1)
+    add_availability(product_repo, flour, other_store, "3.00", days_ago=1)
+    run = add_run_with_bid(product_repo, store, oats)
+
+    def names_of(rows):
+        return [product.name.split()[0] for product, _ in rows]
+
+    rows = product_repo.get_available_products_for_run(
+        run.id, store.id, search=suffix, store_only=False
+    )
+    assert names_of(rows) == ["beans", "Rice", "Flour", "Sugar"]
+    assert [a.price if a else None for _, a in rows] == [
+        Decimal("2.00"),
+        Decimal("9.50"),
+        None,
+        None,
+    ]
+
+    store_rows = product_repo.get_available_products_for_run(
+        run.id, store.id, search=suffix, store_only=True
+    )
+    assert names_of(store_rows) == ["beans", "Rice"]
+
+    first_page = product_repo.get_available_products_for_run(
+        run.id, store.id, search=suffix, store_only=False, limit=2
+    )
+    offset_page = product_repo.get_available_products_for_run(
+        run.id, store.id, search=suffix, store_only=False, limit=2, offset=2
+    )
+    keyset_page = product_repo.get_available_products_for_run(
+        run.id,
+        store.id,
+        search=suffix,
+        store_only=False,
+        limit=2,
+        after_product_id=first_page[-1][0].id,
+    )
+    assert names_of(first_page) == ["beans", "Rice"]
+    assert names_of(offset_page) == names_of(keyset_page) == ["Flour", "Sugar"]
+    # An unknown cursor is rejected rather than restarting at the first page
+    assert (
+        product_repo.get_available_products_for_run(run.id, store.id, after_product_id=uuid4())
+        is None
+    )
+
+
+def test_get_latest_day_prices_by_store(product_repo):
+    """Only priced observations from each product's most recent day are returned"""
+    store = add_store(product_repo, "Costco")
+    other_store = add_store(product_repo, "Sam's Club")
+    rice = product_repo.create_product("Rice")
+    beans = product_repo.create_product("Beans")
+    oats = product_repo.create_product("Oats")
+
+    base = datetime(2024, 5, 10, 12, 0, tzinfo=UTC)
+    observations = [
+        (rice, store, "10.00", base - timedelta(days=3)),
+        (rice, store, "9.50", base - timedelta(hours=2)),
+        (rice, store, "9.00", base),
+        (rice, store, None, base + timedelta(hours=1)),
+        (rice, other_store, "8.00", base + timedelta(hours=2)),
+        (beans, store, "2.00", base - timedelta(days=1)),
+        (oats, other_store, "4.00", base),
+    ]
+    for product, obs_store, price, created_at in observations:
+        add_row(
+            product_repo,
+            ProductAvailability(
+                id=uuid4(),
+                product_id=product.id,
+                store_id=obs_store.id,
+                price=Decimal(price) if price else None,
+                created_at=created_at,
+            ),
+            "product_availabilities",
+        )
+
+    prices = product_repo.get_latest_day_prices_by_store(store.id, [rice.id, beans.id, oats.id])
+
+    assert {pid: [a.price for a in obs] for pid, obs in prices.items()} == {
+        rice.id: [Decimal("9.00"), Decimal("9.50")],
+        beans.id: [Decimal("2.00")],
+    }
+    assert product_repo.get_latest_day_prices_by_store(store.id, []) == {}
+
+
+def test_get_store_prices_by_products(product_repo):
+    """Latest price per store for each product, stores ordered by name"""
+    tag = uuid4().hex[:8]
+    costco, aldi = add_store(product_repo, f"{tag} Costco"), add_store(product_repo, f"{tag} Aldi")
+    rice, beans, unseen = (
+        add_row(product_repo, Product(id=uuid4(), name=name), "products")
+        for name in ("Rice", "Beans", "Unseen")
+    )
+    add_availability(product_repo, rice, costco, "9.50", days_ago=2)
+    add_availability(product_repo, rice, costco, "10.00", days_ago=1)
+    add_availability(product_repo, rice, aldi, "8.00", days_ago=3)
+    add_availability(product_repo, beans, aldi, "2.00", days_ago=1)
+
+    prices = product_repo.get_store_prices_by_products([rice.id, beans.id, unseen.id])
+
+    assert set(prices) == {rice.id, beans.id}
+    assert [(e["store_id"], e["price"]) for e in prices[rice.id]] == [
+        (aldi.id, Decimal("8.00")),
+        (costco.id, Decimal("10.00")),
+    ]
+    assert [e["store_name"] for e in prices[beans.id]] == [aldi.name]
+    assert product_repo.get_store_prices_by_products([]) == {}
+
+
+def test_get_user_group_summaries(group_repo):
+    """Member and run counts per group, with active runs and their store names"""
+    user, other = (
+        add_row(
+            group_repo,
+            User(id=uuid4(), name=name, username=f"u{uuid4().hex}", password_hash="x"),
+            "users",
+        )
+        for name in ("Leader", "Member")
+    )
+    store = add_store(group_repo, "Costco")
+    busy = group_repo.create_group("Busy", user.id)
+    quiet = group_repo.create_group("Quiet", other.id)
+    elsewhere = group_repo.create_group("Elsewhere", other.id)
+    for group in (busy, quiet):
+        group_repo.add_group_member(group.id, user)
+    group_repo.add_group_member(busy.id, other)
+    group_repo.add_group_member(elsewhere.id, other)
+    for state in ("active", "shopping", "completed", "completed", "cancelled"):
+        add_row(
+            group_repo, Run(id=uuid4(), group_id=busy.id, store_id=store.id, state=state), "runs"
+        )
+
+    summaries = {s["group"].id: s for s in group_repo.get_user_group_summaries(user.id)}
+
+    assert set(summaries) == {busy.id, quiet.id}
+    busy_summary = summaries[busy.id]
+    assert busy_summary["creator_name"] == "Leader"
+    assert busy_summary["member_count"] == 2
+    assert busy_summary["active_runs_count"] == 2
+    assert busy_summary["completed_runs_count"] == 2
+    assert sorted(r["state"] for r in busy_summary["active_runs"]) == ["active", "shopping"]
+    assert {r["store_name"] for r in busy_summary["active_runs"]} == {"Costco"}
+    assert summaries[quiet.id]["creator_name"] == "Member"
+    assert summaries[quiet.id]["member_count"] == 1
+    assert summaries[quiet.id]["active_runs"] == []
+    assert group_repo.get_user_group_summaries(uuid4()) == []
+
+
+def test_search_user_groups(group_repo):
+    """Only the user's groups matching the query, by name, with member counts"""
+    user, other = (
+        add_row(
+            group_repo,
+            User(id=uuid4(), name=name, username=f"u{uuid4().hex}", password_hash="x"),
+            "users",
+        )
+        for name in ("Leader", "Member")
+    )
+    tag = uuid4().hex[:8]
+    groups = [group_repo.create_group(f"{tag} {name}", user.id) for name in ("b", "a", "c")]
+    for group in groups:
+        group_repo.add_group_member(group.id, user)
+    group_repo.add_group_member(groups[0].id, other)
+    not_joined = group_repo.create_group(f"{tag} d", other.id)
+    group_repo.add_group_member(not_joined.id, other)
+
+    matches = group_repo.search_user_groups(user.id, tag.upper(), limit=2)
+
+    assert [(m["group"].id, m["member_count"]) for m in matches] == [
+        (groups[1].id, 1),
+        (groups[0].id, 2),
+    ]
+    assert group_repo.search_user_groups(other.id, f"{tag} d", limit=3)[0]["group"].id == (
+        not_joined.id
+    )
+    assert group_repo.search_user_groups(user.id, "zzqqxxjj", limit=3) == []
+
+
+def test_run_listings(run_repo):
+    """Run listings carry leader, store and group names and page by finish time"""
+    leader, member = (
+        add_row(
+            run_repo,
+            User(id=uuid4(), name=name, username=f"u{uuid4().hex}", password_hash="x"),
+            "users",
+        )
+        for name in ("Leader", "Member")
+    )
+    store = add_store(run_repo, "Costco")
+    group = add_row(run_repo, Group(id=uuid4(), name="Bulk", created_by=leader.id), "groups")
+    base = datetime(2024, 5, 10, tzinfo=UTC)
+    runs = {}
+    for name, state, finished_days_ago in (
+        ("active", "active", None),
+        ("newest", "completed", 1),
+        ("middle", "cancelled", 2),
+        ("oldest", "completed", 3),
+    ):
+        finished_at = base - timedelta(days=finished_days_ago) if finished_days_ago else None
+        runs[name] = add_row(
+            run_repo,
+            Run(
+                id=uuid4(),
+                group_id=group.id,
+                store_id=store.id,
+                state=state,
+                completed_at=finished_at if state == "completed" else None,
+                cancelled_at=finished_at if state == "cancelled" else None,
+            ),
+            "runs",
+        )
+        for user, is_removed in ((leader, False), (member, name == "newest")):
+            add_row(
+                run_repo,
+                RunParticipation(
+                    id=uuid4(),
+                    user_id=user.id,
+                    run_id=runs[name].id,
+                    is_leader=user is leader,
+                    is_removed=is_removed,
+                ),
+                "participations",
+            )
+
+    listings = {li["run"].id: li for li in run_repo.get_run_listings_by_group(group.id)}
+    assert set(listings) == {run.id for run in runs.values()}
+    newest = listings[runs["newest"].id]
+    assert (newest["store_name"], newest["group_name"], newest["leader_name"]) == (
+        "Costco",
+        "Bulk",
+        "Leader",
+    )
+    assert newest["leader_is_removed"] is False
+    assert newest["participant_count"] == 1
+    assert listings[runs["active"].id]["participant_count"] == 2
+
+    def names_of(page):
+        return [next(n for n, r in runs.items() if r.id == li["run"].id) for li in page]
+
+    history = run_repo.get_completed_cancelled_run_listings_by_group(group.id)
+    first_page = run_repo.get_completed_cancelled_run_listings_by_group(group.id, limit=1)
+    keyset_page = run_repo.get_completed_cancelled_run_listings_by_group(
+        group.id, limit=5, after_run_id=first_page[-1]["run"].id
+    )
+    assert names_of(history) == ["newest", "middle", "oldest"]
+    assert names_of(keyset_page) == ["middle", "oldest"]
+    # Unknown cursors and runs that are not in the group's history are rejected
+    for cursor in (uuid4(), runs["active"].id):
+        assert (
+            run_repo.get_completed_cancelled_run_listings_by_group(group.id, after_run_id=cursor)
+            is None
+        )
+
+    store_runs = run_repo.get_active_run_listings_by_store_for_user(store.id, member.id)
+    assert names_of(store_runs) == []
+    if hasattr(run_repo, "db"):
+        run_repo.db.execute(group_membership.insert().values(user_id=member.id, group_id=group.id))
+    else:
+        run_repo.storage.group_memberships[group.id] = [member.id]
+    store_runs = run_repo.get_active_run_listings_by_store_for_user(store.id, member.id)
+    assert names_of(store_runs) == ["active"]
+
+
+@pytest.fixture(params=["database", "memory"])
+def bulk_repos(request, db_session):
+    """Database and memory bid and shopping repositories sharing one backend"""
+    if request.param == "database":
+        return DatabaseBidRepository(db_session), DatabaseShoppingRepository(db_session)
+    storage = MemoryStorage()
+    return MemoryBidRepository(storage), MemoryShoppingRepository(storage)
+
+
+def test_bulk_bid_and_shopping_writes(bulk_repos):
+    """Bulk inserts and updates write every row, with differing columns per row"""
+    bid_repo, shopping_repo = bulk_repos
+    store = add_store(bid_repo, "Costco")
+    rice, beans, oats = (add_row(bid_repo, Product(id=uuid4(), name=n), "products") for n in "RBO")
+    run = add_run_with_bid(bid_repo, store, rice)
+    participation_id = bid_repo.get_bids_by_run(run.id)[0].participation_id
+
+    shopping_repo.bulk_create_shopping_list_items(
+        run.id, {rice.id: Decimal(3), beans.id: Decimal(2)}
+    )
+    bid_repo.bulk_create_bids(
+        [
+            {"participation_id": participation_id, "product_id": beans.id, "quantity": 2},
+            {
+                "participation_id": participation_id,
+                "product_id": oats.id,
+                "quantity": 1,
+                "interested_only": True,
+            },
+        ]
+    )
+    if hasattr(bid_repo, "db"):
+        bid_repo.db.commit()
+
+    items = {item.product_id: item for item in shopping_repo.get_shopping_list_items(run.id)}
+    assert {pid: item.requested_quantity for pid, item in items.items()} == {
+        rice.id: Decimal(3),
+        beans.id: Decimal(2),
+    }
+    bids = {bid.product_id: bid for bid in bid_repo.get_bids_by_run(run.id)}
+    assert bids[oats.id].interested_only is True
+
+    shopping_repo.bulk_update_requested_quantities({items[rice.id].id: Decimal(5)})
+    bid_repo.bulk_update_bids(
+        [
+            {
+                "id": bids[rice.id].id,
+                "distributed_quantity": Decimal(1),
+                "distributed_price_per_unit": Decimal("2.50"),
+            },
+            {
+                "id": bids[oats.id].id,
+                "quantity": Decimal(4),
+                "interested_only": False,
+                "distributed_quantity": Decimal(4),
+                "distributed_price_per_unit": Decimal("2.50"),
+            },
+        ]
+    )
+    if hasattr(bid_repo, "db"):
+        bid_repo.db.commit()
+        bid_repo.db.expire_all()
+
+    assert shopping_repo.get_shopping_list_item(items[rice.id].id).requested_quantity == 5
+    bids = {bid.product_id: bid for bid in bid_repo.get_bids_by_run(run.id)}
+    assert (bids[rice.id].quantity, bids[rice.id].distributed_quantity) == (1, Decimal(1))
+    assert (bids[oats.id].quantity, bids[oats.id].interested_only) == (4, False)
+    assert bids[beans.id].distributed_quantity is None
+
+
+@pytest.fixture(params=["database", "memory"])
+def notification_repo(request, db_session):
+    """Database and memory notification repositories"""
+    if request.param == "database":
+        return DatabaseNotificationRepository(db_session)
+    return MemoryNotificationRepository(MemoryStorage())
+
+
+def test_create_notifications_bulk(notification_repo):
+    """Bulk-created notifications get IDs and timestamps up front and are stored"""
+    users = [
+        add_row(
+            notification_repo,
+            User(id=uuid4(), name="User", username=f"u{uuid4().hex}", password_hash="x"),
+            "users",
+        )
+        for _ in range(3)
+    ]
+    created = notification_repo.create_notifications_bulk(
+        [
+            {"user_id": user.id, "type": "run_state_changed", "data": {"n": i}}
+            for i, user in enumerate(users)
+        ]
+    )
+    if hasattr(notification_repo, "db"):
+        notification_repo.db.commit()
+
+    assert [n.user_id for n in created] == [user.id for user in users]
+    assert all(n.id and n.created_at and not n.read for n in created)
+    stored = notification_repo.get_user_notifications(users[1].id)
+    assert [(n.id, n.data) for n in stored] == [(created[1].id, {"n": 1})]
+    assert notification_repo.create_notifications_bulk([]) == []
+
+
+@pytest.fixture(params=["database", "memory"])
+def admin_repos(request, db_session):
+    """Database and memory store and group repositories sharing one backend"""
+    if request.param == "database":
+        return DatabaseStoreRepository(db_session), DatabaseGroupRepository(db_session)
+    storage = MemoryStorage()
+    return MemoryStoreRepository(storage), MemoryGroupRepository(storage)
+
+
+def test_admin_listings(admin_repos):
+    """Admin lists filter, order newest first and page by offset or keyset cursor"""
+    store_repo, group_repo = admin_repos
+    now = datetime.now(UTC)
+    stores = [
+        add_row(
+            store_repo,
+            Store(
+                id=uuid4(),
+                name=f"{name} {i}",
+                chain=name,
+                verified=i % 2 == 0,
+                created_at=now - timedelta(days=i),
+            ),
+            "stores",
+        )
+        for i, name in enumerate(["Costco", "Lidl", "Costco", "Aldi", "Costco"])
+    ]
+
+    def names(page):
+        return [store.name for store in page]
+
+    assert names(store_repo.get_stores_page(limit=2)) == ["Costco 0", "Lidl 1"]
+    assert names(store_repo.get_stores_page(search="costco")) == [
+        "Costco 0",
+        "Costco 2",
+        "Costco 4",
+    ]
+    assert names(store_repo.get_stores_page(search="COSTCO", verified=True, offset=1)) == [
+        "Costco 2",
+        "Costco 4",
+    ]
+    assert names(store_repo.get_stores_page(limit=2, after_store_id=stores[1].id)) == [
+        "Costco 2",
+        "Aldi 3",
+    ]
+    assert names(store_repo.get_stores_page(search="costco", after_store_id=stores[2].id)) == [
+        "Costco 4"
+    ]
+    # Cursors that are unknown or outside the filtered listing are rejected
+    assert store_repo.get_stores_page(after_store_id=uuid4()) is None
+    assert store_repo.get_stores_page(search="costco", after_store_id=stores[1].id) is None
+    assert store_repo.count_stores() == 5
+    assert store_repo.count_stores(search="costco", verified=False) == 0
+    assert store_repo.count_stores(verified=False) == 2
+
+    creator = add_row(
+        group_repo,
+        User(id=uuid4(), name="Creator", username=f"u{uuid4().hex}", password_hash="x"),
+        "users",
+    )
+    older = add_row(
+        group_repo,
+        Group(
+            id=uuid4(),
+            name="Old friends",
+            created_by=creator.id,
+            created_at=now - timedelta(days=1),
+        ),
+        "groups",
+    )
+    newer = add_row(
+        group_repo,
+        Group(id=uuid4(), name="New friends", created_by=creator.id, created_at=now),
+        "groups",
+    )
+    if hasattr(group_repo, "db"):
+        group_repo.add_group_member(older.id, creator)
+        group_repo.db.commit()
+    else:
+        group_repo.storage.group_memberships[older.id] = [creator.id]
+
+    listings = group_repo.get_group_admin_listings(search="friends")
+    assert [(row["group"].id, row["creator_name"], row["member_count"]) for row in listings] == [
+        (newer.id, "Creator", 0),
+        (older.id, "Creator", 1),
+    ]
+    after_newer = group_repo.get_group_admin_listings(after_group_id=newer.id)
+    assert [row["group"].id for row in after_newer] == [older.id]
+    assert group_repo.get_group_admin_listings(after_group_id=uuid4()) is None
+    assert group_repo.count_groups(search="old") == 1
+
+
+def test_admin_search_wildcards_match_literally(admin_repos):
+    """%, _ and backslash in a search match themselves, not any text"""
+    store_repo, _ = admin_repos
+    for name in ("50% off", "snack_bar", "back\\slash", "plain"):
+        add_row(store_repo, Store(id=uuid4(), name=name), "stores")
+
+    def names(search):
+        return sorted(store.name for store in store_repo.get_stores_page(search=search))
+
+    assert names("%") == ["50% off"]
+    assert names("_") == ["snack_bar"]
+    assert names("\\") == ["back\\slash"]
+    assert store_repo.count_stores(search="%%") == 0
+
+
+def test_name_search_is_ranked_and_limited(product_repo):
+    """Product search returns the closest names first and honours the limit"""
+    tag = uuid4().hex[:8]
+    names = [f"{tag} rice", f"{tag} brown rice", f"{tag} rice crackers xl"]
+    for name in reversed(names):
+        add_row(product_repo, Product(id=uuid4(), name=name), "products")
+
+    assert [p.name for p in product_repo.search_products(tag)] == names
+    assert [p.name for p in product_repo.search_products(tag.upper(), limit=2)] == names[:2]
+    assert product_repo.search_products("zzqqxxjj") == []
+    # LIKE wildcards in the search text are matched literally
+    assert product_repo.search_products("%%%%") == []
@@ -0,0 +1,197 @@
+"""
+Tests for the read-through cached repositories (REPO_MODE=cached).
+"""
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import app.repositories as repositories
+from app.core.models import Base
+from app.core.run_state import RunState
+from app.repositories import (
+    CachedGroupRepository,
+    CachedRunRepository,
+    CachedUserRepository,
+    DatabaseStoreRepository,
+    get_group_repository,
+    get_run_repository,
+    get_user_repository,
+)
+from app.repositories.cached.cache import (
+    MISSING,
+    RepositoryCache,
+    claim_single_process,
+    release_single_process,
+    repository_cache,
+)
+
+
+@pytest.fixture
+def sessions():
+    """Session factory on a fresh database and the list of statements it executes"""
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine)
+    statements = []
+    event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+    repository_cache.clear()
+    yield sessionmaker(bind=engine, autoflush=False), statements
+    repository_cache.clear()
+    engine.dispose()
+
+
+@pytest.fixture
+def data(sessions):
+    """A user leading a run in a group they administer"""
+    session_factory, _ = sessions
+    db = session_factory()
+    user = CachedUserRepository(db).create_user("Alice", "alice", "hash")
+    other = CachedUserRepository(db).create_user("Bob", "bob", "hash")
+    groups = CachedGroupRepository(db)
+    group = groups.create_group("Friends", user.id)
+    groups.add_group_member(group.id, user, is_group_admin=True)
+    store = DatabaseStoreRepository(db).create_store("Costco")
+    run = CachedRunRepository(db).create_run(group.id, store.id, user.id)
+    ids = {"user": user.id, "other": other.id, "group": group.id, "run": run.id}
+    db.close()
+    return ids
+
+
+def lookups(db, ids):
+    """Every cached lookup for the test data"""
+    runs = CachedRunRepository(db)
+    users = CachedUserRepository(db)
+    groups = CachedGroupRepository(db)
+    user = users.get_user_by_id(ids["user"])
+    return {
+        "run": runs.get_run_by_id(ids["run"]),
+        "participation": runs.get_participation(ids["user"], ids["run"]),
+        "user": user,
+        "user_groups": users.get_user_groups(user),
+        "group": groups.get_group_by_id(ids["group"]),
+        "is_admin": groups.is_user_group_admin(ids["group"], ids["user"]),
+    }
+
+
+def test_lookups_served_across_sessions(sessions, data):
+    """A second session gets every lookup from the cache, as rows of its own"""
+    session_factory, statements = sessions
+    first = lookups(session_factory(), data)
+
+    db = session_factory()
+    statements.clear()
+    second = lookups(db, data)
+
+    assert statements == []
+    assert second["run"] is not first["run"]
+    assert second["run"] in db
+    assert (second["run"].state, second["participation"].is_leader) == ("planning", True)
+    assert [g.id for g in second["user_groups"]] == [data["group"]]
+    assert second["is_admin"] is True
+    assert second["group"].name == "Friends"
+    assert repository_cache.stats()["sections"]["runs"] == {"hits": 1, "misses": 1}
+
+
+def test_cached_rows_can_be_changed(sessions, data):
+    """Rows attached from the cache are flushed normally and the change is cached next"""
+    session_factory, _ = sessions
+    lookups(session_factory(), data)
+
+    db = session_factory()
+    run = CachedRunRepository(db).get_run_by_id(data["run"])
+    run.comment = "Bring bags"
+    user = CachedUserRepository(db).get_user_by_id(data["user"])
+    user.name = "Alice Smith"
+    db.commit()
+
+    fresh = lookups(session_factory(), data)
+    assert fresh["run"].comment == "Bring bags"
+    assert fresh["user"].name == "Alice Smith"
+
+
+def test_repository_writes_invalidate(sessions, data):
+    """State, readiness, membership and bulk reassignment writes are seen by later lookups"""
+    session_factory, _ = sessions
+    lookups(session_factory(), data)
+
+    db = session_factory()
+    runs = CachedRunRepository(db)
+    runs.update_run_state(data["run"], RunState.ACTIVE)
+    participation = runs.get_participation(data["user"], data["run"])
+    runs.update_participation_ready(participation.id, True)
+    groups = CachedGroupRepository(db)
+    groups.set_group_member_admin(data["group"], data["user"], False)
+    other = CachedUserRepository(db).get_user_by_id(data["other"])
+    groups.add_group_member(data["group"], other)
+    CachedUserRepository(db).bulk_update_run_participations(data["user"], data["other"])
+    db.commit()
+
+    db = session_factory()
+    runs = CachedRunRepository(db)
+    assert runs.get_run_by_id(data["run"]).state == "active"
+    assert runs.get_participation(data["user"], data["run"]) is None
+    assert runs.get_participation(data["other"], data["run"]).is_ready is True
+    assert CachedGroupRepository(db).is_user_group_admin(data["group"], data["user"]) is False
+    other = CachedUserRepository(db).get_user_by_id(data["other"])
+    assert [g.id for g in CachedUserRepository(db).get_user_groups(other)] == [data["group"]]
+
+
+def test_uncommitted_writes_are_not_cached(sessions, data):
+    """A session bypasses the cache for rows it changed, and a rollback leaves no trace"""
+    session_factory, _ = sessions
+    db = session_factory()
+    run = CachedRunRepository(db).get_run_by_id(data["run"])
+    run.comment = "Draft"
+    db.flush()
+    db.expunge_all()
+    assert CachedRunRepository(db).get_run_by_id(data["run"]).comment == "Draft"
+    db.rollback()
+
+    assert CachedRunRepository(session_factory()).get_run_by_id(data["run"]).comment is None
+
+
+def test_lru_eviction_and_stale_puts(sessions):
+    """The least recently used entry is evicted; a value loaded across a write is dropped"""
+    session_factory, _ = sessions
+    db = session_factory()
+    cache = RepositoryCache(max_entries=2)
+    for key in "abc":
+        if key == "c":
+            assert cache.get(db, "runs", "a")[0] == "a"
+        _, token = cache.get(db, "runs", key)
+        cache.put("runs", key, token, key)
+
+    assert cache.get(db, "runs", "b")[0] is MISSING
+    assert cache.get(db, "runs", "a")[0] == "a"
+    assert cache.stats()["evictions"] == 1
+
+    _, token = cache.get(db, "users", "d")
+    cache.invalidate([("users", "d")])
+    cache.put("users", "d", token, "stale")
+    assert cache.get(db, "users", "d")[0] is MISSING
+
+
+def test_factories_select_cached_repositories(sessions, monkeypatch):
+    """REPO_MODE=cached returns the cached run, user and group repositories"""
+    session_factory, _ = sessions
+    monkeypatch.setattr(repositories, "REPO_MODE", "cached")
+    db = session_factory()
+    assert isinstance(get_run_repository(db), CachedRunRepository)
+    assert isinstance(get_user_repository(db), CachedUserRepository)
+    assert isinstance(get_group_repository(db), CachedGroupRepository)
+    assert type(repositories.get_bid_repository(db)).__name__ == "DatabaseBidRepository"
+
+
+def test_single_process_lock_only_taken_on_postgresql(sessions):
+    """Databases without advisory locks start without one; releasing nothing is a no-op"""
+    session_factory, _ = sessions
+    engine = session_factory.kw["bind"]
+    lock = claim_single_process(engine)
+    assert lock is None
+    release_single_process(lock)
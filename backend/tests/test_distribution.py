@@ -0,0 +1,153 @@
+"""
+Tests for shopping list generation and distribution of purchased items to bidders.
+"""
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import insert
+
+import app.repositories as repositories
+from app.core.models import (
+    Group,
+    Product,
+    ProductBid,
+    Run,
+    RunParticipation,
+    ShoppingListItem,
+    Store,
+    User,
+    group_membership,
+)
+from app.core.run_state import RunState
+from app.services import RunStateService
+
+
+@pytest.fixture
+def run_setup(db_session, monkeypatch):
+    """A run with a leader and two members in a group"""
+    monkeypatch.setattr(repositories, "REPO_MODE", "database")
+    leader = User(name="Leader", username="leader", password_hash="x")
+    alice = User(name="Alice", username="alice", password_hash="x")
+    bob = User(name="Bob", username="bob", password_hash="x")
+    store = Store(name="Costco")
+    db_session.add_all([leader, alice, bob, store])
+    db_session.flush()
+    group = Group(name="Bulk Buyers", created_by=leader.id)
+    db_session.add(group)
+    db_session.flush()
+    db_session.execute(
+        insert(group_membership),
+        [{"user_id": user.id, "group_id": group.id} for user in (leader, alice, bob)],
+    )
+    run = Run(group_id=group.id, store_id=store.id, state=RunState.ADJUSTING)
+    db_session.add(run)
+    db_session.flush()
+    participations = {}
+    for user in (leader, alice, bob):
+        participation = RunParticipation(user_id=user.id, run_id=run.id, is_leader=user is leader)
+        db_session.add(participation)
+        participations[user.name] = participation
+    db_session.commit()
+    return db_session, run, leader, participations
+
+
+def add_product(session, run, participations, bids, purchased=None):
+    """Add a product with bids ({name: quantity, or None for interested only})"""
+    product = Product(name="Product")
+    session.add(product)
+    session.flush()
+    for name, quantity in bids.items():
+        session.add(
+            ProductBid(
+                participation_id=participations[name].id,
+                product_id=product.id,
+                quantity=Decimal(quantity or 0),
+                interested_only=quantity is None,
+            )
+        )
+    session.add(
+        ShoppingListItem(
+            run_id=run.id,
+            product_id=product.id,
+            requested_quantity=Decimal(0),
+            purchased_quantity=Decimal(purchased) if purchased is not None else None,
+            purchased_price_per_unit=Decimal("2.50") if purchased is not None else None,
+            is_purchased=purchased is not None,
+        )
+    )
+    session.commit()
+    return product
+
+
+def allocations(session, product):
+    """Map of bidder name to (quantity, distributed quantity, interested only)"""
+    bids = session.query(ProductBid).filter(ProductBid.product_id == product.id).all()
+    return {
+        bid.participation.user.name: (
+            bid.quantity,
+            bid.distributed_quantity,
+            bid.interested_only,
+        )
+        for bid in bids
+    }
+
+
+def requested(session, product):
+    """Requested quantity of the product's shopping list item"""
+    item = session.query(ShoppingListItem).filter(ShoppingListItem.product_id == product.id).one()
+    return item.requested_quantity
+
+
+def test_finish_adjusting_distributes_purchases(run_setup):
+    """Short purchases are split proportionally and surpluses go to the leader"""
+    session, run, leader, participations = run_setup
+    short = add_product(session, run, participations, {"Alice": 3, "Bob": 1}, purchased=2)
+    leader_bid = add_product(session, run, participations, {"Alice": 2, "Leader": 1}, purchased=5)
+    leader_interest = add_product(
+        session, run, participations, {"Alice": 1, "Leader": None}, purchased=2
+    )
+    no_leader_bid = add_product(session, run, participations, {"Bob": 2}, purchased=3)
+    not_bought = add_product(session, run, participations, {"Alice": 1})
+
+    RunStateService(session).finish_adjusting(str(run.id), leader, force=True)
+    session.expire_all()
+
+    assert allocations(session, short) == {
+        "Alice": (Decimal(3), Decimal("1.5"), False),
+        "Bob": (Decimal(1), Decimal("0.5"), False),
+    }
+    assert requested(session, short) == Decimal(4)
+    assert allocations(session, leader_bid) == {
+        "Alice": (Decimal(2), Decimal(2), False),
+        "Leader": (Decimal(3), Decimal(3), False),
+    }
+    assert allocations(session, leader_interest) == {
+        "Alice": (Decimal(1), Decimal(1), False),
+        "Leader": (Decimal(1), Decimal(1), False),
+    }
+    assert allocations(session, no_leader_bid) == {
+        "Bob": (Decimal(2), Decimal(2), False),
+        "Leader": (Decimal(1), Decimal(1), False),
+    }
+    assert requested(session, no_leader_bid) == Decimal(3)
+    assert allocations(session, not_bought) == {"Alice": (Decimal(1), None, False)}
+    assert session.get(Run, run.id).state == RunState.DISTRIBUTING
+
+
+def test_start_shopping_generates_shopping_list(run_setup):
+    """One shopping list item per product with the summed non-interest bids"""
+    session, run, leader, participations = run_setup
+    run.state = RunState.CONFIRMED
+    session.commit()
+    rice = add_product(session, run, participations, {"Alice": 2, "Bob": 3, "Leader": None})
+    only_interest = add_product(session, run, participations, {"Bob": None})
+    session.query(ShoppingListItem).delete()
+    session.commit()
+
+    RunStateService(session).start_shopping(str(run.id), leader)
+    session.expire_all()
+
+    items = session.query(ShoppingListItem).filter(ShoppingListItem.run_id == run.id).all()
+    assert [(item.product_id, item.requested_quantity) for item in items] == [(rice.id, Decimal(5))]
+    assert only_interest.id not in {item.product_id for item in items}
+    assert all(not item.is_purchased for item in items)
@@ -0,0 +1,161 @@
+"""
+Tests and benchmark for the indexed tables backing the memory repositories.
+"""
+import copy
+import pickle
+import time
+from uuid import uuid4
+
+import pytest
+
+from app.core.models import ProductAvailability, ProductBid, RunParticipation
+from app.repositories import MemoryBidRepository, MemoryProductRepository, MemoryStorage
+from app.repositories.memory.indexed_table import IndexedTable
+
+# Runs in the benchmark: (runs, participants per run, bids per participant)
+BENCHMARK_RUNS = (200, 25, 10)
+BENCHMARK_LOOKUP_MS = 1.0
+
+
+def availability(product_id, store_id):
+    """A price observation of product_id at store_id"""
+    return ProductAvailability(id=uuid4(), product_id=product_id, store_id=store_id)
+
+
+def test_where_follows_every_mutation():
+    """Rows are found by indexed fields after set, replace, delete, pop and clear"""
+    table = IndexedTable(("product_id",), ("store_id",), ("product_id", "store_id"))
+    rice, beans, costco, aldi = uuid4(), uuid4(), uuid4(), uuid4()
+    first, second, third = (
+        availability(rice, costco),
+        availability(rice, aldi),
+        availability(beans, aldi),
+    )
+    for row in (first, second, third):
+        table[row.id] = row
+
+    assert table.where(product_id=rice) == [first, second]
+    assert table.where(store_id=aldi, product_id=rice) == [second]
+    assert table.where_in("store_id", [costco, aldi]) == [first, second, third]
+
+    table[first.id] = availability(beans, costco)
+    assert table.where(product_id=rice) == [second]
+    del table[second.id]
+    assert table.pop(third.id) is third
+    assert table.pop(uuid4(), None) is None
+    assert table.where(store_id=aldi) == []
+    assert table.where(product_id=beans, store_id=costco) == [table[first.id]]
+
+    table.clear()
+    assert table.where(product_id=beans) == []
+    with pytest.raises(KeyError):
+        table.where(price=1)
+
+
+def test_reindex_after_in_place_change():
+    """A row whose indexed attribute changed in place moves after reindex()"""
+    table = IndexedTable(("user_id",))
+    old_user, new_user = uuid4(), uuid4()
+    row = RunParticipation(id=uuid4(), user_id=old_user, run_id=uuid4())
+    table[row.id] = row
+
+    row.user_id = new_user
+    assert table.where(user_id=old_user) == [row]
+    table.reindex(row.id)
+    assert table.where(user_id=old_user) == []
+    assert table.where(user_id=new_user) == [row]
+
+
+def test_copies_and_pickles_are_indexed():
+    """Deep copies and unpickled tables rebuild their indexes"""
+    table = IndexedTable(("product_id",))
+    product_id = uuid4()
+    row = ProductBid(id=uuid4(), product_id=product_id, participation_id=uuid4(), quantity=1)
+    table[row.id] = row
+
+    for clone in (copy.deepcopy(table), pickle.loads(pickle.dumps(table))):
+        assert [bid.id for bid in clone.where(product_id=product_id)] == [row.id]
+        assert clone.where(product_id=product_id)[0] is not row
+
+
+def test_merge_moves_rows_between_index_entries():
+    """Merging products moves bids and availabilities to the target in the indexes"""
+    storage = MemoryStorage()
+    repo = MemoryProductRepository(storage)
+    source, target, store_id = uuid4(), uuid4(), uuid4()
+    bid = ProductBid(id=uuid4(), participation_id=uuid4(), product_id=source, quantity=1)
+    storage.bids[bid.id] = bid
+    avail = availability(source, store_id)
+    storage.product_availabilities[avail.id] = avail
+
+    assert repo.bulk_update_product_bids(source, target) == 1
+    assert repo.bulk_update_product_availabilities(source, target) == 1
+
+    assert repo.count_product_bids(source) == 0
+    assert repo.count_product_bids(target) == 1
+    assert repo.get_product_availabilities(target, store_id) == [avail]
+    assert repo.get_product_availabilities(source) == []
+
+
+def stored_runs(runs, participants, bids_per_participant):
+    """Memory storage holding runs with participants that each bid on some products"""
+    storage = MemoryStorage()
+    run_ids = [uuid4() for _ in range(runs)]
+    for run_id in run_ids:
+        for _ in range(participants):
+            participation = RunParticipation(id=uuid4(), user_id=uuid4(), run_id=run_id)
+            storage.participations[participation.id] = participation
+            for _ in range(bids_per_participant):
+                bid = ProductBid(
+                    id=uuid4(), participation_id=participation.id, product_id=uuid4(), quantity=1
+                )
+                storage.bids[bid.id] = bid
+    return storage, run_ids
+
+
+def test_bids_by_run_reads_only_the_runs_rows():
+    """Loading one run's bids reads only its rows, however many runs are stored"""
+    runs, participants, bids_per_participant = 20, 5, 4
+    storage, run_ids = stored_runs(runs, participants, bids_per_participant)
+    rows_read = []
+
+    def counting(table):
+        where = table.where
+
+        def counted_where(**criteria):
+            rows = where(**criteria)
+            rows_read.append(len(rows))
+            return rows
+
+        return counted_where
+
+    storage.participations.where = counting(storage.participations)
+    storage.bids.where = counting(storage.bids)
+
+    bids = MemoryBidRepository(storage).get_bids_by_run_with_participations(run_ids[0])
+
+    assert len(bids) == participants * bids_per_participant
+    # One participation lookup, then one bid lookup per participation
+    assert len(rows_read) == 1 + participants
+    assert sum(rows_read) == participants + len(bids)
+
+
+@pytest.mark.benchmark
+@pytest.mark.slow
+def test_benchmark_bids_by_run():
+    """Loading one run's bids costs the same however many other runs are stored"""
+    runs, participants, bids_per_participant = BENCHMARK_RUNS
+    storage, run_ids = stored_runs(runs, participants, bids_per_participant)
+    repo = MemoryBidRepository(storage)
+    # The first load of each run also sets up the attached relationships
+    for run_id in run_ids:
+        repo.get_bids_by_run_with_participations(run_id)
+
+    start = time.perf_counter()
+    for run_id in run_ids:
+        assert len(repo.get_bids_by_run_with_participations(run_id)) == (
+            participants * bids_per_participant
+        )
+    elapsed_ms = (time.perf_counter() - start) * 1000 / runs
+
+    assert elapsed_ms < BENCHMARK_LOOKUP_MS
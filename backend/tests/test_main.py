@@ -15,4 +15,9 @@ def test_db_health_check(client):
     assert response.status_code == 200
     data = response.json()
     assert data["status"] == "healthy"
-    assert data["database"] == "connected"
\ No newline at end of file
+    assert data["database"] == "connected"
+
+
+def test_session_health_requires_admin(client):
+    response = client.get("/session-health")
+    assert response.status_code == 401
@@ -0,0 +1,178 @@
+"""
+Tests for durable memory mode: journal replay, snapshots, torn journal tails and failed writes.
+"""
+import asyncio
+import threading
+
+import pytest
+
+import app.repositories.memory.journal as journal_module
+from app.repositories import (
+    MemoryGroupRepository,
+    MemoryStorage,
+    MemoryStoreRepository,
+    MemoryUserRepository,
+)
+from app.repositories.memory import MemoryJournal
+
+
+@pytest.fixture
+def journals():
+    """Journals created by a test, detached afterwards so their listeners go away"""
+    created = []
+
+    def open_journal(data_dir):
+        storage = MemoryStorage()
+        journal = MemoryJournal(storage, data_dir)
+        created.append(journal)
+        return storage, journal
+
+    yield open_journal
+    for journal in created:
+        journal.detach()
+
+
+def populate(storage, journal):
+    """Record a user, a group with the user as admin, and two stores (one deleted)"""
+    journal.recover()
+    journal.attach()
+    user = MemoryUserRepository(storage).create_user("Alice", "alice", "hash")
+    groups = MemoryGroupRepository(storage)
+    group = groups.create_group("Friends", user.id)
+    groups.add_group_member(group.id, user, is_group_admin=True)
+    store_repo = MemoryStoreRepository(storage)
+    kept = store_repo.create_store("Costco")
+    dropped = store_repo.create_store("Aldi")
+    del storage.stores[dropped.id]
+    # Changed in place after being stored
+    user.name = "Alice Smith"
+    return user, group, kept
+
+
+def assert_restored(storage, user, group, store):
+    """The storage holds the populated rows and derived lookups"""
+    restored = storage.users[user.id]
+    assert restored is not user
+    assert restored.name == "Alice Smith"
+    assert storage.users_by_username["alice"] is restored
+    assert storage.group_memberships[group.id] == [user.id]
+    assert storage.group_admin_status[(group.id, user.id)] is True
+    assert list(storage.stores) == [store.id]
+    assert [s.id for s in MemoryStoreRepository(storage).search_stores("costco")] == [store.id]
+
+
+def test_recover_replays_journal(tmp_path, journals):
+    """Changes flushed to the journal are restored into a new storage"""
+    storage, journal = journals(tmp_path)
+    user, group, store = populate(storage, journal)
+    assert journal.flush() > 0
+    assert journal.flush() == 0
+    journal.detach()
+
+    restored, second = journals(tmp_path)
+    assert second.recover() is True
+    assert_restored(restored, user, group, store)
+
+
+def test_recover_loads_snapshot_and_later_frames(tmp_path, journals):
+    """A snapshot truncates the journal; frames written after it are replayed on top"""
+    storage, journal = journals(tmp_path)
+    user, group, store = populate(storage, journal)
+    journal.snapshot()
+    assert journal.journal_bytes() == 0
+    user.is_admin = True
+    journal.flush()
+    journal.detach()
+
+    restored, second = journals(tmp_path)
+    assert second.recover() is True
+    assert_restored(restored, user, group, store)
+    assert restored.users[user.id].is_admin is True
+
+
+def test_recover_truncates_torn_tail(tmp_path, journals):
+    """A partially written last frame is dropped and the frames before it are kept"""
+    storage, journal = journals(tmp_path)
+    user, group, store = populate(storage, journal)
+    journal.flush()
+    valid_size = journal.journal_bytes()
+    user.name = "Lost"
+    journal.flush()
+    journal.detach()
+    with open(journal.journal_path, "r+b") as f:
+        f.truncate(valid_size + 5)
+
+    restored, second = journals(tmp_path)
+    assert second.recover() is True
+    assert_restored(restored, user, group, store)
+    assert journal.journal_path.stat().st_size == valid_size
+
+
+def test_recover_without_data(tmp_path, journals):
+    """An empty data directory recovers nothing"""
+    _, journal = journals(tmp_path / "data")
+    assert journal.recover() is False
+
+
+def test_failed_flush_keeps_rows_pending(tmp_path, journals, monkeypatch):
+    """A flush failing mid-write leaves no partial frame and is written by the next flush"""
+    storage, journal = journals(tmp_path)
+    user, group, store = populate(storage, journal)
+
+    def failing_fsync(fd):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(journal_module.os, "fsync", failing_fsync)
+    with pytest.raises(OSError):
+        journal.flush()
+    assert journal.journal_bytes() == 0
+    monkeypatch.undo()
+
+    assert journal.flush() > 0
+    journal.detach()
+    restored, second = journals(tmp_path)
+    assert second.recover() is True
+    assert_restored(restored, user, group, store)
+
+
+@pytest.mark.asyncio
+async def test_run_keeps_going_after_a_failure(tmp_path, journals, monkeypatch):
+    """The background loop logs a failed write and flushes again on the next interval"""
+    storage, journal = journals(tmp_path)
+    populate(storage, journal)
+    journal.flush_interval_ms = 1
+    flush = journal.flush
+    calls = []
+
+    def flaky_flush():
+        calls.append(None)
+        if len(calls) == 1:
+            raise OSError("disk full")
+        return flush()
+
+    monkeypatch.setattr(journal, "flush", flaky_flush)
+    task = asyncio.create_task(journal.run())
+    try:
+        for _ in range(500):
+            if journal.stats()["flushes"]:
+                break
+            await asyncio.sleep(0.01)
+    finally:
+        task.cancel()
+    assert journal.stats()["failures"] == 1
+    assert journal.stats()["flushes"] == 1
+    assert journal.stats()["pending"] == 0
+
+
+def test_snapshot_copies_tables_under_their_lock(tmp_path, journals):
+    """A snapshot waits for rows being stored or removed in another thread"""
+    storage, journal = journals(tmp_path)
+    populate(storage, journal)
+    with storage.users.lock:
+        snapshot = threading.Thread(target=journal.snapshot)
+        snapshot.start()
+        snapshot.join(timeout=0.2)
+        assert snapshot.is_alive()
+    snapshot.join(timeout=5)
+    assert not snapshot.is_alive()
+    assert journal.stats()["snapshots"] == 2
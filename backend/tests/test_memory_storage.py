@@ -0,0 +1,63 @@
+"""
+Tests for per-instance memory storage: isolation, reset and copies.
+"""
+from uuid import uuid4
+
+from app.core.models import ProductBid
+from app.repositories import (
+    MemoryStorage,
+    MemoryStoreRepository,
+    MemoryUserRepository,
+    get_memory_storage,
+    get_user_repository,
+)
+
+
+def test_instances_are_independent():
+    """Rows stored in one storage are not visible in another"""
+    first, second = MemoryStorage(), MemoryStorage()
+    MemoryUserRepository(first).create_user("Alice", "alice", "hash")
+
+    assert len(first.users) == 1
+    assert len(second.users) == 0
+    assert MemoryUserRepository(second).get_user_by_username("alice") is None
+
+
+def test_factories_use_installed_storage(memory_storage):
+    """Repository factories read and write the storage installed for the test"""
+    assert get_memory_storage() is memory_storage
+    get_user_repository().create_user("Bob", "bob", "hash")
+    assert [user.username for user in memory_storage.users.values()] == ["bob"]
+
+
+def test_reset_clears_rows_and_lookups():
+    """reset() empties every table, the username lookup and the name indexes"""
+    storage = MemoryStorage()
+    users = storage.users
+    MemoryUserRepository(storage).create_user("Alice", "alice", "hash")
+    MemoryStoreRepository(storage).create_store("Costco")
+
+    storage.reset()
+
+    assert storage.users is users
+    assert all(len(table) == 0 for table in storage.tables().values())
+    assert storage.users_by_username == {}
+    assert MemoryStoreRepository(storage).search_stores("costco") == []
+
+
+def test_copy_is_independent_and_indexed():
+    """A copy holds equal rows and indexes; changes to it leave the original alone"""
+    storage = MemoryStorage()
+    user = MemoryUserRepository(storage).create_user("Alice", "alice", "hash")
+    product_id = uuid4()
+    bid = ProductBid(id=uuid4(), participation_id=uuid4(), product_id=product_id, quantity=1)
+    storage.bids[bid.id] = bid
+
+    clone = storage.copy()
+    clone.users[user.id].name = "Changed"
+    MemoryUserRepository(clone).create_user("Carol", "carol", "hash")
+
+    assert storage.users[user.id].name == "Alice"
+    assert len(storage.users) == 1
+    assert clone.users_by_username["alice"] is clone.users[user.id]
+    assert [b.id for b in clone.bids.where(product_id=product_id)] == [bid.id]
@@ -0,0 +1,95 @@
+"""
+Tests and benchmark for the memory-mode trigram name index.
+"""
+import random
+import string
+import time
+
+import pytest
+
+from app.repositories.memory.ngram_index import NgramIndex, trigrams
+
+# Catalog size for the benchmark and the per-search time it must stay under
+BENCHMARK_NAMES = 20_000
+BENCHMARK_SEARCH_MS = 10.0
+
+
+def test_trigrams_match_pg_trgm():
+    """Words are lowercased and padded like pg_trgm's show_trgm"""
+    assert trigrams("Cat") == {"  c", " ca", "cat", "at "}
+    assert trigrams("a-b") == {"  a", " a ", "  b", " b "}
+
+
+def test_search_ranks_substring_and_fuzzy_matches():
+    """Substring matches and typos are found, most similar first"""
+    index = NgramIndex()
+    names = ["Rice", "Brown Rice", "Rice Crackers XL", "Costco", "Beans"]
+    for key, name in enumerate(names):
+        index.add(key, name)
+
+    assert index.search("rice", limit=10) == [0, 1, 2]
+    assert index.search("rice", limit=2) == [0, 1]
+    assert index.search("cosco", limit=10) == [3]
+    # Too short to share a trigram: substring matches, tied on similarity, by name
+    assert index.search("ic", limit=10) == [1, 0, 2]
+    assert index.search("  ", limit=10) == []
+
+
+def test_add_replaces_and_remove_drops():
+    """Re-adding a key reindexes its new text and removed keys are not found"""
+    index = NgramIndex()
+    index.add("a", "Rice")
+    index.add("a", "Beans")
+    index.add("b", "Rice")
+    assert index.search("rice", limit=10) == ["b"]
+    index.remove("b")
+    index.remove("missing")
+    assert index.search("rice", limit=10) == []
+    assert len(index) == 1
+
+
+class CountingDict(dict):
+    """Dict counting item reads"""
+
+    reads = 0
+
+    def __getitem__(self, key):
+        self.reads += 1
+        return super().__getitem__(key)
+
+
+def test_search_scores_only_posting_list_candidates():
+    """A query with a full word only scores entries sharing one of its trigrams"""
+    index = NgramIndex()
+    index.add("rice", "Rice")
+    index.add("brown", "Brown Rice")
+    for key in range(1000):
+        index.add(key, f"Bean {key}")
+    index._grams = CountingDict(index._grams)
+
+    assert index.search("rice", limit=10) == ["rice", "brown"]
+    assert index._grams.reads == 2
+
+    # Without a three-character word every entry has to be checked
+    index._grams.reads = 0
+    assert index.search("ic", limit=10) == ["brown", "rice"]
+    assert index._grams.reads == len(index)
+
+
+@pytest.mark.benchmark
+@pytest.mark.slow
+def test_benchmark_search():
+    """Searching a large catalog stays well under the per-search budget"""
+    rng = random.Random(42)
+    words = ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 9))) for _ in range(2000)]
+    index = NgramIndex()
+    for key in range(BENCHMARK_NAMES):
+        index.add(key, " ".join(rng.choices(words, k=3)))
+    queries = [rng.choice(words)[:5] for _ in range(100)]
+
+    start = time.perf_counter()
+    for query in queries:
+        assert index.search(query, limit=5)
+    elapsed_ms = (time.perf_counter() - start) * 1000 / len(queries)
+
+    assert elapsed_ms < BENCHMARK_SEARCH_MS
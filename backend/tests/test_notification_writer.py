@@ -0,0 +1,92 @@
+"""
+Tests for the buffered notification writer.
+"""
+import asyncio
+
+import pytest
+
+import app.repositories as repositories
+from app.core.models import Group, Notification, Run, RunParticipation, Store, User
+from app.infrastructure.notification_writer import NotificationWriter
+from app.infrastructure.query_counter import (
+    install_query_counter,
+    query_stats_var,
+    start_query_stats,
+)
+from tests.conftest import TestingSessionLocal
+
+
+@pytest.fixture
+def run_with_participants(db_session, monkeypatch):
+    """A run with five participants, in database mode"""
+    monkeypatch.setattr(repositories, "REPO_MODE", "database")
+    users = [User(name=f"User {i}", username=f"user{i}", password_hash="x") for i in range(5)]
+    store = Store(name="Costco")
+    db_session.add_all([*users, store])
+    db_session.flush()
+    group = Group(name="Bulk Buyers", created_by=users[0].id)
+    db_session.add(group)
+    db_session.flush()
+    run = Run(group_id=group.id, store_id=store.id, state="active")
+    db_session.add(run)
+    db_session.flush()
+    db_session.add_all([RunParticipation(user_id=user.id, run_id=run.id) for user in users])
+    db_session.commit()
+    return run, users
+
+
+def test_flush_writes_all_events_in_one_insert(db_session, run_with_participants):
+    """Queued events fan out to participants and are written with one insert and one commit"""
+    run, users = run_with_participants
+    writer = NotificationWriter(session_factory=TestingSessionLocal)
+    writer.enqueue_for_run(run.id, "run_state_changed", {"new_state": "confirmed"})
+    writer.enqueue_for_run(run.id, "run_state_changed", {"new_state": "shopping"})
+    writer.enqueue(users[0].id, "leader_reassignment_request", {"run_id": str(run.id)})
+    assert writer.stats()["pending"] == 3
+
+    install_query_counter()
+    stats = start_query_stats()
+    try:
+        written = writer.flush()
+    finally:
+        query_stats_var.set(None)
+
+    assert written == 11
+    assert sum(n for shape, n in stats.shapes.items() if shape.startswith("INSERT")) == 1
+    assert db_session.query(Notification).count() == 11
+    assert {key: writer.stats()[key] for key in ("pending", "flushes", "written")} == {
+        "pending": 0,
+        "flushes": 1,
+        "written": 11,
+    }
+    assert writer.flush() == 0
+
+
+def test_failed_flush_is_dropped_and_counted(db_session, run_with_participants):
+    """A batch that cannot be written is logged and counted, not retried"""
+    run, users = run_with_participants
+    writer = NotificationWriter(session_factory=TestingSessionLocal)
+    writer.enqueue(None, "run_state_changed", {})
+
+    assert writer.flush() == 0
+    assert writer.stats()["failed"] == 1
+    assert writer.stats()["pending"] == 0
+    assert db_session.query(Notification).count() == 0
+
+
+@pytest.mark.asyncio
+async def test_run_loop_flushes_on_interval(db_session, run_with_participants):
+    """The background loop writes queued notifications within the flush interval"""
+    run, users = run_with_participants
+    writer = NotificationWriter(flush_interval_ms=10, session_factory=TestingSessionLocal)
+    task = asyncio.create_task(writer.run())
+    try:
+        writer.enqueue_for_run(run.id, "run_state_changed", {"new_state": "confirmed"})
+        for _ in range(100):
+            await asyncio.sleep(0.01)
+            if writer.stats()["written"]:
+                break
+    finally:
+        task.cancel()
+
+    assert writer.stats()["written"] == len(users)
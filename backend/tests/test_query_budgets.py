@@ -0,0 +1,386 @@
+"""
+Query budget tests.
+
+Each endpoint's service call is run against a seeded database at two sizes and must
+stay within a fixed number of SQL statements, whatever the number of products, bids
+or participants. Every test also runs with lazy loading disabled, so a relationship
+loaded one object at a time fails loudly instead of adding a query per row.
+"""
+from contextlib import contextmanager
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import app.repositories as repositories
+from app.core.models import (
+    Base,
+    Group,
+    Product,
+    ProductAvailability,
+    ProductBid,
+    Run,
+    RunParticipation,
+    ShoppingListItem,
+    Store,
+    User,
+    group_membership,
+)
+from app.core.run_state import RunState
+from app.infrastructure.query_counter import (
+    install_query_counter,
+    query_stats_var,
+    start_query_stats,
+)
+from app.services import AdminService, DistributionService, GroupService, ProductService
+from app.services import RunService, RunStateService, SearchService, ShoppingService, StoreService
+
+pytestmark = pytest.mark.query_budget
+
+# (products, participants) - budgets must hold for both
+SIZES = [(3, 2), (40, 12)]
+
+# Maximum statements per endpoint, independent of the dataset size
+BUDGETS = {
+    "run_detail": 8,
+    "available_products": 3,
+    "group_list": 2,
+    "group_runs": 4,
+    "group_run_history": 4,
+    "store_page": 5,
+    "shopping_list": 5,
+    "start_shopping": 10,
+    "finish_adjusting": 12,
+    "distribution_summary": 8,
+    "product_search": 2,
+    "search_all": 4,
+    "admin_users": 2,
+    "admin_products": 2,
+    "admin_stores": 2,
+    "admin_groups": 2,
+}
+
+# Endpoints still issuing per-row queries; remove an entry once the endpoint is batched
+KNOWN_OVER_BUDGET: dict[str, str] = {}
+
+
+@pytest.fixture(params=[False, True], ids=["lazyload", "raiseload"])
+def raiseload(request):
+    """Run each budget test with and without lazy loading allowed"""
+    return request.param
+
+
+@pytest.fixture
+def budget_session(monkeypatch, raiseload):
+    """Database-mode session on a fresh in-memory SQLite database"""
+    install_query_counter()
+    monkeypatch.setattr(repositories, "REPO_MODE", "database")
+
+    engine = create_engine(
+        "sqlite:///:memory:", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    session = session_factory()
+
+    if raiseload:
+
+        @event.listens_for(session, "do_orm_execute")
+        def _raise_on_lazy_load(orm_execute_state):
+            if orm_execute_state.is_select and orm_execute_state.lazy_loaded_from is not None:
+                raise InvalidRequestError(
+                    f"Lazy load of {orm_execute_state.loader_strategy_path} "
+                    "is not allowed in query budget tests"
+                )
+
+    yield session_factory, session
+
+    session.close()
+    engine.dispose()
+
+
+@contextmanager
+def count_queries():
+    """Count the statements executed inside the block"""
+    stats = start_query_stats()
+    try:
+        yield stats
+    finally:
+        query_stats_var.set(None)
+
+
+def seed_dataset(session_factory, products, participants):
+    """Seed a group with runs in every interesting state.
+
+    Uses its own session so the service under test starts with an empty identity map.
+    Returns a dict with the admin, leader, group, store, one run per state and the
+    finished runs newest first (all detached).
+    """
+    session = session_factory(expire_on_commit=False)
+    now = datetime.now(UTC)
+    admin = User(name="Admin", username="admin", password_hash="x", is_admin=True)
+    leader = User(name="Leader", username="leader", password_hash="x")
+    members = [
+        User(name=f"Member {i}", username=f"member{i}", password_hash="x")
+        for i in range(participants - 1)
+    ]
+    users = [leader, *members]
+    session.add_all([admin, *users])
+    session.flush()
+
+    group = Group(name="Bulk Buyers", created_by=leader.id)
+    store = Store(name="Costco", address="1 Warehouse Way")
+    other_store = Store(name="Sam's Club")
+    session.add_all([group, store, other_store])
+    session.flush()
+    session.execute(
+        insert(group_membership),
+        [
+            {"user_id": user.id, "group_id": group.id, "is_group_admin": user is leader}
+            for user in users
+        ],
+    )
+
+    items = [Product(name=f"Rice {i}", brand="Kirkland", unit="kg") for i in range(products)]
+    # Catalog products nobody has bid on yet
+    unbid_items = [Product(name=f"Beans {i}", unit="kg") for i in range(products)]
+    session.add_all([*items, *unbid_items])
+    session.flush()
+    for day, price in ((2, "10.00"), (1, "9.50")):
+        for product in (*items, *unbid_items):
+            for product_store in (store, other_store):
+                session.add(
+                    ProductAvailability(
+                        product_id=product.id,
+                        store_id=product_store.id,
+                        price=Decimal(price),
+                        created_by=leader.id,
+                        created_at=now - timedelta(days=day),
+                    )
+                )
+
+    runs = {}
+    for state in (
+        RunState.ACTIVE,
+        RunState.CONFIRMED,
+        RunState.SHOPPING,
+        RunState.ADJUSTING,
+        RunState.DISTRIBUTING,
+        RunState.COMPLETED,
+    ):
+        run = Run(group_id=group.id, store_id=store.id, state=state)
+        session.add(run)
+        session.flush()
+        runs[state] = run
+        for user in users:
+            participation = RunParticipation(
+                user_id=user.id, run_id=run.id, is_leader=user is leader
+            )
+            session.add(participation)
+            session.flush()
+            for product in items:
+                session.add(
+                    ProductBid(
+                        participation_id=participation.id,
+                        product_id=product.id,
+                        quantity=Decimal(2),
+                        distributed_quantity=Decimal(2),
+                        distributed_price_per_unit=Decimal("9.50"),
+                    )
+                )
+        if state not in (RunState.ACTIVE, RunState.CONFIRMED):
+            for order, product in enumerate(items):
+                session.add(
+                    ShoppingListItem(
+                        run_id=run.id,
+                        product_id=product.id,
+                        requested_quantity=Decimal(2 * participants),
+                        purchased_quantity=Decimal(2 * participants),
+                        purchased_price_per_unit=Decimal("9.50"),
+                        purchased_total=Decimal("9.50") * 2 * participants,
+                        is_purchased=True,
+                        purchase_order=order,
+                    )
+                )
+
+    # Run history for the group, finished one day apart (most recent first)
+    history = []
+    for i in range(participants * 2):
+        state = RunState.CANCELLED if i % 3 == 0 else RunState.COMPLETED
+        finished_at = now - timedelta(days=i + 3)
+        history_run = Run(
+            group_id=group.id,
+            store_id=store.id,
+            state=state,
+            completed_at=finished_at if state == RunState.COMPLETED else None,
+            cancelled_at=finished_at if state == RunState.CANCELLED else None,
+        )
+        session.add(history_run)
+        session.flush()
+        history.append(history_run)
+        session.add_all(
+            [
+                RunParticipation(user_id=user.id, run_id=history_run.id, is_leader=user is leader)
+                for user in users
+            ]
+        )
+
+    # More groups for the group list, each with a finished run led by the leader
+    for i in range(participants // 2):
+        extra_group = Group(name=f"Neighbours {i}", created_by=leader.id)
+        session.add(extra_group)
+        session.flush()
+        session.execute(
+            insert(group_membership),
+            [{"user_id": leader.id, "group_id": extra_group.id, "is_group_admin": True}],
+        )
+        extra_run = Run(group_id=extra_group.id, store_id=other_store.id, state=RunState.COMPLETED)
+        session.add(extra_run)
+        session.flush()
+        session.add(RunParticipation(user_id=leader.id, run_id=extra_run.id, is_leader=True))
+
+    session.commit()
+    session.close()
+    return {
+        "admin": admin,
+        "leader": leader,
+        "group": group,
+        "store": store,
+        "runs": runs,
+        "history": history,
+    }
+
+
+def run_detail(session, data):
+    run = data["runs"][RunState.ACTIVE]
+    return RunService(session).get_run_details(str(run.id), data["leader"])
+
+
+def available_products(session, data):
+    run = data["runs"][RunState.ACTIVE]
+    return RunService(session).get_available_products(str(run.id), data["leader"], limit=50)
+
+
+def group_list(session, data):
+    return GroupService(session).get_user_groups(data["leader"])
+
+
+def group_runs(session, data):
+    return GroupService(session).get_group_runs(str(data["group"].id), data["leader"])
+
+
+def group_run_history(session, data):
+    # Second page, continuing after the last run of the first
+    return GroupService(session).get_group_completed_cancelled_runs(
+        str(data["group"].id), data["leader"], limit=2, after=str(data["history"][1].id)
+    )
+
+
+def store_page(session, data):
+    return StoreService(session).get_store_page_data(data["store"].id, data["leader"].id)
+
+
+async def shopping_list(session, data):
+    run = data["runs"][RunState.SHOPPING]
+    return await ShoppingService(session).get_shopping_list(str(run.id), data["leader"])
+
+
+def start_shopping(session, data):
+    run = data["runs"][RunState.CONFIRMED]
+    return RunStateService(session).start_shopping(str(run.id), data["leader"])
+
+
+def finish_adjusting(session, data):
+    run = data["runs"][RunState.ADJUSTING]
+    return RunStateService(session).finish_adjusting(str(run.id), data["leader"])
+
+
+def distribution_summary(session, data):
+    run = data["runs"][RunState.DISTRIBUTING]
+    return DistributionService(session).get_distribution_summary(run.id, data["leader"])
+
+
+def product_search(session, data):
+    return ProductService(session).search_products("rice")
+
+
+def search_all(session, data):
+    # One statement per category, plus the store prices of the matching products
+    return SearchService(session).search_all("c", data["leader"])
+
+
+# Admin list routes fetch a page and the total count of matching rows
+
+
+def admin_users(session, data):
+    service = AdminService(session)
+    return service.count_users() and service.get_users(limit=20)
+
+
+def admin_products(session, data):
+    service = AdminService(session)
+    return service.count_products(search="rice") and service.get_products(search="rice", limit=20)
+
+
+def admin_stores(session, data):
+    service = AdminService(session)
+    return service.count_stores() and service.get_stores(limit=20)
+
+
+def admin_groups(session, data):
+    service = AdminService(session)
+    return service.count_groups() and service.get_groups(limit=20)
+
+
+ENDPOINTS = [
+    pytest.param(
+        endpoint,
+        id=endpoint.__name__,
+        marks=[pytest.mark.xfail(reason=KNOWN_OVER_BUDGET[endpoint.__name__])]
+        if endpoint.__name__ in KNOWN_OVER_BUDGET
+        else [],
+    )
+    for endpoint in (
+        run_detail,
+        available_products,
+        group_list,
+        group_runs,
+        group_run_history,
+        store_page,
+        shopping_list,
+        start_shopping,
+        finish_adjusting,
+        distribution_summary,
+        product_search,
+        search_all,
+        admin_users,
+        admin_products,
+        admin_stores,
+        admin_groups,
+    )
+]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("size", SIZES, ids=lambda s: f"{s[0]}p{s[1]}u")
+@pytest.mark.parametrize("endpoint", ENDPOINTS)
+async def test_query_budget(budget_session, endpoint, size):
+    """Endpoint stays within its statement budget"""
+    session_factory, session = budget_session
+    data = seed_dataset(session_factory, *size)
+
+    with count_queries() as stats:
+        result = endpoint(session, data)
+        if hasattr(result, "__await__"):
+            result = await result
+
+    assert result
+    budget = BUDGETS[endpoint.__name__]
+    assert stats.count <= budget, (
+        f"{endpoint.__name__} ran {stats.count} statements (budget {budget}); "
+        f"most repeated: {stats.repeated_shapes(threshold=2)[:1]}"
+    )
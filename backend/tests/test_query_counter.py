@@ -0,0 +1,58 @@
+"""
+Tests for per-request SQL statement counting.
+"""
+from sqlalchemy import create_engine, text
+
+from app.infrastructure.query_counter import (
+    install_query_counter,
+    query_stats_var,
+    start_query_stats,
+    statement_shape,
+)
+
+
+def test_statement_shape_collapses_in_lists():
+    """IN lists of different lengths share a shape"""
+    short = "SELECT * FROM products WHERE products.id IN (?, ?)"
+    long = "SELECT *\n  FROM products WHERE products.id IN (?, ?, ?, ?)"
+    assert statement_shape(short) == statement_shape(long)
+    assert statement_shape("SELECT * FROM x WHERE id IN (%(id_1_1)s, %(id_1_2)s)") == (
+        "SELECT * FROM x WHERE id IN (...)"
+    )
+
+
+def test_counts_statements_and_flags_repeated_shapes():
+    """Statements run in a counting context are counted and grouped by shape"""
+    install_query_counter()
+    engine = create_engine("sqlite:///:memory:")
+    stats = start_query_stats()
+    try:
+        with engine.connect() as conn:
+            for i in range(6):
+                conn.execute(text("SELECT :value"), {"value": i})
+            conn.execute(text("SELECT 1"))
+    finally:
+        query_stats_var.set(None)
+        engine.dispose()
+
+    assert stats.count == 7
+    assert stats.total_ms >= 0
+    assert stats.repeated_shapes(threshold=5) == [("SELECT ?", 6)]
+
+
+def test_statements_outside_a_request_are_not_counted():
+    """Without a started context nothing is recorded"""
+    install_query_counter()
+    engine = create_engine("sqlite:///:memory:")
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+    engine.dispose()
+    assert query_stats_var.get() is None
+
+
+def test_db_headers_on_response(client):
+    """Responses report the number of statements and their total time"""
+    response = client.get("/db-health")
+    assert response.status_code == 200
+    assert int(response.headers["X-DB-Queries"]) >= 1
+    assert float(response.headers["X-DB-Time"]) >= 0
@@ -0,0 +1,132 @@
+"""
+Tests for the reference-data cache of stores, products and runtime settings.
+"""
+from uuid import uuid4
+
+import app.repositories as repositories
+from app.core.models import Store, User
+from app.infrastructure.reference_cache import ReferenceCache, reference_cache
+from app.infrastructure.runtime_settings import is_registration_allowed, set_registration_allowed
+from app.repositories import (
+    MemoryStoreRepository,
+    get_product_repository,
+    get_store_repository,
+)
+from app.services import AdminService, StoreService
+
+
+class FakeClock:
+    """Monotonic clock advanced by hand"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_hits_misses_and_expiry(memory_storage):
+    """Entries are served until the TTL passes, then reloaded"""
+    clock = FakeClock()
+    cache = ReferenceCache(ttl_seconds=60, clock=clock)
+    store = get_store_repository().create_store("Costco")
+
+    assert cache.get_store(None, store.id).name == "Costco"
+    assert cache.get_store(None, store.id).name == "Costco"
+    assert cache.stats()["stores"] == {"entries": 1, "hits": 1, "misses": 1}
+
+    memory_storage.stores[store.id].name = "Costco Wholesale"
+    assert cache.get_store(None, store.id).name == "Costco"
+    clock.now = 61
+    assert cache.get_store(None, store.id).name == "Costco Wholesale"
+    assert cache.stats()["stores"]["misses"] == 2
+
+
+def test_missing_rows_are_not_cached(memory_storage):
+    """A lookup of an unknown ID is retried, so rows created later are found"""
+    cache = ReferenceCache()
+    product_id = uuid4()
+    assert cache.get_product(None, product_id) is None
+
+    product = get_product_repository().create_product("Rice")
+    assert cache.get_product(None, product.id).name == "Rice"
+    assert cache.stats()["products"] == {"entries": 1, "hits": 0, "misses": 2}
+
+
+def test_cached_rows_are_detached_copies(memory_storage):
+    """Cached rows are copies, so in-place changes to stored rows need invalidation"""
+    cache = ReferenceCache()
+    store = get_store_repository().create_store("Aldi")
+    cached = cache.get_store(None, store.id)
+    assert cached is not memory_storage.stores[store.id]
+
+    memory_storage.stores[store.id].name = "Aldi Nord"
+    cache.invalidate_stores(store.id)
+    assert cache.get_store(None, store.id).name == "Aldi Nord"
+
+
+def test_load_racing_an_invalidation_is_not_cached(memory_storage, monkeypatch):
+    """A row loaded before a concurrent update invalidates it is returned but not cached"""
+    cache = ReferenceCache()
+    store = get_store_repository().create_store("Lidl")
+    get_store_by_id = MemoryStoreRepository.get_store_by_id
+
+    def load_then_update(self, store_id):
+        loaded = get_store_by_id(self, store_id)
+        # Another request renames the store while this one is still loading it
+        memory_storage.stores[store_id] = Store(id=store_id, name="Lidl Plus")
+        cache.invalidate_stores(store_id)
+        return loaded
+
+    monkeypatch.setattr(MemoryStoreRepository, "get_store_by_id", load_then_update)
+    assert cache.get_store(None, store.id).name == "Lidl"
+    monkeypatch.undo()
+
+    assert cache.stats()["stores"]["entries"] == 0
+    assert cache.get_store(None, store.id).name == "Lidl Plus"
+
+
+def test_warm_loads_stores_and_products(memory_storage):
+    """Warming caches every store and product, so first lookups are hits"""
+    cache = ReferenceCache()
+    store = get_store_repository().create_store("Costco")
+    product = get_product_repository().create_product("Rice")
+
+    cache.warm(None)
+    cache.get_store(None, store.id)
+    cache.get_product(None, product.id)
+
+    stats = cache.stats()
+    assert stats["stores"]["hits"] == stats["products"]["hits"] == 1
+    assert stats["stores"]["misses"] == stats["products"]["misses"] == 0
+
+
+def test_admin_changes_invalidate(db_session, monkeypatch):
+    """Renaming, verifying and deleting a store through the services is seen immediately"""
+    monkeypatch.setattr(repositories, "REPO_MODE", "database")
+    admin = User(name="Admin", username="admin", password_hash="x", is_admin=True)
+    db_session.add(admin)
+    db_session.commit()
+
+    store = StoreService(db_session).create_store("Costco")
+    assert reference_cache.get_store(db_session, store.id).name == "Costco"
+
+    AdminService(db_session).update_store(store.id, {"name": "Costco Wholesale"}, admin)
+    assert reference_cache.get_store(db_session, store.id).name == "Costco Wholesale"
+
+    AdminService(db_session).toggle_store_verification(store.id, admin)
+    assert reference_cache.get_store(db_session, store.id).verified is True
+
+    AdminService(db_session).delete_store(store.id, admin)
+    assert reference_cache.get_store(db_session, store.id) is None
+
+
+def test_registration_setting_cached_and_invalidated(db_session):
+    """The registration check is served from the cache and follows set_setting"""
+    set_registration_allowed(db_session, False)
+    assert is_registration_allowed(db_session) is False
+    assert is_registration_allowed(db_session) is False
+    assert reference_cache.stats()["settings"]["hits"] == 1
+
+    set_registration_allowed(db_session, True)
+    assert is_registration_allowed(db_session) is True
@@ -0,0 +1,92 @@
+"""
+Tests for the service worker pool and thread-safe background tasks.
+"""
+import asyncio
+import threading
+
+import pytest
+
+from app.infrastructure.request_context import (
+    get_request_id,
+    request_stats_var,
+    set_request_id,
+    start_request_stats,
+)
+from app.infrastructure.service_executor import ServiceExecutor
+from app.utils.background_tasks import create_background_task, set_main_loop
+
+
+@pytest.mark.asyncio
+async def test_run_propagates_request_context():
+    """The request ID is visible in the worker and queue wait is recorded"""
+    executor = ServiceExecutor(max_workers=1)
+    set_request_id("req-123")
+    stats = start_request_stats()
+
+    def service_call(value):
+        return value, get_request_id(), threading.current_thread().name
+
+    value, request_id, thread_name = await executor.run(service_call, 7)
+
+    assert value == 7
+    assert request_id == "req-123"
+    assert thread_name.startswith("service-worker")
+    assert "queue_wait_ms" in stats
+    assert executor.stats()["calls"] == 1
+    executor.shutdown()
+    request_stats_var.set(None)
+
+
+@pytest.mark.asyncio
+async def test_run_reraises_service_exceptions():
+    """Exceptions from the service call reach the awaiting route"""
+    executor = ServiceExecutor(max_workers=1)
+
+    def failing_call():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        await executor.run(failing_call)
+    assert executor.stats()["in_flight"] == 0
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_inline_executor_runs_on_the_calling_thread():
+    """Memory mode calls run on the event loop thread, where the other routes use storage"""
+    executor = ServiceExecutor(inline=True)
+
+    thread = await executor.run(threading.current_thread)
+
+    assert thread is threading.current_thread()
+    assert executor.stats()["calls"] == 1
+    assert executor.stats()["inline"] is True
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_background_task_from_worker_thread_runs_on_main_loop():
+    """Tasks started by a service in a worker thread are scheduled on the app loop"""
+    loop = asyncio.get_running_loop()
+    set_main_loop(loop)
+    executor = ServiceExecutor(max_workers=1)
+    done = asyncio.Event()
+    seen = {}
+
+    async def broadcast():
+        seen["loop"] = asyncio.get_running_loop()
+        seen["request_id"] = get_request_id()
+        done.set()
+
+    def service_call():
+        create_background_task(broadcast(), task_name="broadcast")
+
+    set_request_id("req-456")
+    try:
+        await executor.run(service_call)
+        await asyncio.wait_for(done.wait(), timeout=1)
+    finally:
+        set_main_loop(None)
+        executor.shutdown()
+
+    assert seen == {"loop": loop, "request_id": "req-456"}
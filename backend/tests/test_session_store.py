@@ -0,0 +1,319 @@
+"""
+Tests for the pluggable session store backends.
+"""
+import socketserver
+import threading
+import time
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.exceptions import ConfigurationError
+from app.core.models import Base
+from app.infrastructure import auth
+from app.infrastructure.session_store import (
+    DatabaseSessionStore,
+    MemorySessionStore,
+    RedisSessionStore,
+    create_redis_client,
+    create_session_store,
+)
+
+
+class _RespStandInHandler(socketserver.StreamRequestHandler):
+    """Handles the subset of Redis commands used by RedisSessionStore."""
+
+    def handle(self):
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            args = []
+            for _ in range(int(line[1:-2])):
+                length = int(self.rfile.readline()[1:-2])
+                args.append(self.rfile.read(length + 2)[:-2].decode())
+            self.wfile.write(self.server.dispatch(args))
+
+
+class RespStandIn(socketserver.ThreadingTCPServer):
+    """Tiny in-process server speaking the Redis protocol (RESP2), for tests only."""
+
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _RespStandInHandler)
+        self.data: dict[str, tuple[str, float | None]] = {}
+        self.sorted_sets: dict[str, dict[str, float]] = {}
+
+    def _live(self, key):
+        value = self.data.get(key)
+        if value and value[1] is not None and time.monotonic() > value[1]:
+            del self.data[key]
+            return None
+        return value
+
+    def dispatch(self, args):
+        command = args[0].upper()
+        if command == "SET":
+            expires = None
+            if len(args) == 5 and args[3].upper() == "PX":
+                expires = time.monotonic() + int(args[4]) / 1000
+            self.data[args[1]] = (args[2], expires)
+            return b"+OK\r\n"
+        if command == "GET":
+            value = self._live(args[1])
+            if value is None:
+                return b"$-1\r\n"
+            encoded = value[0].encode()
+            return b"$%d\r\n%s\r\n" % (len(encoded), encoded)
+        if command == "MGET":
+            reply = b"*%d\r\n" % (len(args) - 1)
+            for key in args[1:]:
+                value = self._live(key)
+                if value is None:
+                    reply += b"$-1\r\n"
+                else:
+                    encoded = value[0].encode()
+                    reply += b"$%d\r\n%s\r\n" % (len(encoded), encoded)
+            return reply
+        if command == "DEL":
+            return b":%d\r\n" % (1 if self.data.pop(args[1], None) else 0)
+        if command == "ZADD":
+            members = self.sorted_sets.setdefault(args[1], {})
+            pairs = list(zip(args[2::2], args[3::2], strict=True))
+            added = sum(member not in members for _, member in pairs)
+            members.update((member, float(score)) for score, member in pairs)
+            return b":%d\r\n" % added
+        if command == "ZRANGEBYSCORE":
+            low, high = float(args[2]), float(args[3])
+            members = sorted(
+                (score, member)
+                for member, score in self.sorted_sets.get(args[1], {}).items()
+                if low <= score <= high
+            )
+            reply = b"*%d\r\n" % len(members)
+            for _, member in members:
+                encoded = member.encode()
+                reply += b"$%d\r\n%s\r\n" % (len(encoded), encoded)
+            return reply
+        if command == "ZREMRANGEBYSCORE":
+            low, high = float(args[2]), float(args[3])
+            members = self.sorted_sets.get(args[1], {})
+            removed = [member for member, score in members.items() if low <= score <= high]
+            for member in removed:
+                del members[member]
+            return b":%d\r\n" % len(removed)
+        if command in ("CLIENT", "SELECT"):
+            return b"+OK\r\n"
+        if command == "PING":
+            return b"+PONG\r\n"
+        return b"-ERR unknown command\r\n"
+
+
+@pytest.fixture
+def resp_server():
+    server = RespStandIn()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _session(user_id="user-1", hours=1):
+    now = datetime.now(UTC)
+    return {"user_id": user_id, "expires_at": now + timedelta(hours=hours), "created_at": now}
+
+
+@pytest.fixture
+def memory_store():
+    return MemorySessionStore()
+
+
+@pytest.fixture
+def database_store():
+    engine = create_engine(
+        "sqlite:///:memory:", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+    return DatabaseSessionStore(sessionmaker(bind=engine))
+
+
+@pytest.fixture
+def redis_store(resp_server):
+    pytest.importorskip("redis")
+    host, port = resp_server.server_address
+    client = create_redis_client(f"redis://{host}:{port}/0?protocol=2")
+    yield RedisSessionStore(client)
+    client.close()
+
+
+@pytest.fixture(params=["memory_store", "database_store", "redis_store"])
+def store(request):
+    return request.getfixturevalue(request.param)
+
+
+def test_save_get_delete(store):
+    """Sessions round-trip through every backend"""
+    session = _session()
+    store.save("token-1", session)
+
+    loaded = store.get("token-1")
+    assert loaded["user_id"] == "user-1"
+    assert abs((loaded["expires_at"] - session["expires_at"]).total_seconds()) < 1
+
+    assert store.delete("token-1") is True
+    assert store.get("token-1") is None
+    assert store.delete("token-1") is False
+
+
+def test_expired_session_not_returned(store):
+    """Expired sessions are never returned"""
+    store.save("expired", _session(hours=-1))
+    store.save("valid", _session())
+
+    assert store.get("expired") is None
+    assert store.get("valid") is not None
+
+
+def test_revocations(store):
+    """Revocations round-trip through every backend and are not returned once expired"""
+    now = datetime.now(UTC)
+    store.save_revocation("jti:a", 10, now + timedelta(hours=1))
+    store.save_revocation("user:user-1", 20, now + timedelta(hours=1))
+    store.save_revocation("user:user-2", 30, now - timedelta(hours=1))
+
+    revocations = store.get_revocations_since(None)
+    assert {key: cutoff for key, (cutoff, _) in revocations.items()} == {
+        "jti:a": 10,
+        "user:user-1": 20,
+    }
+    assert abs((revocations["jti:a"][1] - (now + timedelta(hours=1))).total_seconds()) < 1
+
+    time.sleep(0.01)
+    since = datetime.now(UTC)
+    store.save_revocation("user:user-1", 40, now + timedelta(hours=1))
+    assert store.get_revocations_since(since) == {
+        "user:user-1": (40, revocations["user:user-1"][1]),
+    }
+
+
+def test_cleanup_expired(memory_store, database_store):
+    """Backends without native TTL remove expired sessions on cleanup"""
+    memory_store.EVICT_ON_SAVE = 0
+    for backend in (memory_store, database_store):
+        backend.save("expired", _session(hours=-1))
+        backend.save("valid", _session())
+
+        assert backend.cleanup_expired() == 1
+        assert backend.count() == 1
+
+
+def test_cleanup_expired_in_batches(memory_store, database_store):
+    """A cleanup pass removes at most limit sessions and limit revocations"""
+    memory_store.EVICT_ON_SAVE = 0
+    now = datetime.now(UTC)
+    for backend in (memory_store, database_store):
+        for i in range(5):
+            backend.save(f"expired-{i}", _session(hours=-1))
+            backend.save_revocation(f"jti:{i}", i, now - timedelta(hours=1))
+        backend.save("valid", _session())
+        backend.save_revocation("jti:valid", 1, now + timedelta(hours=1))
+
+        assert backend.cleanup_expired(limit=2) == 2
+        assert backend.count() == 4
+        assert backend.cleanup_expired(limit=10) == 3
+        assert backend.count() == 1
+        assert list(backend.get_revocations_since(None)) == ["jti:valid"]
+
+    assert list(memory_store.revocations) == ["jti:valid"]
+
+
+def test_memory_store_evicts_from_expiry_heap(memory_store):
+    """Expired sessions are evicted through the expiry heap, skipping stale entries"""
+    memory_store.EVICT_ON_SAVE = 0
+    for i in range(5):
+        memory_store.save(f"expired-{i}", _session(hours=-1))
+    for i in range(3):
+        memory_store.save(f"valid-{i}", _session())
+
+    # Deleted and re-saved sessions leave stale heap entries behind
+    memory_store.save("renewed", _session(hours=-1))
+    memory_store.save("renewed", _session())
+    memory_store.delete("expired-0")
+
+    assert memory_store.cleanup_expired() == 4
+    assert memory_store.count() == 4
+    assert memory_store.get("renewed") is not None
+
+    stats = memory_store.stats()
+    assert stats["session_count"] == 4
+    assert stats["expiry_heap_size"] == 4
+    assert stats["evicted_from_heap"] == 4
+
+
+def test_memory_store_evicts_incrementally_on_save(memory_store):
+    """Saving a session evicts a bounded batch of expired sessions"""
+    memory_store.EVICT_ON_SAVE = 0
+    for i in range(10):
+        memory_store.save(f"expired-{i}", _session(hours=-1))
+
+    memory_store.EVICT_ON_SAVE = 4
+    memory_store.save("valid", _session())
+
+    assert memory_store.count() == 7
+
+
+def test_memory_store_compacts_stale_heap_entries(memory_store):
+    """Heap is rebuilt once stale entries outnumber live sessions"""
+    for i in range(200):
+        memory_store.save(f"token-{i}", _session())
+        memory_store.delete(f"token-{i}")
+    memory_store.evict_expired()
+
+    assert memory_store.stats()["heap_compactions"] >= 1
+    assert memory_store.stats()["expiry_heap_size"] < 200
+
+
+def test_sessions_shared_between_store_instances(resp_server):
+    """Two workers (separate clients) see the same sessions"""
+    pytest.importorskip("redis")
+    host, port = resp_server.server_address
+    worker_a = RedisSessionStore(create_redis_client(f"redis://{host}:{port}/0?protocol=2"))
+    worker_b = RedisSessionStore(create_redis_client(f"redis://{host}:{port}/0?protocol=2"))
+
+    worker_a.save("shared", _session(user_id="user-42"))
+
+    assert worker_b.get("shared")["user_id"] == "user-42"
+
+
+def test_redis_store_does_not_count_or_scan(redis_store):
+    """Counting a Redis store would scan the keyspace, so it is not supported"""
+    redis_store.save("token-1", _session())
+
+    assert redis_store.count() is None
+    assert "session_count" not in redis_store.stats()
+
+
+def test_auth_functions_use_configured_store(redis_store):
+    """create/get/delete_session go through the active session store"""
+    previous = auth.get_session_store()
+    auth.set_session_store(redis_store)
+    try:
+        token = auth.create_session("user-7")
+        assert redis_store.get(token)["user_id"] == "user-7"
+        assert auth.get_session(token)["user_id"] == "user-7"
+        assert auth.delete_session(token) is True
+        assert auth.get_session(token) is None
+    finally:
+        auth.set_session_store(previous)
+
+
+def test_invalid_backend():
+    """Unknown backends raise a configuration error"""
+    with pytest.raises(ConfigurationError):
+        create_session_store("nosuchbackend")
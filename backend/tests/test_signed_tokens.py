@@ -0,0 +1,139 @@
+"""
+Tests for stateless signed session tokens and the revocation set.
+"""
+import time
+
+import pytest
+
+from app.infrastructure import auth
+from app.infrastructure.session_store import MemorySessionStore
+from app.infrastructure.signed_tokens import (
+    RevocationSet,
+    decode_signed_token,
+    encode_signed_token,
+)
+
+
+@pytest.fixture
+def signed_mode(monkeypatch):
+    """Switch the auth module to signed tokens, a fresh session store and revocations"""
+    monkeypatch.setattr(auth, "SESSION_TOKEN_MODE", "signed")
+    monkeypatch.setattr(auth, "revoked_tokens", RevocationSet(auth.get_session_store))
+    previous = auth.get_session_store()
+    auth.set_session_store(MemorySessionStore())
+    yield
+    auth.set_session_store(previous)
+
+
+def test_encode_decode_roundtrip():
+    """Signed tokens decode back to their claims"""
+    token = encode_signed_token("user-1", time.time() + 60, secret_key="k")
+    claims = decode_signed_token(token, secret_key="k")
+
+    assert claims["sub"] == "user-1"
+    assert claims["jti"]
+
+
+def test_tampered_or_foreign_tokens_rejected():
+    """Tokens with a modified payload or a different key are rejected"""
+    token = encode_signed_token("user-1", time.time() + 60, secret_key="k")
+    payload, signature = token.split(".")
+
+    assert decode_signed_token(token, secret_key="other") is None
+    assert decode_signed_token(payload[:-2] + "xx." + signature, secret_key="k") is None
+    assert decode_signed_token("garbage", secret_key="k") is None
+
+
+def test_non_ascii_signature_rejected():
+    """Tokens with non-ASCII characters are rejected instead of raising"""
+    token = encode_signed_token("user-1", time.time() + 60, secret_key="k")
+    payload, signature = token.split(".")
+
+    assert decode_signed_token(payload + ".\u00e9" + signature[1:], secret_key="k") is None
+    assert decode_signed_token("\u00e9" + token, secret_key="k") is None
+
+
+def test_expired_token_rejected():
+    """Expired tokens are rejected"""
+    token = encode_signed_token("user-1", time.time() - 1, secret_key="k")
+    assert decode_signed_token(token, secret_key="k") is None
+
+
+def test_signed_session_lifecycle(signed_mode):
+    """Signed sessions validate without the session store and honour logout"""
+    token = auth.create_session("user-1")
+
+    assert auth.get_session_store().get(token) is None
+    assert auth.get_session(token)["user_id"] == "user-1"
+
+    assert auth.delete_session(token) is True
+    assert auth.get_session(token) is None
+
+
+def test_revoke_user_sessions(signed_mode):
+    """Revoking a user invalidates earlier tokens but not ones issued afterwards"""
+    old_token = auth.create_session("user-1")
+    other_user_token = auth.create_session("user-2")
+
+    auth.revoke_user_sessions("user-1")
+    new_token = auth.create_session("user-1")
+
+    assert auth.get_session(old_token) is None
+    assert auth.get_session(other_user_token) is not None
+    assert auth.get_session(new_token) is not None
+
+
+def test_revocations_shared_between_workers(signed_mode):
+    """A revocation recorded by one worker is seen by another sharing the store"""
+    worker_a = RevocationSet(auth.get_session_store)
+    worker_b = RevocationSet(auth.get_session_store)
+    claims = decode_signed_token(auth.create_session("user-1"))
+
+    worker_a.revoke_token(claims)
+
+    assert worker_a.is_revoked(claims)
+    assert worker_b.is_revoked(claims)
+
+
+class CountingStore(MemorySessionStore):
+    """Memory session store counting revocation reads"""
+
+    reads = 0
+
+    def get_revocations_since(self, since):
+        self.reads += 1
+        return super().get_revocations_since(since)
+
+
+def test_revocations_checked_in_process_and_synced_on_interval():
+    """Checks read the local copy; other workers' revocations arrive on the next sync"""
+    store = CountingStore()
+    worker_a = RevocationSet(lambda: store, sync_interval=60)
+    worker_b = RevocationSet(lambda: store, sync_interval=60)
+    claims = decode_signed_token(encode_signed_token("user-1", time.time() + 60))
+
+    for _ in range(10):
+        assert not worker_b.is_revoked(claims)
+    assert store.reads == 1
+
+    worker_a.revoke_user("user-1", time.time() + 60)
+    assert worker_a.is_revoked(claims)
+    # Within the sync interval worker B has not seen it yet
+    assert not worker_b.is_revoked(claims)
+    assert store.reads == 2
+
+    worker_b.sync_interval = 0
+    assert worker_b.is_revoked(claims)
+    assert store.reads == 3
+
+
+def test_revocation_entries_expire():
+    """Revocation entries are dropped once the tokens they cover have expired"""
+    store = MemorySessionStore()
+    revoked = RevocationSet(lambda: store)
+    revoked.revoke_token({"jti": "a", "iat": 1, "exp": time.time() - 1})
+    revoked.revoke_token({"jti": "b", "iat": 1, "exp": time.time() + 60})
+    revoked.revoke_user("user-1", time.time() - 1)
+
+    store.cleanup_expired()
+    assert list(store.revocations) == ["jti:b"]
@@ -0,0 +1,123 @@
+"""
+Tests and benchmark for the typeahead prefix index.
+"""
+import math
+import random
+import string
+import time
+from uuid import uuid4
+
+import pytest
+
+import app.repositories as repositories
+from app.core.models import User
+from app.infrastructure.suggest_index import PrefixIndex, suggest_index
+from app.services import AdminService, StoreService
+
+# Catalog size for the benchmark and the per-lookup time it must stay under
+BENCHMARK_NAMES = 20_000
+BENCHMARK_SUGGEST_US = 100.0
+
+
+def test_suggest_name_prefixes_before_word_prefixes():
+    """Names starting with the prefix come first, then later words, each by name"""
+    index = PrefixIndex()
+    names = ["Rice Crackers", "Brown Rice", "Rice", "Costco", "Wild  rice"]
+    for key, name in enumerate(names):
+        index.add(key, name)
+
+    assert index.suggest("RI", limit=10) == [
+        (2, "Rice"),
+        (0, "Rice Crackers"),
+        (1, "Brown Rice"),
+        (4, "Wild  rice"),
+    ]
+    assert index.suggest("ri", limit=2) == [(2, "Rice"), (0, "Rice Crackers")]
+    assert index.suggest("wild r", limit=10) == [(4, "Wild  rice")]
+    assert index.suggest("cra", limit=10) == [(0, "Rice Crackers")]
+    assert index.suggest("x", limit=10) == []
+    assert index.suggest(" ", limit=10) == []
+
+
+def test_add_replaces_remove_drops_and_rebuild_resets():
+    """Renamed keys are found by their new name only and removed keys not at all"""
+    index = PrefixIndex()
+    index.add("a", "Rice")
+    index.add("a", "Black Beans")
+    index.add("b", "Rice")
+    assert index.suggest("b", limit=10) == [("a", "Black Beans")]
+    assert index.suggest("r", limit=10) == [("b", "Rice")]
+    index.remove("b")
+    index.remove("missing")
+    assert index.suggest("r", limit=10) == []
+    assert len(index) == 1
+
+    index.rebuild([("c", "Oats"), ("d", "Rolled Oats")])
+    assert index.suggest("oa", limit=10) == [("c", "Oats"), ("d", "Rolled Oats")]
+    assert index.suggest("bla", limit=10) == []
+
+
+def test_services_keep_index_current(db_session, monkeypatch):
+    """Creating, renaming and deleting stores updates the suggestions"""
+    monkeypatch.setattr(repositories, "REPO_MODE", "database")
+    admin = User(name="Admin", username="admin", password_hash="x", is_admin=True)
+    db_session.add(admin)
+    db_session.commit()
+    tag = uuid4().hex[:8]
+
+    store = StoreService(db_session).create_store(f"{tag} Costco")
+    assert suggest_index.stores.suggest(tag, limit=5) == [(store.id, f"{tag} Costco")]
+
+    AdminService(db_session).update_store(store.id, {"name": f"{tag} Costco Wholesale"}, admin)
+    assert suggest_index.stores.suggest(f"{tag} costco w", limit=5) == [
+        (store.id, f"{tag} Costco Wholesale")
+    ]
+
+    AdminService(db_session).delete_store(store.id, admin)
+    assert suggest_index.stores.suggest(tag, limit=5) == []
+
+
+class CountingList(list):
+    """List counting item reads"""
+
+    reads = 0
+
+    def __getitem__(self, i):
+        self.reads += 1
+        return super().__getitem__(i)
+
+
+def test_suggest_reads_a_bisect_and_at_most_limit_entries():
+    """A lookup reads a logarithmic number of entries plus the ones it returns"""
+    index = PrefixIndex()
+    index.rebuild((key, f"Rice {key:04}") for key in range(1000))
+    index._names = CountingList(index._names)
+    index._word_starts = CountingList(index._word_starts)
+
+    bisect_reads = math.ceil(math.log2(1000))
+    assert len(index.suggest("rice", limit=5)) == 5
+    assert index._names.reads <= bisect_reads + 5
+    assert index._word_starts.reads <= bisect_reads
+
+    index._names.reads = index._word_starts.reads = 0
+    assert index.suggest("00", limit=5) == [(key, f"Rice {key:04}") for key in range(5)]
+    assert index._names.reads <= bisect_reads + 1
+    assert index._word_starts.reads <= bisect_reads + 5
+
+
+@pytest.mark.benchmark
+@pytest.mark.slow
+def test_benchmark_suggest():
+    """Suggesting from a large catalog takes microseconds"""
+    rng = random.Random(42)
+    words = ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 9))) for _ in range(2000)]
+    index = PrefixIndex()
+    index.rebuild((key, " ".join(rng.choices(words, k=3))) for key in range(BENCHMARK_NAMES))
+    prefixes = [rng.choice(words)[: rng.randint(1, 4)] for _ in range(1000)]
+
+    start = time.perf_counter()
+    for prefix in prefixes:
+        assert index.suggest(prefix, limit=5)
+    elapsed_us = (time.perf_counter() - start) * 1_000_000 / len(prefixes)
+
+    assert elapsed_us < BENCHMARK_SUGGEST_US